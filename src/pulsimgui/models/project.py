@@ -39,6 +39,8 @@ class SimulationSettings:
     thermal_include_switching_losses: bool = True
     thermal_include_conduction_losses: bool = True
     thermal_network: str = "foster"
+    thermal_cycle_average: bool = False
+    ac_adaptive: bool = False
     formulation_mode: str = "projected_wrapper"
     direct_formulation_fallback: bool = True
 
@@ -70,6 +72,8 @@ class SimulationSettings:
             "thermal_include_switching_losses": self.thermal_include_switching_losses,
             "thermal_include_conduction_losses": self.thermal_include_conduction_losses,
             "thermal_network": self.thermal_network,
+            "thermal_cycle_average": self.thermal_cycle_average,
+            "ac_adaptive": self.ac_adaptive,
             "formulation_mode": self.formulation_mode,
             "direct_formulation_fallback": self.direct_formulation_fallback,
         }
@@ -119,6 +123,8 @@ class SimulationSettings:
                 data.get("thermal_include_conduction_losses", True)
             ),
             thermal_network=thermal_network,
+            thermal_cycle_average=bool(data.get("thermal_cycle_average", False)),
+            ac_adaptive=bool(data.get("ac_adaptive", False)),
             formulation_mode=formulation_mode,
             direct_formulation_fallback=bool(
                 data.get("direct_formulation_fallback", True)
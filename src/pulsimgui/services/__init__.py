@@ -37,6 +37,7 @@ from pulsimgui.services.theme_service import (
 )
 from pulsimgui.services.thermal_service import (
     ThermalAnalysisService,
+    ThermalAnalysisWorker,
     ThermalDeviceResult,
     ThermalResult,
     ThermalStage,
@@ -56,6 +57,7 @@ __all__ = [
     "DCResult",
     "ACResult",
     "ThermalAnalysisService",
+    "ThermalAnalysisWorker",
     "ThermalResult",
     "ThermalDeviceResult",
     "ThermalStage",
@@ -0,0 +1,319 @@
+"""Frequency-partitioned execution of AC sweeps.
+
+An AC sweep is a set of independent complex linear solves, one per frequency
+point. :class:`ChunkedACExecutor` splits ``[f_start, f_stop]`` into decade
+chunks, runs them concurrently and merges the partial results back into a
+single :class:`~pulsimgui.services.backend_types.ACResult` in frequency order.
+With ``ACSettings.adaptive`` the merged coarse sweep is then refined by
+bisecting intervals where the response bends sharply or crosses 0 dB / -180°.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from typing import Callable
+
+import numpy as np
+
+from pulsimgui.services.backend_types import ACResult, ACSettings
+
+#: Relative tolerance used to drop duplicate frequencies at chunk boundaries.
+FREQUENCY_MERGE_RTOL = 1e-9
+
+#: Interval used while waiting on chunks, so cancellation is noticed promptly.
+CHUNK_POLL_INTERVAL = 0.1
+
+#: Narrowest interval (decades) bisected because of curvature alone.
+MIN_CURVATURE_WIDTH_DECADES = 1e-3
+
+
+def split_decade_chunks(settings: ACSettings) -> list[ACSettings]:
+    """Split an AC sweep into per-decade sub-sweeps.
+
+    Chunk edges fall on whole decades (``10**k``) so each chunk keeps the
+    requested ``points_per_decade`` density. Ranges narrower than a decade are
+    returned unchanged as a single chunk.
+
+    Args:
+        settings: Full-range AC settings.
+
+    Returns:
+        Settings for each chunk, in ascending frequency order.
+    """
+    f_start = float(settings.f_start)
+    f_stop = float(settings.f_stop)
+    if f_start <= 0.0 or f_stop <= f_start:
+        return [settings]
+
+    edges = [f_start]
+    decade = math.floor(math.log10(f_start)) + 1
+    while 10.0**decade < f_stop * (1.0 - FREQUENCY_MERGE_RTOL):
+        edge = 10.0**decade
+        if edge > f_start * (1.0 + FREQUENCY_MERGE_RTOL):
+            edges.append(edge)
+        decade += 1
+    edges.append(f_stop)
+
+    if len(edges) <= 2:
+        return [settings]
+    return [
+        replace(settings, f_start=lo, f_stop=hi, output_nodes=list(settings.output_nodes))
+        for lo, hi in zip(edges[:-1], edges[1:])
+    ]
+
+
+def merge_ac_chunks(chunks: list[ACResult]) -> ACResult:
+    """Merge chunk results into one result sorted by frequency.
+
+    Frequencies shared by neighbouring chunks are kept once. Signals missing
+    from a chunk are padded with ``nan`` so every trace stays aligned with the
+    frequency axis. Error messages from failed chunks are joined.
+    """
+    rows: list[tuple[float, int, int]] = []
+    signal_names: list[str] = []
+    errors: list[str] = []
+    for chunk_index, chunk in enumerate(chunks):
+        if chunk.error_message:
+            errors.append(chunk.error_message)
+        for name in chunk.magnitude:
+            if name not in signal_names:
+                signal_names.append(name)
+        rows.extend((float(f), chunk_index, idx) for idx, f in enumerate(chunk.frequencies))
+    rows.sort(key=lambda row: row[0])
+
+    merged = ACResult(error_message="; ".join(dict.fromkeys(errors)))
+    merged.magnitude = {name: [] for name in signal_names}
+    merged.phase = {name: [] for name in signal_names}
+    last_freq: float | None = None
+    for freq, chunk_index, idx in rows:
+        if last_freq is not None and math.isclose(freq, last_freq, rel_tol=FREQUENCY_MERGE_RTOL):
+            continue
+        last_freq = freq
+        chunk = chunks[chunk_index]
+        merged.frequencies.append(freq)
+        for name in signal_names:
+            merged.magnitude[name].append(_value_at(chunk.magnitude.get(name), idx))
+            merged.phase[name].append(_value_at(chunk.phase.get(name), idx))
+    return merged
+
+
+def select_refinement_frequencies(result: ACResult, settings: ACSettings) -> list[float]:
+    """Return bisection midpoints for intervals that need more resolution.
+
+    An interval is refined when a signal crosses 0 dB or -180° inside it (until
+    it is narrower than ``crossing_tolerance``) or when the magnitude or phase
+    at either end deviates from the chord through its neighbours by more than
+    the configured tolerance. Phase is unwrapped first so ±180° wraps are not
+    mistaken for curvature. Crossing midpoints are listed first so they win
+    when the solve budget runs out.
+    """
+    freqs = np.asarray(result.frequencies, dtype=float)
+    if freqs.size < 2 or np.any(freqs <= 0.0):
+        return []
+    log_f = np.log10(freqs)
+    widths = np.diff(log_f)
+    crossing_floor = math.log10(1.0 + max(settings.crossing_tolerance, 1e-12))
+
+    crossing = np.zeros(widths.size, dtype=bool)
+    curved = np.zeros(widths.size, dtype=bool)
+    for name, magnitude in result.magnitude.items():
+        mag = np.asarray(magnitude, dtype=float)
+        phase = np.asarray(result.phase.get(name, []), dtype=float)
+        if mag.size == freqs.size:
+            crossing |= _sign_changes(mag)
+            curved |= _chord_deviation(log_f, mag, settings.magnitude_tolerance_db)
+        if phase.size == freqs.size and np.all(np.isfinite(phase)):
+            phase = np.rad2deg(np.unwrap(np.deg2rad(phase)))
+            crossing |= _sign_changes(phase + 180.0)
+            curved |= _chord_deviation(log_f, phase, settings.phase_tolerance_deg)
+
+    crossing &= widths > crossing_floor
+    curved &= ~crossing & (widths > MIN_CURVATURE_WIDTH_DECADES)
+    midpoints = 10.0 ** (0.5 * (log_f[:-1] + log_f[1:]))
+    return [*midpoints[crossing].tolist(), *midpoints[curved].tolist()]
+
+
+def _sign_changes(values: np.ndarray) -> np.ndarray:
+    """Flag intervals whose end values straddle zero."""
+    finite = np.isfinite(values[:-1]) & np.isfinite(values[1:])
+    return finite & ((values[:-1] >= 0.0) != (values[1:] >= 0.0))
+
+
+def _chord_deviation(log_f: np.ndarray, values: np.ndarray, tolerance: float) -> np.ndarray:
+    """Flag both intervals around points that stray from their neighbours' chord."""
+    flags = np.zeros(log_f.size - 1, dtype=bool)
+    if log_f.size < 3:
+        return flags
+    span = log_f[2:] - log_f[:-2]
+    weight = np.divide(log_f[1:-1] - log_f[:-2], span, out=np.zeros_like(span), where=span > 0)
+    chord = values[:-2] + weight * (values[2:] - values[:-2])
+    with np.errstate(invalid="ignore"):
+        bent = np.abs(values[1:-1] - chord) > tolerance
+    flags[:-1] |= bent
+    flags[1:] |= bent
+    return flags
+
+
+def _value_at(values: list[float] | None, index: int) -> float:
+    if values is None or index >= len(values):
+        return math.nan
+    return float(values[index])
+
+
+class ChunkedACExecutor:
+    """Run decade chunks of an AC sweep concurrently.
+
+    Chunks run on a thread pool: backend circuits wrap native objects that
+    cannot be pickled into worker processes, and the native solver releases
+    the GIL while it factorises, so threads scale across cores. Each chunk
+    solves its own circuit; ``PulsimBackend`` serialises the circuit builds,
+    which go through a converter shared by all chunks.
+    """
+
+    def __init__(
+        self,
+        run_chunk: Callable[[ACSettings], ACResult],
+        max_workers: int | None = None,
+    ) -> None:
+        """Create an executor.
+
+        Args:
+            run_chunk: Callable running one sub-sweep (usually ``backend.run_ac``
+                bound to the circuit data).
+            max_workers: Thread count. Defaults to the CPU count.
+        """
+        self._run_chunk = run_chunk
+        self._max_workers = max_workers
+
+    def run(
+        self,
+        settings: ACSettings,
+        on_chunk: Callable[[ACResult, int, int], None] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> ACResult:
+        """Run the sweep and return the merged result.
+
+        Args:
+            settings: Full-range AC settings.
+            on_chunk: Called after each chunk completes with the merged result
+                so far, the number of completed chunks and the total.
+            is_cancelled: Polled between chunks. Pending chunks are dropped
+                once it returns True.
+
+        Returns:
+            Merged result in ascending frequency order.
+
+        In adaptive mode the refinement counts as one extra step, so every
+        callback made before the final result reports ``completed < total``.
+        """
+        chunks = split_decade_chunks(settings)
+        total = len(chunks) + (1 if settings.adaptive else 0)
+        workers = self._max_workers or os.cpu_count() or 1
+        if not settings.adaptive:
+            # Refinement passes reuse the pool, so only cap plain sweeps.
+            workers = min(workers, total)
+        workers = max(1, workers)
+        results: dict[int, ACResult] = {}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pulsim-ac") as executor:
+            pending: dict[Future, int] = {
+                executor.submit(self._run_chunk, chunk): index
+                for index, chunk in enumerate(chunks)
+            }
+            while pending:
+                if is_cancelled is not None and is_cancelled():
+                    for future in pending:
+                        future.cancel()
+                    break
+                done, _ = wait(pending, timeout=CHUNK_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        results[index] = future.result()
+                    except Exception as exc:
+                        results[index] = ACResult(error_message=str(exc))
+                if done and on_chunk is not None:
+                    on_chunk(self._merge(results), len(results), total)
+
+            merged = self._merge(results)
+            if settings.adaptive and not merged.error_message and len(results) == len(chunks):
+                merged = self._refine(
+                    executor, workers, merged, settings, on_chunk, is_cancelled, total
+                )
+
+        return merged
+
+    def _refine(
+        self,
+        executor: ThreadPoolExecutor,
+        workers: int,
+        merged: ACResult,
+        settings: ACSettings,
+        on_chunk: Callable[[ACResult, int, int], None] | None,
+        is_cancelled: Callable[[], bool] | None,
+        total: int,
+    ) -> ACResult:
+        """Bisect flagged intervals pass by pass until tolerances or budget are met.
+
+        Each pass solves its midpoints as at most ``workers`` batches of
+        explicit frequencies, so the backend builds one circuit per batch
+        rather than one per point.
+        """
+        solves = len(merged.frequencies)
+        while not (is_cancelled is not None and is_cancelled()):
+            budget = settings.max_points - solves
+            if budget <= 0:
+                break
+            targets = sorted(select_refinement_frequencies(merged, settings)[:budget])
+            if not targets:
+                break
+            size = -(-len(targets) // workers)
+            batches = [targets[start : start + size] for start in range(0, len(targets), size)]
+            batch_settings = [
+                replace(
+                    settings,
+                    f_start=batch[0],
+                    f_stop=batch[-1],
+                    points_per_decade=1,
+                    adaptive=False,
+                    output_nodes=list(settings.output_nodes),
+                    frequencies=batch,
+                )
+                for batch in batches
+            ]
+            points: list[ACResult] = []
+            pending = {executor.submit(self._run_chunk, batch) for batch in batch_settings}
+            while pending:
+                if is_cancelled is not None and is_cancelled():
+                    for future in pending:
+                        future.cancel()
+                    return merged
+                done, pending = wait(pending, timeout=CHUNK_POLL_INTERVAL)
+                for future in done:
+                    try:
+                        points.append(future.result())
+                    except Exception as exc:
+                        points.append(ACResult(error_message=str(exc)))
+            refined = merge_ac_chunks([merged, *points])
+            if refined.error_message:
+                break
+            merged = refined
+            solves += len(targets)
+            if on_chunk is not None:
+                on_chunk(merged, total - 1, total)
+        return merged
+
+    @staticmethod
+    def _merge(results: dict[int, ACResult]) -> ACResult:
+        return merge_ac_chunks([results[index] for index in sorted(results)])
+
+
+__all__ = [
+    "ChunkedACExecutor",
+    "merge_ac_chunks",
+    "select_refinement_frequencies",
+    "split_decade_chunks",
+]
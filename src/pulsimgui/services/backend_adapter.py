@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import copy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from importlib import import_module, metadata
 import logging
 from pathlib import Path
@@ -19,8 +19,36 @@ import numpy as np
 if TYPE_CHECKING:  # pragma: no cover - type checking only
     from pulsimgui.services.simulation_service import SimulationSettings
 
+from pulsimgui.services.ac_sweep import merge_ac_chunks
 from pulsimgui.services.circuit_converter import CircuitConversionError, CircuitConverter
-from pulsimgui.services.signal_evaluator import AlgebraicLoopError, SignalEvaluator
+from pulsimgui.services.loss_averaging import (
+    MissionSegment,
+    average_losses,
+    boundaries_from_edges,
+    boundaries_from_frequency,
+    integrate_over_intervals,
+    mission_profile_power,
+)
+from pulsimgui.services.loss_extraction import extract_losses
+from pulsimgui.services.operating_point_cache import (
+    OperatingPoint,
+    OperatingPointCache,
+    circuit_fingerprint,
+)
+from pulsimgui.services.signal_evaluator import (
+    AlgebraicLoopError,
+    SignalEvaluator,
+    restore_evaluator_state,
+    snapshot_evaluator_state,
+)
+from pulsimgui.services.thermal_coupling import (
+    DeviceThermalParameters,
+    device_thermal_parameters,
+    heatsink_network,
+    thermal_device_names,
+    thermal_port_groups,
+)
+from pulsimgui.services.thermal_network import ThermalNetworkBatch
 from pulsimgui.services.backend_types import (
     ACResult,
     ACSettings,
@@ -28,12 +56,15 @@ from pulsimgui.services.backend_types import (
     ConvergenceInfo,
     DCResult,
     DCSettings,
+    DCSweepResult,
+    DCSweepSettings,
     IterationRecord,
     MIN_BACKEND_API,
     ProblematicVariable,
     ThermalDeviceResult,
     ThermalResult,
     ThermalSettings,
+    TransientCheckpoint,
     TransientResult,
     TransientSettings,
     FosterStage,
@@ -95,6 +126,8 @@ class BackendRunResult:
     signals: dict[str, list[float]] = field(default_factory=dict)
     statistics: dict[str, Any] = field(default_factory=dict)
     error_message: str = ""
+    final_state: list[float] = field(default_factory=list)
+    checkpoint: TransientCheckpoint | None = None
 
 
 @dataclass
@@ -119,6 +152,29 @@ class _TransientRetryProfile:
     dt_scale: float = 1.0
 
 
+@dataclass
+class _DCSweepCircuit:
+    """Native circuit reused across the points of one DC sweep.
+
+    Attributes:
+        working: Circuit data the swept value is written into.
+        circuit: Last built native circuit, or None before the first build.
+        value: Swept value ``circuit`` currently holds.
+        update: Writes a new swept value into ``circuit`` in place, or None
+            when the native circuit has no parameter setter.
+        seeded: False once ``solve_dc`` has been found to lack the
+            initial-guess overload.
+        labels: Signal names of the circuit, resolved on first use.
+    """
+
+    working: dict
+    circuit: Any = None
+    value: float | None = None
+    update: Callable[[float], None] | None = None
+    seeded: bool = True
+    labels: list[str] | None = None
+
+
 class SimulationBackend(Protocol):
     """Protocol describing the full backend interface used by the GUI.
 
@@ -142,7 +198,10 @@ class SimulationBackend(Protocol):
         circuit_data: dict,
         settings: "SimulationSettings",
         callbacks: BackendCallbacks,
+        *,
+        checkpoint: TransientCheckpoint | None = None,
     ) -> BackendRunResult:
+        """Run transient analysis, optionally resuming from ``checkpoint``."""
         ...
 
     def run_dc(
@@ -153,6 +212,15 @@ class SimulationBackend(Protocol):
         """Run DC operating point analysis."""
         ...
 
+    def run_dc_sweep(
+        self,
+        circuit_data: dict,
+        settings: DCSweepSettings,
+        callbacks: BackendCallbacks | None = None,
+    ) -> DCSweepResult:
+        """Run a DC sweep, solving the operating point at each swept value."""
+        ...
+
     def run_ac(
         self,
         circuit_data: dict,
@@ -192,6 +260,7 @@ class PlaceholderBackend(SimulationBackend):
             capabilities={"transient", "dc", "ac", "thermal"},
             message="Running in demo mode; install pulsim backend to enable real simulations.",
         )
+        self.operating_points = OperatingPointCache()
 
     @property
     def capabilities(self) -> set[str]:
@@ -207,13 +276,20 @@ class PlaceholderBackend(SimulationBackend):
         circuit_data: dict,
         settings: "SimulationSettings",
         callbacks: BackendCallbacks,
+        *,
+        checkpoint: TransientCheckpoint | None = None,
     ) -> BackendRunResult:
         result = BackendRunResult()
 
         callbacks.progress(0, "Initializing simulation...")
-        total_points = max(1, int(settings.output_points))
-        duration = max(settings.t_stop - settings.t_start, 1e-12)
-        dt = duration / total_points
+        t_start = checkpoint.t_end if checkpoint is not None else settings.t_start
+        duration = max(settings.t_stop - t_start, 1e-12)
+        if checkpoint is not None and checkpoint.dt > 0:
+            dt = checkpoint.dt
+            total_points = max(1, int(round(duration / dt)))
+        else:
+            total_points = max(1, int(settings.output_points))
+            dt = duration / total_points
 
         callbacks.progress(5, "Building circuit model...")
         time_axis: list[float] = []
@@ -226,7 +302,7 @@ class PlaceholderBackend(SimulationBackend):
 
             callbacks.wait_if_paused()
 
-            current_time = settings.t_start + index * dt
+            current_time = t_start + index * dt
             time_axis.append(current_time)
 
             sample = self._simulate_step(current_time)
@@ -250,6 +326,12 @@ class PlaceholderBackend(SimulationBackend):
             "time_steps": len(time_axis),
             "signals_count": len(signals),
         }
+        result.checkpoint = TransientCheckpoint(
+            t_end=time_axis[-1],
+            state=[values[-1] for values in signals.values()],
+            signal_names=list(signals.keys()),
+            dt=dt,
+        )
 
         callbacks.progress(100, "Simulation complete")
         return result
@@ -291,6 +373,15 @@ class PlaceholderBackend(SimulationBackend):
             final_residual=1e-12,
             strategy_used="placeholder",
         )
+        self.operating_points.store(
+            OperatingPoint(
+                fingerprint=circuit_fingerprint(circuit_data),
+                strategy=settings.strategy,
+                node_voltages=dict(node_voltages),
+                branch_currents=dict(branch_currents),
+                power_dissipation=dict(power_dissipation),
+            )
+        )
         return DCResult(
             node_voltages=node_voltages,
             branch_currents=branch_currents,
@@ -298,6 +389,23 @@ class PlaceholderBackend(SimulationBackend):
             convergence_info=convergence_info,
         )
 
+    def run_dc_sweep(
+        self,
+        circuit_data: dict,
+        settings: DCSweepSettings,
+        callbacks: BackendCallbacks | None = None,
+    ) -> DCSweepResult:
+        """Generate a synthetic transfer characteristic (soft-limited divider)."""
+        values = settings.generate_values()
+        v_out = 5.0 * np.tanh(0.5 * values / 5.0)
+        return DCSweepResult(
+            parameter=settings.component_name or settings.parameter_name,
+            values=values,
+            signals={"V(in)": values.copy(), "V(out)": v_out, "I(R1)": v_out / 1000.0},
+            converged=np.ones(values.size, dtype=bool),
+            statistics={"points": int(values.size)},
+        )
+
     def run_ac(
         self,
         circuit_data: dict,
@@ -307,13 +415,16 @@ class PlaceholderBackend(SimulationBackend):
         import numpy as np
 
         # Generate frequency points
-        num_decades = max(1, int(math.log10(settings.f_stop / max(settings.f_start, 1))))
-        num_points = num_decades * settings.points_per_decade
-        frequencies = list(np.logspace(
-            math.log10(settings.f_start),
-            math.log10(settings.f_stop),
-            num_points,
-        ))
+        if settings.frequencies:
+            frequencies = [float(f) for f in settings.frequencies]
+        else:
+            num_decades = max(1, int(math.log10(settings.f_stop / max(settings.f_start, 1))))
+            num_points = num_decades * settings.points_per_decade
+            frequencies = list(np.logspace(
+                math.log10(settings.f_start),
+                math.log10(settings.f_stop),
+                num_points,
+            ))
 
         # Generate synthetic Bode plot (simple low-pass filter response)
         fc = 1000.0  # Corner frequency
@@ -439,7 +550,12 @@ class PulsimBackend(SimulationBackend):
         self._converter = CircuitConverter(module)
         self._controllers: dict[int, Any] = {}
         self._lock = threading.Lock()
+        # The converter and the native circuit builders are not documented as
+        # thread-safe; concurrent AC chunks build their circuits one at a time.
+        self._build_lock = threading.Lock()
         self._cached_capabilities: set[str] | None = None
+        # Converged operating points, reused as x0 and for the DC overlay.
+        self.operating_points = OperatingPointCache()
 
     @property
     def capabilities(self) -> set[str]:
@@ -473,34 +589,46 @@ class PulsimBackend(SimulationBackend):
         circuit_data: dict,
         settings: "SimulationSettings",
         callbacks: BackendCallbacks,
+        *,
+        checkpoint: TransientCheckpoint | None = None,
     ) -> BackendRunResult:
         result = BackendRunResult()
 
         callbacks.progress(0.0, "Starting Pulsim simulation...")
 
+        if checkpoint is not None:
+            settings = copy.copy(settings)
+            settings.t_start = float(checkpoint.t_end)
+
         try:
             base_dt = self._compute_time_step(settings)
         except Exception as exc:
             result.error_message = str(exc)
             return result
+        if checkpoint is not None and checkpoint.dt > 0:
+            base_dt = float(checkpoint.dt)
 
         retry_profiles = self._build_transient_retry_profiles(settings)
         retry_errors: list[str] = []
+        fingerprint = circuit_fingerprint(circuit_data)
 
         for retry_index, profile in enumerate(retry_profiles):
             if retry_index > 0:
                 callbacks.progress(2.0, f"Retrying convergence with profile '{profile.name}'...")
 
             try:
-                circuit = self._converter.build(circuit_data)
+                circuit = self._build_circuit(circuit_data)
             except CircuitConversionError as exc:
                 result.error_message = str(exc)
                 return result
 
             # --- Signal-flow evaluator for closed-loop control blocks ---
+            sig_evaluator: SignalEvaluator | None = None
             try:
                 sig_evaluator = SignalEvaluator(circuit_data)
                 sig_evaluator.build()
+                if checkpoint is not None:
+                    restore_evaluator_state(sig_evaluator, checkpoint.evaluator_state)
                 if sig_evaluator.has_signal_blocks():
                     self._attach_signal_evaluator(circuit, sig_evaluator, circuit_data)
             except AlgebraicLoopError as exc:
@@ -521,7 +649,10 @@ class PulsimBackend(SimulationBackend):
             try:
                 newton_opts = self._build_newton_options(attempt_settings, circuit)
                 linear_solver = self._build_linear_solver_config()
-                x0 = self._build_initial_state(circuit, attempt_settings)
+                if checkpoint is not None and checkpoint.state:
+                    x0 = np.asarray(checkpoint.state, dtype=np.float64)
+                else:
+                    x0 = self._build_initial_state(circuit, attempt_settings, fingerprint)
                 attempt_result = self._run_transient_once(
                     circuit,
                     attempt_settings,
@@ -539,6 +670,13 @@ class PulsimBackend(SimulationBackend):
                     attempt_result.statistics["convergence_retry_profile"] = profile.name
                     attempt_result.statistics["convergence_retries"] = retry_index
                     attempt_result.statistics["convergence_retry_errors"] = retry_errors.copy()
+                attempt_result.checkpoint = self._build_checkpoint(
+                    attempt_result, sig_evaluator, dt, profile.name
+                )
+                if checkpoint is None:
+                    self._store_transient_operating_point(
+                        attempt_result, fingerprint, attempt_settings.dc_strategy
+                    )
                 return attempt_result
 
             error_text = attempt_result.error_message
@@ -557,6 +695,69 @@ class PulsimBackend(SimulationBackend):
             result.error_message = retry_errors[-1]
         return result
 
+    def _store_transient_operating_point(
+        self,
+        result: BackendRunResult,
+        fingerprint: str,
+        strategy: str,
+    ) -> None:
+        """Cache the t=0 solution of a transient for the DC overlay and reuse."""
+        if not result.time:
+            return
+        first = {name: values[0] for name, values in result.signals.items() if values}
+        # Signals mirror the state vector only when their counts agree.
+        state = list(first.values()) if len(first) == len(result.final_state) else []
+        self.operating_points.store(
+            OperatingPoint(
+                fingerprint=fingerprint,
+                strategy=strategy,
+                state=[float(value) for value in state],
+                node_voltages={k: float(v) for k, v in first.items() if k.startswith("V(")},
+                branch_currents={k: float(v) for k, v in first.items() if k.startswith("I(")},
+                power_dissipation={k: float(v) for k, v in first.items() if k.startswith("P(")},
+                source="transient",
+            )
+        )
+
+    @staticmethod
+    def _build_checkpoint(
+        result: BackendRunResult,
+        evaluator: SignalEvaluator | None,
+        dt: float,
+        profile_name: str,
+    ) -> TransientCheckpoint | None:
+        """Capture the end-of-run state so the run can later be extended."""
+        if not result.time:
+            return None
+        signal_names = list(result.signals.keys())
+        state = list(result.final_state)
+        if not state:
+            # Paths without raw state access: rebuild from the last samples.
+            state = [values[-1] if values else 0.0 for values in result.signals.values()]
+        step_info: dict[str, Any] = {"retry_profile": profile_name}
+        execution_path = result.statistics.get("execution_path")
+        if execution_path:
+            step_info["execution_path"] = execution_path
+        if len(result.time) > 1:
+            step_info["last_step"] = float(result.time[-1] - result.time[-2])
+        evaluator_state = snapshot_evaluator_state(evaluator) if evaluator is not None else {}
+        restarted = evaluator_state.get("uncaptured") or []
+        if restarted:
+            # Opaque native controllers restart from zero when the run is extended.
+            log.warning(
+                "Controller state not captured for %s; an extended run restarts them",
+                ", ".join(restarted),
+            )
+            step_info["restarted_controllers"] = list(restarted)
+        return TransientCheckpoint(
+            t_end=float(result.time[-1]),
+            state=state,
+            signal_names=signal_names,
+            dt=float(dt),
+            evaluator_state=evaluator_state,
+            step_info=step_info,
+        )
+
     # ------------------------------------------------------------------
     # Signal evaluator helpers
     # ------------------------------------------------------------------
@@ -944,6 +1145,8 @@ class PulsimBackend(SimulationBackend):
             for idx, name in enumerate(signal_names):
                 if idx < len(state):
                     result.signals.setdefault(name, []).append(float(state[idx]))
+        if states:
+            result.final_state = [float(value) for value in states[-1]]
 
         if result.time:
             final_sample = {
@@ -1229,6 +1432,8 @@ class PulsimBackend(SimulationBackend):
             result.time.append(float(t))
             for i, name in enumerate(signal_names):
                 result.signals[name].append(float(state[i]))
+        if len(states):
+            result.final_state = [float(value) for value in states[-1]]
 
         callbacks.progress(95.0, "Finalizing results...")
 
@@ -1378,6 +1583,8 @@ class PulsimBackend(SimulationBackend):
         result.time = time_buffer[:final_index].tolist()
         for i, name in enumerate(signal_names):
             result.signals[name] = states_buffer[:final_index, i].tolist()
+        if final_index > 0:
+            result.final_state = states_buffer[final_index - 1].tolist()
 
         # Send final complete data
         if result.time:
@@ -1437,6 +1644,8 @@ class PulsimBackend(SimulationBackend):
         # Store in result for final return
         result.time = time_array.tolist()
         result.signals = {name: arr.tolist() for name, arr in signal_arrays.items()}
+        if total_points:
+            result.final_state = [float(value) for value in states[-1]]
 
         callbacks.progress(90.0, "Starting animation...")
 
@@ -1456,7 +1665,246 @@ class PulsimBackend(SimulationBackend):
         circuit_data: dict,
         settings: DCSettings,
     ) -> DCResult:
-        """Run DC operating point analysis using PulsimCore solver."""
+        """Run DC operating point analysis using PulsimCore solver.
+
+        A converged solution for the same circuit content and strategy is
+        served from :attr:`operating_points` without solving again.
+        """
+        fingerprint = circuit_fingerprint(circuit_data)
+        cached = self.operating_points.get(fingerprint, settings.strategy)
+        if cached is not None and cached.source == "dc":
+            return DCResult(
+                node_voltages=dict(cached.node_voltages),
+                branch_currents=dict(cached.branch_currents),
+                power_dissipation=dict(cached.power_dissipation),
+                convergence_info=ConvergenceInfo(converged=True, strategy_used="cached"),
+                solution=list(cached.state),
+            )
+
+        result = self._solve_dc(circuit_data, settings)
+        if result.is_valid:
+            self.operating_points.store(
+                OperatingPoint(
+                    fingerprint=fingerprint,
+                    strategy=settings.strategy,
+                    state=list(result.solution),
+                    node_voltages=dict(result.node_voltages),
+                    branch_currents=dict(result.branch_currents),
+                    power_dissipation=dict(result.power_dissipation),
+                )
+            )
+        return result
+
+    def run_dc_sweep(
+        self,
+        circuit_data: dict,
+        settings: DCSweepSettings,
+        callbacks: BackendCallbacks | None = None,
+    ) -> DCSweepResult:
+        """Sweep a source or parameter using natural-parameter continuation.
+
+        The first point gets a full operating-point solve. Each later point
+        runs Newton seeded with the previous converged solution; on failure
+        the step towards it is halved up to ``max_halvings`` times before
+        falling back to a full solve. Points that still fail hold ``nan``.
+        """
+        values = settings.generate_values()
+        result = DCSweepResult(
+            parameter=settings.component_name or settings.parameter_name,
+            values=values,
+            converged=np.zeros(values.size, dtype=bool),
+        )
+        if not self.has_capability("dc"):
+            result.error_message = "DC analysis not supported by this backend version"
+            return result
+
+        stats = {
+            "newton_solves": 0,
+            "full_solves": 0,
+            "step_halvings": 0,
+            "failed_points": 0,
+            "circuit_builds": 0,
+        }
+        result.statistics = stats
+        sweep = _DCSweepCircuit(working=copy.deepcopy(circuit_data))
+        newton_opts = self._build_dc_options(settings.dc)
+        x_prev: np.ndarray | None = None
+        lam_prev: float | None = None
+
+        for index, target in enumerate(values):
+            if callbacks is not None and callbacks.check_cancelled():
+                result.error_message = "DC sweep cancelled"
+                break
+            try:
+                x_new = self._continue_dc(
+                    sweep, settings, lam_prev, float(target), x_prev, newton_opts, stats
+                )
+            except (CircuitConversionError, ValueError) as exc:
+                result.error_message = str(exc)
+                break
+            if x_new is None:
+                stats["failed_points"] += 1
+                continue
+
+            x_prev = x_new
+            lam_prev = float(target)
+            result.converged[index] = True
+            if sweep.labels is None:
+                sweep.labels = self._resolve_signal_names(sweep.circuit)
+            for position, name in enumerate(sweep.labels[: x_prev.size]):
+                column = result.signals.get(name)
+                if column is None:
+                    column = result.signals[name] = np.full(values.size, np.nan)
+                column[index] = x_prev[position]
+            if callbacks is not None:
+                callbacks.progress(
+                    100.0 * (index + 1) / values.size,
+                    f"DC sweep {index + 1}/{values.size}",
+                )
+
+        if not result.error_message and not np.any(result.converged):
+            result.error_message = "DC sweep failed to converge at every point"
+        return result
+
+    def _continue_dc(
+        self,
+        sweep: _DCSweepCircuit,
+        settings: DCSweepSettings,
+        lam_from: float | None,
+        lam_to: float,
+        x_from: np.ndarray | None,
+        newton_opts: Any,
+        stats: dict[str, int],
+    ) -> np.ndarray | None:
+        """Advance the continuation from ``lam_from`` to ``lam_to``.
+
+        Returns the converged solution at ``lam_to``, leaving ``sweep.circuit``
+        set to it, or None when neither continuation nor a full solve
+        converges.
+        """
+        if (
+            sweep.seeded
+            and x_from is not None
+            and lam_from is not None
+            and hasattr(self._module, "solve_dc")
+        ):
+            lam, x = lam_from, x_from
+            step = lam_to - lam_from
+            halvings = 0
+            while halvings <= settings.max_halvings:
+                remaining = lam_to - lam
+                trial = lam_to if abs(step) >= abs(remaining) else lam + step
+                circuit = self._dc_sweep_circuit(sweep, settings, trial, stats)
+                stats["newton_solves"] += 1
+                try:
+                    x_new = self._solve_dc_seeded(circuit, x, newton_opts)
+                except TypeError:
+                    # Variant without an initial-guess overload: solve every
+                    # remaining point from scratch.
+                    sweep.seeded = False
+                    break
+                if x_new is None:
+                    step *= 0.5
+                    halvings += 1
+                    stats["step_halvings"] += 1
+                    continue
+                lam, x = trial, x_new
+                if trial == lam_to:
+                    return x
+                step *= 2.0  # Recover the step size after a successful sub-step
+
+        circuit = self._dc_sweep_circuit(sweep, settings, lam_to, stats)
+        stats["full_solves"] += 1
+        dc_result = self._solve_dc_circuit(circuit, settings.dc)
+        if not dc_result.is_valid or not dc_result.solution:
+            return None
+        return np.asarray(dc_result.solution, dtype=np.float64)
+
+    def _dc_sweep_circuit(
+        self,
+        sweep: _DCSweepCircuit,
+        settings: DCSweepSettings,
+        value: float,
+        stats: dict[str, int],
+    ) -> Any:
+        """Return the sweep's native circuit with the swept parameter at ``value``.
+
+        The circuit is updated in place when it exposes a parameter setter and
+        rebuilt from the circuit data otherwise.
+        """
+        if sweep.circuit is not None and sweep.value == value:
+            return sweep.circuit
+        if sweep.circuit is not None and sweep.update is not None:
+            sweep.update(value)
+        else:
+            settings.apply_value(sweep.working, value)
+            sweep.circuit = self._build_circuit(sweep.working)
+            stats["circuit_builds"] += 1
+            sweep.update = self._native_parameter_setter(sweep, settings)
+        sweep.value = value
+        return sweep.circuit
+
+    def _native_parameter_setter(
+        self, sweep: _DCSweepCircuit, settings: DCSweepSettings
+    ) -> Callable[[float], None] | None:
+        """Return a callable writing the swept value into the built circuit."""
+        circuit = sweep.circuit
+        component = next(
+            (
+                item
+                for item in sweep.working.get("components", [])
+                if str(item.get("id")) == settings.component_id
+            ),
+            None,
+        )
+        if component is None:
+            return None
+        name = str(component.get("name") or settings.component_name or "").strip()
+        if not name:
+            return None
+        comp_type = str(component.get("type", "")).upper()
+
+        def _write_back(value: float) -> None:
+            # Keep the circuit data in step for a later rebuild.
+            settings.apply_value(sweep.working, value)
+
+        if settings.parameter_name == "value" and comp_type in ("VOLTAGE_SOURCE", "CURRENT_SOURCE"):
+            setter = getattr(circuit, "set_source_value", None)
+            if callable(setter):
+                def _update_source(value: float) -> None:
+                    setter(name, float(value))
+                    _write_back(value)
+
+                return _update_source
+
+        setter = getattr(circuit, "set_parameter", None)
+        if callable(setter):
+            parameter = settings.parameter_name
+
+            def _update_parameter(value: float) -> None:
+                setter(name, parameter, float(value))
+                _write_back(value)
+
+            return _update_parameter
+        return None
+
+    def _solve_dc_seeded(self, circuit: Any, x0: np.ndarray, newton_opts: Any) -> np.ndarray | None:
+        """Run Newton from ``x0``; return the solution when it converges.
+
+        Raises:
+            TypeError: When ``solve_dc`` has no initial-guess overload.
+        """
+        size = getattr(circuit, "system_size", None)
+        if callable(size) and int(size()) != x0.size:
+            return None
+        native_result = self._module.solve_dc(circuit, x0, newton_opts)
+        converted = self._convert_dc_result(native_result, circuit)
+        if not converted.convergence_info.converged or not converted.solution:
+            return None
+        return np.asarray(converted.solution, dtype=np.float64)
+
+    def _solve_dc(self, circuit_data: dict, settings: DCSettings) -> DCResult:
+        """Solve the DC operating point across backend API variants."""
         if not self.has_capability("dc"):
             return DCResult(
                 error_message="DC analysis not supported by this backend version",
@@ -1464,13 +1912,16 @@ class PulsimBackend(SimulationBackend):
             )
 
         try:
-            circuit = self._converter.build(circuit_data)
+            circuit = self._build_circuit(circuit_data)
         except CircuitConversionError as exc:
             return DCResult(
                 error_message=str(exc),
                 convergence_info=ConvergenceInfo(converged=False, failure_reason=str(exc)),
             )
+        return self._solve_dc_circuit(circuit, settings)
 
+    def _solve_dc_circuit(self, circuit: Any, settings: DCSettings) -> DCResult:
+        """Solve the DC operating point of an already built circuit."""
         try:
             # Try top-level dc_operating_point first (preferred)
             if hasattr(self._module, "dc_operating_point"):
@@ -1696,6 +2147,7 @@ class PulsimBackend(SimulationBackend):
             power_dissipation=power_dissipation,
             convergence_info=convergence_info,
             error_message=error_message,
+            solution=[float(value) for value in solution] if solution is not None else [],
         )
 
     def _convert_newton_result(self, native_result: Any, circuit: Any) -> DCResult:
@@ -1758,6 +2210,7 @@ class PulsimBackend(SimulationBackend):
             power_dissipation=power_dissipation,
             convergence_info=convergence_info,
             error_message=error_message,
+            solution=[float(value) for value in solution] if solution is not None else [],
         )
 
     def _build_convergence_info(self, native_result: Any, circuit: Any = None) -> ConvergenceInfo:
@@ -1854,11 +2307,14 @@ class PulsimBackend(SimulationBackend):
             )
 
         try:
-            circuit = self._converter.build(circuit_data)
+            circuit = self._build_circuit(circuit_data)
         except CircuitConversionError as exc:
             return ACResult(error_message=str(exc))
 
         try:
+            if settings.frequencies:
+                return self._run_ac_points(circuit, settings)
+
             # Build AC options
             ac_opts = self._build_ac_options(settings)
 
@@ -1871,6 +2327,31 @@ class PulsimBackend(SimulationBackend):
         except Exception as exc:
             return ACResult(error_message=str(exc))
 
+    def _run_ac_points(self, circuit: Any, settings: ACSettings) -> ACResult:
+        """Solve ``settings.frequencies`` on one already built circuit.
+
+        Bindings whose options take a frequency list solve every point in one
+        call; older ones get a single-point sweep per frequency, still without
+        rebuilding the circuit.
+        """
+        ac_opts = self._build_ac_options(settings)
+        for attr in ("frequencies", "frequency_list", "frequency_points"):
+            if hasattr(ac_opts, attr):
+                setattr(ac_opts, attr, list(settings.frequencies))
+                native_result = self._run_ac_native(circuit, ac_opts)
+                if native_result is None:
+                    return ACResult(error_message="No AC analysis API available")
+                return self._convert_ac_result(native_result, settings)
+
+        points: list[ACResult] = []
+        for frequency in settings.frequencies:
+            point = replace(settings, f_start=frequency, f_stop=frequency, frequencies=[])
+            native_result = self._run_ac_native(circuit, self._build_ac_options(point))
+            if native_result is None:
+                return ACResult(error_message="No AC analysis API available")
+            points.append(self._convert_ac_result(native_result, point))
+        return merge_ac_chunks(points)
+
     def _run_ac_native(self, circuit: Any, ac_opts: Any) -> Any | None:
         """Run AC analysis across backend API variants."""
         if hasattr(self._module, "run_ac"):
@@ -2009,7 +2490,7 @@ class PulsimBackend(SimulationBackend):
             )
 
         try:
-            circuit = self._converter.build(circuit_data)
+            circuit = self._build_circuit(circuit_data)
         except CircuitConversionError as exc:
             return ThermalResult(error_message=str(exc), is_synthetic=True)
 
@@ -2084,131 +2565,279 @@ class PulsimBackend(SimulationBackend):
         electrical_result: TransientResult,
         settings: ThermalSettings,
     ) -> ThermalResult | None:
-        """Run thermal using Foster-network API with per-device power waveforms."""
-        simulator_cls = getattr(self._module, "ThermalSimulator", None)
-        create_simple_model = getattr(self._module, "create_simple_thermal_model", None)
-        if simulator_cls is None or not callable(create_simple_model):
-            return None
-        create_network_model = create_simple_model
-        if settings.thermal_network == "cauer":
-            for model_name in ("create_simple_cauer_model", "create_cauer_thermal_model"):
-                candidate = getattr(self._module, model_name, None)
-                if callable(candidate):
-                    create_network_model = candidate
-                    break
+        """Run thermal from per-device power waveforms on the NumPy engine.
+
+        Device power and its conduction/switching split come from the
+        terminal waveforms (see :mod:`loss_extraction`), falling back to a
+        published power signal when the terminals cannot be resolved.
 
-        times = [float(t) for t in (electrical_result.time or [])]
-        if len(times) < 2:
+        Stage parameters come from the backend model factories when present;
+        the networks of every device are then integrated together by
+        :class:`ThermalNetworkBatch` instead of one native simulator per device.
+        """
+        times = np.asarray(electrical_result.time or [], dtype=np.float64)
+        if times.size < 2:
             return None
 
         device_names = self._extract_thermal_device_names(circuit_data)
+        # Defaults are keyed by the position in the full device list, so a
+        # subset run reproduces the same rows as a run over every device.
+        positions = list(range(len(device_names)))
+        if settings.devices is not None:
+            wanted = set(settings.devices)
+            positions = [i for i, name in enumerate(device_names) if name in wanted]
+            device_names = [device_names[i] for i in positions]
         if not device_names:
             return None
 
-        devices: list[ThermalDeviceResult] = []
+        if settings.losses is not None:
+            extracted = settings.losses
+        else:
+            extracted = extract_losses(circuit_data, times, electrical_result.signals or {})
+        # Without terminal waveforms the power cannot be split by kind and
+        # is all counted as conduction.
+        components = {
+            "conduction": np.empty((len(device_names), times.size)),
+            "switching": np.zeros((len(device_names), times.size)),
+        }
+        conduction = components["conduction"]
         used_real_power = False
-
         for index, device_name in enumerate(device_names):
-            measured_power = self._extract_power_trace(device_name, electrical_result.signals, len(times))
-            if measured_power:
+            device_losses = extracted.get(device_name)
+            if device_losses is not None:
+                used_real_power = True
+                split = device_losses.components(
+                    settings.include_conduction_losses, settings.include_switching_losses
+                )
+                for kind, values in split.items():
+                    components[kind][index] = values
+                continue
+            measured_power = self._extract_power_trace(
+                device_name, electrical_result.signals, times.size
+            )
+            if measured_power.size:
                 used_real_power = True
-                powers = measured_power
+                conduction[index, : measured_power.size] = measured_power
+                conduction[index, measured_power.size :] = measured_power[-1]
             else:
-                fallback_power = 2.0 + (0.4 * index)
-                powers = [fallback_power] * len(times)
+                conduction[index] = 2.0 + (0.4 * positions[index])
+        powers = components["conduction"] + components["switching"]
 
-            if len(powers) < len(times):
-                powers = powers + [powers[-1] if powers else 0.0] * (len(times) - len(powers))
-            elif len(powers) > len(times):
-                powers = powers[: len(times)]
+        parameters = device_thermal_parameters(circuit_data, device_names)
+        ladders = [
+            self._thermal_ladder(device_name, parameters[device_name], settings)
+            for device_name in device_names
+        ]
+        if settings.thermal_network == "cauer" and all(kind == "cauer" for kind, _ in ladders):
+            batch = ThermalNetworkBatch.from_cauer(device_names, [stages for _, stages in ladders])
+        else:
+            batch = ThermalNetworkBatch.from_foster(device_names, [stages for _, stages in ladders])
+        avg_powers = np.abs(powers).mean(axis=1)
+        thermal_time, thermal_power = self._thermal_drive(
+            circuit_data, device_names, times, components, settings
+        )
+        temperatures = batch.simulate(thermal_time, thermal_power, settings.ambient_temperature)
+        self._couple_shared_heatsinks(
+            circuit_data,
+            device_names,
+            parameters,
+            thermal_time,
+            thermal_power,
+            temperatures,
+            settings,
+        )
 
-            rth = 0.8 + (0.15 * index)
-            tau = 0.02 + (0.004 * index)
-            try:
-                network = create_network_model(rth, tau, device_name)
-            except TypeError:
-                network = create_simple_model(rth, tau, device_name)
-            thermal_sim = simulator_cls(network, settings.ambient_temperature)
-            if hasattr(thermal_sim, "set_ambient"):
-                thermal_sim.set_ambient(settings.ambient_temperature)
-            elif hasattr(thermal_sim, "set_ambient_temperature"):
-                thermal_sim.set_ambient_temperature(settings.ambient_temperature)
-
-            if not hasattr(thermal_sim, "simulate"):
-                return None
-
-            temps = [float(value) for value in thermal_sim.simulate(times, powers)]
-            avg_power = sum(float(abs(value)) for value in powers) / max(1, len(powers))
-
-            conduction = 0.0
-            switching_on = 0.0
-            if settings.include_conduction_losses and settings.include_switching_losses:
-                conduction = avg_power * 0.7
-                switching_on = avg_power * 0.3
-            elif settings.include_conduction_losses:
-                conduction = avg_power
-            elif settings.include_switching_losses:
-                switching_on = avg_power
+        devices: list[ThermalDeviceResult] = []
+        for index, device_name in enumerate(device_names):
+            temps = temperatures[index]
+            device_losses = extracted.get(device_name)
+            if device_losses is not None:
+                losses = device_losses.breakdown(
+                    settings.include_conduction_losses, settings.include_switching_losses
+                )
+            else:
+                # Without terminal waveforms the power cannot be split by kind.
+                losses = LossBreakdown(conduction=float(avg_powers[index]))
 
             devices.append(ThermalDeviceResult(
                 name=device_name,
-                junction_temperature=temps,
-                peak_temperature=max(temps) if temps else settings.ambient_temperature,
-                steady_state_temperature=temps[-1] if temps else settings.ambient_temperature,
-                losses=LossBreakdown(
-                    conduction=conduction,
-                    switching_on=switching_on,
-                ),
-                foster_stages=self._extract_foster_stages(network),
+                junction_temperature=temps.tolist(),
+                peak_temperature=float(temps.max()),
+                steady_state_temperature=float(temps[-1]),
+                losses=losses,
+                foster_stages=[
+                    FosterStage(resistance=r, capacitance=c)
+                    for r, c in batch.foster_stages(index)
+                ],
             ))
 
-        if not devices:
-            return None
-
         return ThermalResult(
-            time=times,
+            time=thermal_time.tolist(),
             devices=devices,
             ambient_temperature=settings.ambient_temperature,
             is_synthetic=not used_real_power,
         )
 
-    def _extract_thermal_device_names(self, circuit_data: dict) -> list[str]:
+    def _thermal_drive(
+        self,
+        circuit_data: dict,
+        device_names: list[str],
+        times: np.ndarray,
+        components: dict[str, np.ndarray],
+        settings: ThermalSettings,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the ``(time, power)`` series that drives the thermal network.
+
+        ``components`` holds each device's loss waveforms by kind
+        (``conduction`` and ``switching``), each ``(n_devices, n)``. With
+        ``cycle_average`` every component is averaged over each switching
+        period, so the network steps once per period. A mission profile is
+        then appended using the steady-state loss of the run.
+        """
+        powers = sum(components.values())
+        thermal_time, thermal_power = times, powers
+        steady_loss = None
+        if settings.cycle_average:
+            frequency = settings.switching_frequency or self._switching_frequency(circuit_data)
+            if frequency > 0.0:
+                boundaries = boundaries_from_frequency(times, frequency)
+            else:
+                # The device with the strongest switching losses marks the
+                # periods, falling back to the most strongly varying total.
+                switching = components.get("switching")
+                if switching is not None and np.any(switching):
+                    edges = switching
+                else:
+                    edges = powers
+                busiest = int(np.argmax(np.ptp(edges, axis=1)))
+                boundaries = boundaries_from_edges(times, edges[busiest])
+            if boundaries.size:
+                # Partial periods at either end keep the run's full span.
+                boundaries = np.unique(np.concatenate([times[:1], boundaries, times[-1:]]))
+                averaged = average_losses(times, components, boundaries, device_names)
+                thermal_time, thermal_power = boundaries, averaged.thermal_power()
+                steady_loss = sum(averaged.steady_state().values())
+
+        segments = [
+            MissionSegment(float(duration), float(load))
+            for duration, load in settings.mission_profile
+        ]
+        if segments and settings.mission_repeats > 0:
+            if steady_loss is None:
+                span = float(times[-1] - times[0]) or 1.0
+                steady_loss = integrate_over_intervals(times, powers, times[[0, -1]])[:, 0] / span
+            mission_time, mission_power = mission_profile_power(
+                steady_loss,
+                segments,
+                settings.mission_repeats,
+                start_time=float(thermal_time[-1]),
+            )
+            thermal_time = np.concatenate([thermal_time, mission_time[1:]])
+            thermal_power = np.concatenate([thermal_power, mission_power[:, 1:]], axis=1)
+        return thermal_time, thermal_power
+
+    @staticmethod
+    def _couple_shared_heatsinks(
+        circuit_data: dict,
+        device_names: list[str],
+        parameters: dict[str, DeviceThermalParameters],
+        thermal_time: np.ndarray,
+        thermal_power: np.ndarray,
+        temperatures: np.ndarray,
+        settings: ThermalSettings,
+    ) -> None:
+        """Lift junction temperatures by the case rise of shared heatsinks.
+
+        Devices whose thermal ports share a net get their case temperature
+        from one coupled case/heatsink network instead of ambient. Their own
+        network then acts as the junction-to-case impedance.
+
+        Case values come from each device's parameters. The heatsink takes the
+        first ``rth_sa``/``cth_sink`` set on one of its devices. Anything left
+        unset falls back to ``settings``.
+        """
+        def _first(values: list[float | None], default: float) -> float:
+            return next((value for value in values if value is not None), default)
+
+        for group in thermal_port_groups(circuit_data, device_names):
+            rows = [device_names.index(name) for name in group]
+            members = [parameters[name] for name in group]
+            network = heatsink_network(
+                group,
+                [
+                    _first([p.case_to_sink_resistance], settings.case_to_sink_resistance)
+                    for p in members
+                ],
+                [_first([p.case_capacitance], settings.case_capacitance) for p in members],
+                _first([p.heatsink_resistance for p in members], settings.heatsink_resistance),
+                _first([p.heatsink_capacitance for p in members], settings.heatsink_capacitance),
+            )
+            cases = network.simulate(thermal_time, thermal_power[rows], 0.0)
+            temperatures[rows] += cases[: len(rows)]
+
+    @staticmethod
+    def _switching_frequency(circuit_data: dict) -> float:
+        """Return the highest PWM generator frequency in the circuit, or 0."""
         components = circuit_data.get("components", []) if isinstance(circuit_data, dict) else []
-        thermal_types = {
-            "DIODE",
-            "ZENER_DIODE",
-            "LED",
-            "MOSFET_N",
-            "MOSFET_P",
-            "IGBT",
-            "BJT_NPN",
-            "BJT_PNP",
-            "THYRISTOR",
-            "TRIAC",
-            "SWITCH",
-            "TRANSFORMER",
-        }
-        names: list[str] = []
-        seen: set[str] = set()
+        frequency = 0.0
         for component in components:
-            comp_type = str(component.get("type", "")).strip().upper()
-            if comp_type not in thermal_types:
+            if str(component.get("type", "")).strip().upper() != "PWM_GENERATOR":
                 continue
-            name = str(component.get("name") or component.get("id") or "").strip()
-            if not name or name in seen:
+            params = component.get("parameters") or {}
+            try:
+                frequency = max(frequency, float(params.get("frequency", 10000.0)))
+            except (TypeError, ValueError):
                 continue
-            seen.add(name)
-            names.append(name)
-        return names
+        return frequency
+
+    def _thermal_ladder(
+        self,
+        device_name: str,
+        parameters: DeviceThermalParameters,
+        settings: ThermalSettings,
+    ) -> tuple[str, list[tuple[float, float]]]:
+        """Return ``(kind, [(R, C), ...])`` for a device's thermal network.
+
+        The junction-to-case resistance and time constant come from the
+        device's ``rth_jc`` and ``tau_jc`` parameters. ``kind`` is
+        ``"cauer"`` only when the backend provides a Cauer model factory and
+        Cauer was requested; otherwise the stages are Foster.
+        """
+        rth = parameters.junction_resistance
+        tau = parameters.junction_tau
+        if settings.thermal_network == "cauer":
+            for model_name in ("create_simple_cauer_model", "create_cauer_thermal_model"):
+                factory = getattr(self._module, model_name, None)
+                if not callable(factory):
+                    continue
+                try:
+                    stages = self._extract_foster_stages(factory(rth, tau, device_name))
+                except Exception:
+                    continue
+                if stages:
+                    return "cauer", [(stage.resistance, stage.capacitance) for stage in stages]
+
+        factory = getattr(self._module, "create_simple_thermal_model", None)
+        if callable(factory):
+            try:
+                stages = self._extract_foster_stages(factory(rth, tau, device_name))
+            except Exception:
+                stages = []
+            if stages:
+                return "foster", [(stage.resistance, stage.capacitance) for stage in stages]
+        return "foster", [(rth, tau / rth)]
+
+    def _extract_thermal_device_names(self, circuit_data: dict) -> list[str]:
+        return thermal_device_names(circuit_data)
 
     def _extract_power_trace(
         self,
         device_name: str,
         signals: dict[str, list[float]],
         expected_points: int,
-    ) -> list[float]:
+    ) -> np.ndarray:
         if not signals:
-            return []
+            return np.empty(0)
 
         key_candidates = (
             f"P({device_name})",
@@ -2218,21 +2847,22 @@ class PulsimBackend(SimulationBackend):
         )
         for key in key_candidates:
             series = signals.get(key)
-            if series:
-                return [float(value) for value in series[:expected_points]]
+            if series is not None and len(series):
+                return np.asarray(series[:expected_points], dtype=np.float64)
 
         device_lower = device_name.lower()
         for key, series in signals.items():
-            if not series:
+            if series is None or not len(series):
                 continue
             key_lower = str(key).lower()
             if key_lower.startswith("p(") and device_lower in key_lower:
-                return [float(value) for value in series[:expected_points]]
+                return np.asarray(series[:expected_points], dtype=np.float64)
 
-        total_series = signals.get("P(total)") or signals.get("p(total)")
-        if total_series:
-            return [float(value) for value in total_series[:expected_points]]
-        return []
+        for key in ("P(total)", "p(total)"):
+            series = signals.get(key)
+            if series is not None and len(series):
+                return np.asarray(series[:expected_points], dtype=np.float64)
+        return np.empty(0)
 
     def _extract_foster_stages(self, network: Any) -> list[FosterStage]:
         stages_attr = getattr(network, "stages", None)
@@ -2269,8 +2899,11 @@ class PulsimBackend(SimulationBackend):
         time = list(getattr(native_result, "time", []))
         devices: list[ThermalDeviceResult] = []
 
+        wanted = None if settings.devices is None else set(settings.devices)
         if hasattr(native_result, "devices"):
             for dev in native_result.devices:
+                if wanted is not None and getattr(dev, "name", None) not in wanted:
+                    continue
                 # Extract Foster stages
                 foster_stages: list[FosterStage] = []
                 if hasattr(dev, "foster_network"):
@@ -2319,6 +2952,11 @@ class PulsimBackend(SimulationBackend):
         if controller:
             controller.request_resume()
 
+    def _build_circuit(self, circuit_data: dict) -> Any:
+        """Build a native circuit; calls from concurrent workers are serialised."""
+        with self._build_lock:
+            return self._converter.build(circuit_data)
+
     def request_stop(self, run_id: int | None = None) -> None:
         controller = self._controller_for(run_id)
         if controller:
@@ -2506,8 +3144,22 @@ class PulsimBackend(SimulationBackend):
             config.auto_select = True
         return config
 
-    def _build_initial_state(self, circuit: Any, settings: "SimulationSettings") -> Any:
-        """Compute initial state, preferring DC operating point when available."""
+    def _build_initial_state(
+        self,
+        circuit: Any,
+        settings: "SimulationSettings",
+        fingerprint: str | None = None,
+    ) -> Any:
+        """Compute initial state, preferring DC operating point when available.
+
+        With a circuit ``fingerprint`` a cached operating point is reused, and a
+        freshly converged one is cached for later runs and retry profiles.
+        """
+        if fingerprint is not None:
+            cached = self.operating_points.lookup(fingerprint, settings.dc_strategy)
+            if cached is not None and cached.state:
+                return np.asarray(cached.state, dtype=np.float64)
+
         if hasattr(self._module, "dc_operating_point"):
             try:
                 config = self._module.DCConvergenceConfig()
@@ -2529,6 +3181,16 @@ class PulsimBackend(SimulationBackend):
                 if success:
                     newton_result = getattr(dc_result, "newton_result", None)
                     if newton_result is not None:
+                        if fingerprint is not None:
+                            converted = self._convert_dc_analysis_result(dc_result, circuit)
+                            self.operating_points.store(
+                                OperatingPoint(
+                                    fingerprint=fingerprint,
+                                    strategy=settings.dc_strategy,
+                                    state=list(converted.solution),
+                                    node_voltages=converted.node_voltages,
+                                )
+                            )
                         return newton_result.solution
             except Exception:
                 pass
@@ -8,7 +8,12 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for typing
+    from pulsimgui.services.loss_extraction import DeviceLosses
 
 
 # =============================================================================
@@ -231,6 +236,32 @@ class TransientResult:
         return not self.error_message and len(self.time) > 0
 
 
+@dataclass
+class TransientCheckpoint:
+    """Solver state captured at the end of a transient run.
+
+    A checkpoint lets a later run continue from ``t_end`` instead of
+    re-simulating from ``t_start``.
+
+    Attributes:
+        t_end: Simulation time of the captured state (s).
+        state: Final solver state vector (node voltages, branch currents).
+        signal_names: Signal labels aligned with the leading state entries.
+        dt: Time step used by the run that produced the checkpoint (s).
+        evaluator_state: Snapshot of control-block state (integrators, PI).
+        step_info: Extra solver step information reported by the backend.
+            ``"restarted_controllers"`` lists native controllers whose state
+            could not be captured; an extended run restarts them from zero.
+    """
+
+    t_end: float
+    state: list[float] = field(default_factory=list)
+    signal_names: list[str] = field(default_factory=list)
+    dt: float = 0.0
+    evaluator_state: dict[str, Any] = field(default_factory=dict)
+    step_info: dict[str, Any] = field(default_factory=dict)
+
+
 @dataclass
 class DCResult:
     """Backend-agnostic DC operating point result.
@@ -241,6 +272,7 @@ class DCResult:
         power_dissipation: Dictionary mapping device names to power (W).
         convergence_info: Convergence diagnostics.
         error_message: Error message if analysis failed.
+        solution: Raw backend state vector, when the backend exposes it.
     """
 
     node_voltages: dict[str, float] = field(default_factory=dict)
@@ -250,6 +282,7 @@ class DCResult:
         default_factory=lambda: ConvergenceInfo(converged=False)
     )
     error_message: str = ""
+    solution: list[float] = field(default_factory=list)
 
     @property
     def is_valid(self) -> bool:
@@ -279,6 +312,41 @@ class ACResult:
         return not self.error_message and len(self.frequencies) > 0
 
 
+@dataclass
+class DCSweepResult:
+    """DC transfer characteristic as column arrays.
+
+    Attributes:
+        parameter: Label of the swept quantity.
+        values: Swept values, shape ``(n,)``.
+        signals: Solution columns keyed by signal name, each shape ``(n,)``.
+            Points that failed to converge hold ``nan``.
+        converged: Per-point convergence flags, shape ``(n,)``.
+        statistics: Solver counters (Newton solves, step halvings, ...).
+        error_message: Error message if the sweep failed or was cancelled.
+    """
+
+    parameter: str = ""
+    values: np.ndarray = field(default_factory=lambda: np.empty(0))
+    signals: dict[str, np.ndarray] = field(default_factory=dict)
+    converged: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    statistics: dict[str, Any] = field(default_factory=dict)
+    error_message: str = ""
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if at least one point converged and no error occurred."""
+        return not self.error_message and bool(np.any(self.converged))
+
+    def xy(self, signal: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return converged ``(values, signal)`` pairs for XY plotting."""
+        column = self.signals.get(signal)
+        if column is None:
+            return np.empty(0), np.empty(0)
+        mask = self.converged & np.isfinite(column)
+        return self.values[mask], column[mask]
+
+
 @dataclass
 class FosterStage:
     """Single stage of a Foster thermal network.
@@ -471,6 +539,18 @@ class ACSettings:
         points_per_decade: Number of frequency points per decade.
         input_source: Name of AC input source.
         output_nodes: List of output node names to analyze.
+        max_workers: Threads used for decade-chunked sweeps (0 = CPU count).
+        adaptive: Treat ``points_per_decade`` as a coarse grid and bisect
+            intervals with high curvature or 0 dB / -180° crossings.
+        magnitude_tolerance_db: Adaptive limit on the second difference of
+            magnitude across neighbouring points (dB).
+        phase_tolerance_deg: Adaptive limit on the second difference of phase
+            across neighbouring points (degrees).
+        crossing_tolerance: Relative frequency width to which 0 dB and -180°
+            crossings are localised.
+        max_points: Upper bound on the total number of adaptive solves.
+        frequencies: Explicit frequency points to solve instead of the
+            ``f_start``..``f_stop`` grid (used for refinement batches).
     """
 
     f_start: float = 1.0
@@ -478,6 +558,58 @@ class ACSettings:
     points_per_decade: int = 10
     input_source: str = ""
     output_nodes: list[str] = field(default_factory=list)
+    max_workers: int = 0
+    adaptive: bool = False
+    magnitude_tolerance_db: float = 0.5
+    phase_tolerance_deg: float = 2.0
+    crossing_tolerance: float = 1e-4
+    max_points: int = 2000
+    frequencies: list[float] = field(default_factory=list)
+
+
+@dataclass
+class DCSweepSettings:
+    """Settings for a DC sweep (transfer characteristic).
+
+    Attributes:
+        component_id: Component whose value is stepped.
+        start_value: First swept value.
+        stop_value: Last swept value.
+        points: Number of sweep points.
+        parameter_name: Parameter to step. ``"value"`` on a voltage or current
+            source steps its DC value.
+        component_name: Display name of the swept component.
+        dc: Settings for the initial and fallback full operating-point solves.
+        max_halvings: Continuation step halvings tried before falling back to
+            a full operating-point solve.
+    """
+
+    component_id: str
+    start_value: float
+    stop_value: float
+    points: int = 101
+    parameter_name: str = "value"
+    component_name: str = ""
+    dc: DCSettings = field(default_factory=DCSettings)
+    max_halvings: int = 6
+
+    def generate_values(self) -> np.ndarray:
+        """Return the swept values."""
+        return np.linspace(self.start_value, self.stop_value, max(1, int(self.points)))
+
+    def apply_value(self, circuit_data: dict, value: float) -> None:
+        """Set the swept parameter of ``circuit_data`` to ``value`` in place."""
+        for component in circuit_data.get("components", []):
+            if str(component.get("id")) != self.component_id:
+                continue
+            params = component.setdefault("parameters", {})
+            comp_type = str(component.get("type", "")).upper()
+            if self.parameter_name == "value" and comp_type in ("VOLTAGE_SOURCE", "CURRENT_SOURCE"):
+                params["waveform"] = {"type": "dc", "value": float(value)}
+            else:
+                params[self.parameter_name] = float(value)
+            return
+        raise ValueError("Target component not found in circuit data")
 
 
 @dataclass
@@ -489,12 +621,43 @@ class ThermalSettings:
         include_switching_losses: Include switching losses in calculation.
         include_conduction_losses: Include conduction losses in calculation.
         thermal_network: Thermal network type ("foster" or "cauer").
+        cycle_average: Drive the thermal network with per-switching-period
+            average losses instead of every electrical sample.
+        switching_frequency: Averaging frequency (Hz). 0 uses the circuit's
+            PWM generator frequency, falling back to edges detected in the
+            power waveforms.
+        mission_profile: ``(duration, load)`` segments appended after the
+            simulated run, each scaling the steady-state loss by ``load``.
+        mission_repeats: Number of times the mission profile is repeated.
+        case_to_sink_resistance: Case-to-heatsink resistance (K/W) of devices
+            whose thermal ports share a net, unless set by a device's ``rth_cs``.
+        case_capacitance: Case heat capacity (J/K) of those devices, unless
+            set by ``cth_case``.
+        heatsink_resistance: Shared heatsink-to-ambient resistance (K/W),
+            unless one of its devices sets ``rth_sa``.
+        heatsink_capacitance: Shared heatsink heat capacity (J/K), unless one
+            of its devices sets ``cth_sink``.
+        devices: Restrict the run to these device names. None runs every
+            thermal device in the circuit.
+        losses: Device losses already extracted from the electrical
+            waveforms, keyed by device name. None extracts them during the
+            run; devices missing from the mapping use their power signal.
     """
 
     ambient_temperature: float = 25.0
     include_switching_losses: bool = True
     include_conduction_losses: bool = True
     thermal_network: str = "foster"
+    cycle_average: bool = False
+    switching_frequency: float = 0.0
+    mission_profile: list[tuple[float, float]] = field(default_factory=list)
+    mission_repeats: int = 1
+    case_to_sink_resistance: float = 0.1
+    case_capacitance: float = 2.0
+    heatsink_resistance: float = 0.5
+    heatsink_capacitance: float = 100.0
+    devices: list[str] | None = None
+    losses: dict[str, DeviceLosses] | None = None
 
 
 __all__ = [
@@ -507,7 +670,9 @@ __all__ = [
     "ConvergenceInfo",
     # Results
     "TransientResult",
+    "TransientCheckpoint",
     "DCResult",
+    "DCSweepResult",
     "ACResult",
     "ThermalResult",
     "ThermalDeviceResult",
@@ -517,5 +682,6 @@ __all__ = [
     "TransientSettings",
     "DCSettings",
     "ACSettings",
+    "DCSweepSettings",
     "ThermalSettings",
 ]
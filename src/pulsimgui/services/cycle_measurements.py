@@ -0,0 +1,356 @@
+"""Per-switching-cycle measurements on transient waveforms.
+
+Cycles run from one rising crossing of a reference signal (usually a gate
+or switch-node voltage) to the next. Crossings are found without Python
+loops: ``np.diff(np.signbit(values - level))`` marks every sign change.
+An optional hysteresis band rejects chatter on noisy edges.
+
+Per-cycle reductions are also vectorized. Extrema use
+``np.minimum.reduceat`` and ``np.maximum.reduceat`` over the sample
+boundaries of the cycles. Averages and RMS values difference a cumulative
+trapezoid integral evaluated exactly at the crossing times. Millions of
+samples are therefore processed in a few NumPy passes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Mapping
+
+import numpy as np
+
+#: Default hysteresis, as a fraction of the reference swing.
+DEFAULT_HYSTERESIS_FRACTION = 0.05
+#: Lower and upper levels used for rise and fall times, as fractions of the swing.
+TRANSITION_LEVELS = (0.1, 0.9)
+
+#: Per-signal reductions, in display order.
+SIGNAL_METRICS = ("mean", "rms", "min", "max", "ripple")
+
+
+@dataclass
+class SwitchingEdges:
+    """Threshold crossings of a reference signal.
+
+    Attributes:
+        rising: Interpolated times of rising crossings.
+        falling: Interpolated times of falling crossings.
+        level: Threshold that was crossed.
+        low: Low state level, the mean of the samples below the midpoint.
+        high: High state level, the mean of the samples above the midpoint.
+    """
+
+    rising: np.ndarray
+    falling: np.ndarray
+    level: float
+    low: float
+    high: float
+
+
+@dataclass
+class CycleMeasurements:
+    """Table of per-cycle metrics.
+
+    Attributes:
+        start: Start time of each cycle.
+        stop: End time of each cycle.
+        columns: Metric name to per-cycle values, in display order. Cycles
+            where a metric is undefined hold NaN.
+    """
+
+    start: np.ndarray
+    stop: np.ndarray
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def count(self) -> int:
+        """Number of complete cycles."""
+        return int(self.start.size)
+
+    def summary(self) -> dict[str, float]:
+        """Mean of every metric over the cycles where it is defined."""
+        summary: dict[str, float] = {}
+        for name, values in self.columns.items():
+            finite = values[np.isfinite(values)]
+            summary[name] = float(np.mean(finite)) if finite.size else float("nan")
+        return summary
+
+    def as_signal(self, column: str, time: np.ndarray, hold_edges: bool = False) -> np.ndarray:
+        """Hold each cycle's ``column`` value over that cycle's samples.
+
+        Args:
+            column: Metric to expand.
+            time: Time axis of the returned samples.
+            hold_edges: Extend the first and last cycle over the partial
+                cycles at either end instead of leaving them NaN.
+
+        Raises:
+            KeyError: If ``column`` is not measured.
+        """
+        values = self.columns[column]
+        time = np.asarray(time, dtype=np.float64)
+        out = np.full(time.size, np.nan)
+        if self.count == 0:
+            return out
+        cycle = np.searchsorted(self.start, time, side="right") - 1
+        if hold_edges:
+            return values[np.clip(cycle, 0, self.count - 1)].astype(np.float64)
+        inside = (cycle >= 0) & (time < self.stop[-1])
+        out[inside] = values[cycle[inside]]
+        return out
+
+
+def find_edges(
+    time: np.ndarray,
+    values: np.ndarray,
+    level: float | None = None,
+    hysteresis: float | None = None,
+) -> SwitchingEdges:
+    """Find rising and falling crossings of ``level``.
+
+    Args:
+        time: Monotonic time axis.
+        values: Reference samples.
+        level: Threshold. Defaults to the midpoint of the swing.
+        hysteresis: Width of the band a transition must cross before it
+            counts. Defaults to 5 % of the swing. Accepted transitions are
+            timed at their last crossing of ``level``.
+
+    Raises:
+        ValueError: If the arrays mismatch or hold fewer than two samples.
+    """
+    time, values = _validate(time, values)
+    minimum, maximum = float(np.min(values)), float(np.max(values))
+    midpoint = 0.5 * (minimum + maximum)
+    if level is None:
+        level = midpoint
+    if hysteresis is None:
+        hysteresis = DEFAULT_HYSTERESIS_FRACTION * (maximum - minimum)
+    # State levels ignore noise spikes and overshoot, unlike the extrema.
+    upper = values >= midpoint
+    high = float(np.mean(values[upper]))
+    low = float(np.mean(values[~upper])) if not np.all(upper) else high
+
+    raw_rising, raw_falling = _crossing_indices(values, level)
+    if hysteresis > 0.0:
+        half = 0.5 * hysteresis
+        rising, falling = _crossing_indices(_hysteresis_state(values, level, half), 0.5)
+        # Time each accepted transition at its last crossing of ``level``.
+        rising = _last_at_or_before(raw_rising, rising)
+        falling = _last_at_or_before(raw_falling, falling)
+    else:
+        rising, falling = raw_rising, raw_falling
+
+    return SwitchingEdges(
+        rising=_crossing_times(time, values, rising, level),
+        falling=_crossing_times(time, values, falling, level),
+        level=float(level),
+        low=low,
+        high=high,
+    )
+
+
+def measure_cycles(
+    time: np.ndarray,
+    reference: np.ndarray,
+    signals: Mapping[str, np.ndarray] | None = None,
+    *,
+    level: float | None = None,
+    hysteresis: float | None = None,
+    power_in: np.ndarray | None = None,
+    power_out: np.ndarray | None = None,
+) -> CycleMeasurements:
+    """Measure every complete cycle of ``reference``.
+
+    Columns always include ``period``, ``frequency``, ``duty``,
+    ``rise_time`` and ``fall_time`` of the reference. For each entry of
+    ``signals`` they add ``"<name> mean"``, ``rms``, ``min``, ``max`` and
+    ``ripple`` (peak to peak). When both ``power_in`` and ``power_out`` are
+    given, ``P_in``, ``P_out`` and ``efficiency`` are added as well.
+
+    Args:
+        time: Monotonic time axis shared by every array.
+        reference: Signal defining the cycles.
+        signals: Further signals reduced per cycle.
+        level: Reference threshold (see :func:`find_edges`).
+        hysteresis: Reference hysteresis (see :func:`find_edges`).
+        power_in: Instantaneous input power samples.
+        power_out: Instantaneous output power samples.
+
+    Raises:
+        ValueError: If an array does not match the time axis.
+    """
+    time, reference = _validate(time, reference)
+    edges = find_edges(time, reference, level, hysteresis)
+    start, stop = edges.rising[:-1], edges.rising[1:]
+    result = CycleMeasurements(start=start, stop=stop)
+    if start.size == 0:
+        return result
+
+    period = stop - start
+    result.columns["period"] = period
+    result.columns["frequency"] = 1.0 / period
+    result.columns["duty"] = _duty(edges, start, stop)
+    rise, fall = _transition_times(time, reference, edges)
+    result.columns["rise_time"] = rise
+    result.columns["fall_time"] = fall
+
+    bounds = np.searchsorted(time, edges.rising, side="left")
+    for name, values in (signals or {}).items():
+        _, values = _validate(time, values, name)
+        for metric, column in zip(SIGNAL_METRICS, _reduce(time, values, edges.rising, bounds)):
+            result.columns[f"{name} {metric}"] = column
+
+    if power_in is not None and power_out is not None:
+        _, power_in = _validate(time, power_in, "power_in")
+        _, power_out = _validate(time, power_out, "power_out")
+        p_in = _cycle_mean(time, power_in, edges.rising)
+        p_out = _cycle_mean(time, power_out, edges.rising)
+        result.columns["P_in"] = p_in
+        result.columns["P_out"] = p_out
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result.columns["efficiency"] = np.where(np.abs(p_in) > 0.0, p_out / p_in, np.nan)
+    return result
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+def _validate(
+    time: np.ndarray, values: np.ndarray, name: str = "values"
+) -> tuple[np.ndarray, np.ndarray]:
+    time = np.asarray(time, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if time.ndim != 1 or values.shape != time.shape:
+        raise ValueError(f"'{name}' does not match the time axis")
+    if time.size < 2:
+        raise ValueError("At least two samples are required")
+    return time, values
+
+
+def _crossing_indices(values: np.ndarray, level: float) -> tuple[np.ndarray, np.ndarray]:
+    """Indices ``i`` where the sign of ``values - level`` flips between i and i+1."""
+    change = np.diff(np.signbit(values - level).view(np.int8))
+    return np.flatnonzero(change == -1), np.flatnonzero(change == 1)
+
+
+def _hysteresis_state(values: np.ndarray, level: float, half: float) -> np.ndarray:
+    """1.0 while the signal is considered high, 0.0 while low (a Schmitt trigger)."""
+    above = values > level + half
+    definite = above | (values < level - half)
+    if not np.any(definite):
+        return np.zeros(values.size)
+    # Forward-fill the last definite sample; leading samples copy the first one.
+    index = np.where(definite, np.arange(values.size), -1)
+    np.maximum.accumulate(index, out=index)
+    index[index < 0] = int(np.argmax(definite))
+    return above[index].astype(np.float64)
+
+
+def _last_at_or_before(candidates: np.ndarray, accepted: np.ndarray) -> np.ndarray:
+    position = np.searchsorted(candidates, accepted, side="right") - 1
+    chosen = candidates[position[position >= 0]]
+    return np.unique(chosen)
+
+
+def _crossing_times(time: np.ndarray, values: np.ndarray, index: np.ndarray, level: float) -> np.ndarray:
+    t0, t1 = time[index], time[index + 1]
+    v0, v1 = values[index], values[index + 1]
+    span = v1 - v0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.where(span != 0.0, (level - v0) / span, 0.0)
+    return t0 + np.clip(fraction, 0.0, 1.0) * (t1 - t0)
+
+
+def _duty(edges: SwitchingEdges, start: np.ndarray, stop: np.ndarray) -> np.ndarray:
+    falling = edges.falling
+    duty = np.full(start.size, np.nan)
+    if falling.size == 0:
+        return duty
+    index = np.searchsorted(falling, start, side="left")
+    valid = index < falling.size
+    fall = falling[np.minimum(index, falling.size - 1)]
+    valid &= fall < stop
+    duty[valid] = (fall[valid] - start[valid]) / (stop[valid] - start[valid])
+    return duty
+
+
+def _transition_times(
+    time: np.ndarray, values: np.ndarray, edges: SwitchingEdges
+) -> tuple[np.ndarray, np.ndarray]:
+    """10-90 % rise and 90-10 % fall time of the edge opening/inside each cycle."""
+    swing = edges.high - edges.low
+    lower = edges.low + TRANSITION_LEVELS[0] * swing
+    upper = edges.low + TRANSITION_LEVELS[1] * swing
+    lo_rise, lo_fall = (_crossing_times(time, values, i, lower) for i in _crossing_indices(values, lower))
+    hi_rise, hi_fall = (_crossing_times(time, values, i, upper) for i in _crossing_indices(values, upper))
+
+    cycles = edges.rising.size - 1
+    rise = _span_around(edges.rising[:cycles], lo_rise, hi_rise)
+    falls = np.full(cycles, np.nan)
+    if edges.falling.size:
+        index = np.searchsorted(edges.falling, edges.rising[:cycles], side="left")
+        valid = (index < edges.falling.size)
+        fall_at = edges.falling[np.minimum(index, edges.falling.size - 1)]
+        valid &= fall_at < edges.rising[1 : cycles + 1]
+        falls[valid] = _span_around(fall_at[valid], hi_fall, lo_fall)
+    return rise, falls
+
+
+def _span_around(centres: np.ndarray, before: np.ndarray, after: np.ndarray) -> np.ndarray:
+    """Time from the last ``before`` crossing up to each centre to the first ``after`` one."""
+    out = np.full(centres.size, np.nan)
+    if before.size == 0 or after.size == 0 or centres.size == 0:
+        return out
+    b = np.searchsorted(before, centres, side="right") - 1
+    a = np.searchsorted(after, centres, side="left")
+    valid = (b >= 0) & (a < after.size)
+    out[valid] = after[a[valid]] - before[b[valid]]
+    return out
+
+
+def _cumulative_integral(time: np.ndarray, values: np.ndarray) -> np.ndarray:
+    out = np.zeros(values.size)
+    out[1:] = np.cumsum(0.5 * (values[1:] + values[:-1]) * np.diff(time))
+    return out
+
+
+def _integral_at(time: np.ndarray, values: np.ndarray, cumulative: np.ndarray, at: np.ndarray) -> np.ndarray:
+    """Exact trapezoid integral from ``time[0]`` to each ``at`` (linear segments)."""
+    index = np.clip(np.searchsorted(time, at, side="right") - 1, 0, time.size - 2)
+    t0 = time[index]
+    dt = time[index + 1] - t0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.where(dt > 0.0, (at - t0) / dt, 0.0)
+    v_at = values[index] + fraction * (values[index + 1] - values[index])
+    return cumulative[index] + 0.5 * (values[index] + v_at) * (at - t0)
+
+
+def _cycle_mean(time: np.ndarray, values: np.ndarray, boundaries: np.ndarray) -> np.ndarray:
+    integral = _integral_at(time, values, _cumulative_integral(time, values), boundaries)
+    return np.diff(integral) / np.diff(boundaries)
+
+
+def _reduce(
+    time: np.ndarray, values: np.ndarray, boundaries: np.ndarray, bounds: np.ndarray
+) -> tuple[np.ndarray, ...]:
+    """Mean, RMS, min, max and ripple of ``values`` per cycle."""
+    mean = _cycle_mean(time, values, boundaries)
+    rms = np.sqrt(np.maximum(_cycle_mean(time, values * values, boundaries), 0.0))
+    # Sample range of each cycle; reduceat needs every start below the end of the data.
+    starts = np.minimum(bounds[:-1], values.size - 1)
+    segment = values[: max(int(bounds[-1]), int(starts[-1]) + 1)]
+    minimum = np.minimum.reduceat(segment, starts)
+    maximum = np.maximum.reduceat(segment, starts)
+    return mean, rms, minimum, maximum, maximum - minimum
+
+
+__all__ = [
+    "CycleMeasurements",
+    "DEFAULT_HYSTERESIS_FRACTION",
+    "SIGNAL_METRICS",
+    "SwitchingEdges",
+    "TRANSITION_LEVELS",
+    "find_edges",
+    "measure_cycles",
+]
@@ -1,15 +1,24 @@
 """Export service for exporting circuits and waveforms to various formats."""
 
 import csv
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 import json
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-from PySide6.QtCore import QRectF
+import secrets
+import struct
+import time as _time
+from typing import IO, TYPE_CHECKING, Callable, Iterator
+import zipfile
+
+import numpy as np
+from PySide6.QtCore import QRectF, QThread, Signal
 from PySide6.QtGui import QImage, QPainter
 from PySide6.QtSvg import QSvgGenerator
 
 from pulsimgui.models.component import ComponentType
+from pulsimgui.services.result_store import ResultStore
 from pulsimgui.utils.net_utils import build_node_map
 
 if TYPE_CHECKING:
@@ -34,6 +43,90 @@ SPICE_COMPONENT_MAP = {
     ComponentType.TRANSFORMER: "X",
 }
 
+#: Output rows (CSV) or samples per column (binary) written per chunk.
+EXPORT_CHUNK_SAMPLES = 1 << 16
+#: Extension of the columnar waveform format.
+COLUMNAR_EXTENSION = ".pwf"
+#: Waveform export formats by file extension.
+WAVEFORM_FORMATS = {".csv": "csv", ".npz": "npz", COLUMNAR_EXTENSION: "columnar"}
+
+_COLUMNAR_MAGIC = b"PULSIMWF"
+_COLUMNAR_ALIGNMENT = 64
+_NPZ_ALIGNMENT = 64
+
+
+
+class ExportCancelled(Exception):
+    """Raised by waveform exports when ``is_cancelled`` returns True."""
+
+
+@dataclass
+class WaveformExportOptions:
+    """What part of a result a waveform export writes.
+
+    Attributes:
+        signals: Signals to write, in order. None writes every signal.
+        start: First time to include in seconds. None starts at the beginning.
+        stop: Last time to include in seconds. None runs to the end.
+        decimation: Keep every n-th sample of the selected range.
+        precision: Significant digits of CSV values. The default of 17
+            writes every float64 so that it reads back unchanged.
+
+    Raises:
+        ValueError: If ``decimation`` or ``precision`` is below 1 or
+            ``start`` is after ``stop``.
+    """
+
+    signals: list[str] | None = None
+    start: float | None = None
+    stop: float | None = None
+    decimation: int = 1
+    precision: int = 17
+
+    def __post_init__(self) -> None:
+        if int(self.decimation) < 1:
+            raise ValueError("decimation must be at least 1")
+        if int(self.precision) < 1:
+            raise ValueError("precision must be at least 1")
+        if self.start is not None and self.stop is not None and self.start > self.stop:
+            raise ValueError("The export start time is after the stop time")
+
+
+@dataclass
+class _ExportPlan:
+    """Rows ``start:stop:step`` of the chosen columns of a store."""
+
+    store: ResultStore
+    names: list[str]
+    start: int
+    stop: int
+    step: int
+    rows: int
+    options: WaveformExportOptions = field(default_factory=WaveformExportOptions)
+
+    def chunks(self):
+        """Yield ``(source_start, source_stop)`` per :data:`EXPORT_CHUNK_SAMPLES` rows."""
+        span = EXPORT_CHUNK_SAMPLES * self.step
+        for first in range(self.start, self.stop, span):
+            yield first, min(first + span, self.stop)
+
+    def column(self, name: str | None, first: int, last: int) -> np.ndarray:
+        """Exported samples of ``name`` (None for time) from source rows ``first:last``."""
+        source = self.store.time if name is None else self.store.get(name)
+        chunk = np.asarray(source[first:last:self.step], dtype="<f8")
+        expected = len(range(first, last, self.step))
+        if chunk.size < expected:
+            # Signals shorter than the time axis are padded with NaN.
+            padded = np.full(expected, np.nan)
+            padded[: chunk.size] = chunk
+            chunk = padded
+        return chunk
+
+    def available(self, name: str) -> int:
+        """Exported rows for which ``name`` has a sample; shorter signals stop early."""
+        samples = len(self.store.get(name))
+        return len(range(self.start, min(self.stop, samples), self.step))
+
 
 class ExportService:
     """Service for exporting circuits and simulation results."""
@@ -269,30 +362,349 @@ class ExportService:
         painter.end()
 
     @staticmethod
-    def export_waveforms_csv(result: "SimulationResult", filepath: str) -> None:
+    def export_waveforms(
+        result: "SimulationResult | ResultStore",
+        filepath: str,
+        options: WaveformExportOptions | None = None,
+        progress: Callable[[float], None] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> int:
+        """Export waveforms in the format given by the extension of ``filepath``.
+
+        ``.csv``, ``.npz`` and :data:`COLUMNAR_EXTENSION` are supported. See
+        the format-specific methods for the arguments.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            ValueError: On an unsupported extension or invalid options.
+        """
+        fmt = WAVEFORM_FORMATS.get(Path(filepath).suffix.lower())
+        if fmt is None:
+            raise ValueError(f"Unsupported waveform export format: {Path(filepath).suffix or filepath}")
+        exporter = {
+            "csv": ExportService.export_waveforms_csv,
+            "npz": ExportService.export_waveforms_npz,
+            "columnar": ExportService.export_waveforms_columnar,
+        }[fmt]
+        return exporter(result, filepath, options, progress, is_cancelled)
+
+    @staticmethod
+    def export_waveforms_csv(
+        result: "SimulationResult | ResultStore",
+        filepath: str,
+        options: WaveformExportOptions | None = None,
+        progress: Callable[[float], None] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> int:
         """Export simulation waveforms to CSV file.
 
+        Rows are formatted in blocks with ``np.savetxt``. Samples missing from
+        a signal shorter than the time axis are left as empty cells.
+
         Args:
-            result: Simulation result containing time and signal data
+            result: Simulation result (or its store) containing the waveforms
             filepath: Path to save the CSV
+            options: Signals, time range, decimation and precision
+            progress: Called with the fraction written after each block
+            is_cancelled: Polled between blocks; True removes the partial
+                file, leaves any existing ``filepath`` untouched and raises
+                :class:`ExportCancelled`
+
+        Returns:
+            Number of data rows written.
         """
+        plan = _plan_export(result, options)
+        fmt = f"%.{int(plan.options.precision)}g"
+        lengths = [plan.rows] + [plan.available(name) for name in plan.names]
+        complete = min(lengths)  # Rows in which every column has a sample
+        with _replaced_on_success(filepath, "w", newline="") as f:
+            csv.writer(f).writerow(["Time (s)"] + plan.names)
+            block = np.empty((min(plan.rows, EXPORT_CHUNK_SAMPLES), 1 + len(plan.names)))
+            written = 0
+            for first, last in plan.chunks():
+                check_cancelled(is_cancelled)
+                count = len(range(first, last, plan.step))
+                rows = block[:count]
+                rows[:, 0] = plan.column(None, first, last)
+                for index, name in enumerate(plan.names, start=1):
+                    rows[:, index] = plan.column(name, first, last)
+                full = max(0, min(count, complete - written))
+                np.savetxt(f, rows[:full], fmt=fmt, delimiter=",")
+                for offset, row in enumerate(rows[full:], start=written + full):
+                    cells = [fmt % v if offset < n else "" for v, n in zip(row, lengths)]
+                    f.write(",".join(cells) + "\n")
+                written += count
+                report_progress(progress, written / plan.rows)
+        return plan.rows
+
+    @staticmethod
+    def export_waveforms_npz(
+        result: "SimulationResult | ResultStore",
+        filepath: str,
+        options: WaveformExportOptions | None = None,
+        progress: Callable[[float], None] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> int:
+        """Export waveforms to a NumPy ``.npz`` archive.
+
+        The archive holds ``time`` and one float64 array per signal, keyed by
+        signal name, and loads with ``np.load``. Arrays are streamed into the
+        archive in chunks, so no decimated copy of the whole result is built.
+        Members are stored uncompressed with their data aligned to 64 bytes,
+        so the arrays can be memory-mapped in place (see
+        :func:`~pulsimgui.services.reference_import.load_reference`).
+        Arguments and return value are as for :meth:`export_waveforms_csv`.
+
+        Raises:
+            ValueError: If a signal is named ``time``.
+        """
+        plan = _plan_export(result, options)
+        if "time" in plan.names:
+            raise ValueError("A signal named 'time' cannot be exported to NPZ")
+        total = plan.rows * (1 + len(plan.names))
+        done = 0
+        with _replaced_on_success(filepath, "wb") as f, zipfile.ZipFile(
+            f, "w", compression=zipfile.ZIP_STORED, allowZip64=True
+        ) as archive:
+            for key, name in [("time", None)] + [(n, n) for n in plan.names]:
+                member = _aligned_npz_member(f.tell(), f"{key}.npy")
+                with archive.open(member, "w", force_zip64=True) as handle:
+                    np.lib.format.write_array_header_1_0(
+                        handle, {"descr": "<f8", "fortran_order": False, "shape": (plan.rows,)}
+                    )
+                    for first, last in plan.chunks():
+                        check_cancelled(is_cancelled)
+                        chunk = plan.column(name, first, last)
+                        handle.write(chunk.tobytes())
+                        done += chunk.size
+                        report_progress(progress, done / total)
+        return plan.rows
+
+    @staticmethod
+    def export_waveforms_columnar(
+        result: "SimulationResult | ResultStore",
+        filepath: str,
+        options: WaveformExportOptions | None = None,
+        progress: Callable[[float], None] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> int:
+        """Export waveforms to the columnar :data:`COLUMNAR_EXTENSION` format.
+
+        Layout: 8 magic bytes (``PULSIMWF``), the header length as a
+        little-endian uint64, a UTF-8 JSON header, zero padding to a 64-byte
+        boundary, then each column as contiguous little-endian float64
+        values, time first. The header lists ``rows``, ``data_offset`` and
+        each column's ``name`` and byte ``offset`` from ``data_offset``, so
+        a column can be memory-mapped without reading the rest. Arguments and
+        return value are as for :meth:`export_waveforms_csv`.
+        """
+        plan = _plan_export(result, options)
+        column_bytes = plan.rows * 8
+        names = ["time"] + plan.names
+        header = {
+            "format": "pulsim-waveform-columns",
+            "version": 1,
+            "dtype": "<f8",
+            "rows": plan.rows,
+            "columns": [
+                {"name": name, "offset": index * column_bytes} for index, name in enumerate(names)
+            ],
+            "statistics": {
+                str(key): value
+                for key, value in plan.store.statistics.items()
+                if isinstance(value, (bool, int, float, str)) or value is None
+            },
+        }
+        # data_offset depends on the header length; two passes settle it.
+        header["data_offset"] = 0
+        for _ in range(2):
+            encoded = json.dumps(header).encode("utf-8")
+            prefix = len(_COLUMNAR_MAGIC) + 8 + len(encoded)
+            header["data_offset"] = -(-prefix // _COLUMNAR_ALIGNMENT) * _COLUMNAR_ALIGNMENT
+        encoded = json.dumps(header).encode("utf-8")
+        prefix = len(_COLUMNAR_MAGIC) + 8 + len(encoded)
+
+        total = plan.rows * len(names)
+        done = 0
+        with _replaced_on_success(filepath, "wb") as f:
+            f.write(_COLUMNAR_MAGIC)
+            f.write(np.uint64(len(encoded)).astype("<u8").tobytes())
+            f.write(encoded)
+            f.write(b"\0" * (header["data_offset"] - prefix))
+            for name in [None] + plan.names:
+                for first, last in plan.chunks():
+                    check_cancelled(is_cancelled)
+                    chunk = plan.column(name, first, last)
+                    f.write(chunk.tobytes())
+                    done += chunk.size
+                    report_progress(progress, done / total)
+        return plan.rows
+
+    @staticmethod
+    def read_waveform_columns(filepath: str) -> tuple[np.ndarray, dict[str, np.ndarray], dict]:
+        """Map a :data:`COLUMNAR_EXTENSION` file as read-only arrays.
+
+        Returns:
+            ``(time, signals, header)``; the arrays are memory maps, so only
+            the parts that are used are read from disk.
+
+        Raises:
+            ValueError: If the file is not in the columnar format.
+        """
+        with open(filepath, "rb") as f:
+            magic = f.read(len(_COLUMNAR_MAGIC))
+            length = f.read(8)
+            if magic != _COLUMNAR_MAGIC or len(length) != 8:
+                raise ValueError(f"Not a Pulsim waveform file: {filepath}")
+            header = json.loads(f.read(int(np.frombuffer(length, dtype="<u8")[0])).decode("utf-8"))
+        rows = int(header["rows"])
+        columns = {}
+        for column in header["columns"]:
+            columns[column["name"]] = np.memmap(
+                filepath,
+                dtype=header.get("dtype", "<f8"),
+                mode="r",
+                offset=int(header["data_offset"]) + int(column["offset"]),
+                shape=(rows,),
+            )
+        time = columns.pop("time")
+        return time, columns, header
+
+
+class WaveformExportWorker(QThread):
+    """Worker thread running :meth:`ExportService.export_waveforms`.
+
+    ``finished_signal`` carries the path and row count; a cancelled export
+    emits neither it nor ``error`` and leaves no file behind.
+    """
+
+    progress = Signal(float, str)
+    finished_signal = Signal(str, int)
+    error = Signal(str)
+
+    def __init__(
+        self,
+        result: "SimulationResult | ResultStore",
+        filepath: str,
+        options: WaveformExportOptions | None = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._result = result
+        self._filepath = filepath
+        self._options = options
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Request cancellation; the partial file is removed."""
+        self._cancelled = True
+
+    @property
+    def was_cancelled(self) -> bool:
+        """Return whether cancellation was requested."""
+        return self._cancelled
+
+    def run(self) -> None:
+        """Write the export file."""
+        name = Path(self._filepath).name
+        self.progress.emit(0.0, f"Exporting {name}...")
+        try:
+            rows = ExportService.export_waveforms(
+                self._result,
+                self._filepath,
+                self._options,
+                progress=lambda fraction: self.progress.emit(100.0 * fraction, f"Exporting {name}..."),
+                is_cancelled=lambda: self._cancelled,
+            )
+        except ExportCancelled:
+            return
+        except Exception as exc:
+            self.error.emit(str(exc))
+            return
+        self.finished_signal.emit(self._filepath, rows)
+
+
+def _plan_export(
+    result: "SimulationResult | ResultStore",
+    options: WaveformExportOptions | None,
+) -> _ExportPlan:
+    """Resolve the rows and columns an export writes."""
+    if isinstance(result, ResultStore):
+        store = result
+    else:
         if not result.is_valid:
             raise ValueError("Cannot export invalid simulation result")
-
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.writer(f)
-
-            # Header row: Time, Signal1, Signal2, ...
-            headers = ["Time (s)"] + list(result.signals.keys())
-            writer.writerow(headers)
-
-            # Data rows
-            for i, t in enumerate(result.time):
-                row = [t]
-                for signal_name in result.signals.keys():
-                    values = result.signals[signal_name]
-                    if i < len(values):
-                        row.append(values[i])
-                    else:
-                        row.append("")
-                writer.writerow(row)
+        store = ResultStore.for_result(result)
+    options = options or WaveformExportOptions()
+
+    names = list(options.signals) if options.signals is not None else store.keys()
+    unknown = [name for name in names if name not in store]
+    if unknown:
+        raise ValueError(f"Unknown signal(s): {', '.join(unknown)}")
+
+    time = store.time
+    start = 0 if options.start is None else int(np.searchsorted(time, options.start, side="left"))
+    stop = time.size if options.stop is None else int(np.searchsorted(time, options.stop, side="right"))
+    step = int(options.decimation)
+    rows = len(range(start, stop, step))
+    if rows == 0:
+        raise ValueError("No samples in the selected time range")
+    return _ExportPlan(store, names, start, stop, step, rows, options)
+
+
+def _aligned_npz_member(offset: int, filename: str) -> zipfile.ZipInfo:
+    """Entry for a stored member starting at ``offset``, padded so its data is 64-byte aligned.
+
+    The padding goes into an extra field (the ``0xD935`` alignment record
+    used by zipalign). ``np.lib.format`` pads the array header to a
+    multiple of 64 bytes itself, so only the member start needs aligning.
+    The local header is measured with ``ZipInfo.FileHeader``, which builds
+    the bytes ``zipfile`` writes for a forced ZIP64 entry. Should a
+    ``zipfile`` ever lay it out differently, the archive stays valid and
+    :func:`~pulsimgui.services.reference_import.load_reference` converts
+    it instead of mapping it.
+    """
+    info = zipfile.ZipInfo(filename, date_time=_time.localtime()[:6])
+    info.compress_type = zipfile.ZIP_STORED
+    info.CRC = info.compress_size = info.file_size = 0  # Set like this by ZipFile.open("w")
+    record = struct.Struct("<HH")
+    start = offset + len(info.FileHeader(zip64=True)) + record.size
+    padding = -start % _NPZ_ALIGNMENT
+    info.extra = record.pack(0xD935, padding) + b"\0" * padding
+    return info
+
+
+def report_progress(progress: Callable[[float], None] | None, fraction: float) -> None:
+    """Pass ``fraction``, capped at 1.0, to the optional ``progress`` callback."""
+    if progress is not None:
+        progress(min(1.0, fraction))
+
+
+def check_cancelled(is_cancelled: Callable[[], bool] | None) -> None:
+    """Raise :class:`ExportCancelled` when the optional ``is_cancelled`` returns True."""
+    if is_cancelled is not None and is_cancelled():
+        raise ExportCancelled()
+
+
+@contextmanager
+def _replaced_on_success(filepath: str, mode: str, **kwargs) -> Iterator[IO]:
+    """Write to a partial file beside ``filepath``, moved onto it on success.
+
+    An existing ``filepath`` is only replaced once the block completes; a
+    failure or cancellation removes the partial file and leaves it as it was.
+    """
+    target = Path(filepath)
+    # Created exclusively, so it gets the usual permissions for new files.
+    partial = target.with_name(f".{target.name}.{secrets.token_hex(4)}.partial")
+    try:
+        with open(partial, mode.replace("w", "x"), **kwargs) as handle:
+            yield handle
+        os.replace(partial, filepath)
+    except BaseException:
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,234 @@
+"""Switching-period averaging of device losses for thermal analysis.
+
+Thermal time constants are milliseconds to minutes while switching periods
+are microseconds, so the thermal network does not need every electrical
+sample. This stage integrates each loss waveform over every switching
+period and hands the thermal solver one averaged sample per period. It can
+also stretch the steady-state loss over a long mission profile, such as
+hours of load cycling, that would be far too long to simulate electrically.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Mapping, Sequence
+
+import numpy as np
+
+#: Periods averaged to estimate the steady-state loss of a run.
+STEADY_STATE_PERIODS = 10
+
+
+@dataclass
+class MissionSegment:
+    """One constant-load segment of a mission profile.
+
+    Attributes:
+        duration: Segment length (s).
+        load: Scale applied to the steady-state loss of every device.
+    """
+
+    duration: float
+    load: float = 1.0
+
+
+@dataclass
+class CycleAveragedLosses:
+    """Per-period average losses of a set of devices.
+
+    Attributes:
+        names: Device names, one per row.
+        boundaries: Period edge times, shape ``(n_periods + 1,)``.
+        components: Average loss per period keyed by loss kind (for example
+            ``"conduction"`` and ``"switching"``), each ``(n_devices, n_periods)``.
+    """
+
+    names: list[str] = field(default_factory=list)
+    boundaries: np.ndarray = field(default_factory=lambda: np.empty(0))
+    components: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def period_count(self) -> int:
+        """Number of averaged periods."""
+        return max(0, self.boundaries.size - 1)
+
+    @property
+    def total(self) -> np.ndarray:
+        """Sum of all loss components, shape ``(n_devices, n_periods)``."""
+        total = np.zeros((len(self.names), self.period_count))
+        for values in self.components.values():
+            total += values
+        return total
+
+    def thermal_power(self) -> np.ndarray:
+        """Return power samples aligned with :attr:`boundaries`.
+
+        Column ``k + 1`` holds the average over period ``k``, matching the
+        thermal integrator, which holds sample ``k + 1`` over step ``k``.
+        """
+        total = self.total
+        if total.shape[1] == 0:
+            return np.zeros((len(self.names), self.boundaries.size))
+        return np.concatenate([total[:, :1], total], axis=1)
+
+    def steady_state(self, periods: int = STEADY_STATE_PERIODS) -> dict[str, np.ndarray]:
+        """Average each component over the last ``periods`` periods.
+
+        The average is weighted by period length. Each value has shape
+        ``(n_devices,)``.
+        """
+        count = min(max(1, int(periods)), self.period_count)
+        if count == 0:
+            return {name: np.zeros(len(self.names)) for name in self.components}
+        widths = np.diff(self.boundaries[-count - 1 :])
+        span = float(widths.sum()) or 1.0
+        return {
+            name: (values[:, -count:] * widths).sum(axis=1) / span
+            for name, values in self.components.items()
+        }
+
+
+def boundaries_from_frequency(time: np.ndarray, frequency: float) -> np.ndarray:
+    """Return period edges ``t0 + k / f`` covering whole periods of ``time``."""
+    t = np.asarray(time, dtype=np.float64)
+    if t.size < 2 or frequency <= 0.0:
+        return np.empty(0)
+    period = 1.0 / float(frequency)
+    count = int(np.floor((t[-1] - t[0]) / period * (1.0 + 1e-12)))
+    return t[0] + period * np.arange(count + 1)
+
+
+def boundaries_from_edges(
+    time: np.ndarray,
+    signal: np.ndarray,
+    threshold: float | None = None,
+) -> np.ndarray:
+    """Return the times of rising crossings of ``threshold`` in ``signal``.
+
+    Crossing times are linearly interpolated between samples. The threshold
+    defaults to halfway between the signal's minimum and maximum, which finds
+    one edge per period of a PWM gate or switched-device waveform.
+    """
+    t = np.asarray(time, dtype=np.float64)
+    s = np.asarray(signal, dtype=np.float64)
+    if t.size < 2 or s.size != t.size:
+        return np.empty(0)
+    lo, hi = float(np.min(s)), float(np.max(s))
+    if hi <= lo:
+        return np.empty(0)
+    level = 0.5 * (lo + hi) if threshold is None else float(threshold)
+
+    above = s >= level
+    rising = np.flatnonzero(~above[:-1] & above[1:])
+    if rising.size == 0:
+        return np.empty(0)
+    s0, s1 = s[rising], s[rising + 1]
+    fraction = (level - s0) / (s1 - s0)
+    return t[rising] + fraction * (t[rising + 1] - t[rising])
+
+
+def integrate_over_intervals(
+    time: np.ndarray,
+    values: np.ndarray,
+    boundaries: np.ndarray,
+) -> np.ndarray:
+    """Integrate piecewise-linear ``values`` between consecutive boundaries.
+
+    Args:
+        time: Sample times, shape ``(n,)``.
+        values: Samples, shape ``(rows, n)``.
+        boundaries: Interval edges inside ``[time[0], time[-1]]``, shape ``(m,)``.
+
+    Returns:
+        Integral over each interval, shape ``(rows, m - 1)``. Partial samples
+        at either edge are integrated exactly, not snapped to the grid.
+    """
+    t = np.asarray(time, dtype=np.float64)
+    v = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    b = np.clip(np.asarray(boundaries, dtype=np.float64), t[0], t[-1])
+    dt = np.diff(t)
+    cumulative = np.zeros_like(v)
+    np.cumsum(0.5 * (v[:, 1:] + v[:, :-1]) * dt, axis=1, out=cumulative[:, 1:])
+
+    index = np.clip(np.searchsorted(t, b, side="right") - 1, 0, t.size - 2)
+    width = dt[index]
+    fraction = np.divide(b - t[index], width, out=np.zeros_like(b), where=width > 0)
+    v0 = v[:, index]
+    slope = v[:, index + 1] - v0
+    # Exact integral of the linear segment from t[index] up to the boundary.
+    partial = width * fraction * (v0 + 0.5 * fraction * slope)
+    at_boundary = cumulative[:, index] + partial
+    return np.diff(at_boundary, axis=1)
+
+
+def average_losses(
+    time: np.ndarray,
+    losses: Mapping[str, np.ndarray],
+    boundaries: np.ndarray,
+    names: Sequence[str],
+) -> CycleAveragedLosses:
+    """Average every loss component over each period.
+
+    Args:
+        time: Sample times, shape ``(n,)``.
+        losses: Loss waveforms keyed by kind, each ``(n_devices, n)``.
+        boundaries: Period edges from :func:`boundaries_from_frequency` or
+            :func:`boundaries_from_edges`.
+        names: Device names, one per row.
+    """
+    b = np.asarray(boundaries, dtype=np.float64)
+    widths = np.diff(b)
+    components = {}
+    for kind, values in losses.items():
+        energy = integrate_over_intervals(time, values, b)
+        components[kind] = np.divide(
+            energy, widths, out=np.zeros_like(energy), where=widths > 0
+        )
+    return CycleAveragedLosses(names=list(names), boundaries=b, components=components)
+
+
+def mission_profile_power(
+    steady_loss: np.ndarray,
+    segments: Sequence[MissionSegment],
+    repeats: int = 1,
+    samples_per_segment: int = 16,
+    start_time: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build a thermal drive from a steady-state loss and a mission profile.
+
+    Each segment holds ``load * steady_loss`` constant. The thermal update is
+    exact for a constant loss, so temperatures at segment ends do not depend
+    on ``samples_per_segment``. Intermediate samples are only for plotting.
+
+    Returns:
+        ``(time, power)`` with power shaped ``(n_devices, n)`` and aligned
+        with the integrator's convention (sample ``k + 1`` held over step ``k``).
+    """
+    loss = np.asarray(steady_loss, dtype=np.float64).reshape(-1)
+    durations = np.array([max(0.0, float(s.duration)) for s in segments] * max(0, repeats))
+    loads = np.array([float(s.load) for s in segments] * max(0, repeats))
+    keep = durations > 0.0
+    durations, loads = durations[keep], loads[keep]
+    if durations.size == 0:
+        return np.array([start_time]), np.zeros((loss.size, 1))
+
+    per_segment = max(1, int(samples_per_segment))
+    steps = np.repeat(durations / per_segment, per_segment)
+    time = start_time + np.concatenate([[0.0], np.cumsum(steps)])
+    step_loads = np.repeat(loads, per_segment)
+    power = np.empty((loss.size, time.size))
+    power[:, 1:] = loss[:, None] * step_loads[None, :]
+    power[:, 0] = power[:, 1]
+    return time, power
+
+
+__all__ = [
+    "CycleAveragedLosses",
+    "MissionSegment",
+    "STEADY_STATE_PERIODS",
+    "average_losses",
+    "boundaries_from_edges",
+    "boundaries_from_frequency",
+    "integrate_over_intervals",
+    "mission_profile_power",
+]
@@ -0,0 +1,129 @@
+"""Cache of converged operating points keyed by circuit content.
+
+A converged DC operating point (or the t=0 solution of a transient) is
+reused as the initial state of later transients, as the seed for convergence
+retries and for the schematic DC overlay. Entries are keyed by a hash of the
+electrical content of the circuit, so any edit to topology or parameters
+misses the cache automatically.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+def circuit_fingerprint(circuit_data: dict) -> str:
+    """Hash the electrical content of ``circuit_data``, ignoring layout."""
+    components = [
+        {
+            "id": comp.get("id"),
+            "type": comp.get("type"),
+            "parameters": comp.get("parameters"),
+            "pin_nodes": comp.get("pin_nodes"),
+        }
+        for comp in circuit_data.get("components", [])
+    ]
+    payload = json.dumps(
+        {"components": components, "node_aliases": circuit_data.get("node_aliases", {})},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class OperatingPoint:
+    """A converged operating point for one circuit.
+
+    Attributes:
+        fingerprint: :func:`circuit_fingerprint` of the circuit.
+        strategy: DC strategy that produced the solution.
+        state: Backend state vector (empty when the backend has none).
+        node_voltages: Node voltages keyed ``V(name)``.
+        branch_currents: Device currents keyed ``I(name)``.
+        power_dissipation: Device power keyed ``P(name)``.
+        source: ``"dc"`` for a DC solve, ``"transient"`` for a t=0 solution.
+    """
+
+    fingerprint: str
+    strategy: str
+    state: list[float] = field(default_factory=list)
+    node_voltages: dict[str, float] = field(default_factory=dict)
+    branch_currents: dict[str, float] = field(default_factory=dict)
+    power_dissipation: dict[str, float] = field(default_factory=dict)
+    source: str = "dc"
+
+
+class OperatingPointCache:
+    """Thread-safe LRU of :class:`OperatingPoint` entries.
+
+    Entries are keyed by ``(fingerprint, strategy)``. Keeping a handful of
+    fingerprints lets undo/redo hit the cache; edits miss it by construction.
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self._entries: OrderedDict[tuple[str, str], OperatingPoint] = OrderedDict()
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, fingerprint: str, strategy: str) -> OperatingPoint | None:
+        """Return the entry solved with exactly ``strategy``."""
+        with self._lock:
+            entry = self._entries.get((fingerprint, strategy))
+            if entry is not None:
+                self._entries.move_to_end((fingerprint, strategy))
+            return entry
+
+    def lookup(self, fingerprint: str, strategy: str | None = None) -> OperatingPoint | None:
+        """Return the best entry for ``fingerprint``.
+
+        The exact strategy is preferred; otherwise the most recent entry for
+        the circuit is returned, since any converged solution is a good
+        initial state regardless of how it was reached.
+        """
+        if strategy is not None:
+            entry = self.get(fingerprint, strategy)
+            if entry is not None:
+                return entry
+        with self._lock:
+            for (entry_fingerprint, _strategy), entry in reversed(self._entries.items()):
+                if entry_fingerprint == fingerprint:
+                    return entry
+        return None
+
+    def store(self, entry: OperatingPoint) -> None:
+        """Insert or replace an entry, evicting the least recently used."""
+        key = (entry.fingerprint, entry.strategy)
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None and existing.source == "dc" and entry.source != "dc":
+                # A true DC solution is never replaced by a t=0 transient sample.
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, fingerprint: str | None = None) -> None:
+        """Drop entries for ``fingerprint``, or every entry when None."""
+        with self._lock:
+            if fingerprint is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == fingerprint]:
+                del self._entries[key]
+
+
+__all__ = [
+    "OperatingPoint",
+    "OperatingPointCache",
+    "circuit_fingerprint",
+]
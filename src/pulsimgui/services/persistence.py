@@ -0,0 +1,202 @@
+"""Persistence (eye-diagram) maps of periodic waveforms.
+
+A signal is folded by its switching period: every sample is placed at its
+phase inside the period. The time spent in each (phase, value) cell
+accumulates into a 2-D histogram, which shows thousands of cycles on top of
+each other like a scope's persistence mode.
+
+Samples are weighted by the time step that follows them, so fine solver
+steps around switching events do not look brighter than they are. The
+accumulator only consumes samples it has not seen yet. A growing result
+therefore costs only its new tail on each refresh.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from pulsimgui.services.loss_averaging import boundaries_from_edges
+
+#: Default phase resolution of the map.
+DEFAULT_PHASE_BINS = 512
+#: Default value resolution of the map.
+DEFAULT_VALUE_BINS = 256
+#: Samples binned per pass, bounding temporary memory on long records.
+CHUNK_SAMPLES = 1 << 21
+#: Headroom added around the value range inferred from the first samples.
+_VALUE_MARGIN = 0.05
+
+
+def detect_period(time: np.ndarray, values: np.ndarray) -> float | None:
+    """Median interval between rising mid-level crossings, or None.
+
+    Works for PWM gates, switch-node voltages and inductor currents alike.
+    """
+    edges = boundaries_from_edges(time, values)
+    if edges.size < 2:
+        return None
+    period = float(np.median(np.diff(edges)))
+    return period if period > 0.0 else None
+
+
+@dataclass
+class PersistenceMap:
+    """Time-weighted 2-D histogram of a folded signal.
+
+    Attributes:
+        counts: Seconds spent per cell, shape ``(phase_bins, value_bins)``.
+        period: Folding period in seconds.
+        value_range: ``(low, high)`` limits of the value axis.
+        cycles: Periods covered by the accumulated samples.
+    """
+
+    counts: np.ndarray
+    period: float
+    value_range: tuple[float, float]
+    cycles: float = 0.0
+
+    @property
+    def phase_edges(self) -> np.ndarray:
+        """Bin edges of the phase axis, in seconds."""
+        return np.linspace(0.0, self.period, self.counts.shape[0] + 1)
+
+    @property
+    def value_edges(self) -> np.ndarray:
+        """Bin edges of the value axis."""
+        return np.linspace(self.value_range[0], self.value_range[1], self.counts.shape[1] + 1)
+
+    def intensity(self, gamma: float = 0.5) -> np.ndarray:
+        """Counts scaled to ``[0, 1]`` with a gamma that lifts rare traces."""
+        peak = float(self.counts.max()) if self.counts.size else 0.0
+        if peak <= 0.0:
+            return np.zeros_like(self.counts)
+        return (self.counts / peak) ** gamma
+
+
+class PersistenceAccumulator:
+    """Incrementally fold a signal into a :class:`PersistenceMap`.
+
+    Args:
+        period: Folding period in seconds.
+        phase_bins: Columns of the map.
+        value_bins: Rows of the map.
+        value_range: ``(low, high)`` of the value axis. Defaults to the range
+            of the first samples plus a small margin. Later samples outside
+            the range land in the edge rows.
+        origin: Time of phase zero. Defaults to the first sample.
+
+    Raises:
+        ValueError: If the period or bin counts are not positive.
+    """
+
+    def __init__(
+        self,
+        period: float,
+        *,
+        phase_bins: int = DEFAULT_PHASE_BINS,
+        value_bins: int = DEFAULT_VALUE_BINS,
+        value_range: tuple[float, float] | None = None,
+        origin: float | None = None,
+    ) -> None:
+        if not period > 0.0:
+            raise ValueError("The folding period must be positive")
+        if phase_bins < 1 or value_bins < 1:
+            raise ValueError("Bin counts must be at least 1")
+        self._period = float(period)
+        self._phase_bins = int(phase_bins)
+        self._value_bins = int(value_bins)
+        self._value_range = value_range
+        self._origin = origin
+        self.reset()
+
+    @property
+    def period(self) -> float:
+        """Folding period in seconds."""
+        return self._period
+
+    @property
+    def consumed(self) -> int:
+        """Samples already folded into the map."""
+        return self._consumed
+
+    @property
+    def map(self) -> PersistenceMap:
+        """Current map (shares the accumulated counts)."""
+        low, high = self._value_range if self._value_range is not None else (0.0, 1.0)
+        return PersistenceMap(self._counts, self._period, (low, high), self._span / self._period)
+
+    def reset(self) -> None:
+        """Drop every accumulated sample."""
+        self._counts = np.zeros((self._phase_bins, self._value_bins))
+        self._consumed = 0
+        self._span = 0.0
+
+    def update(self, time: np.ndarray, values: np.ndarray) -> PersistenceMap:
+        """Fold the samples of ``time``/``values`` not consumed yet.
+
+        Pass the whole (possibly grown) record each time; only its new tail
+        is binned. The last sample waits for the next update because its
+        weight is the step that follows it.
+
+        Raises:
+            ValueError: If the arrays differ in length.
+        """
+        if len(time) != len(values):
+            raise ValueError("Time and values must have the same length")
+        stop = len(time) - 1
+        if stop <= self._consumed:
+            return self.map
+
+        if self._origin is None:
+            self._origin = float(time[0])
+        if self._value_range is None:
+            head = np.asarray(values[: min(len(values), CHUNK_SAMPLES)], dtype=np.float64)
+            head = head[np.isfinite(head)]
+            low, high = (float(head.min()), float(head.max())) if head.size else (0.0, 1.0)
+            margin = _VALUE_MARGIN * (high - low) if high > low else max(abs(low), 1.0) * _VALUE_MARGIN
+            self._value_range = (low - margin, high + margin)
+
+        for start in range(self._consumed, stop, CHUNK_SAMPLES):
+            end = min(start + CHUNK_SAMPLES, stop)
+            self._fold(
+                np.asarray(time[start : end + 1], dtype=np.float64),
+                np.asarray(values[start:end], dtype=np.float64),
+            )
+        self._consumed = stop
+        return self.map
+
+    def _fold(self, time: np.ndarray, values: np.ndarray) -> None:
+        """Bin ``values`` (one sample shorter than ``time``) into the map."""
+        weights = np.diff(time)
+        self._span += float(time[-1] - time[0])
+
+        # Fractional part of the cycle count is the phase.
+        cycles = (time[:-1] - self._origin) * (1.0 / self._period)
+        column = ((cycles - np.floor(cycles)) * self._phase_bins).astype(np.intp)
+        np.clip(column, 0, self._phase_bins - 1, out=column)
+
+        low, high = self._value_range
+        scale = self._value_bins / (high - low)
+        finite = np.isfinite(values)
+        row = ((np.where(finite, values, low) - low) * scale).astype(np.intp)
+        np.clip(row, 0, self._value_bins - 1, out=row)
+
+        # Uniform bins: a flat bincount gives np.histogram2d's result directly.
+        cells = column * self._value_bins + row
+        self._counts += np.bincount(
+            cells[finite],
+            weights=weights[finite],
+            minlength=self._phase_bins * self._value_bins,
+        ).reshape(self._phase_bins, self._value_bins)
+
+
+__all__ = [
+    "CHUNK_SAMPLES",
+    "DEFAULT_PHASE_BINS",
+    "DEFAULT_VALUE_BINS",
+    "PersistenceAccumulator",
+    "PersistenceMap",
+    "detect_period",
+]
@@ -0,0 +1,552 @@
+"""Import of external reference waveforms as memory-mapped results.
+
+Lab captures and the outputs of other tools often hold tens of millions of
+samples. :func:`load_reference` returns them as a
+:class:`~pulsimgui.services.simulation_service.SimulationResult` whose arrays
+are read-only ``np.memmap`` views, so the viewer and scopes read from disk only
+the samples they draw:
+
+* Columnar files (:data:`~pulsimgui.services.export_service.COLUMNAR_EXTENSION`)
+  are mapped in place.
+* ``.npz`` archives hold a ``time`` array and one array per signal. They are
+  mapped in place when their members are stored uncompressed as aligned
+  float64, as the waveform export writes them.
+* ``.npy`` files hold a ``(samples, columns)`` array with time in the first
+  column; the others become ``ch1``, ``ch2``... A Fortran-ordered float64
+  array is mapped in place.
+* CSV files, and archives or arrays that cannot be mapped in place, are
+  converted once, in chunks, into a columnar sidecar. Later imports map the
+  sidecar directly for as long as the source file is unchanged.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+from itertools import islice
+import os
+from pathlib import Path
+import shutil
+import struct
+import tempfile
+from typing import TYPE_CHECKING, Callable, Iterator
+import zipfile
+
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+
+from pulsimgui.services.export_service import (
+    COLUMNAR_EXTENSION,
+    ExportCancelled,
+    ExportService,
+    check_cancelled,
+    report_progress,
+)
+from pulsimgui.services.result_store import ResultStore
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for typing
+    from pulsimgui.services.simulation_service import SimulationResult
+
+#: File extensions :func:`load_reference` accepts.
+REFERENCE_FORMATS = (".csv", ".npy", ".npz", COLUMNAR_EXTENSION)
+#: Rows parsed or copied per block while converting to a sidecar.
+CONVERT_CHUNK_ROWS = 1 << 16
+
+#: Lines searched for the first numeric row of a CSV file.
+_MAX_PREAMBLE_LINES = 1000
+_CACHE_DIRNAME = "pulsim-reference-cache"
+_ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")
+
+
+def reference_cache_path(filepath: str | Path, cache_dir: str | Path | None = None) -> Path:
+    """Path of the columnar sidecar converted from ``filepath``.
+
+    Without ``cache_dir`` the sidecar sits next to the source, named after it
+    (``capture.csv`` -> ``capture.csv.pwf``). In ``cache_dir`` its name also
+    carries a hash of the source path, so equally named files do not collide.
+    """
+    source = Path(filepath).resolve()
+    if cache_dir is None:
+        return source.with_name(source.name + COLUMNAR_EXTENSION)
+    digest = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir) / f"{source.stem}-{digest}{COLUMNAR_EXTENSION}"
+
+
+def load_reference(
+    filepath: str | Path,
+    cache_dir: str | Path | None = None,
+    progress: Callable[[float], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> "SimulationResult":
+    """Map an external waveform file as a result backed by read-only memmaps.
+
+    Args:
+        filepath: File with one of the :data:`REFERENCE_FORMATS` extensions.
+        cache_dir: Directory for converted sidecars. By default they are
+            written next to the source, or to a cache directory under the
+            system temporary directory when that is not writable.
+        progress: Called with the completed fraction (0-1) while converting.
+        is_cancelled: Polled between blocks; returning True aborts the
+            conversion with :class:`ExportCancelled` and leaves no sidecar.
+
+    Returns:
+        A result whose ``time`` and ``signals`` are memory maps.
+
+    Raises:
+        ValueError: If the file format is unsupported or the data is
+            malformed (no time axis, a decreasing time axis, signals whose
+            length differs from the time axis).
+        ExportCancelled: If ``is_cancelled`` requested cancellation.
+    """
+    from pulsimgui.services.simulation_service import SimulationResult
+
+    path = Path(filepath)
+    suffix = path.suffix.lower()
+    if suffix not in REFERENCE_FORMATS:
+        raise ValueError(f"Unsupported reference file type: {path.suffix or path.name}")
+
+    statistics: dict = {}
+    if suffix == COLUMNAR_EXTENSION:
+        time, signals, header = ExportService.read_waveform_columns(str(path))
+        statistics.update(header.get("statistics", {}))
+    else:
+        mapped = None
+        if suffix == ".npy":
+            mapped = _map_npy(path)
+        elif suffix == ".npz":
+            mapped = _map_npz(path)
+        if mapped is None:
+            sidecar = _converted_sidecar(path, cache_dir, progress, is_cancelled)
+            time, signals, _header = ExportService.read_waveform_columns(str(sidecar))
+        else:
+            time, signals = mapped
+
+    _check_time_axis(time, path)
+    for name, values in signals.items():
+        if values.shape != time.shape:
+            raise ValueError(
+                f"Signal '{name}' has {values.size} samples but the time axis has {time.size}"
+            )
+    statistics["reference_source"] = str(path)
+    report_progress(progress, 1.0)
+    return SimulationResult(time=time, signals=signals, statistics=statistics)
+
+
+class ReferenceImportWorker(QThread):
+    """Worker thread running :func:`load_reference`.
+
+    ``finished_signal`` carries the source path and the mapped result; a
+    cancelled import emits neither it nor ``error``. The min/max pyramids of
+    the signals are built here too (see :meth:`ResultStore.pyramid`), so the
+    first draw does not scan the record on the GUI thread.
+    """
+
+    progress = Signal(float, str)
+    finished_signal = Signal(str, object)
+    error = Signal(str)
+
+    def __init__(self, filepath: str, cache_dir: str | None = None, parent=None):
+        super().__init__(parent)
+        self._filepath = filepath
+        self._cache_dir = cache_dir
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Request cancellation; a partial sidecar is removed."""
+        self._cancelled = True
+
+    @property
+    def was_cancelled(self) -> bool:
+        """Return whether cancellation was requested."""
+        return self._cancelled
+
+    def run(self) -> None:
+        """Map or convert the reference file."""
+        name = Path(self._filepath).name
+        message = f"Importing {name}..."
+        self.progress.emit(0.0, message)
+        try:
+            result = load_reference(
+                self._filepath,
+                self._cache_dir,
+                progress=lambda fraction: self.progress.emit(100.0 * fraction, message),
+                is_cancelled=lambda: self._cancelled,
+            )
+            store = ResultStore.for_result(result)
+            for name in store.keys():
+                if self._cancelled:
+                    return
+                self.progress.emit(100.0, f"Indexing {name}...")
+                store.pyramid(name)
+        except ExportCancelled:
+            return
+        except Exception as exc:
+            self.error.emit(str(exc))
+            return
+        self.finished_signal.emit(self._filepath, result)
+
+
+def _map_npy(path: Path) -> tuple[np.ndarray, dict[str, np.ndarray]] | None:
+    """Map a float64 ``(samples, columns)`` array, or None if it needs converting."""
+    array = np.load(path, mmap_mode="r")
+    if array.ndim != 2 or array.shape[1] < 2:
+        raise ValueError(f"Expected a (samples, columns) array with time first in {path.name}")
+    columns = [array[:, index] for index in range(array.shape[1])]
+    if array.dtype != np.float64 or array.shape[0] == 0 or not all(map(_mappable, columns)):
+        return None
+    return columns[0], {f"ch{index}": column for index, column in enumerate(columns[1:], 1)}
+
+
+def _mappable(values: np.ndarray) -> bool:
+    """Whether ``values`` can be used in place.
+
+    NumPy copies a strided or misaligned array for searches and reductions.
+    A mapped array like that would be read from disk in full on every
+    redraw.
+    """
+    return values.flags.c_contiguous and values.flags.aligned
+
+
+def _npz_members(archive: zipfile.ZipFile) -> dict[str, zipfile.ZipInfo]:
+    members = {
+        info.filename[: -len(".npy")]: info
+        for info in archive.infolist()
+        if info.filename.endswith(".npy")
+    }
+    if "time" not in members:
+        raise ValueError(f"No 'time' array in {archive.filename}")
+    return members
+
+
+def _read_npy_header(f) -> tuple[tuple[int, ...], bool, np.dtype]:
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(f)
+    return np.lib.format.read_array_header_2_0(f)
+
+
+def _map_npz(path: Path) -> tuple[np.ndarray, dict[str, np.ndarray]] | None:
+    """Map the stored float64 members of an archive, or None if it needs converting."""
+    with zipfile.ZipFile(path) as archive:
+        members = _npz_members(archive)
+    if any(info.compress_type != zipfile.ZIP_STORED for info in members.values()):
+        return None
+
+    arrays: dict[str, np.ndarray] = {}
+    with open(path, "rb") as f:
+        for name, info in members.items():
+            # The data follows the member's local header, whose name and
+            # extra field lengths may differ from the central directory.
+            f.seek(info.header_offset)
+            signature, name_length, extra_length = _ZIP_LOCAL_HEADER.unpack(
+                f.read(_ZIP_LOCAL_HEADER.size)
+            )
+            if signature != b"PK\x03\x04":
+                raise ValueError(f"Corrupt archive member '{info.filename}' in {path.name}")
+            f.seek(info.header_offset + _ZIP_LOCAL_HEADER.size + name_length + extra_length)
+            shape, _fortran, dtype = _read_npy_header(f)
+            if dtype != np.float64 or len(shape) != 1 or shape[0] == 0:
+                return None
+            arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=f.tell(), shape=shape)
+            if not _mappable(arrays[name]):
+                return None
+    time = arrays.pop("time")
+    return time, arrays
+
+
+def _converted_sidecar(
+    path: Path,
+    cache_dir: str | Path | None,
+    progress: Callable[[float], None] | None,
+    is_cancelled: Callable[[], bool] | None,
+) -> Path:
+    """Return an up-to-date columnar sidecar of ``path``, converting if needed."""
+    stat = path.stat()
+    if cache_dir is not None:
+        candidates = [reference_cache_path(path, cache_dir)]
+    else:
+        candidates = [
+            reference_cache_path(path),
+            reference_cache_path(path, Path(tempfile.gettempdir()) / _CACHE_DIRNAME),
+        ]
+    for sidecar in candidates:
+        if _sidecar_is_current(sidecar, stat):
+            return sidecar
+
+    error: OSError | None = None
+    for sidecar in candidates:
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            scratch = Path(tempfile.mkdtemp(prefix=".pulsim-import-", dir=sidecar.parent))
+        except OSError as exc:
+            error = exc
+            continue
+        try:
+            _convert(path, stat, sidecar, scratch, progress, is_cancelled)
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+        return sidecar
+    raise ValueError(f"No writable location for the converted copy of {path.name}: {error}")
+
+
+def _sidecar_is_current(sidecar: Path, stat: os.stat_result) -> bool:
+    if not sidecar.is_file():
+        return False
+    try:
+        _time, _signals, header = ExportService.read_waveform_columns(str(sidecar))
+    except (OSError, ValueError, KeyError):
+        return False
+    statistics = header.get("statistics", {})
+    return (
+        statistics.get("source_size") == stat.st_size
+        and statistics.get("source_mtime_ns") == stat.st_mtime_ns
+    )
+
+
+def _convert(
+    path: Path,
+    stat: os.stat_result,
+    sidecar: Path,
+    scratch: Path,
+    progress: Callable[[float], None] | None,
+    is_cancelled: Callable[[], bool] | None,
+) -> None:
+    """Spool ``path`` into raw float64 columns, then write them as ``sidecar``.
+
+    Parsing takes the first 80 % of the reported progress, writing the rest.
+    """
+
+    def parse_progress(fraction: float) -> None:
+        report_progress(progress, 0.8 * fraction)
+
+    suffix = path.suffix.lower()
+    if suffix == ".npz":
+        names, rows = _spool_npz(path, scratch, parse_progress, is_cancelled)
+    else:
+        names, blocks = (_csv_blocks if suffix == ".csv" else _npy_blocks)(path, parse_progress)
+        rows = _spool_blocks(blocks, scratch, len(names), is_cancelled)
+    if rows == 0:
+        raise ValueError(f"No samples in {path.name}")
+
+    columns = [
+        np.memmap(_column_file(scratch, index), dtype="<f8", mode="r", shape=(rows,))
+        for index in range(len(names))
+    ]
+    _check_time_axis(columns[0], path)
+    store = ResultStore(
+        columns[0],
+        dict(zip(names[1:], columns[1:])),
+        {
+            "source_name": path.name,
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+        },
+    )
+    partial = scratch / sidecar.name
+    ExportService.export_waveforms_columnar(
+        store,
+        str(partial),
+        progress=lambda fraction: report_progress(progress, 0.8 + 0.2 * fraction),
+        is_cancelled=is_cancelled,
+    )
+    del store, columns
+    os.replace(partial, sidecar)
+
+
+def _column_file(scratch: Path, index: int) -> Path:
+    return scratch / f"column_{index}.f8"
+
+
+def _spool_blocks(
+    blocks: Iterator[np.ndarray],
+    scratch: Path,
+    width: int,
+    is_cancelled: Callable[[], bool] | None,
+) -> int:
+    """Append the columns of ``(rows, width)`` blocks to raw float64 files."""
+    rows = 0
+    handles = [open(_column_file(scratch, index), "wb") for index in range(width)]
+    try:
+        for block in blocks:
+            check_cancelled(is_cancelled)
+            for index, handle in enumerate(handles):
+                handle.write(np.ascontiguousarray(block[:, index], dtype="<f8").tobytes())
+            rows += block.shape[0]
+    finally:
+        for handle in handles:
+            handle.close()
+    return rows
+
+
+def _npy_blocks(
+    path: Path, progress: Callable[[float], None]
+) -> tuple[list[str], Iterator[np.ndarray]]:
+    array = np.load(path, mmap_mode="r")
+    names = ["time"] + [f"ch{index}" for index in range(1, array.shape[1])]
+
+    def blocks() -> Iterator[np.ndarray]:
+        for first in range(0, array.shape[0], CONVERT_CHUNK_ROWS):
+            yield np.asarray(array[first : first + CONVERT_CHUNK_ROWS], dtype=np.float64)
+            progress(min(1.0, (first + CONVERT_CHUNK_ROWS) / array.shape[0]))
+
+    return names, blocks()
+
+
+def _spool_npz(
+    path: Path,
+    scratch: Path,
+    progress: Callable[[float], None],
+    is_cancelled: Callable[[], bool] | None,
+) -> tuple[list[str], int]:
+    """Stream each archive member, decompressing block by block, to a raw column."""
+    with zipfile.ZipFile(path) as archive:
+        members = _npz_members(archive)
+        names = ["time"] + [name for name in members if name != "time"]
+        total = sum(info.file_size for info in members.values()) or 1
+        done = 0
+        rows = None
+        for index, name in enumerate(names):
+            column = _column_file(scratch, index)
+            with archive.open(members[name]) as source, open(column, "wb") as target:
+                shape, _fortran, dtype = _read_npy_header(source)
+                if len(shape) != 1 or dtype.hasobject:
+                    raise ValueError(f"Array '{name}' in {path.name} is not a 1-D numeric array")
+                if rows is None:
+                    rows = shape[0]
+                remaining = shape[0]
+                while remaining:
+                    check_cancelled(is_cancelled)
+                    count = min(remaining, CONVERT_CHUNK_ROWS)
+                    raw = source.read(count * dtype.itemsize)
+                    if len(raw) != count * dtype.itemsize:
+                        raise ValueError(f"Array '{name}' in {path.name} is truncated")
+                    target.write(np.frombuffer(raw, dtype=dtype).astype("<f8").tobytes())
+                    remaining -= count
+                    done += len(raw)
+                    progress(done / total)
+            if shape[0] != rows:
+                raise ValueError(
+                    f"Signal '{name}' has {shape[0]} samples but the time axis has {rows}"
+                )
+    return names, rows or 0
+
+
+def _csv_blocks(
+    path: Path, progress: Callable[[float], None]
+) -> tuple[list[str], Iterator[np.ndarray]]:
+    """Column names and numeric row blocks of a delimited text file.
+
+    Lines before the first numeric row are skipped, except that the last of
+    them names the columns when it has as many fields. Empty fields read as
+    NaN.
+    """
+    total = path.stat().st_size or 1
+    data_offset = 0
+    header_line: str | None = None
+    first_row: str | None = None
+    with open(path, "rb") as f:
+        for _ in range(_MAX_PREAMBLE_LINES):
+            raw = f.readline()
+            if not raw:
+                break
+            line = raw.decode("utf-8", errors="replace").lstrip("\ufeff").strip()
+            if line and _numeric_fields(line, _sniff_delimiter(line)) is not None:
+                first_row = line
+                break
+            data_offset += len(raw)
+            if line:
+                header_line = line
+    if first_row is None:
+        raise ValueError(f"No numeric rows in {path.name}")
+
+    delimiter = _sniff_delimiter(first_row)
+    width = len(_numeric_fields(first_row, delimiter))
+    if width < 2:
+        raise ValueError(f"Expected a time column and at least one signal in {path.name}")
+    names = ["time"] + [f"ch{index}" for index in range(1, width)]
+    if header_line is not None:
+        fields = next(csv.reader([header_line], delimiter=delimiter or " ", skipinitialspace=True))
+        fields = [field.strip() for field in fields]
+        if len(fields) == width and all(fields[1:]) and len(set(fields[1:])) == width - 1:
+            names[1:] = fields[1:]
+
+    def blocks() -> Iterator[np.ndarray]:
+        with open(path, "rb") as f:
+            f.seek(data_offset)
+            consumed = data_offset
+            while True:
+                raw_lines = list(islice(f, CONVERT_CHUNK_ROWS))
+                if not raw_lines:
+                    return
+                consumed += sum(len(raw) for raw in raw_lines)
+                lines = [raw.decode("utf-8", errors="replace") for raw in raw_lines]
+                yield _parse_block(lines, delimiter, width, path)
+                progress(consumed / total)
+
+    return names, blocks()
+
+
+def _sniff_delimiter(line: str) -> str | None:
+    for delimiter in ("\t", ";", ","):
+        if delimiter in line:
+            return delimiter
+    return None
+
+
+def _split(line: str, delimiter: str | None) -> list[str]:
+    fields = line.split(delimiter) if delimiter else line.split()
+    return [field.strip().strip('"') for field in fields]
+
+
+def _numeric_fields(line: str, delimiter: str | None) -> list[float] | None:
+    try:
+        return [float(field) for field in _split(line, delimiter)]
+    except ValueError:
+        return None
+
+
+def _parse_block(lines: list[str], delimiter: str | None, width: int, path: Path) -> np.ndarray:
+    """Parse data lines into a ``(rows, width)`` float64 block."""
+    try:
+        block = np.loadtxt(lines, delimiter=delimiter, quotechar='"', ndmin=2, dtype=np.float64)
+    except ValueError:
+        # Slow path for empty fields, which loadtxt rejects.
+        block = _parse_rows(lines, delimiter, width, path)
+    if block.shape[1] != width:
+        raise ValueError(f"Rows of {path.name} do not all have {width} fields")
+    return block
+
+
+def _parse_rows(lines: list[str], delimiter: str | None, width: int, path: Path) -> np.ndarray:
+    """Parse data lines one by one, reading empty fields as NaN."""
+    rows = []
+    for line in lines:
+        if not line.strip():
+            continue
+        fields = _split(line.strip(), delimiter)
+        try:
+            rows.append([float(field) if field else np.nan for field in fields])
+        except ValueError:
+            raise ValueError(f"Non-numeric row in {path.name}: {line.strip()[:80]}") from None
+    if any(len(row) != width for row in rows):
+        raise ValueError(f"Rows of {path.name} do not all have {width} fields")
+    return np.array(rows, dtype=np.float64).reshape(-1, width)
+
+
+def _check_time_axis(time: np.ndarray, path: Path) -> None:
+    """Reject an empty, non-finite or decreasing time axis, reading it block by block."""
+    if time.size == 0:
+        raise ValueError(f"No samples in {path.name}")
+    for first in range(0, time.size, CONVERT_CHUNK_ROWS):
+        block = np.asarray(time[max(first - 1, 0) : first + CONVERT_CHUNK_ROWS])
+        if not np.isfinite(block).all() or np.any(np.diff(block) < 0.0):
+            raise ValueError(f"The time axis of {path.name} must be finite and non-decreasing")
+
+
+__all__ = [
+    "CONVERT_CHUNK_ROWS",
+    "REFERENCE_FORMATS",
+    "ReferenceImportWorker",
+    "load_reference",
+    "reference_cache_path",
+]
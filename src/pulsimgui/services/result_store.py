@@ -0,0 +1,291 @@
+"""Shared, read-only storage of simulation results for viewers.
+
+Several scope windows usually show channels of the same run. Instead of each
+window copying the time axis and its bound series, every window resolves
+:class:`SignalView` references into one :class:`ResultStore` per result. The
+store converts each series to a read-only float64 array the first time any
+window asks for it. Views slice those arrays without copying, so rebinding a
+channel only re-resolves names.
+
+For drawing long records, :meth:`ResultStore.pyramid` keeps a
+:class:`MinMaxPyramid` per series: min/max envelopes at successively coarser
+resolutions, so a redraw reads a few buckets per pixel instead of every
+sample.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Sequence
+import weakref
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for typing
+    from pulsimgui.services.simulation_service import SimulationResult
+
+#: Samples per bucket at the finest pyramid level.
+PYRAMID_BASE = 64
+#: Buckets of one level merged into one bucket of the next.
+PYRAMID_FACTOR = 8
+#: Samples read at a time while building the finest level.
+_PYRAMID_CHUNK = PYRAMID_BASE << 14
+
+
+def _read_only(values: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Return ``values`` as a read-only float64 array, copying only to convert."""
+    array = np.asarray(values, dtype=np.float64)
+    if array is values:
+        # Freeze a view so the caller's own array stays writable.
+        array = array.view()
+    array.flags.writeable = False
+    return array
+
+
+class ResultStore:
+    """Read-only time axis and signals of one simulation result.
+
+    Series are converted lazily and cached. Arrays handed out are not
+    writeable, so a consumer cannot corrupt what other windows display.
+    """
+
+    _shared: dict[int, tuple[weakref.ref, "ResultStore"]] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        time: Sequence[float] | np.ndarray,
+        signals: Mapping[str, Sequence[float] | np.ndarray],
+        statistics: Mapping[str, Any] | None = None,
+    ) -> None:
+        self._time = _read_only(time)
+        self._raw = signals
+        self._arrays: dict[str, np.ndarray] = {}
+        self._pyramids: dict[str, MinMaxPyramid] = {}
+        self._statistics = MappingProxyType(dict(statistics or {}))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_result(cls, result: "SimulationResult") -> "ResultStore":
+        """Return the store shared by every consumer of ``result``.
+
+        Stores are cached by result identity for as long as the result is
+        alive. A result whose time axis has grown since (a streamed run)
+        gets a fresh store.
+        """
+        key = id(result)
+        with cls._shared_lock:
+            entry = cls._shared.get(key)
+            if entry is not None:
+                ref, store = entry
+                if ref() is result and store.sample_count == len(result.time):
+                    return store
+
+            store = cls(result.time, result.signals, result.statistics)
+
+            def _forget(dead: weakref.ref, key: int = key) -> None:
+                with cls._shared_lock:
+                    current = cls._shared.get(key)
+                    if current is not None and current[0] is dead:
+                        del cls._shared[key]
+
+            cls._shared[key] = (weakref.ref(result, _forget), store)
+            return store
+
+    @property
+    def time(self) -> np.ndarray:
+        """Read-only time axis."""
+        return self._time
+
+    @property
+    def sample_count(self) -> int:
+        """Number of time samples."""
+        return int(self._time.size)
+
+    @property
+    def statistics(self) -> Mapping[str, Any]:
+        """Read-only run statistics."""
+        return self._statistics
+
+    def keys(self) -> list[str]:
+        """Return the signal names in result order."""
+        return list(self._raw.keys())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Return the read-only array of ``key``, or None when it is missing."""
+        array = self._arrays.get(key)
+        if array is not None:
+            return array
+        raw = self._raw.get(key)
+        if raw is None:
+            return None
+        with self._lock:
+            array = self._arrays.get(key)
+            if array is None:
+                array = _read_only(raw)
+                self._arrays[key] = array
+        return array
+
+    def view(self, key: str, start: int = 0, stop: int | None = None) -> "SignalView":
+        """Return a reference to samples ``start:stop`` of ``key``."""
+        return SignalView(self, key, start, stop)
+
+    def pyramid(self, key: str) -> "MinMaxPyramid | None":
+        """Return the min/max pyramid of ``key``, building it on first use.
+
+        None when the signal is missing or does not match the time axis.
+        """
+        pyramid = self._pyramids.get(key)
+        if pyramid is not None:
+            return pyramid
+        values = self.get(key)
+        if values is None or values.shape != self._time.shape:
+            return None
+        with self._lock:
+            pyramid = self._pyramids.get(key)
+            if pyramid is None:
+                pyramid = MinMaxPyramid(self._time, values)
+                self._pyramids[key] = pyramid
+        return pyramid
+
+
+@dataclass(frozen=True)
+class PyramidLevel:
+    """Min/max envelope of a series in buckets of equal sample count.
+
+    Attributes:
+        bucket: Samples per bucket; bucket ``i`` covers samples
+            ``i * bucket`` up to ``(i + 1) * bucket``.
+        time: Time of the first sample of each bucket.
+        lows: Minimum of each bucket.
+        highs: Maximum of each bucket.
+    """
+
+    bucket: int
+    time: np.ndarray
+    lows: np.ndarray
+    highs: np.ndarray
+
+
+class MinMaxPyramid:
+    """Min/max envelopes of one series at successively coarser resolutions.
+
+    The finest level has :data:`PYRAMID_BASE` samples per bucket and each
+    next one :data:`PYRAMID_FACTOR` times more. Together the levels take
+    about a twentieth of the series' memory. The series is read in blocks
+    while building, so a memory-mapped record is never loaded as a whole.
+    """
+
+    def __init__(self, time: np.ndarray, values: np.ndarray) -> None:
+        self._levels: list[PyramidLevel] = []
+        n_samples = len(values)
+        if n_samples < 2 * PYRAMID_BASE:
+            return
+
+        lows = np.empty(-(-n_samples // PYRAMID_BASE))
+        highs = np.empty_like(lows)
+        for first in range(0, n_samples, _PYRAMID_CHUNK):
+            block = np.asarray(values[first : first + _PYRAMID_CHUNK], dtype=np.float64)
+            out = slice(first // PYRAMID_BASE, None)
+            _bucket_extremes(block, block, PYRAMID_BASE, lows[out], highs[out])
+        bucket_time = np.array(time[::PYRAMID_BASE], dtype=np.float64)
+        self._levels.append(PyramidLevel(PYRAMID_BASE, bucket_time, lows, highs))
+
+        while len(lows) >= 2 * PYRAMID_FACTOR:
+            size = -(-len(lows) // PYRAMID_FACTOR)
+            coarse_lows, coarse_highs = np.empty(size), np.empty(size)
+            _bucket_extremes(lows, highs, PYRAMID_FACTOR, coarse_lows, coarse_highs)
+            lows, highs = coarse_lows, coarse_highs
+            bucket_time = bucket_time[::PYRAMID_FACTOR].copy()
+            bucket = self._levels[-1].bucket * PYRAMID_FACTOR
+            self._levels.append(PyramidLevel(bucket, bucket_time, lows, highs))
+
+    @property
+    def levels(self) -> list[PyramidLevel]:
+        """Levels from finest to coarsest; empty for short series."""
+        return list(self._levels)
+
+    def level_for(self, samples: int, buckets: int) -> PyramidLevel | None:
+        """Coarsest level still splitting ``samples`` into at least ``buckets`` buckets.
+
+        None when even the finest level is too coarse, in which case the
+        samples themselves should be used.
+        """
+        for level in reversed(self._levels):
+            if samples // level.bucket >= buckets:
+                return level
+        return None
+
+
+def _bucket_extremes(
+    lows: np.ndarray,
+    highs: np.ndarray,
+    bucket: int,
+    out_lows: np.ndarray,
+    out_highs: np.ndarray,
+) -> None:
+    """Write the minimum of ``lows`` and maximum of ``highs`` per ``bucket`` items."""
+    full = len(lows) // bucket
+    if full:
+        np.min(lows[: full * bucket].reshape(full, bucket), axis=1, out=out_lows[:full])
+        np.max(highs[: full * bucket].reshape(full, bucket), axis=1, out=out_highs[:full])
+    if len(lows) > full * bucket:
+        out_lows[full] = lows[full * bucket :].min()
+        out_highs[full] = highs[full * bucket :].max()
+
+
+@dataclass(frozen=True)
+class SignalView:
+    """Lightweight reference to a sample range of one stored signal.
+
+    Attributes:
+        store: Store holding the data.
+        key: Signal name inside the store.
+        start: First sample of the range.
+        stop: End of the range (exclusive). None runs to the last sample.
+    """
+
+    store: ResultStore
+    key: str
+    start: int = 0
+    stop: int | None = None
+
+    @property
+    def is_valid(self) -> bool:
+        """True when the signal exists and matches the time axis length."""
+        values = self.store.get(self.key)
+        return values is not None and values.size == self.store.sample_count > 0
+
+    @property
+    def time(self) -> np.ndarray:
+        """Time samples of the range (a view, not a copy)."""
+        return self.store.time[self.start : self.stop]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Signal samples of the range (a view, not a copy); empty when missing."""
+        values = self.store.get(self.key)
+        if values is None:
+            return np.empty(0)
+        return values[self.start : self.stop]
+
+
+__all__ = [
+    "MinMaxPyramid",
+    "PYRAMID_BASE",
+    "PYRAMID_FACTOR",
+    "PyramidLevel",
+    "ResultStore",
+    "SignalView",
+]
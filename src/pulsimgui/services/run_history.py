@@ -0,0 +1,374 @@
+"""History of recent transient runs for before/after comparisons.
+
+:class:`RunHistory` keeps the most recent simulation results in memory,
+bounded both by run count and by the bytes their samples occupy. The least
+recently used run is evicted first. With a spill directory, an evicted run
+is written to one ``.npy`` file per series, in a directory of its own under
+the spill directory so histories sharing it never collide, and stays listed. Fetching it
+again maps those files with ``np.memmap`` instead of reading them into RAM.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+import threading
+import time as _time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for typing
+    from pulsimgui.services.simulation_service import SimulationResult
+
+#: Runs kept in memory by default.
+DEFAULT_MAX_RUNS = 8
+#: Sample bytes kept in memory by default.
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+#: Spilled runs kept on disk before the oldest is deleted.
+DEFAULT_MAX_SPILLED_RUNS = 32
+
+_MANIFEST = "manifest.json"
+#: Size of one boxed Python float held by a list.
+_FLOAT_OBJECT_BYTES = sys.getsizeof(0.0)
+
+
+def _series_nbytes(values) -> int:
+    if isinstance(values, np.ndarray):
+        return int(values.nbytes)
+    # A list holds a pointer per item plus one float object per sample.
+    return sys.getsizeof(values) + len(values) * _FLOAT_OBJECT_BYTES
+
+
+def result_nbytes(result: "SimulationResult") -> int:
+    """Bytes the samples of ``result`` occupy in memory.
+
+    Arrays count their buffer. Lists count the list itself and one boxed
+    float per sample, about four times the size of a float64 array.
+    """
+    return _series_nbytes(result.time) + sum(
+        _series_nbytes(values) for values in result.signals.values()
+    )
+
+
+@dataclass
+class RunRecord:
+    """One run of the history.
+
+    Attributes:
+        run_id: Increasing identifier, unique within the history.
+        label: Name shown to the user.
+        created: Wall-clock time the run was recorded (``time.time()``).
+        nbytes: Sample bytes of the run (see :func:`result_nbytes`).
+        signal_names: Signals of the run, in result order.
+        result: The result while it is held in memory, else None.
+        spill_path: Directory holding the spilled arrays, else None.
+        mapped: The spilled arrays mapped read-only by :meth:`RunHistory.peek`,
+            which do not count against the memory budget.
+    """
+
+    run_id: int
+    label: str
+    created: float
+    nbytes: int
+    signal_names: list[str]
+    result: "SimulationResult | None" = None
+    spill_path: Path | None = None
+    mapped: "SimulationResult | None" = None
+
+    @property
+    def in_memory(self) -> bool:
+        """Whether the result is currently held in memory."""
+        return self.result is not None
+
+
+class RunHistory:
+    """LRU history of simulation results bounded by count and bytes.
+
+    Args:
+        max_runs: Runs kept in memory.
+        max_bytes: Sample bytes kept in memory. The newest run is always
+            kept, even when it alone exceeds the budget.
+        spill_dir: Directory for evicted runs. Each history spills into its
+            own temporary subdirectory, removed by :meth:`clear`. None drops
+            evicted runs.
+        max_spilled_runs: Spilled runs kept before the oldest is deleted.
+    """
+
+    def __init__(
+        self,
+        max_runs: int = DEFAULT_MAX_RUNS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        spill_dir: str | Path | None = None,
+        max_spilled_runs: int = DEFAULT_MAX_SPILLED_RUNS,
+    ) -> None:
+        self._max_runs = 1
+        self._max_bytes = 0
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._max_spilled_runs = max(0, int(max_spilled_runs))
+        # Per-history subdirectories made under each spill directory used.
+        self._session_dirs: dict[Path, Path] = {}
+        # Ordered from least to most recently used.
+        self._records: OrderedDict[int, RunRecord] = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.RLock()
+        self.set_limits(max_runs, max_bytes)
+
+    def set_spill_dir(self, spill_dir: str | Path | None) -> None:
+        """Spill future evictions to ``spill_dir``; None drops them instead.
+
+        Runs already spilled stay where they are.
+        """
+        with self._lock:
+            self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+
+    @property
+    def max_runs(self) -> int:
+        """Runs kept in memory."""
+        return self._max_runs
+
+    @property
+    def max_bytes(self) -> int:
+        """Sample bytes kept in memory."""
+        return self._max_bytes
+
+    @property
+    def spill_dir(self) -> Path | None:
+        """Directory evicted runs are spilled to, or None."""
+        return self._spill_dir
+
+    @property
+    def memory_bytes(self) -> int:
+        """Sample bytes of the runs held in memory."""
+        with self._lock:
+            return sum(r.nbytes for r in self._records.values() if r.in_memory)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def max_spilled_runs(self) -> int:
+        """Spilled runs kept on disk."""
+        return self._max_spilled_runs
+
+    def set_limits(
+        self,
+        max_runs: int | None = None,
+        max_bytes: int | None = None,
+        max_spilled_runs: int | None = None,
+    ) -> None:
+        """Change the limits, evicting runs that no longer fit.
+
+        Raises:
+            ValueError: If ``max_runs`` is below 1, or ``max_bytes`` or
+                ``max_spilled_runs`` is negative.
+        """
+        if max_runs is not None and int(max_runs) < 1:
+            raise ValueError("max_runs must be at least 1")
+        if max_bytes is not None and int(max_bytes) < 0:
+            raise ValueError("max_bytes must not be negative")
+        if max_spilled_runs is not None and int(max_spilled_runs) < 0:
+            raise ValueError("max_spilled_runs must not be negative")
+        with self._lock:
+            if max_runs is not None:
+                self._max_runs = int(max_runs)
+            if max_bytes is not None:
+                self._max_bytes = int(max_bytes)
+            if max_spilled_runs is not None:
+                self._max_spilled_runs = int(max_spilled_runs)
+            self._evict()
+
+    def add(self, result: "SimulationResult", label: str | None = None) -> RunRecord:
+        """Record ``result`` as the most recent run.
+
+        Adding a result that is already held (an extended run) refreshes its
+        size and recency instead of creating a new entry.
+        """
+        with self._lock:
+            for record in self._records.values():
+                if record.result is result:
+                    record.nbytes = result_nbytes(result)
+                    record.signal_names = list(result.signals)
+                    if record.spill_path is not None:
+                        # The spilled copy is stale now.
+                        shutil.rmtree(record.spill_path, ignore_errors=True)
+                        record.spill_path = None
+                        record.mapped = None
+                    self._records.move_to_end(record.run_id)
+                    self._evict(keep=record.run_id)
+                    return record
+
+            run_id = self._next_id
+            self._next_id += 1
+            record = RunRecord(
+                run_id=run_id,
+                label=label or f"Run {run_id}",
+                created=_time.time(),
+                nbytes=result_nbytes(result),
+                signal_names=list(result.signals),
+                result=result,
+            )
+            self._records[run_id] = record
+            self._evict(keep=run_id)
+            return record
+
+    def runs(self) -> list[RunRecord]:
+        """Return every run, newest first."""
+        with self._lock:
+            return sorted(self._records.values(), key=lambda r: r.run_id, reverse=True)
+
+    def record(self, run_id: int) -> RunRecord | None:
+        """Return the record of ``run_id`` without touching its recency."""
+        return self._records.get(run_id)
+
+    def get(self, run_id: int) -> "SimulationResult | None":
+        """Return the result of ``run_id``, mapping it back from disk if spilled.
+
+        The run becomes the most recently used one.
+        """
+        with self._lock:
+            record = self._records.get(run_id)
+            if record is None:
+                return None
+            if record.result is None:
+                if record.spill_path is None:
+                    return None
+                record.result = self._mapped(record)
+            self._records.move_to_end(run_id)
+            self._evict(keep=run_id)
+            return record.result
+
+    def peek(self, run_id: int) -> "SimulationResult | None":
+        """Return the result of ``run_id`` without touching its recency.
+
+        A spilled run is mapped read-only from disk and stays spilled, so
+        readers such as plot overlays neither reload it into memory nor
+        keep it from being evicted. Callers should not hold on to the
+        result of an in-memory run; peek again when it is needed.
+        """
+        with self._lock:
+            record = self._records.get(run_id)
+            if record is None:
+                return None
+            if record.result is not None:
+                return record.result
+            if record.spill_path is None:
+                return None
+            return self._mapped(record)
+
+    @staticmethod
+    def _mapped(record: RunRecord) -> "SimulationResult":
+        if record.mapped is None:
+            record.mapped = _load_spilled(record.spill_path)
+        return record.mapped
+
+    def remove(self, run_id: int) -> None:
+        """Forget ``run_id`` and delete its spilled files."""
+        with self._lock:
+            record = self._records.pop(run_id, None)
+        if record is not None and record.spill_path is not None:
+            shutil.rmtree(record.spill_path, ignore_errors=True)
+
+    def clear(self) -> None:
+        """Forget every run and delete all spilled files and directories."""
+        with self._lock:
+            records = list(self._records.values())
+            self._records.clear()
+            session_dirs = list(self._session_dirs.values())
+            self._session_dirs.clear()
+        for record in records:
+            if record.spill_path is not None:
+                shutil.rmtree(record.spill_path, ignore_errors=True)
+        for session_dir in session_dirs:
+            shutil.rmtree(session_dir, ignore_errors=True)
+
+    def _evict(self, keep: int | None = None) -> None:
+        """Evict least recently used runs until the memory limits hold."""
+        held = [r for r in self._records.values() if r.in_memory]
+        count = len(held)
+        total = sum(r.nbytes for r in held)
+        for record in held:
+            if count <= self._max_runs and total <= self._max_bytes:
+                break
+            if record.run_id == keep:
+                continue
+            count -= 1
+            total -= record.nbytes
+            self._release(record)
+
+        spilled = [r for r in self._records.values() if not r.in_memory]
+        for record in spilled[: max(0, len(spilled) - self._max_spilled_runs)]:
+            self.remove(record.run_id)
+
+    def _release(self, record: RunRecord) -> None:
+        if self._spill_dir is None:
+            del self._records[record.run_id]
+            return
+        if record.spill_path is None and record.result is not None:
+            record.spill_path = _spill(record.result, self._session_dir() / f"run_{record.run_id}")
+        record.result = None
+
+    def _session_dir(self) -> Path:
+        """Return this history's own directory under the spill directory."""
+        session_dir = self._session_dirs.get(self._spill_dir)
+        if session_dir is None:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+            session_dir = Path(tempfile.mkdtemp(prefix="runs_", dir=self._spill_dir))
+            self._session_dirs[self._spill_dir] = session_dir
+        return session_dir
+
+
+def _spill(result: "SimulationResult", path: Path) -> Path:
+    """Write ``result`` as one ``.npy`` file per series under ``path``."""
+    path.mkdir(parents=True, exist_ok=True)
+    np.save(path / "time.npy", np.asarray(result.time, dtype=np.float64))
+    files: dict[str, str] = {}
+    for index, (name, values) in enumerate(result.signals.items()):
+        filename = f"signal_{index}.npy"
+        np.save(path / filename, np.asarray(values, dtype=np.float64))
+        files[name] = filename
+    manifest = {
+        "signals": files,
+        "statistics": _json_safe(result.statistics),
+    }
+    (path / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+    return path
+
+
+def _load_spilled(path: Path) -> "SimulationResult":
+    """Map a spilled run back as a result backed by read-only memmaps."""
+    from pulsimgui.services.simulation_service import SimulationResult
+
+    manifest = json.loads((path / _MANIFEST).read_text(encoding="utf-8"))
+    signals = {
+        name: np.load(path / filename, mmap_mode="r")
+        for name, filename in manifest["signals"].items()
+    }
+    return SimulationResult(
+        time=np.load(path / "time.npy", mmap_mode="r"),
+        signals=signals,
+        statistics=dict(manifest.get("statistics", {})),
+    )
+
+
+def _json_safe(statistics: dict) -> dict:
+    safe = {}
+    for key, value in statistics.items():
+        if isinstance(value, (bool, int, float, str)) or value is None:
+            safe[str(key)] = value
+    return safe
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_RUNS",
+    "DEFAULT_MAX_SPILLED_RUNS",
+    "RunHistory",
+    "RunRecord",
+    "result_nbytes",
+]
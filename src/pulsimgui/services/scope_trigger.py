@@ -0,0 +1,326 @@
+"""Oscilloscope-style triggering of streamed waveforms.
+
+While a transient streams in, redrawing the whole growing history gets
+slower as the run goes on. :class:`StreamTrigger` instead keeps a bounded
+buffer of recent samples and finds edge crossings of a source signal. It
+hands back only the window around the latest trigger, so the cost of a
+display refresh does not depend on the length of the run.
+
+Modes follow bench scopes:
+
+* ``auto`` shows the latest triggered sweep, or free-runs on the newest
+  samples when no trigger arrived for a while.
+* ``normal`` only ever shows triggered sweeps and keeps the last one on
+  screen between triggers.
+* ``single`` captures one sweep and then disarms until :meth:`rearm`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Mapping
+
+import numpy as np
+
+TRIGGER_MODES: tuple[str, ...] = ("auto", "normal", "single")
+TRIGGER_SLOPES: tuple[str, ...] = ("rising", "falling")
+#: Samples kept per series by default.
+DEFAULT_BUFFER_SAMPLES = 1 << 20
+#: Windows without a trigger before ``auto`` mode free-runs.
+AUTO_TIMEOUT_WINDOWS = 2.0
+
+
+@dataclass
+class TriggerSettings:
+    """Trigger configuration.
+
+    Attributes:
+        source: Signal whose crossings trigger a sweep.
+        level: Threshold in the source signal's units.
+        slope: ``"rising"`` or ``"falling"``.
+        mode: One of :data:`TRIGGER_MODES`.
+        window: Displayed time span in seconds.
+        pre_trigger: Fraction of the window shown before the trigger.
+        holdoff: Minimum time between triggers in seconds. A new sweep never
+            starts before the current one is complete.
+
+    Raises:
+        ValueError: On an unknown slope or mode, or out-of-range values.
+    """
+
+    source: str
+    level: float = 0.0
+    slope: str = "rising"
+    mode: str = "auto"
+    window: float = 1e-4
+    pre_trigger: float = 0.25
+    holdoff: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.slope not in TRIGGER_SLOPES:
+            raise ValueError(f"Unknown trigger slope '{self.slope}'")
+        if self.mode not in TRIGGER_MODES:
+            raise ValueError(f"Unknown trigger mode '{self.mode}'")
+        if not self.window > 0.0:
+            raise ValueError("The trigger window must be positive")
+        if not 0.0 <= self.pre_trigger <= 1.0:
+            raise ValueError("pre_trigger must be between 0 and 1")
+        if self.holdoff < 0.0:
+            raise ValueError("holdoff must not be negative")
+
+    @property
+    def post_trigger_time(self) -> float:
+        """Seconds shown after the trigger."""
+        return self.window * (1.0 - self.pre_trigger)
+
+    @property
+    def pre_trigger_time(self) -> float:
+        """Seconds shown before the trigger."""
+        return self.window * self.pre_trigger
+
+
+@dataclass
+class TriggeredFrame:
+    """One sweep ready for display.
+
+    Attributes:
+        time: Sample times relative to the trigger (negative before it).
+        signals: Samples of every series over the sweep.
+        trigger_time: Absolute trigger time, or None for a free-running
+            ``auto`` sweep.
+        sweeps: Triggered sweeps captured since the last reset.
+    """
+
+    time: np.ndarray
+    signals: dict[str, np.ndarray] = field(default_factory=dict)
+    trigger_time: float | None = None
+    sweeps: int = 0
+
+    @property
+    def triggered(self) -> bool:
+        """Whether the sweep is aligned on a trigger event."""
+        return self.trigger_time is not None
+
+
+class StreamBuffer:
+    """Column store of the most recent streamed samples.
+
+    Appends are amortized O(1). Once ``capacity`` is exceeded the oldest
+    half is dropped, so memory stays bounded for runs of any length.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_BUFFER_SAMPLES) -> None:
+        self._capacity = max(16, int(capacity))
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every sample."""
+        self._time = np.empty(self._capacity)
+        self._series: dict[str, np.ndarray] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def time(self) -> np.ndarray:
+        """Buffered sample times (a view, valid until the next append)."""
+        return self._time[: self._size]
+
+    def names(self) -> list[str]:
+        """Buffered series, in arrival order."""
+        return list(self._series)
+
+    def values(self, name: str) -> np.ndarray | None:
+        """Buffered samples of ``name`` (a view), or None."""
+        series = self._series.get(name)
+        return None if series is None else series[: self._size]
+
+    def append(self, time: np.ndarray, signals: Mapping[str, np.ndarray]) -> None:
+        """Append samples; series missing from ``signals`` are padded with NaN."""
+        time = np.asarray(time, dtype=np.float64).reshape(-1)
+        count = time.size
+        if count == 0:
+            return
+        if count >= self._capacity:
+            time = time[-self._capacity :]
+            signals = {name: np.asarray(values)[-self._capacity :] for name, values in signals.items()}
+            count = time.size
+            self._size = 0
+        elif self._size + count > self._capacity:
+            keep = min(self._size, self._capacity // 2, self._capacity - count)
+            drop = self._size - keep
+            self._time[:keep] = self._time[drop : self._size]
+            for series in self._series.values():
+                series[:keep] = series[drop : self._size]
+            self._size = keep
+
+        start, stop = self._size, self._size + count
+        self._time[start:stop] = time
+        for name, values in signals.items():
+            if name not in self._series:
+                series = np.empty(self._capacity)
+                series[:start] = np.nan
+                self._series[name] = series
+            values = np.asarray(values, dtype=np.float64).reshape(-1)
+            target = self._series[name]
+            filled = min(values.size, count)
+            target[start : start + filled] = values[:filled]
+            target[start + filled : stop] = np.nan
+        for name, series in self._series.items():
+            if name not in signals:
+                series[start:stop] = np.nan
+        self._size = stop
+
+
+class StreamTrigger:
+    """Find trigger events in streamed samples and cut sweeps around them.
+
+    Each :meth:`process` call scans at most the last two windows (plus
+    holdoff) of samples, so its cost is independent of the run length.
+
+    Args:
+        settings: Trigger configuration.
+        capacity: Samples kept per series; must exceed the samples in two
+            windows for triggering to see whole sweeps.
+    """
+
+    def __init__(self, settings: TriggerSettings, capacity: int = DEFAULT_BUFFER_SAMPLES) -> None:
+        self._settings = settings
+        self._buffer = StreamBuffer(capacity)
+        self.reset()
+
+    @property
+    def settings(self) -> TriggerSettings:
+        """Current configuration."""
+        return self._settings
+
+    @settings.setter
+    def settings(self, value: TriggerSettings) -> None:
+        self._settings = value
+        self.rearm()
+
+    @property
+    def buffer(self) -> StreamBuffer:
+        """Samples buffered so far."""
+        return self._buffer
+
+    @property
+    def armed(self) -> bool:
+        """False once a ``single`` sweep was captured."""
+        return self._armed
+
+    @property
+    def sweeps(self) -> int:
+        """Triggered sweeps captured since the last reset."""
+        return self._sweeps
+
+    def reset(self) -> None:
+        """Forget buffered samples and trigger history."""
+        self._buffer.clear()
+        self._sweeps = 0
+        self.rearm()
+
+    def rearm(self) -> None:
+        """Arm for the next trigger (leaves the buffered samples)."""
+        self._armed = True
+        self._next_arm = float("-inf")
+        self._last_trigger: float | None = None
+
+    def process(
+        self,
+        time: np.ndarray,
+        signals: Mapping[str, np.ndarray],
+    ) -> TriggeredFrame | None:
+        """Append new samples and return the sweep to display, if any.
+
+        Returns:
+            The newest complete triggered sweep, a free-running sweep in
+            ``auto`` mode when triggers stopped, or None when the display
+            should keep its current content.
+        """
+        self._buffer.append(time, signals)
+        t = self._buffer.time
+        if t.size < 2 or not self._armed:
+            return None
+
+        settings = self._settings
+        post = settings.post_trigger_time
+        t_last = float(t[-1])
+        trigger = self._latest_complete_trigger(t, t_last)
+        if trigger is not None:
+            self._sweeps += 1
+            self._last_trigger = trigger
+            if settings.mode == "single":
+                self._armed = False
+            return self._cut(trigger - settings.pre_trigger_time, trigger + post, trigger)
+
+        if settings.mode != "auto":
+            return None
+        since = t_last - (self._last_trigger if self._last_trigger is not None else float(t[0]))
+        if since < AUTO_TIMEOUT_WINDOWS * settings.window:
+            return None
+        # Free-run: newest samples, laid out as if triggered at the usual spot.
+        return self._cut(t_last - settings.window, t_last, None, origin=t_last - post)
+
+    def _latest_complete_trigger(self, t: np.ndarray, t_last: float) -> float | None:
+        settings = self._settings
+        source = self._buffer.values(settings.source)
+        if source is None:
+            return None
+        post = settings.post_trigger_time
+        step = max(settings.holdoff, post)
+        horizon = max(self._next_arm, t_last - 2.0 * (settings.window + settings.holdoff))
+        lo = max(int(np.searchsorted(t, horizon, side="left")) - 1, 0)
+        crossings = _crossing_times(t[lo:], source[lo:], settings.level, settings.slope)
+        crossings = crossings[crossings >= self._next_arm]
+
+        latest: float | None = None
+        index = 0
+        while index < crossings.size:
+            candidate = float(crossings[index])
+            if candidate + post > t_last:
+                break  # Sweep not complete yet; it is picked up next time
+            latest = candidate
+            self._next_arm = candidate + step
+            index = int(np.searchsorted(crossings, self._next_arm, side="left"))
+        return latest
+
+    def _cut(
+        self,
+        start: float,
+        stop: float,
+        trigger: float | None,
+        origin: float | None = None,
+    ) -> TriggeredFrame:
+        t = self._buffer.time
+        lo = int(np.searchsorted(t, start, side="left"))
+        hi = int(np.searchsorted(t, stop, side="right"))
+        reference = trigger if trigger is not None else float(origin)
+        signals = {name: self._buffer.values(name)[lo:hi].copy() for name in self._buffer.names()}
+        return TriggeredFrame(t[lo:hi] - reference, signals, trigger, self._sweeps)
+
+
+def _crossing_times(time: np.ndarray, values: np.ndarray, level: float, slope: str) -> np.ndarray:
+    """Interpolated times where ``values`` crosses ``level`` with ``slope``."""
+    if time.size < 2:
+        return np.empty(0)
+    above = values >= level if slope == "rising" else values <= level
+    index = np.flatnonzero(~above[:-1] & above[1:])
+    v0, v1 = values[index], values[index + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.where(v1 != v0, (level - v0) / (v1 - v0), 0.0)
+    fraction = np.clip(np.nan_to_num(fraction), 0.0, 1.0)
+    return time[index] + fraction * (time[index + 1] - time[index])
+
+
+__all__ = [
+    "AUTO_TIMEOUT_WINDOWS",
+    "DEFAULT_BUFFER_SAMPLES",
+    "StreamBuffer",
+    "StreamTrigger",
+    "TRIGGER_MODES",
+    "TRIGGER_SLOPES",
+    "TriggerSettings",
+    "TriggeredFrame",
+]
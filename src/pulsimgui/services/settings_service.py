@@ -5,6 +5,11 @@ from pathlib import Path
 from PySide6.QtCore import QSettings
 
 from pulsimgui.services.backend_runtime_service import DEFAULT_BACKEND_TARGET_VERSION
+from pulsimgui.services.run_history import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_RUNS,
+    DEFAULT_MAX_SPILLED_RUNS,
+)
 
 
 class SettingsService:
@@ -163,6 +168,7 @@ class SettingsService:
             "output_points": int(self._settings.value("simulation/output_points", 10000)),
             "enable_events": self._settings.value("simulation/enable_events", True, type=bool),
             "max_step_retries": int(self._settings.value("simulation/max_step_retries", 8)),
+            "ac_adaptive": self._settings.value("simulation/ac_adaptive", False, type=bool),
         }
 
     def set_simulation_settings(self, settings: dict) -> None:
@@ -170,6 +176,26 @@ class SettingsService:
         for key, value in settings.items():
             self._settings.setValue(f"simulation/{key}", value)
 
+    # Run history (before/after comparisons)
+    def get_run_history_settings(self) -> dict:
+        """Get the limits of the transient run history.
+
+        An empty ``spill_dir`` drops evicted runs instead of writing them to disk.
+        """
+        return {
+            "max_runs": int(self._settings.value("run_history/max_runs", DEFAULT_MAX_RUNS)),
+            "max_bytes": int(self._settings.value("run_history/max_bytes", DEFAULT_MAX_BYTES)),
+            "spill_dir": self._settings.value("run_history/spill_dir", "") or "",
+            "max_spilled_runs": int(
+                self._settings.value("run_history/max_spilled_runs", DEFAULT_MAX_SPILLED_RUNS)
+            ),
+        }
+
+    def set_run_history_settings(self, settings: dict) -> None:
+        """Save the limits of the transient run history."""
+        for key, value in settings.items():
+            self._settings.setValue(f"run_history/{key}", value)
+
     # Solver settings (Newton solver, DC strategies)
     def get_solver_settings(self) -> dict:
         """Get saved solver settings."""
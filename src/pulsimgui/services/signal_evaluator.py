@@ -466,4 +466,104 @@ except Exception:
             return ""
 
 
-__all__ = ["SignalEvaluator", "AlgebraicLoopError", "SIGNAL_TYPES"]
+def _native_controller_state(controller: Any) -> dict[str, Any] | None:
+    """State of a native controller object, or None when it cannot be captured.
+
+    Controllers exposing ``get_state``/``set_state`` are captured through
+    them. Otherwise the public numeric attributes that accept being written
+    back (pybind11 ``def_readwrite`` fields such as an integrator) are kept.
+    """
+    getter = getattr(controller, "get_state", None)
+    if callable(getter) and callable(getattr(controller, "set_state", None)):
+        try:
+            return {"state": getter()}
+        except Exception as exc:
+            log.debug("get_state() failed on %r: %s", controller, exc)
+    attributes: dict[str, float] = {}
+    for name in dir(controller):
+        if name.startswith("_"):
+            continue
+        try:
+            value = getattr(controller, name)
+        except Exception:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        try:
+            setattr(controller, name, value)
+        except Exception:
+            continue  # Read-only: restoring it would silently do nothing
+        attributes[name] = value
+    return {"attributes": attributes} if attributes else None
+
+
+def _restore_native_controller(controller: Any, saved: dict[str, Any]) -> None:
+    if "state" in saved:
+        controller.set_state(saved["state"])
+        return
+    for name, value in (saved.get("attributes") or {}).items():
+        try:
+            setattr(controller, name, value)
+        except Exception as exc:
+            log.debug("Could not restore %s on %r: %s", name, controller, exc)
+
+
+def snapshot_evaluator_state(evaluator: Any) -> dict[str, Any]:
+    """Capture block outputs and controller state of an evaluator.
+
+    Works with both the backend-native and the local fallback evaluator, which
+    share the same ``_state``/``_controllers`` layout. Native controller
+    objects are captured through ``get_state()`` or their writable numeric
+    attributes; the ids of those that expose neither are listed under
+    ``"uncaptured"`` because they restart from their initial state.
+    """
+    outputs = getattr(evaluator, "_state", None)
+    controllers = getattr(evaluator, "_controllers", None)
+    snapshot: dict[str, Any] = {"outputs": {}, "controllers": {}, "native": {}, "uncaptured": []}
+    if isinstance(outputs, dict):
+        snapshot["outputs"] = {str(k): float(v) for k, v in outputs.items()}
+    if isinstance(controllers, dict):
+        for comp_id, ctl in controllers.items():
+            if isinstance(ctl, dict):
+                snapshot["controllers"][str(comp_id)] = dict(ctl)
+                continue
+            state = _native_controller_state(ctl)
+            if state is None:
+                snapshot["uncaptured"].append(str(comp_id))
+            else:
+                snapshot["native"][str(comp_id)] = state
+    return snapshot
+
+
+def restore_evaluator_state(evaluator: Any, snapshot: dict[str, Any] | None) -> None:
+    """Restore a snapshot produced by :func:`snapshot_evaluator_state`.
+
+    Only blocks that still exist in the (rebuilt) evaluator are restored, so a
+    snapshot taken before a topology edit never injects stale block ids.
+    """
+    if not snapshot:
+        return
+    outputs = getattr(evaluator, "_state", None)
+    controllers = getattr(evaluator, "_controllers", None)
+    if isinstance(outputs, dict):
+        for comp_id, value in (snapshot.get("outputs") or {}).items():
+            if comp_id in outputs:
+                outputs[comp_id] = float(value)
+    if isinstance(controllers, dict):
+        for comp_id, saved in (snapshot.get("controllers") or {}).items():
+            current = controllers.get(comp_id)
+            if isinstance(current, dict):
+                current.update(saved)
+        for comp_id, saved in (snapshot.get("native") or {}).items():
+            current = controllers.get(comp_id)
+            if current is not None and not isinstance(current, dict):
+                _restore_native_controller(current, saved)
+
+
+__all__ = [
+    "SignalEvaluator",
+    "AlgebraicLoopError",
+    "SIGNAL_TYPES",
+    "snapshot_evaluator_state",
+    "restore_evaluator_state",
+]
@@ -0,0 +1,602 @@
+"""Math-expression engine for derived waveform signals.
+
+Expressions such as ``V(out)*I(L1)`` or ``avg(V(sw), period=10u)`` are
+parsed once into a small graph of NumPy operations. The graph evaluates
+lazily over any sample range ``[start, stop)``. Pointwise operators only read
+that range of their sources. Windowed functions read just the extra samples
+their window needs. ``integ`` is the only function that needs its whole prefix.
+
+Every node of the graph has a canonical digest. :class:`MathEngine` caches
+node results by ``(digest, start, stop)``, so sub-expressions shared between
+traces are evaluated once. :meth:`MathEngine.bind` drops the cache whenever
+the source result changes.
+
+Grammar::
+
+    expr    := term (("+" | "-") term)*
+    term    := unary (("*" | "/") unary)*
+    unary   := ("-" | "+") unary | power
+    power   := atom (("^" | "**") unary)?
+    atom    := number | signal | "t" | name "(" args ")" | "(" expr ")"
+    args    := expr ("," expr)* ("," name "=" number)*
+
+Numbers accept SI suffixes (``10u``, ``1.5meg``). Signals are written as
+``V(node)``, ``I(device)``, ``P(device)`` and ``T(device)``, as a bare name,
+or quoted (``"CH1: V(out)"``) when the name has spaces or punctuation.
+Division yields 0 where the divisor is below 1e-15 in magnitude.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import re
+import threading
+from typing import Callable
+
+import numpy as np
+
+from pulsimgui.utils.si_prefix import SI_PREFIXES
+
+#: Divisors at or below this magnitude produce 0 instead of inf/nan.
+DIVISION_EPSILON = 1e-15
+#: Default byte budget of the intermediate-result cache.
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+_SIGNAL_PREFIXES = frozenset({"V", "I", "P", "T"})
+_TIME_NAMES = frozenset({"t", "time"})
+
+_POINTWISE_FUNCTIONS: dict[str, tuple[int, Callable[..., np.ndarray]]] = {
+    "abs": (1, np.abs),
+    "sqrt": (1, lambda x: np.sqrt(np.maximum(x, 0.0))),
+    "exp": (1, np.exp),
+    "log": (1, lambda x: np.log(np.maximum(x, np.finfo(float).tiny))),
+    "log10": (1, lambda x: np.log10(np.maximum(x, np.finfo(float).tiny))),
+    "sin": (1, np.sin),
+    "cos": (1, np.cos),
+    "tan": (1, np.tan),
+    "sign": (1, np.sign),
+    "sq": (1, np.square),
+    "min": (2, np.minimum),
+    "max": (2, np.maximum),
+}
+
+#: Functions reading samples beyond the requested range, with their keyword arguments.
+_WINDOW_FUNCTIONS: dict[str, frozenset[str]] = {
+    "avg": frozenset({"period", "n"}),
+    "rms": frozenset({"period"}),
+    "der": frozenset(),
+    "integ": frozenset(),
+}
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?(?:meg|[fpnuµmkKMgGtT])?(?![A-Za-z0-9_]))
+  | (?P<quoted>"[^"]*")
+  | (?P<name>[A-Za-z_][A-Za-z0-9_.]*)
+  | (?P<op>\*\*|[-+*/^(),=])
+    """,
+    re.VERBOSE,
+)
+_NUMBER_RE = re.compile(r"((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)(meg|[fpnuµmkKMgGtT])?$")
+
+
+# ----------------------------------------------------------------------
+# Graph nodes
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _Node:
+    """Base evaluation node; ``key`` is the canonical form used for hashing."""
+
+    @property
+    def key(self) -> str:
+        raise NotImplementedError
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha1(self.key.encode("utf-8")).hexdigest()[:16]
+
+    def children(self) -> tuple["_Node", ...]:
+        return ()
+
+
+@dataclass(frozen=True)
+class _Const(_Node):
+    value: float
+
+    @property
+    def key(self) -> str:
+        return repr(float(self.value))
+
+
+@dataclass(frozen=True)
+class _Source(_Node):
+    name: str
+
+    @property
+    def key(self) -> str:
+        return f"src({self.name!r})"
+
+
+@dataclass(frozen=True)
+class _Time(_Node):
+    @property
+    def key(self) -> str:
+        return "t"
+
+
+@dataclass(frozen=True)
+class _Apply(_Node):
+    """Operator or function call: ``func(*args, **options)``."""
+
+    func: str
+    args: tuple[_Node, ...]
+    options: tuple[tuple[str, float], ...] = ()
+
+    @property
+    def key(self) -> str:
+        parts = [arg.key for arg in self.args]
+        parts.extend(f"{name}={value!r}" for name, value in self.options)
+        return f"{self.func}({','.join(parts)})"
+
+    def children(self) -> tuple[_Node, ...]:
+        return self.args
+
+
+# ----------------------------------------------------------------------
+# Parsing
+# ----------------------------------------------------------------------
+def _parse_number(text: str) -> float:
+    match = _NUMBER_RE.match(text)
+    if match is None:  # pragma: no cover - guarded by the tokenizer
+        raise ValueError(f"Invalid number '{text}'")
+    return float(match.group(1)) * SI_PREFIXES[match.group(2) or ""]
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if match is None:
+            raise ValueError(f"Unexpected character '{text[position]}' at position {position}")
+        kind = match.lastgroup or ""
+        value = match.group()
+        position = match.end()
+        if kind == "space":
+            continue
+        if kind == "name" and value.upper() in _SIGNAL_PREFIXES and text[position:position + 1] == "(":
+            # V(out), I(L1): keep the balanced parentheses as part of the name.
+            depth = 0
+            end = position
+            while end < len(text):
+                if text[end] == "(":
+                    depth += 1
+                elif text[end] == ")":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                end += 1
+            if depth != 0:
+                raise ValueError(f"Unbalanced parentheses in '{text}'")
+            tokens.append(("signal", text[match.start():end + 1]))
+            position = end + 1
+            continue
+        if kind == "quoted":
+            tokens.append(("signal", value[1:-1]))
+            continue
+        tokens.append((kind, value))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._tokens = _tokenize(text)
+        self._index = 0
+
+    def parse(self) -> _Node:
+        if not self._tokens:
+            raise ValueError("Expression is empty")
+        node = self._expr()
+        if self._index != len(self._tokens):
+            raise ValueError(f"Unexpected '{self._tokens[self._index][1]}' in '{self._text}'")
+        return node
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self._tokens[self._index] if self._index < len(self._tokens) else None
+
+    def _take(self, value: str | None = None) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of expression in '{self._text}'")
+        if value is not None and token[1] != value:
+            raise ValueError(f"Expected '{value}' but found '{token[1]}' in '{self._text}'")
+        self._index += 1
+        return token
+
+    def _accept(self, *values: str) -> str | None:
+        token = self._peek()
+        if token is not None and token[0] == "op" and token[1] in values:
+            self._index += 1
+            return token[1]
+        return None
+
+    def _expr(self) -> _Node:
+        node = self._term()
+        while (op := self._accept("+", "-")) is not None:
+            node = _Apply("add" if op == "+" else "sub", (node, self._term()))
+        return node
+
+    def _term(self) -> _Node:
+        node = self._unary()
+        while (op := self._accept("*", "/")) is not None:
+            node = _Apply("mul" if op == "*" else "div", (node, self._unary()))
+        return node
+
+    def _unary(self) -> _Node:
+        op = self._accept("-", "+")
+        if op == "-":
+            return _Apply("neg", (self._unary(),))
+        if op == "+":
+            return self._unary()
+        return self._power()
+
+    def _power(self) -> _Node:
+        node = self._atom()
+        if self._accept("^", "**") is not None:
+            node = _Apply("pow", (node, self._unary()))
+        return node
+
+    def _atom(self) -> _Node:
+        kind, value = self._take()
+        if kind == "number":
+            return _Const(_parse_number(value))
+        if kind == "signal":
+            return _Source(value)
+        if kind == "op" and value == "(":
+            node = self._expr()
+            self._take(")")
+            return node
+        if kind == "name":
+            if self._accept("(") is not None:
+                return self._call(value.lower())
+            if value in _TIME_NAMES:
+                return _Time()
+            return _Source(value)
+        raise ValueError(f"Unexpected '{value}' in '{self._text}'")
+
+    def _call(self, func: str) -> _Node:
+        args: list[_Node] = []
+        options: dict[str, float] = {}
+        if self._accept(")") is None:
+            while True:
+                token = self._peek()
+                following = self._tokens[self._index + 1] if self._index + 1 < len(self._tokens) else None
+                if token and token[0] == "name" and following == ("op", "="):
+                    self._index += 2
+                    options[token[1].lower()] = self._option_value(func, token[1])
+                elif options:
+                    raise ValueError(f"Positional argument after keyword in {func}()")
+                else:
+                    args.append(self._expr())
+                if self._accept(")") is not None:
+                    break
+                self._take(",")
+        return self._build_call(func, args, options)
+
+    def _option_value(self, func: str, name: str) -> float:
+        sign = -1.0 if self._accept("-") else 1.0
+        kind, value = self._take()
+        if kind != "number":
+            raise ValueError(f"{func}(): '{name}' must be a number")
+        return sign * _parse_number(value)
+
+    def _build_call(self, func: str, args: list[_Node], options: dict[str, float]) -> _Node:
+        if func in _POINTWISE_FUNCTIONS:
+            arity = _POINTWISE_FUNCTIONS[func][0]
+            allowed: frozenset[str] = frozenset()
+        elif func in _WINDOW_FUNCTIONS:
+            arity = 1
+            allowed = _WINDOW_FUNCTIONS[func]
+        else:
+            raise ValueError(f"Unknown function '{func}'")
+        if len(args) != arity:
+            raise ValueError(f"{func}() takes {arity} argument(s), got {len(args)}")
+        unknown = set(options) - allowed
+        if unknown:
+            raise ValueError(f"{func}() got unexpected option(s): {', '.join(sorted(unknown))}")
+        if func == "avg" and len(options) != 1:
+            raise ValueError("avg() needs exactly one of period=... or n=...")
+        if func == "rms" and "period" not in options:
+            raise ValueError("rms() needs period=...")
+        for name, value in options.items():
+            if value <= 0.0:
+                raise ValueError(f"{func}(): '{name}' must be positive")
+        return _Apply(func, tuple(args), tuple(sorted(options.items())))
+
+
+@dataclass(frozen=True)
+class MathExpression:
+    """A parsed expression.
+
+    Attributes:
+        text: Source text as entered.
+        root: Root node of the evaluation graph.
+    """
+
+    text: str
+    root: _Node
+
+    @classmethod
+    def parse(cls, text: str) -> "MathExpression":
+        """Parse ``text``.
+
+        Raises:
+            ValueError: If the expression is malformed or calls an unknown
+                function.
+        """
+        return cls(text=text, root=_Parser(text).parse())
+
+    @property
+    def digest(self) -> str:
+        """Hash of the canonical form; equal for equivalent spellings."""
+        return self.root.digest
+
+    @property
+    def signals(self) -> list[str]:
+        """Names of the source signals the expression reads, in first-use order."""
+        names: list[str] = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, _Source) and node.name not in names:
+                names.append(node.name)
+            stack.extend(reversed(node.children()))
+        return names
+
+
+# ----------------------------------------------------------------------
+# Evaluation
+# ----------------------------------------------------------------------
+class MathEngine:
+    """Evaluate expressions lazily against one bound result, caching by node.
+
+    Args:
+        max_cache_bytes: Byte budget of cached intermediate results; least
+            recently used entries are evicted first.
+    """
+
+    def __init__(self, max_cache_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        self._max_cache_bytes = max(0, int(max_cache_bytes))
+        self._time = np.empty(0)
+        self._resolve: Callable[[str], np.ndarray | None] = lambda _name: None
+        self._cache: OrderedDict[tuple[str, int, int], np.ndarray] = OrderedDict()
+        self._cache_bytes = 0
+        self._parsed: dict[str, MathExpression] = {}
+        self._generation = 0
+        self._lock = threading.RLock()
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every :meth:`bind`."""
+        return self._generation
+
+    @property
+    def sample_count(self) -> int:
+        """Number of samples of the bound time axis."""
+        return int(self._time.size)
+
+    @property
+    def cache_bytes(self) -> int:
+        """Bytes currently held by the result cache."""
+        return self._cache_bytes
+
+    def bind(
+        self,
+        time: np.ndarray,
+        resolve: Callable[[str], np.ndarray | None],
+    ) -> None:
+        """Bind a new source result and drop every cached evaluation.
+
+        Args:
+            time: Time axis shared by all sources.
+            resolve: Returns the full-length samples of a signal name, or None.
+        """
+        with self._lock:
+            self._time = np.asarray(time, dtype=np.float64)
+            self._resolve = resolve
+            self.clear_cache()
+            self._generation += 1
+
+    def clear_cache(self) -> None:
+        """Drop cached evaluations (parsed expressions are kept)."""
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+
+    def parse(self, expression: str | MathExpression) -> MathExpression:
+        """Return the parsed form of ``expression``, parsing each text once."""
+        if isinstance(expression, MathExpression):
+            return expression
+        parsed = self._parsed.get(expression)
+        if parsed is None:
+            parsed = MathExpression.parse(expression)
+            self._parsed[expression] = parsed
+        return parsed
+
+    def missing_signals(self, expression: str | MathExpression) -> list[str]:
+        """Return source names of ``expression`` the bound result cannot resolve."""
+        return [name for name in self.parse(expression).signals if self._resolve(name) is None]
+
+    def evaluate(
+        self,
+        expression: str | MathExpression,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> np.ndarray:
+        """Evaluate ``expression`` over samples ``[start, stop)``.
+
+        The returned array is read-only and may be shared with the cache.
+
+        Raises:
+            ValueError: If the expression is malformed or reads a signal that
+                is missing or does not match the time axis.
+        """
+        parsed = self.parse(expression)
+        n = self.sample_count
+        stop = n if stop is None else stop
+        start, stop = max(0, int(start)), min(n, int(stop))
+        if stop <= start:
+            return np.empty(0)
+        with self._lock:
+            values = self._eval(parsed.root, start, stop)
+        if np.ndim(values) == 0:
+            values = np.full(stop - start, float(values))
+            values.flags.writeable = False
+        return values
+
+    def value_at(self, expression: str | MathExpression, t: float) -> float | None:
+        """Interpolate ``expression`` at time ``t`` reading only two samples."""
+        n = self.sample_count
+        if n == 0 or t < self._time[0] or t > self._time[-1]:
+            return None
+        index = int(np.searchsorted(self._time, t, side="right"))
+        start = max(0, min(index - 1, n - 2))
+        stop = min(n, start + 2)
+        values = self.evaluate(expression, start, stop)
+        return float(np.interp(t, self._time[start:stop], values))
+
+    # ------------------------------------------------------------------
+    def _eval(self, node: _Node, start: int, stop: int):
+        if isinstance(node, _Const):
+            return node.value
+        if isinstance(node, _Time):
+            return self._time[start:stop]
+        if isinstance(node, _Source):
+            return self._source(node.name)[start:stop]
+
+        cache_key = (node.digest, start, stop)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+
+        values = np.asarray(self._apply(node, start, stop), dtype=np.float64)
+        if values.ndim == 0:
+            return float(values)
+        values.flags.writeable = False
+        self._store(cache_key, values)
+        return values
+
+    def _source(self, name: str) -> np.ndarray:
+        values = self._resolve(name)
+        if values is None:
+            raise ValueError(f"Unknown signal '{name}'")
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != self._time.shape:
+            raise ValueError(f"Signal '{name}' does not match the time axis")
+        return values
+
+    def _store(self, key: tuple[str, int, int], values: np.ndarray) -> None:
+        if values.nbytes > self._max_cache_bytes:
+            return
+        self._cache[key] = values
+        self._cache_bytes += values.nbytes
+        while self._cache_bytes > self._max_cache_bytes:
+            _old_key, old = self._cache.popitem(last=False)
+            self._cache_bytes -= old.nbytes
+
+    def _apply(self, node: _Apply, start: int, stop: int):
+        func = node.func
+        if func in _WINDOW_FUNCTIONS:
+            return self._window(node, start, stop)
+        args = [self._eval(arg, start, stop) for arg in node.args]
+        if func == "add":
+            return np.add(*args)
+        if func == "sub":
+            return np.subtract(*args)
+        if func == "mul":
+            return np.multiply(*args)
+        if func == "div":
+            numerator, denominator = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in args))
+            out = np.zeros(numerator.shape)
+            np.divide(numerator, denominator, out=out, where=np.abs(denominator) > DIVISION_EPSILON)
+            return out
+        if func == "neg":
+            return np.negative(args[0])
+        if func == "pow":
+            return np.power(*args)
+        return _POINTWISE_FUNCTIONS[func][1](*args)
+
+    def _window(self, node: _Apply, start: int, stop: int) -> np.ndarray:
+        func = node.func
+        options = dict(node.options)
+        child = node.args[0]
+        n = self.sample_count
+
+        if func == "der":
+            # One extra sample per side makes the central differences exact.
+            lo, hi = max(0, start - 1), min(n, stop + 1)
+            values = self._as_array(self._eval(child, lo, hi), hi - lo)
+            if values.size < 2:
+                return np.zeros(stop - start)
+            return np.gradient(values, self._time[lo:hi])[start - lo : stop - lo]
+
+        if func == "integ":
+            values = self._as_array(self._eval(child, 0, stop), stop)
+            return _cumulative_trapezoid(self._time[:stop], values)[start:stop]
+
+        if func == "avg" and "n" in options:
+            # Centered moving average matching np.convolve(x, ones(k)/k, "same").
+            k = max(1, min(int(options["n"]), n))
+            left = k // 2
+            right = k - 1 - left
+            lo, hi = max(0, start - left), min(n, stop + right)
+            values = self._as_array(self._eval(child, lo, hi), hi - lo)
+            padded = np.concatenate((
+                np.zeros(left - (start - lo)), values, np.zeros(right - (hi - stop))
+            ))
+            sums = np.concatenate(([0.0], np.cumsum(padded)))
+            return (sums[k:] - sums[:-k]) / k
+
+        # Trailing time window: mean of x (or x^2 for rms) over [t - period, t].
+        period = float(options["period"])
+        time = self._time
+        lo = max(0, int(np.searchsorted(time, time[start] - period, side="left")) - 1)
+        values = self._as_array(self._eval(child, lo, stop), stop - lo)
+        if func == "rms":
+            values = np.square(values)
+        t_local = time[lo:stop]
+        integral = _cumulative_trapezoid(t_local, values)
+        t_out = t_local[start - lo :]
+        t_from = np.maximum(t_out - period, time[0])
+        span = t_out - t_from
+        window_sum = integral[start - lo :] - np.interp(t_from, t_local, integral)
+        safe = span > 0.0
+        result = np.where(safe, window_sum / np.where(safe, span, 1.0), values[start - lo :])
+        return np.sqrt(np.maximum(result, 0.0)) if func == "rms" else result
+
+    @staticmethod
+    def _as_array(values, size: int) -> np.ndarray:
+        if np.ndim(values) == 0:
+            return np.full(size, float(values))
+        return values
+
+
+def _cumulative_trapezoid(time: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Cumulative trapezoid integral starting at 0 (numpy-1.24 compatible)."""
+    out = np.zeros(values.size)
+    if values.size > 1:
+        out[1:] = np.cumsum(0.5 * (values[1:] + values[:-1]) * np.diff(time))
+    return out
+
+
+__all__ = [
+    "DEFAULT_CACHE_BYTES",
+    "DIVISION_EPSILON",
+    "MathEngine",
+    "MathExpression",
+]
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any
 
 from PySide6.QtCore import QMutex, QObject, QThread, QWaitCondition, Signal
 
+from pulsimgui.services.ac_sweep import ChunkedACExecutor
 from pulsimgui.services.backend_adapter import (
     BackendCallbacks,
     BackendInfo,
@@ -30,10 +31,15 @@ from pulsimgui.services.backend_types import (
 from pulsimgui.services.backend_types import (
     ACSettings,
     DCSettings,
+    DCSweepResult,
+    DCSweepSettings,
 )
 from pulsimgui.services.backend_types import (
     DCResult as BackendDCResult,
 )
+from pulsimgui.services.backend_types import TransientCheckpoint
+from pulsimgui.services.operating_point_cache import circuit_fingerprint
+from pulsimgui.services.run_history import RunHistory
 from pulsimgui.utils.net_utils import build_node_alias_map, build_node_map
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
@@ -151,6 +157,10 @@ class SimulationSettings:
     thermal_include_switching_losses: bool = True
     thermal_include_conduction_losses: bool = True
     thermal_network: str = "foster"
+    thermal_cycle_average: bool = False
+
+    # AC analysis settings
+    ac_adaptive: bool = False  # Refine the coarse grid around curvature and crossings
 
     # Transient formulation mode (supported by pulsim>=0.6.1)
     formulation_mode: str = "projected_wrapper"
@@ -165,12 +175,45 @@ class SimulationResult:
     signals: dict[str, list[float]] = field(default_factory=dict)
     statistics: dict[str, Any] = field(default_factory=dict)
     error_message: str = ""
+    checkpoint: TransientCheckpoint | None = field(default=None, repr=False, compare=False)
 
     @property
     def is_valid(self) -> bool:
         """Check if results are valid."""
         return len(self.time) > 0 and not self.error_message
 
+    def append_segment(self, segment: SimulationResult) -> int:
+        """Append a continuation run in place and return the new sample count.
+
+        Samples at or before the current end time are dropped so the shared
+        boundary point is not duplicated. Signals missing from ``segment`` hold
+        their last value to keep every trace aligned with ``time``.
+        """
+        if not segment.time:
+            return 0
+        t_end = self.time[-1] if self.time else float("-inf")
+        first = 0
+        while first < len(segment.time) and segment.time[first] <= t_end:
+            first += 1
+        added = len(segment.time) - first
+        if added <= 0:
+            self.checkpoint = segment.checkpoint or self.checkpoint
+            return 0
+
+        self.time.extend(segment.time[first:])
+        for name, values in self.signals.items():
+            new_values = segment.signals.get(name)
+            if new_values is not None and len(new_values) == len(segment.time):
+                values.extend(new_values[first:])
+            else:
+                hold = values[-1] if values else 0.0
+                values.extend([hold] * added)
+
+        self.statistics["time_steps"] = len(self.time)
+        self.statistics["extended_segments"] = int(self.statistics.get("extended_segments", 0)) + 1
+        self.checkpoint = segment.checkpoint
+        return added
+
 
 @dataclass
 class DCResult:
@@ -313,11 +356,14 @@ class SimulationWorker(QThread):
         circuit_data: dict,
         settings: SimulationSettings,
         parent=None,
+        *,
+        checkpoint: TransientCheckpoint | None = None,
     ):
         super().__init__(parent)
         self._backend = backend
         self._circuit_data = circuit_data
         self._settings = settings
+        self._checkpoint = checkpoint
         self._cancelled = False
         self._paused = False
         self._mutex = QMutex()
@@ -341,16 +387,25 @@ class SimulationWorker(QThread):
                 wait_if_paused=self._wait_if_paused,
             )
 
-            backend_result = self._backend.run_transient(
-                self._circuit_data,
-                self._settings,
-                callbacks,
-            )
+            if self._checkpoint is not None:
+                backend_result = self._backend.run_transient(
+                    self._circuit_data,
+                    self._settings,
+                    callbacks,
+                    checkpoint=self._checkpoint,
+                )
+            else:
+                backend_result = self._backend.run_transient(
+                    self._circuit_data,
+                    self._settings,
+                    callbacks,
+                )
 
             result.time = list(backend_result.time)
             result.signals = {name: list(values) for name, values in backend_result.signals.items()}
             result.statistics = dict(backend_result.statistics)
             result.error_message = backend_result.error_message
+            result.checkpoint = getattr(backend_result, "checkpoint", None)
 
             if self._cancelled and not result.error_message:
                 result.error_message = "Simulation cancelled"
@@ -528,6 +583,257 @@ class ParameterSweepWorker(QThread):
         raise ValueError("Target component not found in circuit data")
 
 
+class _AnalysisWorker(QThread):
+    """Base worker for single-shot analyses (DC, AC) that block in the backend."""
+
+    progress = Signal(float, str)
+    error = Signal(str)
+
+    #: Interval used to poll the blocking backend call for cancellation.
+    POLL_INTERVAL = 0.1
+    #: Seconds over which the keepalive progress ramp approaches 95%.
+    KEEPALIVE_SPAN = 10.0
+
+    def __init__(self, backend: SimulationBackend, circuit_data: dict, parent=None):
+        super().__init__(parent)
+        self._backend = backend
+        self._circuit_data = circuit_data
+        self._cancelled = False
+        self._thread_ident: int | None = None
+
+    def cancel(self) -> None:
+        """Request cancellation and ask the backend to stop when supported."""
+        self._cancelled = True
+        run_id = self._thread_ident
+        handler = getattr(self._backend, "request_stop", None)
+        if run_id is None or handler is None:
+            return
+        try:
+            handler(run_id)
+        except TypeError:  # Backends that ignore run identifiers
+            handler()
+        except Exception:
+            pass
+
+    @property
+    def was_cancelled(self) -> bool:
+        """Return whether cancellation was requested."""
+        return self._cancelled
+
+    def _call_blocking(self, func, label: str) -> Any:
+        """Run ``func`` on a helper thread while reporting progress.
+
+        Native analyses do not report progress or poll for cancellation, so the
+        call runs on a daemon thread and this worker emits a keepalive ramp.
+        On cancel the result is abandoned, but the worker keeps running until
+        the helper returns: the backend is still busy with the call, so the
+        service must not start another one on it. Returns None when abandoned.
+        """
+        outcome: dict[str, Any] = {}
+
+        def _target() -> None:
+            try:
+                outcome["value"] = func()
+            except Exception as exc:  # pragma: no cover - delegated backend call
+                outcome["error"] = exc
+
+        helper = threading.Thread(target=_target, name=f"pulsim-{label}", daemon=True)
+        helper.start()
+        self._thread_ident = helper.ident
+
+        start = time.monotonic()
+        abandoning = False
+        while helper.is_alive():
+            helper.join(timeout=self.POLL_INTERVAL)
+            if self._cancelled:
+                if not abandoning and helper.is_alive():
+                    abandoning = True
+                    self.progress.emit(
+                        -1, f"Abandoning {label} analysis: waiting for the backend to return..."
+                    )
+                continue
+            if helper.is_alive():
+                elapsed = time.monotonic() - start
+                ramp = 5.0 + min(90.0, (elapsed / self.KEEPALIVE_SPAN) * 90.0)
+                self.progress.emit(ramp, f"Running {label} analysis... ({elapsed:.0f}s elapsed)")
+
+        if self._cancelled:
+            return None
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("value")
+
+
+class DCWorker(_AnalysisWorker):
+    """Worker thread running a DC operating point analysis."""
+
+    finished_signal = Signal(DCResult, object)  # result, convergence info
+
+    def __init__(
+        self,
+        backend: SimulationBackend,
+        circuit_data: dict,
+        dc_settings: DCSettings,
+        parent=None,
+    ):
+        super().__init__(backend, circuit_data, parent)
+        self._dc_settings = dc_settings
+
+    def run(self) -> None:
+        """Run the DC analysis."""
+        result = DCResult()
+        convergence_info = None
+        try:
+            self.progress.emit(0, "Running DC analysis...")
+            if self._backend.has_capability("dc"):
+                backend_result: BackendDCResult | None = self._call_blocking(
+                    lambda: self._backend.run_dc(self._circuit_data, self._dc_settings),
+                    "DC",
+                )
+                if self._cancelled or backend_result is None:
+                    result.error_message = "DC analysis abandoned"
+                else:
+                    result.node_voltages = backend_result.node_voltages.copy()
+                    result.branch_currents = backend_result.branch_currents.copy()
+                    result.power_dissipation = backend_result.power_dissipation.copy()
+                    result.error_message = backend_result.error_message
+                    convergence_info = backend_result.convergence_info
+            else:
+                # Fallback to placeholder
+                result.node_voltages = {
+                    "V(out)": 5.0,
+                    "V(in)": 10.0,
+                    "V(gnd)": 0.0,
+                }
+                result.branch_currents = {
+                    "I(R1)": 0.005,
+                    "I(V1)": -0.005,
+                }
+                result.power_dissipation = {
+                    "P(R1)": 0.025,
+                }
+        except Exception as exc:
+            result.error_message = str(exc)
+        self.finished_signal.emit(result, convergence_info)
+
+
+class ACWorker(_AnalysisWorker):
+    """Worker thread running an AC frequency sweep.
+
+    Sweeps spanning several decades are split into decade chunks that run
+    concurrently; the merged result so far is emitted via ``chunk_ready`` as
+    each chunk completes.
+    """
+
+    finished_signal = Signal(ACResult)
+    chunk_ready = Signal(ACResult)
+
+    def __init__(
+        self,
+        backend: SimulationBackend,
+        circuit_data: dict,
+        ac_settings: ACSettings,
+        parent=None,
+    ):
+        super().__init__(backend, circuit_data, parent)
+        self._ac_settings = ac_settings
+
+    def run(self) -> None:
+        """Run the AC analysis."""
+        result = ACResult()
+        try:
+            self.progress.emit(0, "Running AC analysis...")
+            if not self._backend.has_capability("ac"):
+                result.error_message = (
+                    f"AC analysis is not available in backend {self._backend.info.label()}."
+                )
+            else:
+                executor = ChunkedACExecutor(
+                    lambda chunk: self._backend.run_ac(self._circuit_data, chunk),
+                    max_workers=self._ac_settings.max_workers or None,
+                )
+                backend_result: BackendACResult | None = self._call_blocking(
+                    lambda: executor.run(
+                        self._ac_settings,
+                        on_chunk=self._on_chunk,
+                        is_cancelled=lambda: self._cancelled,
+                    ),
+                    "AC",
+                )
+                if self._cancelled or backend_result is None:
+                    result.error_message = "AC analysis cancelled"
+                else:
+                    result = self._to_gui_result(backend_result)
+        except Exception as exc:
+            result.error_message = str(exc)
+        self.finished_signal.emit(result)
+
+    def _on_chunk(self, partial: BackendACResult, completed: int, total: int) -> None:
+        """Forward a partially merged sweep while remaining chunks run."""
+        if self._cancelled:
+            return
+        self.progress.emit(
+            5.0 + 90.0 * completed / max(total, 1),
+            f"AC analysis: {completed}/{total} chunks",
+        )
+        if completed < total and not partial.error_message:
+            self.chunk_ready.emit(self._to_gui_result(partial))
+
+    @staticmethod
+    def _to_gui_result(backend_result: BackendACResult) -> ACResult:
+        return ACResult(
+            frequencies=list(backend_result.frequencies),
+            magnitude={k: list(v) for k, v in backend_result.magnitude.items()},
+            phase={k: list(v) for k, v in backend_result.phase.items()},
+            error_message=backend_result.error_message,
+        )
+
+
+class DCSweepWorker(_AnalysisWorker):
+    """Worker thread running a DC sweep.
+
+    The backend solves the sweep point by point, so it reports progress and
+    polls for cancellation itself through :class:`BackendCallbacks`.
+    """
+
+    finished_signal = Signal(object)  # DCSweepResult
+
+    def __init__(
+        self,
+        backend: SimulationBackend,
+        circuit_data: dict,
+        sweep_settings: DCSweepSettings,
+        parent=None,
+    ):
+        super().__init__(backend, circuit_data, parent)
+        self._sweep_settings = sweep_settings
+
+    def run(self) -> None:
+        """Run the DC sweep."""
+        self.progress.emit(0, "Running DC sweep...")
+        run_sweep = getattr(self._backend, "run_dc_sweep", None)
+        if run_sweep is None or not self._backend.has_capability("dc"):
+            result = DCSweepResult(
+                error_message=(
+                    f"DC sweep is not available in backend {self._backend.info.label()}."
+                )
+            )
+            self.finished_signal.emit(result)
+            return
+
+        callbacks = BackendCallbacks(
+            progress=lambda value, message: self.progress.emit(value, message),
+            data_point=lambda *_: None,
+            check_cancelled=lambda: self._cancelled,
+            wait_if_paused=lambda: None,
+        )
+        try:
+            result = run_sweep(self._circuit_data, self._sweep_settings, callbacks)
+        except Exception as exc:
+            result = DCSweepResult(error_message=str(exc))
+        self.finished_signal.emit(result)
+
+
 class SimulationService(QObject):
     """Service for managing simulations."""
 
@@ -540,6 +846,8 @@ class SimulationService(QObject):
     simulation_finished = Signal(SimulationResult)
     dc_finished = Signal(DCResult)
     ac_finished = Signal(ACResult)
+    ac_partial = Signal(ACResult)  # merged decade chunks while an AC sweep runs
+    dc_sweep_finished = Signal(object)  # DCSweepResult
     parameter_sweep_finished = Signal(ParameterSweepResult)
     error = Signal(str)
     backend_changed = Signal(BackendInfo)
@@ -550,8 +858,12 @@ class SimulationService(QObject):
         self._state = SimulationState.IDLE
         self._worker: SimulationWorker | None = None
         self._sweep_worker: ParameterSweepWorker | None = None
+        self._analysis_worker: _AnalysisWorker | None = None
         self._settings = SimulationSettings()
         self._last_result: SimulationResult | None = None
+        self._run_history = RunHistory()
+        self._last_run_fingerprint: str | None = None
+        self._pending_run_fingerprint: str | None = None
         self._last_convergence_info = None  # Store last DC convergence info for diagnostics
         self._settings_service = settings_service
         self._runtime_service = BackendRuntimeService()
@@ -584,6 +896,9 @@ class SimulationService(QObject):
             self._settings.enable_losses = bool(
                 sim_settings.get("enable_losses", self._settings.enable_losses)
             )
+            self._settings.ac_adaptive = bool(
+                sim_settings.get("ac_adaptive", self._settings.ac_adaptive)
+            )
 
             # Load persisted solver settings
             solver_settings = settings_service.get_solver_settings()
@@ -625,6 +940,9 @@ class SimulationService(QObject):
                     solver_settings.get("thermal_network", self._settings.thermal_network)
                 )
             )
+            self._settings.thermal_cycle_average = bool(
+                solver_settings.get("thermal_cycle_average", self._settings.thermal_cycle_average)
+            )
             self._settings.formulation_mode = str(
                 normalize_formulation_mode(
                     solver_settings.get("formulation_mode", self._settings.formulation_mode)
@@ -637,6 +955,8 @@ class SimulationService(QObject):
                 )
             )
 
+            self._apply_run_history_settings(settings_service.get_run_history_settings())
+
             # Load backend runtime settings
             runtime_settings = settings_service.get_backend_runtime_settings()
             self._runtime_config = BackendRuntimeConfig.from_dict(runtime_settings)
@@ -680,6 +1000,23 @@ class SimulationService(QObject):
         """Get the last simulation result."""
         return self._last_result
 
+    @property
+    def run_history(self) -> RunHistory:
+        """Recent valid transient results, for overlay comparisons."""
+        return self._run_history
+
+    @property
+    def last_checkpoint(self) -> TransientCheckpoint | None:
+        """Return the end-of-run checkpoint of the last transient result."""
+        if self._last_result is None or not self._last_result.is_valid:
+            return None
+        return self._last_result.checkpoint
+
+    @property
+    def can_extend(self) -> bool:
+        """Return True when the last transient run can be continued in place."""
+        return not self.is_running and self.last_checkpoint is not None
+
     @property
     def is_running(self) -> bool:
         """Check if simulation is currently running."""
@@ -705,6 +1042,25 @@ class SimulationService(QObject):
         """Return the last DC/transient convergence info for diagnostics."""
         return self._last_convergence_info
 
+    def cached_dc_result(self, circuit_data: dict) -> DCResult | None:
+        """Return the cached operating point of ``circuit_data`` as a DCResult.
+
+        Any converged DC run or transient t=0 solution of the same circuit
+        content can serve the DC overlay without another solve. Returns None
+        when the backend keeps no cache or the circuit changed since.
+        """
+        cache = getattr(self._backend, "operating_points", None)
+        if cache is None:
+            return None
+        entry = cache.lookup(circuit_fingerprint(circuit_data), self._settings.dc_strategy)
+        if entry is None:
+            return None
+        return DCResult(
+            node_voltages=dict(entry.node_voltages),
+            branch_currents=dict(entry.branch_currents),
+            power_dissipation=dict(entry.power_dissipation),
+        )
+
     def has_capability(self, name: str) -> bool:
         """Check if the backend supports a specific capability.
 
@@ -757,6 +1113,29 @@ class SimulationService(QObject):
         self.backend_changed.emit(info)
         return info
 
+    def update_run_history_settings(self, settings: dict) -> None:
+        """Persist and apply the run history limits.
+
+        Args:
+            settings: Any of ``max_runs``, ``max_bytes``, ``max_spilled_runs``
+                and ``spill_dir`` (empty to drop evicted runs).
+
+        Raises:
+            ValueError: If a limit is out of range.
+        """
+        self._apply_run_history_settings(settings)
+        if self._settings_service is not None:
+            self._settings_service.set_run_history_settings(settings)
+
+    def _apply_run_history_settings(self, settings: dict) -> None:
+        self._run_history.set_limits(
+            settings.get("max_runs"),
+            settings.get("max_bytes"),
+            settings.get("max_spilled_runs"),
+        )
+        if "spill_dir" in settings:
+            self._run_history.set_spill_dir(settings["spill_dir"] or None)
+
     def update_backend_runtime_config(self, config: BackendRuntimeConfig) -> None:
         """Persist and apply backend runtime configuration."""
         self._runtime_config = config
@@ -821,6 +1200,7 @@ class SimulationService(QObject):
                 "enable_events": self._settings.enable_events,
                 "max_step_retries": self._settings.max_step_retries,
                 "enable_losses": self._settings.enable_losses,
+                "ac_adaptive": bool(self._settings.ac_adaptive),
             }
         )
         self._settings_service.set_solver_settings(
@@ -838,6 +1218,7 @@ class SimulationService(QObject):
                 "thermal_include_switching_losses": self._settings.thermal_include_switching_losses,
                 "thermal_include_conduction_losses": self._settings.thermal_include_conduction_losses,
                 "thermal_network": normalize_thermal_network(self._settings.thermal_network),
+                "thermal_cycle_average": bool(self._settings.thermal_cycle_average),
                 "formulation_mode": normalize_formulation_mode(self._settings.formulation_mode),
                 "direct_formulation_fallback": bool(
                     self._settings.direct_formulation_fallback
@@ -862,6 +1243,7 @@ class SimulationService(QObject):
             return
 
         self._set_state(SimulationState.RUNNING)
+        self._pending_run_fingerprint = circuit_fingerprint(circuit_data)
 
         # Emit immediate feedback so UI shows activity right away
         self.progress.emit(-1, "Starting simulation...")
@@ -875,6 +1257,57 @@ class SimulationService(QObject):
         self._worker.finished.connect(self._worker.deleteLater)
         self._worker.start()
 
+    def extend_transient(self, circuit_data: dict, t_stop: float) -> None:
+        """Continue the last transient run up to ``t_stop``.
+
+        The backend resumes from the stored checkpoint (final state vector,
+        control-block state and step size) and the new samples are appended to
+        :attr:`last_result` instead of re-simulating from ``t_start``.
+
+        Args:
+            circuit_data: Dictionary representation of the circuit.
+            t_stop: New stop time (s); must be past the current end time.
+        """
+        if not self._ensure_backend_ready():
+            return
+        if self.is_running:
+            self.error.emit("Simulation already running")
+            return
+
+        checkpoint = self.last_checkpoint
+        if checkpoint is None:
+            self.error.emit("No completed transient run to extend. Run the simulation first.")
+            return
+        if t_stop <= checkpoint.t_end:
+            self.error.emit(
+                f"Extension stop time must be after the current end time ({checkpoint.t_end:g} s)."
+            )
+            return
+        fingerprint = circuit_fingerprint(circuit_data)
+        if fingerprint != self._last_run_fingerprint:
+            self.error.emit(
+                "The circuit changed since the last run. Run the simulation again before extending."
+            )
+            return
+
+        self._set_state(SimulationState.RUNNING)
+        self.progress.emit(-1, f"Extending simulation to {t_stop:g} s...")
+
+        settings = replace(self._settings, t_stop=float(t_stop))
+        self._worker = SimulationWorker(
+            self._backend,
+            circuit_data,
+            settings,
+            checkpoint=checkpoint,
+        )
+        # Segment samples are merged on completion rather than streamed, so the
+        # viewer keeps showing the existing waveform while the run continues.
+        self._worker.progress.connect(self._on_progress)
+        self._worker.finished_signal.connect(self._on_extend_finished)
+        self._worker.error.connect(self._on_error)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._worker.start()
+
     def run_dc_operating_point(
         self,
         circuit_data: dict,
@@ -897,63 +1330,51 @@ class SimulationService(QObject):
 
         # Build DC settings from SimulationSettings if not provided
         if dc_settings is None:
-            dc_settings = DCSettings(
-                strategy=self._settings.dc_strategy,
-                max_iterations=self._settings.max_newton_iterations,
-                enable_limiting=self._settings.enable_voltage_limiting,
-                max_voltage_step=self._settings.max_voltage_step,
-                gmin_initial=self._settings.gmin_initial,
-                gmin_final=self._settings.gmin_final,
-                source_steps=self._settings.dc_source_steps,
-            )
+            dc_settings = self._build_dc_settings()
 
-        result = DCResult()
-
-        try:
-            # Check if backend supports DC analysis
-            if self._backend.has_capability("dc"):
-                # Use real backend for DC analysis
-                backend_result: BackendDCResult = self._backend.run_dc(circuit_data, dc_settings)
+        worker = DCWorker(self._backend, circuit_data, dc_settings)
+        worker.progress.connect(self._on_progress)
+        worker.finished_signal.connect(self._on_dc_worker_finished)
+        self._start_analysis_worker(worker)
 
-                # Convert backend result to local DCResult
-                result.node_voltages = backend_result.node_voltages.copy()
-                result.branch_currents = backend_result.branch_currents.copy()
-                result.power_dissipation = backend_result.power_dissipation.copy()
-                result.error_message = backend_result.error_message
+    def run_dc_sweep(self, circuit_data: dict, sweep_settings: DCSweepSettings) -> None:
+        """Run a DC sweep of a source or component parameter.
 
-                # Store convergence info for potential diagnostics dialog
-                self._last_convergence_info = backend_result.convergence_info
+        Each point is seeded with the previous converged solution, so the sweep
+        costs a few Newton iterations per point instead of a full operating
+        point solve.
 
-                if backend_result.error_message:
-                    self._set_state(SimulationState.ERROR)
-                    self.error.emit(backend_result.error_message)
-                else:
-                    self.progress.emit(100, "DC analysis complete")
-                    self._set_state(SimulationState.COMPLETED)
-            else:
-                # Fallback to placeholder
-                result.node_voltages = {
-                    "V(out)": 5.0,
-                    "V(in)": 10.0,
-                    "V(gnd)": 0.0,
-                }
-                result.branch_currents = {
-                    "I(R1)": 0.005,
-                    "I(V1)": -0.005,
-                }
-                result.power_dissipation = {
-                    "P(R1)": 0.025,
-                }
-                self.progress.emit(100, "DC analysis complete (placeholder)")
-                self._set_state(SimulationState.COMPLETED)
-
-            self.dc_finished.emit(result)
+        Args:
+            circuit_data: Dictionary representation of the circuit.
+            sweep_settings: Sweep target and range. Its ``dc`` settings are
+                replaced by the current solver settings.
+        """
+        if not self._ensure_backend_ready():
+            return
+        if self.is_running:
+            self.error.emit("Simulation already running")
+            return
 
-        except Exception as e:
-            result.error_message = str(e)
-            self._set_state(SimulationState.ERROR)
-            self.error.emit(str(e))
-            self.dc_finished.emit(result)
+        self._set_state(SimulationState.RUNNING)
+        self.progress.emit(0, "Running DC sweep...")
+
+        sweep_settings = replace(sweep_settings, dc=self._build_dc_settings())
+        worker = DCSweepWorker(self._backend, circuit_data, sweep_settings)
+        worker.progress.connect(self._on_progress)
+        worker.finished_signal.connect(self._on_dc_sweep_worker_finished)
+        self._start_analysis_worker(worker)
+
+    def _build_dc_settings(self) -> DCSettings:
+        """Build DC solver settings from the current SimulationSettings."""
+        return DCSettings(
+            strategy=self._settings.dc_strategy,
+            max_iterations=self._settings.max_newton_iterations,
+            enable_limiting=self._settings.enable_voltage_limiting,
+            max_voltage_step=self._settings.max_voltage_step,
+            gmin_initial=self._settings.gmin_initial,
+            gmin_final=self._settings.gmin_final,
+            source_steps=self._settings.dc_source_steps,
+        )
 
     def run_ac_analysis(
         self,
@@ -962,6 +1383,7 @@ class SimulationService(QObject):
         f_stop: float,
         points_per_decade: int = 10,
         ac_settings: ACSettings | None = None,
+        adaptive: bool = False,
     ) -> None:
         """Run AC frequency sweep analysis.
 
@@ -969,8 +1391,9 @@ class SimulationService(QObject):
             circuit_data: Dictionary representation of the circuit.
             f_start: Start frequency (Hz).
             f_stop: Stop frequency (Hz).
-            points_per_decade: Number of points per decade.
+            points_per_decade: Number of points per decade (coarse grid when adaptive).
             ac_settings: AC analysis settings. If None, uses parameters above.
+            adaptive: Refine around curvature and 0 dB / -180° crossings.
         """
         if not self._ensure_backend_ready():
             return
@@ -987,42 +1410,20 @@ class SimulationService(QObject):
                 f_start=f_start,
                 f_stop=f_stop,
                 points_per_decade=points_per_decade,
+                adaptive=adaptive,
             )
 
-        result = ACResult()
+        worker = ACWorker(self._backend, circuit_data, ac_settings)
+        worker.progress.connect(self._on_progress)
+        worker.chunk_ready.connect(self.ac_partial)
+        worker.finished_signal.connect(self._on_ac_worker_finished)
+        self._start_analysis_worker(worker)
 
-        try:
-            # Check if backend supports AC analysis
-            if self._backend.has_capability("ac"):
-                # Use real backend for AC analysis
-                backend_result: BackendACResult = self._backend.run_ac(circuit_data, ac_settings)
-
-                # Convert backend result to local ACResult
-                result.frequencies = backend_result.frequencies.copy()
-                result.magnitude = {k: list(v) for k, v in backend_result.magnitude.items()}
-                result.phase = {k: list(v) for k, v in backend_result.phase.items()}
-                result.error_message = backend_result.error_message
-
-                if backend_result.error_message:
-                    self._set_state(SimulationState.ERROR)
-                    self.error.emit(backend_result.error_message)
-                else:
-                    self.progress.emit(100, "AC analysis complete")
-                    self._set_state(SimulationState.COMPLETED)
-            else:
-                result.error_message = (
-                    f"AC analysis is not available in backend {self._backend.info.label()}."
-                )
-                self._set_state(SimulationState.ERROR)
-                self.error.emit(result.error_message)
-
-            self.ac_finished.emit(result)
-
-        except Exception as e:
-            result.error_message = str(e)
-            self._set_state(SimulationState.ERROR)
-            self.error.emit(str(e))
-            self.ac_finished.emit(result)
+    def _start_analysis_worker(self, worker: _AnalysisWorker) -> None:
+        """Start a DC/AC/DC-sweep worker and track it for cancellation."""
+        self._analysis_worker = worker
+        worker.finished.connect(self._on_analysis_thread_finished)
+        worker.start()
 
     def run_parameter_sweep(
         self, circuit_data: dict, sweep_settings: ParameterSweepSettings
@@ -1060,6 +1461,12 @@ class SimulationService(QObject):
             self._sweep_worker.wait(5000)
             self._set_state(SimulationState.CANCELLED)
 
+        if self._analysis_worker and self._analysis_worker.isRunning():
+            # Native DC/AC calls may not honour the stop request. The service
+            # stays busy until the call returns, and the worker's finished
+            # handler then reports the run as cancelled.
+            self._analysis_worker.cancel()
+
     def pause(self) -> None:
         """Pause the current simulation."""
         if self._worker and self._state == SimulationState.RUNNING:
@@ -1088,6 +1495,9 @@ class SimulationService(QObject):
     def _on_finished(self, result: SimulationResult) -> None:
         """Handle simulation completion."""
         self._last_result = result
+        self._last_run_fingerprint = self._pending_run_fingerprint if result.is_valid else None
+        if result.is_valid:
+            self._run_history.add(result)
         if result.error_message == "Simulation cancelled":
             self._set_state(SimulationState.CANCELLED)
         elif result.error_message:
@@ -1096,6 +1506,80 @@ class SimulationService(QObject):
             self._set_state(SimulationState.COMPLETED)
         self.simulation_finished.emit(result)
 
+    def _on_extend_finished(self, segment: SimulationResult) -> None:
+        """Merge a continuation segment into the last result."""
+        if segment.error_message:
+            # The worker already reported the error; keep the existing result.
+            if segment.error_message == "Simulation cancelled":
+                self._set_state(SimulationState.CANCELLED)
+            return
+
+        base = self._last_result
+        if base is None:
+            base = segment
+        else:
+            base.append_segment(segment)
+        self._last_result = base
+        if base.is_valid:
+            self._run_history.add(base)
+        self._set_state(SimulationState.COMPLETED)
+        self.simulation_finished.emit(base)
+
+    def _on_dc_worker_finished(self, result: DCResult, convergence_info: Any) -> None:
+        """Handle completion of a DC worker."""
+        worker = self.sender()
+        if isinstance(worker, _AnalysisWorker) and worker.was_cancelled:
+            self._set_state(SimulationState.CANCELLED)
+            return
+
+        # Store convergence info for potential diagnostics dialog
+        self._last_convergence_info = convergence_info
+        if result.error_message:
+            self._set_state(SimulationState.ERROR)
+            self.error.emit(result.error_message)
+        else:
+            self.progress.emit(100, "DC analysis complete")
+            self._set_state(SimulationState.COMPLETED)
+        self.dc_finished.emit(result)
+
+    def _on_ac_worker_finished(self, result: ACResult) -> None:
+        """Handle completion of an AC worker."""
+        worker = self.sender()
+        if isinstance(worker, _AnalysisWorker) and worker.was_cancelled:
+            self._set_state(SimulationState.CANCELLED)
+            return
+
+        if result.error_message:
+            self._set_state(SimulationState.ERROR)
+            self.error.emit(result.error_message)
+        else:
+            self.progress.emit(100, "AC analysis complete")
+            self._set_state(SimulationState.COMPLETED)
+        self.ac_finished.emit(result)
+
+    def _on_dc_sweep_worker_finished(self, result: DCSweepResult) -> None:
+        """Handle completion of a DC sweep worker."""
+        worker = self.sender()
+        if isinstance(worker, _AnalysisWorker) and worker.was_cancelled:
+            self._set_state(SimulationState.CANCELLED)
+            return
+
+        if result.error_message:
+            self._set_state(SimulationState.ERROR)
+            self.error.emit(result.error_message)
+        else:
+            self.progress.emit(100, "DC sweep complete")
+            self._set_state(SimulationState.COMPLETED)
+        self.dc_sweep_finished.emit(result)
+
+    def _on_analysis_thread_finished(self) -> None:
+        """Release the DC/AC worker once its thread has ended."""
+        worker = self.sender()
+        if worker is self._analysis_worker:
+            self._analysis_worker = None
+        if isinstance(worker, QThread):
+            worker.deleteLater()
+
     def _on_parameter_sweep_finished(self, result: ParameterSweepResult) -> None:
         """Handle completion of a parameter sweep."""
         if self._sweep_worker and self._sweep_worker.was_cancelled:
@@ -0,0 +1,326 @@
+"""Frequency-domain analysis of transient waveforms.
+
+Solver time steps are rarely uniform. Before the FFT, the selected time
+range is resampled onto a uniform grid with one vectorized ``np.interp``
+call. The spectrum is a windowed ``rfft`` scaled to single-sided peak
+amplitudes. Long records can use Welch averaging (half-overlapping
+segments) to trade resolution for a lower noise floor.
+
+Harmonic amplitudes sum the energy of each harmonic's main lobe. Scalloping
+therefore does not bias THD when a harmonic falls between bins.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import threading
+from typing import Callable, Hashable
+
+import numpy as np
+
+#: Largest uniform grid built for one spectrum.
+MAX_SPECTRUM_POINTS = 1 << 20
+#: Harmonics reported by default, the fundamental included.
+DEFAULT_HARMONIC_COUNT = 10
+#: Spectra kept by :class:`SpectrumAnalyzer` before evicting the oldest.
+DEFAULT_CACHE_ENTRIES = 32
+
+#: Window generators and the half-width (in bins) of their main lobe.
+_WINDOWS: dict[str, tuple[Callable[[int], np.ndarray], int]] = {
+    "hann": (np.hanning, 2),
+    "hamming": (np.hamming, 2),
+    "blackman": (np.blackman, 3),
+    "rectangular": (np.ones, 1),
+}
+
+WINDOW_NAMES: tuple[str, ...] = tuple(_WINDOWS)
+
+
+@dataclass
+class Harmonic:
+    """One harmonic of the fundamental.
+
+    Attributes:
+        order: Harmonic number (1 is the fundamental).
+        frequency: Nominal frequency in Hz.
+        amplitude: Peak amplitude in signal units.
+    """
+
+    order: int
+    frequency: float
+    amplitude: float
+
+
+@dataclass
+class Spectrum:
+    """Single-sided amplitude spectrum of one signal range.
+
+    Attributes:
+        frequencies: Bin frequencies in Hz.
+        amplitudes: Peak amplitude of each bin in signal units.
+        sample_rate: Rate of the uniform grid the FFT ran on.
+        window: Window function name.
+        segments: Number of Welch segments averaged (1 for a single FFT).
+        fundamental: Fundamental frequency in Hz, or None without a tone.
+        harmonics: Harmonics of the fundamental, in order.
+        thd: Total harmonic distortion as a ratio, or None.
+    """
+
+    frequencies: np.ndarray
+    amplitudes: np.ndarray
+    sample_rate: float
+    window: str
+    segments: int = 1
+    fundamental: float | None = None
+    harmonics: list[Harmonic] = field(default_factory=list)
+    thd: float | None = None
+
+    @property
+    def resolution(self) -> float:
+        """Bin spacing in Hz."""
+        if self.frequencies.size < 2:
+            return 0.0
+        return float(self.frequencies[1] - self.frequencies[0])
+
+    @property
+    def thd_percent(self) -> float | None:
+        """THD in percent, or None."""
+        return None if self.thd is None else 100.0 * self.thd
+
+
+def resample_uniform(
+    time: np.ndarray,
+    values: np.ndarray,
+    start: float | None = None,
+    stop: float | None = None,
+    points: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Resample ``values`` on a uniform grid spanning ``[start, stop]``.
+
+    Args:
+        time: Monotonic, possibly non-uniform time axis.
+        values: Samples matching ``time``.
+        start: First time of the grid (defaults to the first sample).
+        stop: Last time of the grid (defaults to the last sample).
+        points: Grid size. Defaults to the number of source samples in the
+            range, capped at :data:`MAX_SPECTRUM_POINTS`.
+
+    Returns:
+        ``(grid, samples)`` arrays.
+
+    Raises:
+        ValueError: If the arrays mismatch or the range holds no samples.
+    """
+    time = np.asarray(time, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if time.shape != values.shape or time.ndim != 1:
+        raise ValueError("Time and values must be 1-D arrays of the same length")
+    if time.size < 2:
+        raise ValueError("At least two samples are required")
+
+    t0 = float(time[0]) if start is None else max(float(start), float(time[0]))
+    t1 = float(time[-1]) if stop is None else min(float(stop), float(time[-1]))
+    if t1 <= t0:
+        raise ValueError("The time range is empty")
+
+    if points is None:
+        lo = int(np.searchsorted(time, t0, side="left"))
+        hi = int(np.searchsorted(time, t1, side="right"))
+        points = hi - lo
+    points = int(min(max(points, 2), MAX_SPECTRUM_POINTS))
+
+    grid = np.linspace(t0, t1, points)
+    return grid, np.interp(grid, time, values)
+
+
+def compute_spectrum(
+    time: np.ndarray,
+    values: np.ndarray,
+    *,
+    start: float | None = None,
+    stop: float | None = None,
+    points: int | None = None,
+    window: str = "hann",
+    segments: int = 1,
+    fundamental: float | None = None,
+    harmonic_count: int = DEFAULT_HARMONIC_COUNT,
+) -> Spectrum:
+    """Compute the amplitude spectrum, harmonics and THD of a signal range.
+
+    Args:
+        time: Source time axis (may be non-uniform).
+        values: Source samples.
+        start: Start of the analysed range in seconds.
+        stop: End of the analysed range in seconds.
+        points: Uniform grid size (see :func:`resample_uniform`).
+        window: One of :data:`WINDOW_NAMES`.
+        segments: Welch segments to average; 1 runs a single FFT.
+        fundamental: Fundamental frequency in Hz. Defaults to the strongest
+            non-DC bin.
+        harmonic_count: Harmonics to report, the fundamental included.
+
+    Raises:
+        ValueError: On an unknown window, fewer than 8 grid points per
+            segment, or invalid counts.
+    """
+    if window not in _WINDOWS:
+        raise ValueError(f"Unknown window '{window}'. Choose from: {', '.join(WINDOW_NAMES)}")
+    if segments < 1:
+        raise ValueError("segments must be at least 1")
+    if harmonic_count < 1:
+        raise ValueError("harmonic_count must be at least 1")
+
+    grid, samples = resample_uniform(time, values, start, stop, points)
+    sample_rate = (grid.size - 1) / float(grid[-1] - grid[0])
+
+    # Welch: ``segments`` half-overlapping segments tile the record.
+    segment_length = int(2 * samples.size // (segments + 1)) if segments > 1 else samples.size
+    if segment_length < 8:
+        raise ValueError("Not enough samples for the requested segments")
+    step = max(1, segment_length // 2)
+    starts = range(0, samples.size - segment_length + 1, step)
+
+    make_window, lobe = _WINDOWS[window]
+    weights = make_window(segment_length).astype(np.float64)
+    frames = np.stack([samples[s : s + segment_length] for s in starts][:segments])
+    spectra = np.fft.rfft(frames * weights, axis=1)
+
+    # Single-sided peak amplitude: double every bin except DC and Nyquist.
+    scale = np.full(spectra.shape[1], 2.0 / weights.sum())
+    scale[0] /= 2.0
+    if segment_length % 2 == 0:
+        scale[-1] /= 2.0
+    amplitudes = np.sqrt(np.mean(np.abs(spectra) ** 2, axis=0)) * scale
+    frequencies = np.fft.rfftfreq(segment_length, d=1.0 / sample_rate)
+
+    spectrum = Spectrum(
+        frequencies=frequencies,
+        amplitudes=amplitudes,
+        sample_rate=sample_rate,
+        window=window,
+        segments=frames.shape[0],
+    )
+    # Equivalent noise bandwidth in bins, to turn lobe energy back into amplitude.
+    enbw = segment_length * float(np.sum(weights**2)) / float(weights.sum()) ** 2
+    _fill_harmonics(spectrum, fundamental, harmonic_count, lobe, enbw)
+    return spectrum
+
+
+def _fill_harmonics(
+    spectrum: Spectrum,
+    fundamental: float | None,
+    harmonic_count: int,
+    lobe: int,
+    enbw: float,
+) -> None:
+    amplitudes = spectrum.amplitudes
+    resolution = spectrum.resolution
+    if amplitudes.size <= lobe + 1 or resolution <= 0.0:
+        return
+
+    if fundamental is None:
+        # Skip DC and the leakage of its lobe when looking for the tone.
+        peak = lobe + 1 + int(np.argmax(amplitudes[lobe + 1 :]))
+        if amplitudes[peak] <= 0.0:
+            return
+        # Energy-weighted centroid of the lobe refines the tone between bins.
+        lo, hi = max(1, peak - lobe), min(amplitudes.size, peak + lobe + 1)
+        power = amplitudes[lo:hi] ** 2
+        fundamental = float(np.sum(spectrum.frequencies[lo:hi] * power) / np.sum(power))
+    if fundamental <= 0.0:
+        return
+
+    harmonics: list[Harmonic] = []
+    for order in range(1, harmonic_count + 1):
+        frequency = order * fundamental
+        centre = int(round(frequency / resolution))
+        if centre >= amplitudes.size:
+            break
+        lo, hi = max(1, centre - lobe), min(amplitudes.size, centre + lobe + 1)
+        energy = float(np.sum(amplitudes[lo:hi] ** 2))
+        harmonics.append(Harmonic(order, frequency, float(np.sqrt(energy / enbw))))
+
+    spectrum.fundamental = fundamental
+    spectrum.harmonics = harmonics
+    if harmonics and harmonics[0].amplitude > 0.0:
+        distortion = np.sqrt(sum(h.amplitude**2 for h in harmonics[1:]))
+        spectrum.thd = float(distortion / harmonics[0].amplitude)
+
+
+class SpectrumAnalyzer:
+    """Cache of spectra keyed by signal, range, window and resolution.
+
+    Moving a cursor only recomputes the traces whose range changed. Call
+    :meth:`clear` whenever the underlying result changes.
+
+    Args:
+        max_entries: Spectra kept before the least recently used is evicted.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._cache: OrderedDict[Hashable, Spectrum] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Drop every cached spectrum."""
+        with self._lock:
+            self._cache.clear()
+
+    def analyze(
+        self,
+        signal: str,
+        time: np.ndarray,
+        values: np.ndarray,
+        *,
+        start: float | None = None,
+        stop: float | None = None,
+        points: int | None = None,
+        window: str = "hann",
+        segments: int = 1,
+        harmonic_count: int = DEFAULT_HARMONIC_COUNT,
+    ) -> Spectrum:
+        """Return the spectrum of ``signal``, computing it only on a cache miss.
+
+        Arguments match :func:`compute_spectrum`; ``signal`` names the
+        series in the cache key.
+        """
+        key = (signal, start, stop, points, window, segments, harmonic_count)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        spectrum = compute_spectrum(
+            time,
+            values,
+            start=start,
+            stop=stop,
+            points=points,
+            window=window,
+            segments=segments,
+            harmonic_count=harmonic_count,
+        )
+        with self._lock:
+            self._cache[key] = spectrum
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+        return spectrum
+
+
+__all__ = [
+    "DEFAULT_CACHE_ENTRIES",
+    "DEFAULT_HARMONIC_COUNT",
+    "Harmonic",
+    "MAX_SPECTRUM_POINTS",
+    "Spectrum",
+    "SpectrumAnalyzer",
+    "WINDOW_NAMES",
+    "compute_spectrum",
+    "resample_uniform",
+]
@@ -0,0 +1,291 @@
+"""Coupled thermal networks for devices that share a heatsink.
+
+Devices whose thermal ports (``TH`` pins) are wired to the same thermal net
+are treated as mounted on one heatsink. Each device keeps its own
+junction-to-case network. Below the case, every case node couples through a
+case-to-sink resistance into a shared heatsink node, which leaks to ambient::
+
+    junction --Zjc-- case_i --Rcs-- heatsink --Rsa-- ambient
+
+The case and heatsink nodes form one RC system ``C dT/dt = -G T + B P``.
+It is assembled from its branch list and diagonalized once. In modal
+coordinates every mode is a first-order stage, so the whole coupled network
+is integrated exactly by the same vectorized Foster engine as isolated
+devices. The cost grows with the number of nodes, not with the step count
+times a matrix solve.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from pulsimgui.models.component import THERMAL_PORT_PIN_NAME
+from pulsimgui.services.thermal_network import integrate_foster
+
+
+@dataclass
+class CoupledThermalNetwork:
+    """RC network of thermal nodes driven by device losses.
+
+    Attributes:
+        node_names: Name of each node.
+        capacitances: Heat capacity of each node (J/K).
+        branches: ``(a, b, conductance)`` links; ``b`` is None for ambient.
+        injection: Node receiving each device's loss, one entry per device.
+    """
+
+    node_names: list[str] = field(default_factory=list)
+    capacitances: list[float] = field(default_factory=list)
+    branches: list[tuple[int, int | None, float]] = field(default_factory=list)
+    injection: list[int] = field(default_factory=list)
+    _modes: tuple[np.ndarray, np.ndarray] | None = field(default=None, init=False, repr=False)
+
+    def add_node(self, name: str, capacitance: float) -> int:
+        """Add a node and return its index."""
+        if capacitance <= 0.0:
+            raise ValueError(f"Thermal node '{name}' needs a positive capacitance")
+        self.node_names.append(name)
+        self.capacitances.append(float(capacitance))
+        self._modes = None
+        return len(self.node_names) - 1
+
+    def connect(self, a: int, b: int | None, resistance: float) -> None:
+        """Link node ``a`` to node ``b``, or to ambient when ``b`` is None."""
+        if resistance <= 0.0:
+            raise ValueError("Thermal resistances must be positive")
+        self.branches.append((a, b, 1.0 / float(resistance)))
+        self._modes = None
+
+    def add_device(self, node: int) -> int:
+        """Inject the next device's loss into ``node``; return the device index."""
+        self.injection.append(node)
+        return len(self.injection) - 1
+
+    @property
+    def node_count(self) -> int:
+        """Number of thermal nodes."""
+        return len(self.node_names)
+
+    def conductance_matrix(self) -> np.ndarray:
+        """Assemble the nodal conductance matrix ``G`` from the branch list."""
+        g = np.zeros((self.node_count, self.node_count))
+        for a, b, value in self.branches:
+            g[a, a] += value
+            if b is not None:
+                g[b, b] += value
+                g[a, b] -= value
+                g[b, a] -= value
+        return g
+
+    def modes(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(rates, shapes)``: decay rates (1/s) and ``T = shapes @ z``.
+
+        Uses the symmetric form ``C^-1/2 G C^-1/2``, so the eigenproblem is
+        real and well conditioned. The result is cached until the network changes.
+        """
+        if self._modes is None:
+            scale = 1.0 / np.sqrt(np.asarray(self.capacitances))
+            g = self.conductance_matrix()
+            rates, vectors = np.linalg.eigh(g * scale[:, None] * scale[None, :])
+            if rates.size and rates.min() <= 1e-12 * max(1.0, rates.max()):
+                raise ValueError("Every thermal node needs a path to ambient")
+            self._modes = (rates, scale[:, None] * vectors)
+        return self._modes
+
+    def simulate(
+        self,
+        time: Sequence[float] | np.ndarray,
+        power: Sequence[Sequence[float]] | np.ndarray,
+        ambient: float = 25.0,
+    ) -> np.ndarray:
+        """Return node temperatures, shape ``(n_nodes, n_samples)``.
+
+        Args:
+            time: Sample times (s), non-decreasing.
+            power: Device losses (W), shape ``(n_devices, n_samples)``, held
+                like :meth:`ThermalNetworkBatch.simulate`.
+            ambient: Ambient temperature (°C).
+        """
+        p = np.atleast_2d(np.asarray(power, dtype=np.float64))
+        if p.shape[0] != len(self.injection):
+            raise ValueError(
+                f"Power must have one row per device ({len(self.injection)}), got {p.shape[0]}"
+            )
+        rates, shapes = self.modes()
+        node_power = np.zeros((self.node_count, p.shape[1]))
+        np.add.at(node_power, np.asarray(self.injection, dtype=np.int64), p)
+        # Shapes are C^-1/2 V, so C^-1/2 V^T B P is shapes^T @ (B P).
+        modal_power = shapes.T @ node_power
+        inverse = (1.0 / rates)[:, None]
+        modal, _state = integrate_foster(time, modal_power, inverse, inverse)
+        return shapes @ modal + float(ambient)
+
+
+THERMAL_DEVICE_TYPES = frozenset({
+    "DIODE",
+    "ZENER_DIODE",
+    "LED",
+    "MOSFET_N",
+    "MOSFET_P",
+    "IGBT",
+    "BJT_NPN",
+    "BJT_PNP",
+    "THYRISTOR",
+    "TRIAC",
+    "SWITCH",
+    "TRANSFORMER",
+})
+
+
+def thermal_device_names(circuit_data: Mapping[str, Any]) -> list[str]:
+    """Return the unique names of components that get a thermal network, in order."""
+    components = circuit_data.get("components", []) if isinstance(circuit_data, Mapping) else []
+    names: list[str] = []
+    seen: set[str] = set()
+    for component in components or []:
+        comp_type = str(component.get("type", "")).strip().upper()
+        if comp_type not in THERMAL_DEVICE_TYPES:
+            continue
+        name = str(component.get("name") or component.get("id") or "").strip()
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def thermal_port_groups(
+    circuit_data: Mapping[str, Any],
+    device_names: Sequence[str],
+) -> list[list[str]]:
+    """Return groups of devices whose thermal ports share a thermal net.
+
+    Only nets joining two or more of ``device_names`` are returned. A device
+    wired alone to a thermal scope is just being measured, not coupled.
+    """
+    wanted = set(device_names)
+    nets: dict[str, list[str]] = {}
+    for component in circuit_data.get("components", []) or []:
+        name = str(component.get("name") or component.get("id") or "").strip()
+        if name not in wanted:
+            continue
+        pins = component.get("pins") or []
+        nodes = component.get("pin_nodes") or []
+        for index, pin in enumerate(pins):
+            if pin.get("name") != THERMAL_PORT_PIN_NAME or index >= len(nodes):
+                continue
+            net = str(nodes[index] or "")
+            if net and net != "0" and name not in nets.setdefault(net, []):
+                nets[net].append(name)
+    return [names for names in nets.values() if len(names) >= 2]
+
+
+#: Junction-to-case resistance (K/W) of a device without ``rth_jc``.
+DEFAULT_JUNCTION_RESISTANCE = 0.8
+#: Junction-to-case time constant (s) of a device without ``tau_jc``.
+DEFAULT_JUNCTION_TAU = 0.02
+
+
+@dataclass
+class DeviceThermalParameters:
+    """Thermal parameters read from a device's component parameters.
+
+    Case and heatsink values left as None fall back to the run's
+    :class:`~pulsimgui.services.backend_types.ThermalSettings`.
+
+    Attributes:
+        junction_resistance: Junction-to-case resistance (K/W), ``rth_jc``.
+        junction_tau: Junction-to-case time constant (s), ``tau_jc``.
+        case_to_sink_resistance: Case-to-heatsink resistance (K/W), ``rth_cs``.
+        case_capacitance: Case heat capacity (J/K), ``cth_case``.
+        heatsink_resistance: Heatsink-to-ambient resistance (K/W) of the
+            heatsink the device is mounted on, ``rth_sa``.
+        heatsink_capacitance: Heat capacity (J/K) of that heatsink, ``cth_sink``.
+    """
+
+    junction_resistance: float = DEFAULT_JUNCTION_RESISTANCE
+    junction_tau: float = DEFAULT_JUNCTION_TAU
+    case_to_sink_resistance: float | None = None
+    case_capacitance: float | None = None
+    heatsink_resistance: float | None = None
+    heatsink_capacitance: float | None = None
+
+
+def _positive_parameter(params: Mapping[str, Any], key: str) -> float | None:
+    try:
+        value = float(params[key])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return value if value > 0.0 and np.isfinite(value) else None
+
+
+def device_thermal_parameters(
+    circuit_data: Mapping[str, Any],
+    device_names: Sequence[str],
+) -> dict[str, DeviceThermalParameters]:
+    """Return the thermal parameters of each of ``device_names``.
+
+    Missing, non-numeric or non-positive values keep their defaults.
+    """
+    wanted = set(device_names)
+    found: dict[str, DeviceThermalParameters] = {}
+    for component in circuit_data.get("components", []) or []:
+        name = str(component.get("name") or component.get("id") or "").strip()
+        if name not in wanted or name in found:
+            continue
+        params = component.get("parameters") or {}
+        found[name] = DeviceThermalParameters(
+            junction_resistance=(
+                _positive_parameter(params, "rth_jc") or DEFAULT_JUNCTION_RESISTANCE
+            ),
+            junction_tau=_positive_parameter(params, "tau_jc") or DEFAULT_JUNCTION_TAU,
+            case_to_sink_resistance=_positive_parameter(params, "rth_cs"),
+            case_capacitance=_positive_parameter(params, "cth_case"),
+            heatsink_resistance=_positive_parameter(params, "rth_sa"),
+            heatsink_capacitance=_positive_parameter(params, "cth_sink"),
+        )
+    return {name: found.get(name, DeviceThermalParameters()) for name in device_names}
+
+
+def heatsink_network(
+    device_names: Sequence[str],
+    case_to_sink_resistance: float | Sequence[float],
+    case_capacitance: float | Sequence[float],
+    sink_to_ambient_resistance: float,
+    sink_capacitance: float,
+) -> CoupledThermalNetwork:
+    """Build case nodes of ``device_names`` on one shared heatsink.
+
+    Device ``k`` injects into node ``k`` (its case); the heatsink is the last
+    node. The case values are either shared or given per device.
+    """
+    count = len(device_names)
+    resistances = np.broadcast_to(np.asarray(case_to_sink_resistance, dtype=np.float64), (count,))
+    capacitances = np.broadcast_to(np.asarray(case_capacitance, dtype=np.float64), (count,))
+    network = CoupledThermalNetwork()
+    cases = [
+        network.add_node(f"{name}:case", float(capacitance))
+        for name, capacitance in zip(device_names, capacitances)
+    ]
+    sink = network.add_node("heatsink", sink_capacitance)
+    for case, resistance in zip(cases, resistances):
+        network.connect(case, sink, float(resistance))
+        network.add_device(case)
+    network.connect(sink, None, sink_to_ambient_resistance)
+    return network
+
+
+__all__ = [
+    "DEFAULT_JUNCTION_RESISTANCE",
+    "DEFAULT_JUNCTION_TAU",
+    "THERMAL_DEVICE_TYPES",
+    "CoupledThermalNetwork",
+    "DeviceThermalParameters",
+    "device_thermal_parameters",
+    "heatsink_network",
+    "thermal_device_names",
+    "thermal_port_groups",
+]
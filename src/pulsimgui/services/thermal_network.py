@@ -0,0 +1,310 @@
+"""Vectorized integration of RC thermal networks.
+
+Every device network is held in Foster form: independent stages with a
+resistance ``R`` and time constant ``tau``. Over a step ``dt`` with power held
+constant, a stage rise evolves exactly as::
+
+    x[k+1] = a * x[k] + R * (1 - a) * P[k+1],   a = exp(-dt / tau)
+
+so the update has no truncation error, whatever ``dt / tau`` is. Cauer
+ladders are converted to their equivalent Foster form first. The junction
+response is unchanged by the conversion.
+
+All stages of all devices advance together. The recurrence is solved over
+blocks of the time axis with a cumulative sum in log space. The only Python
+loop is over blocks, not samples.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+
+#: Per-step decay (``dt / tau``) above which a stage is fully settled.
+#: ``exp(-37)`` is below double-precision epsilon.
+SETTLED_DECAY = 37.0
+
+#: Largest cumulative decay inside one block, well inside ``exp`` range.
+MAX_BLOCK_DECAY = 600.0
+
+#: Largest block length in samples, bounding temporary memory.
+MAX_BLOCK_SAMPLES = 4096
+
+#: Step sizes are rounded to 28 mantissa bits (~8.5 significant digits)
+#: before lookup. Sample times carry rounding noise of order ``eps * t``, so
+#: nominally equal steps differ in their last few digits.
+STEP_MANTISSA_SCALE = 2.0**28
+
+#: Decay ramps kept for reuse by constant-step blocks.
+MAX_CACHED_RAMPS = 4
+
+
+def cauer_to_foster(
+    resistances: Sequence[float],
+    capacitances: Sequence[float],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert a Cauer ladder into the Foster stages of its junction response.
+
+    The ladder runs from the junction (node 0) to ambient. Stage ``k`` is a
+    capacitance ``C[k]`` from node ``k`` to ambient and a resistance ``R[k]``
+    from node ``k`` to node ``k + 1``; the last resistance ends at ambient.
+
+    Args:
+        resistances: Stage resistances (K/W), junction side first.
+        capacitances: Stage capacitances (J/K).
+
+    Returns:
+        ``(R, tau)`` arrays of the equivalent Foster stages.
+    """
+    r = np.asarray(resistances, dtype=np.float64)
+    c = np.asarray(capacitances, dtype=np.float64)
+    if r.shape != c.shape or r.ndim != 1:
+        raise ValueError("Cauer ladder needs one resistance per capacitance")
+    if r.size == 0:
+        return np.empty(0), np.empty(0)
+    if np.any(r <= 0.0) or np.any(c <= 0.0):
+        raise ValueError("Cauer stage resistances and capacitances must be positive")
+
+    g = 1.0 / r
+    conductance = np.diag(g.copy())
+    conductance[1:, 1:] += np.diag(g[:-1])
+    idx = np.arange(r.size - 1)
+    conductance[idx, idx + 1] = -g[:-1]
+    conductance[idx + 1, idx] = -g[:-1]
+
+    # Symmetrize C^-1/2 G C^-1/2 so the eigenproblem is real and well conditioned.
+    scale = 1.0 / np.sqrt(c)
+    eigenvalues, vectors = np.linalg.eigh(conductance * scale[:, None] * scale[None, :])
+    foster_r = vectors[0, :] ** 2 / (c[0] * eigenvalues)
+    return foster_r, 1.0 / eigenvalues
+
+
+@dataclass
+class ThermalNetworkBatch:
+    """Foster networks of several devices, padded to a common stage count.
+
+    Attributes:
+        names: Device names, one per row.
+        resistances: Stage resistances, shape ``(n_devices, n_stages)``.
+            Padding stages have zero resistance and contribute nothing.
+        time_constants: Stage time constants (s), same shape.
+    """
+
+    names: list[str] = field(default_factory=list)
+    resistances: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+    time_constants: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+
+    @classmethod
+    def from_foster(
+        cls,
+        names: Sequence[str],
+        stages: Sequence[Sequence[tuple[float, float]]],
+    ) -> ThermalNetworkBatch:
+        """Build a batch from per-device Foster ``(R, C)`` stage lists."""
+        pairs = [
+            [(float(r), float(r) * float(c)) for r, c in device if float(r) > 0.0]
+            for device in stages
+        ]
+        return cls._from_pairs(names, pairs)
+
+    @classmethod
+    def from_cauer(
+        cls,
+        names: Sequence[str],
+        stages: Sequence[Sequence[tuple[float, float]]],
+    ) -> ThermalNetworkBatch:
+        """Build a batch from per-device Cauer ``(R, C)`` ladders."""
+        pairs = []
+        for device in stages:
+            r, tau = cauer_to_foster([s[0] for s in device], [s[1] for s in device])
+            pairs.append(list(zip(r.tolist(), tau.tolist())))
+        return cls._from_pairs(names, pairs)
+
+    @classmethod
+    def _from_pairs(
+        cls,
+        names: Sequence[str],
+        pairs: Sequence[Sequence[tuple[float, float]]],
+    ) -> ThermalNetworkBatch:
+        if len(names) != len(pairs):
+            raise ValueError("One stage list is required per device")
+        width = max((len(device) for device in pairs), default=0)
+        resistances = np.zeros((len(pairs), width))
+        time_constants = np.ones((len(pairs), width))
+        for row, device in enumerate(pairs):
+            for col, (r, tau) in enumerate(device):
+                resistances[row, col] = r
+                time_constants[row, col] = tau
+        if np.any(time_constants <= 0.0):
+            raise ValueError("Thermal time constants must be positive")
+        return cls(list(names), resistances, time_constants)
+
+    @property
+    def device_count(self) -> int:
+        """Number of devices in the batch."""
+        return len(self.names)
+
+    @property
+    def total_resistance(self) -> np.ndarray:
+        """Junction-to-ambient resistance of each device, shape ``(n_devices,)``."""
+        return self.resistances.sum(axis=1)
+
+    def foster_stages(self, index: int) -> list[tuple[float, float]]:
+        """Return the ``(R, C)`` Foster stages of one device, padding removed."""
+        return [
+            (float(r), float(tau / r))
+            for r, tau in zip(self.resistances[index], self.time_constants[index])
+            if r > 0.0
+        ]
+
+    def simulate(
+        self,
+        time: Sequence[float] | np.ndarray,
+        power: Sequence[Sequence[float]] | np.ndarray,
+        ambient: float = 25.0,
+        initial_rise: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Return junction temperatures, shape ``(n_devices, n_samples)``.
+
+        Args:
+            time: Sample times (s), non-decreasing.
+            power: Device power (W), shape ``(n_devices, n_samples)``. Sample
+                ``k + 1`` is held over the step from ``time[k]``.
+            ambient: Ambient temperature (°C).
+            initial_rise: Stage rises at ``time[0]``, shape
+                ``(n_devices, n_stages)``. Defaults to zero (at ambient).
+        """
+        rise, _state = integrate_foster(
+            time, power, self.resistances, self.time_constants, initial_rise
+        )
+        return rise + float(ambient)
+
+
+def integrate_foster(
+    time: Sequence[float] | np.ndarray,
+    power: Sequence[Sequence[float]] | np.ndarray,
+    resistances: np.ndarray,
+    time_constants: np.ndarray,
+    initial: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Integrate Foster stages of every device over the whole time axis.
+
+    Args:
+        time: Sample times, shape ``(n,)``.
+        power: Device power, shape ``(n_devices, n)``.
+        resistances: Stage resistances, shape ``(n_devices, n_stages)``.
+        time_constants: Stage time constants, same shape.
+        initial: Stage rises at ``time[0]``; zeros when None.
+
+    Returns:
+        ``(rise, final)`` where ``rise`` is the junction rise above ambient,
+        shape ``(n_devices, n)``, and ``final`` the stage rises at the last
+        sample. Pass ``final`` back as ``initial`` to continue a run.
+    """
+    t = np.asarray(time, dtype=np.float64)
+    p = np.atleast_2d(np.asarray(power, dtype=np.float64))
+    r = np.atleast_2d(np.asarray(resistances, dtype=np.float64))
+    tau = np.atleast_2d(np.asarray(time_constants, dtype=np.float64))
+    n_devices, n_stages = r.shape
+    if p.shape != (n_devices, t.size):
+        raise ValueError(f"Power must have shape {(n_devices, t.size)}, got {p.shape}")
+
+    # One row per (device, stage); the device power is shared by its stages.
+    r_rows = r.reshape(-1)
+    inv_tau = 1.0 / tau.reshape(-1)
+    state = (
+        np.zeros(r_rows.size)
+        if initial is None
+        else np.asarray(initial, dtype=np.float64).reshape(-1).copy()
+    )
+    rise = np.empty((n_devices, t.size))
+    if t.size == 0:
+        return rise, state.reshape(n_devices, n_stages)
+    rise[:, 0] = state.reshape(n_devices, n_stages).sum(axis=1)
+    if t.size == 1 or r_rows.size == 0:
+        rise[:, 1:] = rise[:, :1]
+        return rise, state.reshape(n_devices, n_stages)
+
+    dt = np.diff(t)
+    if np.any(dt < 0.0):
+        raise ValueError("Time axis must be non-decreasing")
+
+    # Steps that differ only by rounding noise share a table entry, so
+    # exp(-dt/tau) is evaluated once per distinct step size and gathered.
+    mantissa, exponent = np.frexp(dt)
+    steps, step_index = np.unique(
+        np.ldexp(np.rint(mantissa * STEP_MANTISSA_SCALE) / STEP_MANTISSA_SCALE, exponent),
+        return_inverse=True,
+    )
+    decay_table = np.minimum(np.outer(steps, inv_tau), SETTLED_DECAY)
+    gain_table = -np.expm1(-decay_table) * r_rows  # R * (1 - a), exact for tiny steps
+
+    # Stages that settle within every step simply follow R * P. They are
+    # folded into one resistance per device and kept out of the log-space
+    # solve, where they would force very short blocks.
+    settled = decay_table.min(axis=0) >= SETTLED_DECAY
+    settled_grid = settled.reshape(n_devices, n_stages)
+    settled_r = np.where(settled_grid, r, 0.0).sum(axis=1)
+    decay_table[:, settled] = 0.0
+    gain_table[:, settled] = 0.0
+    state[settled] = 0.0
+    decay_table = decay_table.reshape(-1, n_devices, n_stages)
+    gain_table = gain_table.reshape(-1, n_devices, n_stages)
+    state = state.reshape(n_devices, n_stages)
+    max_decay = decay_table.max(axis=(1, 2))[step_index]
+    ramps: dict[tuple[int, int], tuple[np.ndarray, np.ndarray]] = {}
+
+    start = 0
+    while start < dt.size:
+        stop = _block_end(max_decay, start, dt.size)
+        length = stop - start
+        index = step_index[start:stop]
+        power_block = p[:, None, start + 1 : stop + 1]
+        first = int(index[0])
+        if np.all(index == first):
+            # Constant step: the decay ramp is shared by every such block.
+            stage = gain_table[first][:, :, None] * power_block
+            ramp = ramps.get((first, length))
+            if ramp is None:
+                if len(ramps) >= MAX_CACHED_RAMPS:
+                    ramps.clear()
+                log_decay = decay_table[first][:, :, None] * np.arange(1, length + 1)
+                ramp = ramps[(first, length)] = (np.exp(log_decay), np.exp(-log_decay))
+        else:
+            stage = gain_table[index].transpose(1, 2, 0) * power_block
+            log_decay = np.cumsum(decay_table[index].transpose(1, 2, 0), axis=2)
+            ramp = (np.exp(log_decay), np.exp(-log_decay))
+
+        # x[k] = e^-L[k] * (x0 + sum_{j<=k} e^L[j] * u[j]), L = cumulative decay.
+        stage *= ramp[0]
+        stage = np.cumsum(stage, axis=2)
+        stage += state[:, :, None]
+        stage *= ramp[1]
+
+        rise[:, start + 1 : stop + 1] = stage.sum(axis=1) + settled_r[:, None] * power_block[:, 0]
+        state = stage[:, :, -1].copy()
+        start = stop
+
+    state = np.where(settled_grid, r * p[:, -1:], state)
+    return rise, state
+
+
+def _block_end(max_decay: np.ndarray, start: int, last: int) -> int:
+    """Return the end of the longest block whose cumulative decay stays bounded."""
+    stop = min(last, start + MAX_BLOCK_SAMPLES)
+    cumulative = np.cumsum(max_decay[start:stop])
+    fits = int(np.searchsorted(cumulative, MAX_BLOCK_DECAY, side="right"))
+    return start + max(1, fits)
+
+
+__all__ = [
+    "MAX_BLOCK_DECAY",
+    "MAX_BLOCK_SAMPLES",
+    "SETTLED_DECAY",
+    "STEP_MANTISSA_SCALE",
+    "ThermalNetworkBatch",
+    "cauer_to_foster",
+    "integrate_foster",
+]
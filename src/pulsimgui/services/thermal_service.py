@@ -8,14 +8,19 @@ development and testing.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
 import logging
-import math
-from typing import TYPE_CHECKING, Any, Sequence
+import os
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
-from PySide6.QtCore import QObject, Signal
+import numpy as np
+from PySide6.QtCore import QObject, QThread, Signal
 
+from pulsimgui.services.loss_extraction import extract_losses
 from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.services.thermal_coupling import thermal_device_names, thermal_port_groups
+from pulsimgui.services.thermal_network import ThermalNetworkBatch
 
 if TYPE_CHECKING:  # pragma: no cover - imported only for typing
     from pulsimgui.models.circuit import Circuit
@@ -29,6 +34,9 @@ if TYPE_CHECKING:  # pragma: no cover - imported only for typing
 
 logger = logging.getLogger(__name__)
 
+#: Interval (s) used to poll running device chunks for cancellation.
+CHUNK_POLL_INTERVAL = 0.1
+
 
 @dataclass
 class ThermalStage:
@@ -104,6 +112,42 @@ class ThermalResult:
         return sum(device.total_loss for device in self.devices)
 
 
+def partition_thermal_devices(
+    device_names: Sequence[str],
+    groups: Sequence[Sequence[str]] = (),
+    chunk_count: int = 1,
+) -> list[list[str]]:
+    """Split devices into at most ``chunk_count`` chunks for parallel solves.
+
+    Devices coupled through a shared heatsink (``groups``) always land in the
+    same chunk, because their temperatures depend on each other's losses.
+    Chunks keep the order of ``device_names``, which gives a group the
+    position of its first member.
+
+    Raises:
+        ValueError: If ``chunk_count`` is less than 1.
+    """
+    if chunk_count < 1:
+        raise ValueError("chunk_count must be at least 1")
+    group_of = {name: tuple(group) for group in groups for name in group}
+    units: list[list[str]] = []
+    placed: set[str] = set()
+    for name in device_names:
+        if name in placed:
+            continue
+        unit = [member for member in group_of.get(name, (name,)) if member in device_names]
+        placed.update(unit)
+        units.append(unit)
+
+    target = -(-len(placed) // chunk_count) if placed else 1
+    chunks: list[list[str]] = []
+    for unit in units:
+        if not chunks or len(chunks[-1]) >= target:
+            chunks.append([])
+        chunks[-1].extend(unit)
+    return chunks
+
+
 class ThermalAnalysisService(QObject):
     """Thermal analysis with backend integration and synthetic fallback."""
 
@@ -115,16 +159,22 @@ class ThermalAnalysisService(QObject):
         include_switching_losses: bool = True,
         include_conduction_losses: bool = True,
         thermal_network: str = "foster",
+        cycle_average: bool = False,
         backend: "SimulationBackend | None" = None,
+        max_workers: int | None = None,
         parent: QObject | None = None,
     ):
         super().__init__(parent)
+        self._max_workers = max_workers
         self._ambient_temperature = ambient_temperature
         self._include_switching_losses = bool(include_switching_losses)
         self._include_conduction_losses = bool(include_conduction_losses)
         self._thermal_network = str(thermal_network or "foster").strip().lower()
         if self._thermal_network not in {"foster", "cauer"}:
             self._thermal_network = "foster"
+        self._cycle_average = bool(cycle_average)
+        self._mission_profile: list[tuple[float, float]] = []
+        self._mission_repeats = 1
         self._backend = backend
 
     @property
@@ -146,6 +196,15 @@ class ThermalAnalysisService(QObject):
         """Set the backend for thermal analysis."""
         self._backend = value
 
+    @property
+    def max_workers(self) -> int | None:
+        """Thread count for per-device thermal solves. None uses the CPU count."""
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int | None) -> None:
+        self._max_workers = None if value is None else max(1, int(value))
+
     @property
     def include_switching_losses(self) -> bool:
         """Whether switching losses are included when running thermal analysis."""
@@ -174,20 +233,53 @@ class ThermalAnalysisService(QObject):
         network = str(value or "foster").strip().lower()
         self._thermal_network = network if network in {"foster", "cauer"} else "foster"
 
+    @property
+    def cycle_average(self) -> bool:
+        """Whether losses are averaged per switching period before the thermal solve."""
+        return self._cycle_average
+
+    @cycle_average.setter
+    def cycle_average(self, value: bool) -> None:
+        self._cycle_average = bool(value)
+
+    @property
+    def mission_profile(self) -> list[tuple[float, float]]:
+        """``(duration, load)`` segments extrapolated after the simulated run."""
+        return list(self._mission_profile)
+
+    def set_mission_profile(
+        self,
+        segments: list[tuple[float, float]],
+        repeats: int = 1,
+    ) -> None:
+        """Extrapolate the steady-state loss over ``segments`` repeated ``repeats`` times."""
+        self._mission_profile = [(float(duration), float(load)) for duration, load in segments]
+        self._mission_repeats = max(0, int(repeats))
+
     def build_result(
         self,
         circuit: "Circuit | None",
         electrical_result: SimulationResult | None = None,
         max_devices: int = 6,
         circuit_data: dict | None = None,
+        on_partial: Callable[[ThermalResult, int, int], None] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
     ) -> ThermalResult:
         """Build thermal result, trying real backend first then synthetic fallback.
 
+        Backend runs fan the devices out over a thread pool (see
+        :func:`partition_thermal_devices`) and merge the chunks as they finish.
+
         Args:
             circuit: GUI Circuit model for synthetic generation.
             electrical_result: Electrical simulation result for time base.
             max_devices: Maximum devices for synthetic generation.
             circuit_data: Serialized circuit data for backend (if available).
+            on_partial: Called with the merged result so far, the number of
+                completed chunks and the total each time a chunk finishes.
+            is_cancelled: Polled while chunks run. Once it returns True the
+                pending chunks are dropped and the partial result is returned
+                with an error message, without falling back to synthetic data.
 
         Returns:
             ThermalResult with is_synthetic=False if from real backend,
@@ -198,7 +290,11 @@ class ThermalAnalysisService(QObject):
 
         # Try real backend first if available
         if self._backend is not None and self._backend.has_capability("thermal"):
-            result = self._try_backend_thermal(circuit, electrical_result, circuit_data)
+            result = self._try_backend_thermal(
+                circuit, electrical_result, circuit_data, on_partial, is_cancelled
+            )
+            if is_cancelled is not None and is_cancelled():
+                return result or self._empty_result(electrical_result, "Thermal analysis cancelled")
             if result is not None:
                 self.result_generated.emit(result)
                 return result
@@ -206,16 +302,34 @@ class ThermalAnalysisService(QObject):
 
         # Fall back to synthetic generation
         result = self._build_synthetic_result(circuit, electrical_result, max_devices)
+        if on_partial is not None:
+            on_partial(result, 1, 1)
         self.result_generated.emit(result)
         return result
 
+    def _thermal_settings(self) -> "ThermalSettings":
+        """Return backend thermal settings for the current service options."""
+        from pulsimgui.services.backend_types import ThermalSettings
+
+        return ThermalSettings(
+            ambient_temperature=self._ambient_temperature,
+            include_switching_losses=self._include_switching_losses,
+            include_conduction_losses=self._include_conduction_losses,
+            thermal_network=self._thermal_network,
+            cycle_average=self._cycle_average,
+            mission_profile=list(self._mission_profile),
+            mission_repeats=self._mission_repeats,
+        )
+
     def _try_backend_thermal(
         self,
         circuit: "Circuit",
         electrical_result: SimulationResult | None,
         circuit_data: dict | None,
+        on_partial: Callable[[ThermalResult, int, int], None] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
     ) -> ThermalResult | None:
-        """Attempt to run thermal analysis via the backend."""
+        """Attempt to run thermal analysis via the backend, one chunk per worker."""
         if circuit_data is None:
             # Try to build circuit_data from GUI circuit
             circuit_data = self._circuit_to_data(circuit)
@@ -223,34 +337,129 @@ class ThermalAnalysisService(QObject):
                 return None
 
         try:
-            from pulsimgui.services.backend_types import ThermalSettings, TransientResult
-
-            # Build settings
-            settings = ThermalSettings(
-                ambient_temperature=self._ambient_temperature,
-                include_switching_losses=self._include_switching_losses,
-                include_conduction_losses=self._include_conduction_losses,
-                thermal_network=self._thermal_network,
-            )
-
-            # Build transient result for backend
+            settings = self._thermal_settings()
             transient_result = self._simulation_to_transient(electrical_result)
-
-            # Run backend thermal analysis
-            backend_result = self._backend.run_thermal(circuit_data, transient_result, settings)
-
-            # Check for errors
-            if backend_result.error_message:
-                logger.warning(f"Backend thermal error: {backend_result.error_message}")
-                return None
-
-            # Convert to service format
-            return self._convert_backend_result(backend_result)
+            names = thermal_device_names(circuit_data)
+            chunks = self._device_chunks(circuit_data, names, settings)
+            chunk_settings = self._chunk_settings(circuit_data, transient_result, settings, chunks)
+            workers = max(1, min(self._max_workers or os.cpu_count() or 1, len(chunks)))
+            results: dict[int, ThermalResult] = {}
+
+            # Not a ``with`` block: leaving it waits for running chunks, which
+            # would stall cancellation until the slowest chunk finishes.
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pulsim-thermal")
+            pending: dict[Future, int] = {}
+            try:
+                pending = {
+                    executor.submit(
+                        self._backend.run_thermal, circuit_data, transient_result, chunk_setting
+                    ): index
+                    for index, chunk_setting in enumerate(chunk_settings)
+                }
+                while pending:
+                    if is_cancelled is not None and is_cancelled():
+                        merged = self._merge_chunk_results(results, chunks, names)
+                        merged.error_message = "Thermal analysis cancelled"
+                        return merged
+                    done, _ = wait(pending, timeout=CHUNK_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = pending.pop(future)
+                        backend_result = future.result()
+                        if backend_result.error_message:
+                            logger.warning(f"Backend thermal error: {backend_result.error_message}")
+                            return None
+                        results[index] = self._convert_backend_result(backend_result)
+                    if done and on_partial is not None:
+                        merged = self._merge_chunk_results(results, chunks, names)
+                        on_partial(merged, len(results), len(chunks))
+            finally:
+                # Drop queued chunks; running ones finish in the background.
+                executor.shutdown(wait=not pending, cancel_futures=True)
+
+            return self._merge_chunk_results(results, chunks, names)
 
         except Exception as exc:
             logger.warning(f"Backend thermal analysis failed: {exc}")
             return None
 
+    @staticmethod
+    def _chunk_settings(
+        circuit_data: dict,
+        transient_result: "TransientResult",
+        settings: "ThermalSettings",
+        chunks: Sequence[Sequence[str] | None],
+    ) -> list["ThermalSettings"]:
+        """Return the backend settings of each chunk.
+
+        With several chunks the device losses are extracted here once and
+        each chunk gets only its own devices' waveforms, instead of every
+        chunk extracting the losses of the whole circuit again.
+        """
+        if len(chunks) < 2:
+            return [
+                settings if chunk is None else replace(settings, devices=list(chunk))
+                for chunk in chunks
+            ]
+        losses = extract_losses(
+            circuit_data,
+            np.asarray(transient_result.time, dtype=np.float64),
+            transient_result.signals,
+        )
+        return [
+            replace(
+                settings,
+                devices=list(chunk),
+                losses={name: losses[name] for name in chunk if name in losses},
+            )
+            for chunk in chunks
+        ]
+
+    def _device_chunks(
+        self,
+        circuit_data: dict,
+        names: list[str],
+        settings: "ThermalSettings",
+    ) -> list[list[str] | None]:
+        """Return the device subsets to solve in parallel; ``[None]`` runs all at once.
+
+        Cycle-averaged runs stay in one chunk: without a PWM frequency the
+        averaging periods come from the dominant device's edges, and every
+        device must share that time axis.
+        """
+        if len(names) < 2 or settings.cycle_average:
+            return [None]
+        workers = self._max_workers or os.cpu_count() or 1
+        return partition_thermal_devices(names, thermal_port_groups(circuit_data, names), workers)
+
+    @staticmethod
+    def _merge_chunk_results(
+        results: dict[int, ThermalResult],
+        chunks: Sequence[Sequence[str] | None],
+        device_order: Sequence[str],
+    ) -> ThermalResult:
+        """Join chunk results in ``device_order``, dropping devices outside each chunk.
+
+        Backends that ignore :attr:`ThermalSettings.devices` return every
+        device for every chunk, so each chunk only contributes its own names.
+        """
+        merged = ThermalResult(is_synthetic=True)
+        if not results:
+            return merged
+        for index in sorted(results):
+            chunk = chunks[index]
+            result = results[index]
+            if not merged.time:
+                merged.time = list(result.time)
+                merged.ambient_temperature = result.ambient_temperature
+            merged.is_synthetic = merged.is_synthetic and result.is_synthetic
+            merged.devices.extend(
+                device for device in result.devices
+                if chunk is None or device.component_name in chunk
+            )
+        order = {name: rank for rank, name in enumerate(device_order)}
+        merged.devices.sort(key=lambda device: order.get(device.component_name, len(order)))
+        return merged
+
     def _circuit_to_data(self, circuit: "Circuit") -> dict | None:
         """Convert GUI Circuit to serialized data for backend."""
         try:
@@ -357,9 +566,9 @@ class ThermalAnalysisService(QObject):
         """Generate synthetic thermal data from the circuit."""
         ordered_components = self._select_components(circuit, max_devices)
         timeline = self._resolve_time_axis(electrical_result)
-        normalized_time = self._normalize_time(timeline)
+        traces = self._synthetic_temperature_traces(len(ordered_components), timeline)
         devices = [
-            self._build_device_result(comp, index, normalized_time, timeline)
+            self._build_device_result(comp, index, traces[index].tolist())
             for index, comp in enumerate(ordered_components)
         ]
 
@@ -385,30 +594,38 @@ class ThermalAnalysisService(QObject):
         duration = 10e-3
         return [i * (duration / samples) for i in range(samples + 1)]
 
-    def _normalize_time(self, time_axis: Sequence[float]) -> list[float]:
-        if not time_axis:
-            return []
-        start = time_axis[0]
-        end = time_axis[-1]
-        span = end - start
-        if span <= 0:
-            return [0.0 for _ in time_axis]
-        return [(t - start) / span for t in time_axis]
+    def _synthetic_temperature_traces(
+        self, device_count: int, timeline: Sequence[float]
+    ) -> np.ndarray:
+        """Step response of one RC stage per device, integrated as one batch.
+
+        Device ``i`` rises by ``20 + 8 i`` °C with a time constant of the run
+        span divided by ``2.5 + 0.3 i``.
+        """
+        time_axis = np.asarray(timeline, dtype=np.float64)
+        if device_count == 0 or time_axis.size == 0:
+            return np.full((device_count, 1), self._ambient_temperature)
+        span = float(time_axis[-1] - time_axis[0])
+        if span <= 0.0:
+            return np.full((device_count, time_axis.size), self._ambient_temperature)
+
+        index = np.arange(device_count)
+        rise = 20.0 + index * 8.0
+        tau = span / (2.5 + index * 0.3)
+        batch = ThermalNetworkBatch.from_foster(
+            [str(i) for i in index],
+            [[(r, t / r)] for r, t in zip(rise.tolist(), tau.tolist())],
+        )
+        # Unit power makes each trace the normalized step response scaled by R.
+        power = np.ones((device_count, time_axis.size))
+        return batch.simulate(time_axis, power, self._ambient_temperature)
 
     def _build_device_result(
         self,
         component: Component,
         position_index: int,
-        normalized_time: Sequence[float],
-        timeline: Sequence[float],
+        temps: list[float],
     ) -> ThermalDeviceResult:
-        base_rise = 20.0 + position_index * 8.0
-        time_constant = 2.5 + position_index * 0.3
-        temps = [
-            self._ambient_temperature
-            + base_rise * (1 - math.exp(-t * time_constant))
-            for t in normalized_time
-        ] or [self._ambient_temperature]
 
         conduction_loss = 3.0 + position_index * 0.8
         switching_loss = 1.5 + position_index * 0.6
@@ -463,11 +680,16 @@ class ThermalAnalysisService(QObject):
             )
         return stages
 
-    def _empty_result(self, electrical_result: SimulationResult | None) -> ThermalResult:
+    def _empty_result(
+        self,
+        electrical_result: SimulationResult | None,
+        error_message: str = "",
+    ) -> ThermalResult:
         return ThermalResult(
             time=self._resolve_time_axis(electrical_result),
             devices=[],
             is_synthetic=True,
+            error_message=error_message,
         )
 
     @staticmethod
@@ -483,3 +705,72 @@ class ThermalAnalysisService(QObject):
             except (TypeError, ValueError):
                 continue
         return None
+
+
+class ThermalAnalysisWorker(QThread):
+    """Worker thread running :meth:`ThermalAnalysisService.build_result`.
+
+    ``partial_result`` carries the merged result each time a device chunk
+    finishes, so a viewer can fill in while the remaining devices solve.
+    """
+
+    progress = Signal(float, str)
+    partial_result = Signal(object)  # ThermalResult
+    finished_signal = Signal(object)  # ThermalResult
+    error = Signal(str)
+
+    def __init__(
+        self,
+        service: ThermalAnalysisService,
+        circuit: "Circuit | None",
+        electrical_result: SimulationResult | None = None,
+        circuit_data: dict | None = None,
+        max_devices: int = 6,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._service = service
+        self._circuit = circuit
+        self._electrical_result = electrical_result
+        self._circuit_data = circuit_data
+        self._max_devices = max_devices
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Request cancellation; pending device chunks are dropped."""
+        self._cancelled = True
+
+    @property
+    def was_cancelled(self) -> bool:
+        """Return whether cancellation was requested."""
+        return self._cancelled
+
+    def run(self) -> None:
+        """Run the thermal analysis."""
+        self.progress.emit(0.0, "Running thermal analysis...")
+        try:
+            result = self._service.build_result(
+                self._circuit,
+                self._electrical_result,
+                max_devices=self._max_devices,
+                circuit_data=self._circuit_data,
+                on_partial=self._on_partial,
+                is_cancelled=lambda: self._cancelled,
+            )
+        except Exception as exc:
+            self.error.emit(str(exc))
+            return
+        if self._cancelled:
+            self.progress.emit(0.0, "Thermal analysis cancelled")
+            return
+        self.progress.emit(100.0, "Thermal analysis complete")
+        self.finished_signal.emit(result)
+
+    def _on_partial(self, result: ThermalResult, completed: int, total: int) -> None:
+        if self._cancelled:
+            return
+        self.partial_result.emit(result)
+        self.progress.emit(
+            100.0 * completed / max(total, 1),
+            f"Thermal analysis: {len(result.devices)} devices ready ({completed}/{total})",
+        )
@@ -8,11 +8,14 @@ from pulsimgui.views.dialogs.bode_plot_dialog import BodePlotDialog
 from pulsimgui.views.dialogs.keyboard_shortcuts_dialog import KeyboardShortcutsDialog
 from pulsimgui.views.dialogs.template_dialog import TemplateDialog
 from pulsimgui.views.dialogs.create_subcircuit_dialog import CreateSubcircuitDialog
+from pulsimgui.views.dialogs.dc_sweep_dialog import DCSweepDialog
+from pulsimgui.views.dialogs.dc_sweep_results_dialog import DCSweepResultsDialog
 from pulsimgui.views.dialogs.parameter_sweep_dialog import ParameterSweepDialog
 from pulsimgui.views.dialogs.parameter_sweep_results_dialog import ParameterSweepResultsDialog
 from pulsimgui.views.dialogs.thermal_viewer_dialog import ThermalViewerDialog
 from pulsimgui.views.dialogs.convergence_diagnostics_dialog import ConvergenceDiagnosticsDialog
 from pulsimgui.views.dialogs.component_properties_dialog import ComponentPropertiesDialog
+from pulsimgui.views.dialogs.waveform_export_dialog import WaveformExportDialog
 
 __all__ = [
     "PreferencesDialog",
@@ -24,9 +27,12 @@ __all__ = [
     "KeyboardShortcutsDialog",
     "TemplateDialog",
     "CreateSubcircuitDialog",
+    "DCSweepDialog",
+    "DCSweepResultsDialog",
     "ParameterSweepDialog",
     "ParameterSweepResultsDialog",
     "ThermalViewerDialog",
     "ConvergenceDiagnosticsDialog",
     "ComponentPropertiesDialog",
+    "WaveformExportDialog",
 ]
@@ -53,13 +53,9 @@ class BodePlotDialog(QDialog):
         layout.setSpacing(12)
 
         # Status banner
-        if self._result.is_valid:
-            status = StatusBanner.success(
-                f"AC analysis completed: {len(self._result.frequencies)} frequency points"
-            )
-        else:
-            status = StatusBanner.error(f"Error: {self._result.error_message}")
-        layout.addWidget(status)
+        self._status_banner = StatusBanner("")
+        self._update_status_banner()
+        layout.addWidget(self._status_banner)
 
         # Tab widget for plots and data
         self._tabs = QTabWidget()
@@ -123,6 +119,41 @@ class BodePlotDialog(QDialog):
 
         layout.addLayout(controls_layout)
 
+    def _update_status_banner(self, partial: bool = False) -> None:
+        """Describe the current result in the status banner."""
+        points = len(self._result.frequencies)
+        if partial:
+            self._status_banner.setStatusType(StatusBanner.INFO)
+            self._status_banner.setText(f"AC analysis running: {points} frequency points so far")
+        elif self._result.is_valid:
+            self._status_banner.setStatusType(StatusBanner.SUCCESS)
+            self._status_banner.setText(f"AC analysis completed: {points} frequency points")
+        else:
+            self._status_banner.setStatusType(StatusBanner.ERROR)
+            self._status_banner.setText(f"Error: {self._result.error_message}")
+
+    def update_result(self, result: ACResult, partial: bool = False) -> None:
+        """Replace the displayed result, e.g. as AC sweep chunks arrive.
+
+        Args:
+            result: New (possibly partially merged) AC result.
+            partial: True while further chunks are still running.
+        """
+        self._result = result
+        self._update_status_banner(partial)
+
+        current = self._signal_combo.currentText()
+        names = list(result.magnitude.keys())
+        self._signal_combo.blockSignals(True)
+        self._signal_combo.clear()
+        self._signal_combo.addItems(names)
+        if current in names:
+            self._signal_combo.setCurrentText(current)
+        self._signal_combo.blockSignals(False)
+
+        if result.is_valid and names:
+            self._plot_signal(self._signal_combo.currentText())
+
     def _create_bode_tab(self) -> QWidget:
         """Create the Bode plot tab with magnitude and phase plots."""
         widget = QWidget()
@@ -273,7 +304,7 @@ class BodePlotDialog(QDialog):
             if magnitude[i] >= 0 > magnitude[i + 1]:
                 # Linear interpolation to find exact crossing
                 t = (0 - magnitude[i]) / (magnitude[i + 1] - magnitude[i])
-                self._gain_crossover_freq = frequencies[i] + t * (frequencies[i + 1] - frequencies[i])
+                self._gain_crossover_freq = self._interpolate_frequency(frequencies, i, t)
                 # Interpolate phase at this frequency
                 phase_at_gc = phase[i] + t * (phase[i + 1] - phase[i])
                 # Phase margin = phase + 180° (should be positive for stability)
@@ -282,7 +313,7 @@ class BodePlotDialog(QDialog):
             elif magnitude[i] < 0 <= magnitude[i + 1]:
                 # Crossing from below (rising gain)
                 t = (0 - magnitude[i]) / (magnitude[i + 1] - magnitude[i])
-                self._gain_crossover_freq = frequencies[i] + t * (frequencies[i + 1] - frequencies[i])
+                self._gain_crossover_freq = self._interpolate_frequency(frequencies, i, t)
                 phase_at_gc = phase[i] + t * (phase[i + 1] - phase[i])
                 self._phase_margin = phase_at_gc + 180.0
                 break
@@ -292,7 +323,7 @@ class BodePlotDialog(QDialog):
             if phase[i] >= -180 > phase[i + 1]:
                 # Linear interpolation
                 t = (-180 - phase[i]) / (phase[i + 1] - phase[i])
-                self._phase_crossover_freq = frequencies[i] + t * (frequencies[i + 1] - frequencies[i])
+                self._phase_crossover_freq = self._interpolate_frequency(frequencies, i, t)
                 # Interpolate magnitude at this frequency
                 mag_at_pc = magnitude[i] + t * (magnitude[i + 1] - magnitude[i])
                 # Gain margin = -magnitude at phase crossover (positive for stability)
@@ -302,6 +333,14 @@ class BodePlotDialog(QDialog):
         # Update margin labels
         self._update_margin_labels()
 
+    @staticmethod
+    def _interpolate_frequency(frequencies: np.ndarray, i: int, t: float) -> float:
+        """Interpolate between two points on the logarithmic frequency axis."""
+        f0, f1 = float(frequencies[i]), float(frequencies[i + 1])
+        if f0 <= 0 or f1 <= 0:
+            return f0 + t * (f1 - f0)
+        return float(10 ** (np.log10(f0) + t * (np.log10(f1) - np.log10(f0))))
+
     def _update_margin_labels(self) -> None:
         """Update the stability margin display labels."""
         # Gain margin
@@ -0,0 +1,160 @@
+"""Dialog for configuring DC sweeps."""
+
+from dataclasses import dataclass
+from typing import List
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QGroupBox,
+    QLabel,
+    QSpinBox,
+    QVBoxLayout,
+)
+
+from pulsimgui.models.circuit import Circuit
+from pulsimgui.models.component import Component, ComponentType
+from pulsimgui.services.backend_types import DCSweepSettings
+from pulsimgui.views.properties import SILineEdit
+
+_SOURCE_TYPES = (ComponentType.VOLTAGE_SOURCE, ComponentType.CURRENT_SOURCE)
+
+
+@dataclass
+class _SweepTarget:
+    component: Component
+    display_name: str
+    parameters: dict[str, float]
+
+
+class DCSweepDialog(QDialog):
+    """Collects the swept source or parameter and the sweep range."""
+
+    def __init__(self, circuit: Circuit, parent=None):
+        super().__init__(parent)
+        self._targets: List[_SweepTarget] = self._build_targets(circuit)
+
+        self.setWindowTitle("DC Sweep")
+        self.setMinimumWidth(380)
+
+        self._setup_ui()
+        self._populate_targets()
+        self._update_parameter_combo()
+
+    def _setup_ui(self) -> None:
+        layout = QVBoxLayout(self)
+
+        target_group = QGroupBox("Sweep Target")
+        target_layout = QFormLayout(target_group)
+
+        self._component_combo = QComboBox()
+        self._component_combo.currentIndexChanged.connect(self._update_parameter_combo)
+        target_layout.addRow("Component:", self._component_combo)
+
+        self._parameter_combo = QComboBox()
+        self._parameter_combo.currentTextChanged.connect(self._refresh_parameter_defaults)
+        target_layout.addRow("Parameter:", self._parameter_combo)
+
+        layout.addWidget(target_group)
+
+        range_group = QGroupBox("Sweep Range")
+        range_layout = QFormLayout(range_group)
+
+        self._start_edit = SILineEdit("")
+        range_layout.addRow("Start value:", self._start_edit)
+
+        self._stop_edit = SILineEdit("")
+        range_layout.addRow("End value:", self._stop_edit)
+
+        self._points_spin = QSpinBox()
+        self._points_spin.setRange(2, 100000)
+        self._points_spin.setValue(101)
+        range_layout.addRow("Points:", self._points_spin)
+
+        layout.addWidget(range_group)
+
+        self._empty_label = QLabel("No sources or components with numeric parameters available.")
+        self._empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._empty_label.setWordWrap(True)
+        layout.addWidget(self._empty_label)
+
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        button_box.accepted.connect(self._accept_if_valid)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def _build_targets(self, circuit: Circuit) -> List[_SweepTarget]:
+        """List sweepable components, DC sources first."""
+        sources: List[_SweepTarget] = []
+        others: List[_SweepTarget] = []
+        for component in circuit.components.values():
+            display = component.name or component.type.name.title()
+            if component.type in _SOURCE_TYPES:
+                waveform = component.parameters.get("waveform")
+                if isinstance(waveform, dict) and waveform.get("type", "dc") == "dc":
+                    value = float(waveform.get("value", 0.0))
+                    sources.append(_SweepTarget(component, display, {"value": value}))
+                continue
+            numeric_params = {
+                name: float(value)
+                for name, value in component.parameters.items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)
+            }
+            if numeric_params:
+                others.append(_SweepTarget(component, display, numeric_params))
+        return sources + others
+
+    def _populate_targets(self) -> None:
+        self._component_combo.clear()
+        for target in self._targets:
+            self._component_combo.addItem(target.display_name, target)
+        self._empty_label.setVisible(len(self._targets) == 0)
+
+    def _update_parameter_combo(self) -> None:
+        target = self._current_target()
+        self._parameter_combo.clear()
+        enabled = target is not None
+        self._start_edit.setEnabled(enabled)
+        self._stop_edit.setEnabled(enabled)
+        self._points_spin.setEnabled(enabled)
+        if not target:
+            return
+        for name in target.parameters.keys():
+            self._parameter_combo.addItem(name)
+        self._refresh_parameter_defaults()
+
+    def _current_target(self) -> _SweepTarget | None:
+        data = self._component_combo.currentData()
+        return data if isinstance(data, _SweepTarget) else None
+
+    def _refresh_parameter_defaults(self) -> None:
+        target = self._current_target()
+        if not target:
+            return
+        value = float(target.parameters.get(self._parameter_combo.currentText(), 0.0))
+        self._start_edit.value = 0.0
+        self._stop_edit.value = value
+
+    def _accept_if_valid(self) -> None:
+        if not self._current_target() or not self._parameter_combo.currentText():
+            return
+        self.accept()
+
+    def get_settings(self) -> DCSweepSettings | None:
+        target = self._current_target()
+        parameter = self._parameter_combo.currentText()
+        if not target or not parameter:
+            return None
+        return DCSweepSettings(
+            component_id=str(target.component.id),
+            component_name=target.display_name,
+            parameter_name=parameter,
+            start_value=self._start_edit.value,
+            stop_value=self._stop_edit.value,
+            points=self._points_spin.value(),
+        )
@@ -0,0 +1,65 @@
+"""Dialog for viewing DC sweep transfer characteristics."""
+
+import pyqtgraph as pg
+from PySide6.QtWidgets import QComboBox, QDialog, QHBoxLayout, QLabel, QVBoxLayout
+
+from pulsimgui.services.backend_types import DCSweepResult
+from pulsimgui.views.widgets import StatusBanner
+
+
+class DCSweepResultsDialog(QDialog):
+    """Plots any solution signal against the swept value."""
+
+    def __init__(self, result: DCSweepResult, parent=None):
+        super().__init__(parent)
+        self._result = result
+
+        self.setWindowTitle("DC Sweep Results")
+        self.resize(800, 550)
+
+        self._setup_ui()
+        self._update_plot()
+
+    def _setup_ui(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+
+        converged = int(self._result.converged.sum())
+        total = int(self._result.values.size)
+        if converged == total:
+            status = StatusBanner.success(f"DC sweep completed: {total} points")
+        else:
+            status = StatusBanner.warning(
+                f"DC sweep completed: {converged}/{total} points converged"
+            )
+        layout.addWidget(status)
+
+        stats = self._result.statistics
+        summary = QLabel(
+            f"Swept: {self._result.parameter}  |  "
+            f"Newton solves: {stats.get('newton_solves', 0)}  |  "
+            f"Full solves: {stats.get('full_solves', 0)}  |  "
+            f"Step halvings: {stats.get('step_halvings', 0)}"
+        )
+        summary.setStyleSheet("color: #6b7280; font-size: 11px;")
+        layout.addWidget(summary)
+
+        selector = QHBoxLayout()
+        selector.addWidget(QLabel("Signal:"))
+        self._signal_combo = QComboBox()
+        self._signal_combo.addItems(sorted(self._result.signals))
+        self._signal_combo.currentTextChanged.connect(self._update_plot)
+        selector.addWidget(self._signal_combo, 1)
+        layout.addLayout(selector)
+
+        self._plot = pg.PlotWidget()
+        self._plot.setLabel("bottom", self._result.parameter)
+        self._plot.showGrid(x=True, y=True, alpha=0.3)
+        self._curve = self._plot.plot(pen=pg.mkPen(color=(31, 119, 180), width=2))
+        layout.addWidget(self._plot)
+
+    def _update_plot(self) -> None:
+        signal = self._signal_combo.currentText()
+        xs, ys = self._result.xy(signal)
+        self._plot.setLabel("left", signal)
+        self._curve.setData(xs, ys)
@@ -46,6 +46,8 @@ _INTEGRATION_METHOD_OPTIONS = [
     ("SDIRK2", "sdirk2"),
 ]
 
+_MB = 1024 * 1024
+
 
 class PreferencesDialog(QDialog):
     """Dialog for editing application preferences."""
@@ -282,6 +284,34 @@ class PreferencesDialog(QDialog):
 
         layout.addWidget(output_group)
 
+        # Run history group
+        history_group = QGroupBox("Run History")
+        history_layout = QFormLayout(history_group)
+
+        self._history_runs_spin = QSpinBox()
+        self._history_runs_spin.setRange(1, 100)
+        history_layout.addRow("Runs in memory:", self._history_runs_spin)
+
+        self._history_memory_spin = QSpinBox()
+        self._history_memory_spin.setRange(0, 65536)
+        self._history_memory_spin.setSuffix(" MB")
+        history_layout.addRow("Memory budget:", self._history_memory_spin)
+
+        spill_layout = QHBoxLayout()
+        self._history_spill_edit = QLineEdit()
+        self._history_spill_edit.setPlaceholderText("Drop evicted runs")
+        spill_layout.addWidget(self._history_spill_edit)
+        spill_btn = QPushButton("Browse...")
+        spill_btn.clicked.connect(self._browse_history_spill_dir)
+        spill_layout.addWidget(spill_btn)
+        history_layout.addRow("Spill directory:", spill_layout)
+
+        self._history_spilled_spin = QSpinBox()
+        self._history_spilled_spin.setRange(0, 1000)
+        history_layout.addRow("Runs on disk:", self._history_spilled_spin)
+
+        layout.addWidget(history_group)
+
         layout.addStretch()
 
         self._populate_backend_options()
@@ -448,6 +478,12 @@ class PreferencesDialog(QDialog):
         self._max_step_spin.setValue(float(sim_settings.get("max_step", 1e-6)) * 1e6)
         self._output_points_spin.setValue(int(sim_settings.get("output_points", 10000)))
 
+        history_settings = self._settings.get_run_history_settings()
+        self._history_runs_spin.setValue(history_settings["max_runs"])
+        self._history_memory_spin.setValue(history_settings["max_bytes"] // _MB)
+        self._history_spill_edit.setText(history_settings["spill_dir"])
+        self._history_spilled_spin.setValue(history_settings["max_spilled_runs"])
+
         runtime_settings = self._settings.get_backend_runtime_settings()
         source = runtime_settings.get("source", "pypi")
         source_index = next(
@@ -489,6 +525,16 @@ class PreferencesDialog(QDialog):
                 "output_points": self._output_points_spin.value(),
             }
         )
+        history_settings = {
+            "max_runs": self._history_runs_spin.value(),
+            "max_bytes": self._history_memory_spin.value() * _MB,
+            "spill_dir": self._history_spill_edit.text().strip(),
+            "max_spilled_runs": self._history_spilled_spin.value(),
+        }
+        if self._simulation_service:
+            self._simulation_service.update_run_history_settings(history_settings)
+        else:
+            self._settings.set_run_history_settings(history_settings)
 
         runtime_config = self._runtime_config_from_ui()
         self._settings.set_backend_runtime_settings(runtime_config.to_dict())
@@ -509,6 +555,16 @@ class PreferencesDialog(QDialog):
         self._apply_settings()
         self.accept()
 
+    def _browse_history_spill_dir(self) -> None:
+        """Browse for the directory evicted runs are spilled to."""
+        directory = QFileDialog.getExistingDirectory(
+            self,
+            "Select Run History Spill Directory",
+            self._history_spill_edit.text(),
+        )
+        if directory:
+            self._history_spill_edit.setText(directory)
+
     def _browse_project_location(self) -> None:
         """Browse for default project location."""
         directory = QFileDialog.getExistingDirectory(
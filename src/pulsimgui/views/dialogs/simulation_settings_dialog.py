@@ -337,6 +337,13 @@ class SimulationSettingsDialog(QDialog):
         self._output_points_spin.valueChanged.connect(self._update_effective_step)
         form.addRow("Output points:", self._output_points_spin)
 
+        self._ac_adaptive_check = QCheckBox("Refine AC sweeps adaptively")
+        self._ac_adaptive_check.setToolTip(
+            "Treat points per decade as a coarse grid and add points where the\n"
+            "response bends or crosses 0 dB / -180°."
+        )
+        form.addRow(self._ac_adaptive_check)
+
         self._effective_step_label = QLabel("-")
         self._effective_step_label.setObjectName("effectiveStepValue")
         form.addRow("Effective step:", self._effective_step_label)
@@ -533,6 +540,13 @@ class SimulationSettingsDialog(QDialog):
         self._thermal_include_switching_check.setChecked(True)
         form.addRow(self._thermal_include_switching_check)
 
+        self._thermal_cycle_average_check = QCheckBox("Average losses per switching period")
+        self._thermal_cycle_average_check.setToolTip(
+            "Drive the thermal network with one averaged loss sample per PWM period.\n"
+            "Much faster on long runs; hides ripple within a period."
+        )
+        form.addRow(self._thermal_cycle_average_check)
+
         layout.addLayout(form)
         return card
 
@@ -714,6 +728,7 @@ class SimulationSettingsDialog(QDialog):
 
         self._output_points_spin.setValue(source.output_points)
         self._enable_events_check.setChecked(bool(getattr(source, "enable_events", True)))
+        self._ac_adaptive_check.setChecked(bool(getattr(source, "ac_adaptive", False)))
         self._max_step_retries_spin.setValue(max(0, int(getattr(source, "max_step_retries", 8))))
         self._enable_losses_check.setChecked(bool(getattr(source, "enable_losses", True)))
         self._thermal_ambient_spin.setValue(float(getattr(source, "thermal_ambient", 25.0)))
@@ -726,6 +741,9 @@ class SimulationSettingsDialog(QDialog):
         self._thermal_include_switching_check.setChecked(
             bool(getattr(source, "thermal_include_switching_losses", True))
         )
+        self._thermal_cycle_average_check.setChecked(
+            bool(getattr(source, "thermal_cycle_average", False))
+        )
 
         self._update_solver_description()
         self._update_dc_strategy_description()
@@ -800,6 +818,7 @@ class SimulationSettingsDialog(QDialog):
 
         self._settings.output_points = self._output_points_spin.value()
         self._settings.enable_events = self._enable_events_check.isChecked()
+        self._settings.ac_adaptive = self._ac_adaptive_check.isChecked()
         self._settings.max_step_retries = self._max_step_retries_spin.value()
         self._settings.enable_losses = self._enable_losses_check.isChecked()
         self._settings.thermal_ambient = self._thermal_ambient_spin.value()
@@ -812,6 +831,7 @@ class SimulationSettingsDialog(QDialog):
         self._settings.thermal_include_switching_losses = (
             self._thermal_include_switching_check.isChecked()
         )
+        self._settings.thermal_cycle_average = self._thermal_cycle_average_check.isChecked()
 
     def _commit_pending_inputs(self) -> None:
         """Commit text still being edited before reading values."""
@@ -42,6 +42,10 @@ class ThermalViewerDialog(QDialog):
 
         header_layout.addStretch()
 
+        self._status_label = QLabel()
+        self._status_label.setVisible(False)
+        header_layout.addWidget(self._status_label)
+
         self._viewer = ThermalViewerWidget(theme_service=theme_service, parent=self)
         self._update_display(result)
 
@@ -63,6 +67,7 @@ class ThermalViewerDialog(QDialog):
         """Apply active theme to dialog-specific header elements."""
         c = theme.colors
         self._title_label.setStyleSheet(f"font-size: 14px; font-weight: 600; color: {c.foreground};")
+        self._status_label.setStyleSheet(f"color: {c.foreground_muted};")
         self._synthetic_badge.setStyleSheet(
             f"color: {c.warning}; font-weight: 600; padding: 2px 8px; "
             f"border: 1px solid {c.warning}; border-radius: 4px;"
@@ -84,3 +89,8 @@ class ThermalViewerDialog(QDialog):
     def set_result(self, result: ThermalResult | None) -> None:
         """Update the dialog with new data."""
         self._update_display(result)
+
+    def set_status(self, message: str) -> None:
+        """Show a progress message in the header; an empty message hides it."""
+        self._status_label.setText(message)
+        self._status_label.setVisible(bool(message))
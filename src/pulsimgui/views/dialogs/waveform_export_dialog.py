@@ -0,0 +1,144 @@
+"""Dialog for choosing what a waveform export writes."""
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QGroupBox,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QPushButton,
+    QSpinBox,
+    QVBoxLayout,
+)
+
+from pulsimgui.services.export_service import WaveformExportOptions
+from pulsimgui.utils.si_prefix import format_si_value, parse_si_value
+
+
+class WaveformExportDialog(QDialog):
+    """Collects the signals, time range and decimation of a waveform export."""
+
+    def __init__(
+        self,
+        signal_names: list[str],
+        time_span: tuple[float, float] | None = None,
+        sample_count: int = 0,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._sample_count = sample_count
+        self.setWindowTitle("Export Waveforms")
+        self.setMinimumWidth(400)
+        self._setup_ui(signal_names, time_span)
+        self._update_summary()
+
+    def _setup_ui(self, signal_names: list[str], time_span: tuple[float, float] | None) -> None:
+        layout = QVBoxLayout(self)
+
+        signal_group = QGroupBox("Signals")
+        signal_layout = QVBoxLayout(signal_group)
+        self._signal_list = QListWidget()
+        for name in signal_names:
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked)
+            self._signal_list.addItem(item)
+        self._signal_list.itemChanged.connect(self._update_summary)
+        signal_layout.addWidget(self._signal_list)
+
+        buttons = QHBoxLayout()
+        all_btn = QPushButton("All")
+        all_btn.clicked.connect(lambda: self._set_all_checked(True))
+        none_btn = QPushButton("None")
+        none_btn.clicked.connect(lambda: self._set_all_checked(False))
+        buttons.addWidget(all_btn)
+        buttons.addWidget(none_btn)
+        buttons.addStretch()
+        signal_layout.addLayout(buttons)
+        layout.addWidget(signal_group)
+
+        range_group = QGroupBox("Samples")
+        range_layout = QFormLayout(range_group)
+        self._start_edit = QLineEdit()
+        self._stop_edit = QLineEdit()
+        if time_span is not None:
+            self._start_edit.setPlaceholderText(format_si_value(time_span[0], "s"))
+            self._stop_edit.setPlaceholderText(format_si_value(time_span[1], "s"))
+        self._start_edit.setToolTip("First time to export, e.g. 2m (empty = start of run)")
+        self._stop_edit.setToolTip("Last time to export, e.g. 5m (empty = end of run)")
+        self._start_edit.textChanged.connect(self._update_summary)
+        self._stop_edit.textChanged.connect(self._update_summary)
+        range_layout.addRow("Start time:", self._start_edit)
+        range_layout.addRow("Stop time:", self._stop_edit)
+
+        self._decimation_spin = QSpinBox()
+        self._decimation_spin.setRange(1, 1_000_000)
+        self._decimation_spin.setToolTip("Keep every n-th sample")
+        self._decimation_spin.valueChanged.connect(self._update_summary)
+        range_layout.addRow("Keep every:", self._decimation_spin)
+        layout.addWidget(range_group)
+
+        self._summary_label = QLabel()
+        self._summary_label.setWordWrap(True)
+        layout.addWidget(self._summary_label)
+
+        self._button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        self._button_box.accepted.connect(self._accept_if_valid)
+        self._button_box.rejected.connect(self.reject)
+        layout.addWidget(self._button_box)
+
+    def _set_all_checked(self, checked: bool) -> None:
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        for row in range(self._signal_list.count()):
+            self._signal_list.item(row).setCheckState(state)
+
+    def _selected_signals(self) -> list[str]:
+        return [
+            self._signal_list.item(row).text()
+            for row in range(self._signal_list.count())
+            if self._signal_list.item(row).checkState() == Qt.CheckState.Checked
+        ]
+
+    @staticmethod
+    def _parse_time(text: str) -> float | None:
+        text = text.strip()
+        return parse_si_value(text.rstrip("s") or "0") if text else None
+
+    def get_options(self) -> WaveformExportOptions | None:
+        """Options entered in the dialog, or None when they are invalid."""
+        signals = self._selected_signals()
+        if not signals:
+            return None
+        try:
+            return WaveformExportOptions(
+                signals=signals,
+                start=self._parse_time(self._start_edit.text()),
+                stop=self._parse_time(self._stop_edit.text()),
+                decimation=self._decimation_spin.value(),
+            )
+        except ValueError:
+            return None
+
+    def _update_summary(self, *_args) -> None:
+        options = self.get_options()
+        ok_button = self._button_box.button(QDialogButtonBox.StandardButton.Ok)
+        ok_button.setEnabled(options is not None)
+        if options is None:
+            self._summary_label.setText("Select at least one signal and a valid time range.")
+            return
+        text = f"{len(options.signals)} signal(s)"
+        if self._sample_count and options.start is None and options.stop is None:
+            rows = -(-self._sample_count // options.decimation)
+            text += f", {rows:,} rows"
+        self._summary_label.setText(text + ".")
+
+    def _accept_if_valid(self) -> None:
+        if self.get_options() is not None:
+            self.accept()
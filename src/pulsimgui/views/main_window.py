@@ -16,7 +16,9 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QMessageBox,
     QFileDialog,
+    QInputDialog,
     QApplication,
+    QProgressDialog,
 )
 
 from pulsimgui import __version__ as APP_VERSION
@@ -55,9 +57,14 @@ from pulsimgui.services.simulation_service import (
     normalize_integration_method,
     normalize_step_mode,
 )
-from pulsimgui.services.thermal_service import ThermalAnalysisService
+from pulsimgui.services.thermal_service import ThermalAnalysisService, ThermalAnalysisWorker
 from pulsimgui.services.theme_service import ThemeService, Theme
-from pulsimgui.services.export_service import ExportService
+from pulsimgui.services.export_service import (
+    COLUMNAR_EXTENSION,
+    ExportService,
+    WaveformExportWorker,
+)
+from pulsimgui.services.reference_import import REFERENCE_FORMATS, ReferenceImportWorker
 from pulsimgui.services.shortcut_service import ShortcutService
 from pulsimgui.services.hierarchy_service import HierarchyService
 from pulsimgui.resources.icons import IconService
@@ -69,10 +76,13 @@ from pulsimgui.views.dialogs import (
     KeyboardShortcutsDialog,
     TemplateDialog,
     CreateSubcircuitDialog,
+    DCSweepDialog,
+    DCSweepResultsDialog,
     ParameterSweepDialog,
     ParameterSweepResultsDialog,
     ThermalViewerDialog,
     ComponentPropertiesDialog,
+    WaveformExportDialog,
 )
 from pulsimgui.services.template_service import TemplateService
 from pulsimgui.utils.net_utils import build_node_alias_map, build_node_map
@@ -103,12 +113,15 @@ class MainWindow(QMainWindow):
             parent=self,
         )
         self._scope_windows: dict[str, ScopeWindow] = {}
+        # Imported reference waveforms, overlaid in the viewer and every scope
+        self._reference_results: dict[str, SimulationResult] = {}
         self._suppress_scope_state = False
         self._latest_electrical_result: SimulationResult | None = None
         self._latest_thermal_waveform: SimulationResult | None = None
         self._component_state_cache: dict[UUID, dict] = {}
         self._sim_progress_active = False
         self._sim_progress_last_value = 0
+        self._streaming_bode_dialog: BodePlotDialog | None = None
         self._sync_thermal_service_context()
 
         self._setup_window()
@@ -229,8 +242,11 @@ class MainWindow(QMainWindow):
         self.action_export_svg = QAction("Export Schematic as S&VG...", self)
         self.action_export_svg.triggered.connect(self._on_export_svg)
 
-        self.action_export_csv = QAction("Export Waveforms as &CSV...", self)
-        self.action_export_csv.triggered.connect(self._on_export_csv)
+        self.action_export_waveforms = QAction("Export &Waveforms...", self)
+        self.action_export_waveforms.triggered.connect(self._on_export_waveforms)
+
+        self.action_import_reference = QAction("Import &Reference Waveform...", self)
+        self.action_import_reference.triggered.connect(self._on_import_reference)
 
         self.action_close = QAction("&Close Project", self)
         self.action_close.setShortcut(QKeySequence("Ctrl+W"))
@@ -358,6 +374,11 @@ class MainWindow(QMainWindow):
         self.action_pause.setEnabled(False)
         self.action_pause.triggered.connect(self._on_pause_simulation)
 
+        self.action_extend = QAction("E&xtend Simulation...", self)
+        self.action_extend.setToolTip("Continue the last transient run to a later stop time")
+        self.action_extend.setEnabled(False)
+        self.action_extend.triggered.connect(self._on_extend_simulation)
+
         self.action_dc_op = QAction("&DC Operating Point", self)
         self.action_dc_op.setShortcut(QKeySequence("F6"))
         self.action_dc_op.triggered.connect(self._on_dc_analysis)
@@ -366,6 +387,9 @@ class MainWindow(QMainWindow):
         self.action_ac.setShortcut(QKeySequence("F7"))
         self.action_ac.triggered.connect(self._on_ac_analysis)
 
+        self.action_dc_sweep = QAction("DC S&weep...", self)
+        self.action_dc_sweep.triggered.connect(self._on_dc_sweep)
+
         self.action_sim_settings = QAction("Simulation &Settings...", self)
         self.action_sim_settings.setShortcut(QKeySequence("Ctrl+Alt+S"))
         self.action_sim_settings.triggered.connect(self._on_simulation_settings)
@@ -410,7 +434,8 @@ class MainWindow(QMainWindow):
         export_menu.addAction(self.action_export_png)
         export_menu.addAction(self.action_export_svg)
         export_menu.addSeparator()
-        export_menu.addAction(self.action_export_csv)
+        export_menu.addAction(self.action_export_waveforms)
+        file_menu.addAction(self.action_import_reference)
         file_menu.addSeparator()
         file_menu.addAction(self.action_exit)
 
@@ -453,9 +478,11 @@ class MainWindow(QMainWindow):
         sim_menu.addAction(self.action_run)
         sim_menu.addAction(self.action_pause)
         sim_menu.addAction(self.action_stop)
+        sim_menu.addAction(self.action_extend)
         sim_menu.addSeparator()
         sim_menu.addAction(self.action_dc_op)
         sim_menu.addAction(self.action_ac)
+        sim_menu.addAction(self.action_dc_sweep)
         sim_menu.addSeparator()
         sim_menu.addAction(self.action_parameter_sweep)
         sim_menu.addAction(self.action_thermal_viewer)
@@ -621,6 +648,9 @@ class MainWindow(QMainWindow):
             Qt.DockWidgetArea.TopDockWidgetArea | Qt.DockWidgetArea.BottomDockWidgetArea
         )
         self._waveform_viewer = WaveformViewer(theme_service=self._theme_service)
+        self._waveform_viewer.set_run_history(self._simulation_service.run_history)
+        self._waveform_viewer.reference_import_requested.connect(self._on_import_reference)
+        self._waveform_viewer.references_changed.connect(self._on_references_changed)
         self.waveform_dock.setWidget(self._waveform_viewer)
         self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.waveform_dock)
         # Keep schematic-first startup layout: waveform panel opens on demand.
@@ -652,6 +682,8 @@ class MainWindow(QMainWindow):
         self._simulation_service.simulation_finished.connect(self._on_simulation_finished)
         self._simulation_service.dc_finished.connect(self._on_dc_finished)
         self._simulation_service.ac_finished.connect(self._on_ac_finished)
+        self._simulation_service.ac_partial.connect(self._on_ac_partial)
+        self._simulation_service.dc_sweep_finished.connect(self._on_dc_sweep_finished)
         self._simulation_service.parameter_sweep_finished.connect(
             self._on_parameter_sweep_finished
         )
@@ -675,8 +707,10 @@ class MainWindow(QMainWindow):
         self.action_run.setEnabled(backend_ready and not is_running)
         self.action_stop.setEnabled(backend_ready and is_running)
         self.action_pause.setEnabled(backend_ready and is_running)
+        self.action_extend.setEnabled(backend_ready and self._simulation_service.can_extend)
         self.action_dc_op.setEnabled(backend_ready and has_dc and not is_running)
         self.action_ac.setEnabled(backend_ready and has_ac and not is_running)
+        self.action_dc_sweep.setEnabled(backend_ready and has_dc and not is_running)
         self.action_parameter_sweep.setEnabled(backend_ready and not is_running)
 
     def _update_backend_status(self, info: BackendInfo | None = None) -> None:
@@ -711,6 +745,9 @@ class MainWindow(QMainWindow):
         self._thermal_service.thermal_network = str(
             getattr(runtime_settings, "thermal_network", "foster") or "foster"
         )
+        self._thermal_service.cycle_average = bool(
+            getattr(runtime_settings, "thermal_cycle_average", False)
+        )
 
     def _handle_backend_changed(self, info: BackendInfo, notify: bool) -> None:
         """Apply backend changes and optionally notify the user."""
@@ -1233,6 +1270,16 @@ class MainWindow(QMainWindow):
         runtime_settings.thermal_network = str(
             getattr(project_settings, "thermal_network", runtime_settings.thermal_network) or "foster"
         )
+        runtime_settings.thermal_cycle_average = bool(
+            getattr(
+                project_settings,
+                "thermal_cycle_average",
+                runtime_settings.thermal_cycle_average,
+            )
+        )
+        runtime_settings.ac_adaptive = bool(
+            getattr(project_settings, "ac_adaptive", runtime_settings.ac_adaptive)
+        )
         runtime_settings.formulation_mode = normalize_formulation_mode(
             getattr(project_settings, "formulation_mode", runtime_settings.formulation_mode)
         )
@@ -1278,6 +1325,8 @@ class MainWindow(QMainWindow):
             runtime_settings.thermal_include_conduction_losses
         )
         project_settings.thermal_network = str(runtime_settings.thermal_network)
+        project_settings.thermal_cycle_average = bool(runtime_settings.thermal_cycle_average)
+        project_settings.ac_adaptive = bool(runtime_settings.ac_adaptive)
         project_settings.formulation_mode = normalize_formulation_mode(
             runtime_settings.formulation_mode
         )
@@ -1612,8 +1661,19 @@ class MainWindow(QMainWindow):
 
     def _on_toggle_dc_overlay(self, checked: bool) -> None:
         """Toggle DC operating point overlay visibility."""
+        if checked and self._apply_cached_dc_overlay():
+            return
         self._schematic_scene.show_dc_overlay = checked
 
+    def _apply_cached_dc_overlay(self) -> bool:
+        """Show the cached operating point of the current circuit, if any."""
+        circuit_data = self._simulation_service.convert_gui_circuit(self._project)
+        cached = self._simulation_service.cached_dc_result(circuit_data)
+        if cached is None:
+            return False
+        self._schematic_scene.set_dc_results(cached)
+        return True
+
     def _on_toggle_minimap(self, checked: bool) -> None:
         """Toggle minimap visibility."""
         self._minimap.setVisible(checked)
@@ -2059,6 +2119,8 @@ class MainWindow(QMainWindow):
             )
             window.closed.connect(self._on_scope_window_closed)
             self._scope_windows[comp_id] = window
+            for label, reference in self._reference_results.items():
+                window.add_reference(label, reference)
 
         window.set_component_name(component.name)
         circuit = self._current_circuit()
@@ -2205,6 +2267,9 @@ class MainWindow(QMainWindow):
         # Stop any running simulation
         if self._simulation_service.is_running:
             self._simulation_service.stop()
+        self._waveform_viewer.shutdown_background_jobs()
+        # Drop this session's spilled runs from the spill directory
+        self._simulation_service.run_history.clear()
 
         # Save window state
         self._settings.set_window_geometry(self.saveGeometry())
@@ -2219,6 +2284,39 @@ class MainWindow(QMainWindow):
         circuit_data = self._simulation_service.convert_gui_circuit(self._project)
         self._simulation_service.run_transient(circuit_data)
 
+    def _on_extend_simulation(self) -> None:
+        """Continue the last transient run up to a new stop time."""
+        checkpoint = self._simulation_service.last_checkpoint
+        if checkpoint is None:
+            return
+        result = self._simulation_service.last_result
+        span = checkpoint.t_end - result.time[0] if result and result.time else checkpoint.t_end
+        t_stop, ok = QInputDialog.getDouble(
+            self,
+            "Extend Simulation",
+            f"Current end time: {checkpoint.t_end:g} s\nExtend to t (s):",
+            checkpoint.t_end + max(span, checkpoint.dt),
+            checkpoint.t_end,
+            1e6,
+            9,
+        )
+        if not ok or t_stop <= checkpoint.t_end:
+            return
+        restarted = checkpoint.step_info.get("restarted_controllers") or []
+        if restarted:
+            answer = QMessageBox.warning(
+                self,
+                "Extend Simulation",
+                "The state of these controllers could not be saved and restarts "
+                f"from zero: {', '.join(restarted)}.\n\nExtend the run anyway?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No,
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                return
+        circuit_data = self._simulation_service.convert_gui_circuit(self._project)
+        self._simulation_service.extend_transient(circuit_data, t_stop)
+
     def _on_stop_simulation(self) -> None:
         """Stop current simulation."""
         self._simulation_service.stop()
@@ -2253,7 +2351,30 @@ class MainWindow(QMainWindow):
         # TODO: Show AC settings dialog first
         self._apply_project_simulation_settings_to_service()
         circuit_data = self._simulation_service.convert_gui_circuit(self._project)
-        self._simulation_service.run_ac_analysis(circuit_data, 1, 1e6, 10)
+        self._streaming_bode_dialog = None
+        self._simulation_service.run_ac_analysis(
+            circuit_data, 1, 1e6, 10, adaptive=self._simulation_service.settings.ac_adaptive
+        )
+
+    def _on_dc_sweep(self) -> None:
+        """Open the DC sweep configuration dialog and run the sweep."""
+        circuit = self._current_circuit()
+        if not circuit.components:
+            QMessageBox.information(
+                self,
+                "No Components",
+                "Add a source or a component with numeric parameters before running a DC sweep.",
+            )
+            return
+
+        dialog = DCSweepDialog(circuit, self)
+        if dialog.exec():
+            sweep_settings = dialog.get_settings()
+            if not sweep_settings:
+                return
+            self._apply_project_simulation_settings_to_service()
+            circuit_data = self._simulation_service.convert_gui_circuit(self._project)
+            self._simulation_service.run_dc_sweep(circuit_data, sweep_settings)
 
     def _on_simulation_settings(self) -> None:
         """Show simulation settings dialog."""
@@ -2300,7 +2421,7 @@ class MainWindow(QMainWindow):
             self._simulation_service.run_parameter_sweep(circuit_data, sweep_settings)
 
     def _on_show_thermal_viewer(self) -> None:
-        """Generate synthetic thermal data and open the viewer dialog."""
+        """Open the thermal viewer and fill it from a background thermal job."""
         circuit = self._current_circuit()
         if not circuit or not circuit.components:
             QMessageBox.information(
@@ -2312,11 +2433,6 @@ class MainWindow(QMainWindow):
 
         try:
             circuit_data = self._simulation_service.convert_gui_circuit(self._project)
-            result = self._thermal_service.build_result(
-                circuit,
-                self._simulation_service.last_result,
-                circuit_data=circuit_data,
-            )
         except Exception as exc:  # pragma: no cover - defensive dialog
             QMessageBox.warning(
                 self,
@@ -2325,7 +2441,24 @@ class MainWindow(QMainWindow):
             )
             return
 
-        dialog = ThermalViewerDialog(result, theme_service=self._theme_service, parent=self)
+        dialog = ThermalViewerDialog(None, theme_service=self._theme_service, parent=self)
+        worker = ThermalAnalysisWorker(
+            self._thermal_service,
+            circuit,
+            self._simulation_service.last_result,
+            circuit_data=circuit_data,
+            parent=self,
+        )
+        worker.partial_result.connect(dialog.set_result)
+        worker.finished_signal.connect(dialog.set_result)
+        worker.progress.connect(lambda _value, message: dialog.set_status(message))
+        worker.finished_signal.connect(lambda _result: dialog.set_status(""))
+        worker.error.connect(
+            lambda message: dialog.set_status(f"Unable to generate thermal data: {message}")
+        )
+        worker.finished.connect(worker.deleteLater)
+        dialog.finished.connect(worker.cancel)
+        worker.start()
         dialog.exec()
 
     def _on_simulation_state_changed(self, state: SimulationState) -> None:
@@ -2400,10 +2533,13 @@ class MainWindow(QMainWindow):
         """Handle streaming data point during simulation."""
         # Keep streaming data in the dock viewer without forcing it open.
         self._waveform_viewer.add_data_point(time, signals)
+        for window in self._scope_windows.values():
+            window.add_data_point(time, signals)
 
     def _on_simulation_finished(self, result) -> None:
         """Handle simulation completion."""
         if result.is_valid:
+            self._waveform_viewer.set_switching_frequency(self._pwm_frequency())
             # Finalize streaming in the dock viewer without forcing it open.
             self._waveform_viewer.finalize_streaming(result)
 
@@ -2413,6 +2549,8 @@ class MainWindow(QMainWindow):
                 5000,
             )
             self._latest_electrical_result = self._result_with_probe_signals(result)
+            if self.action_toggle_dc_overlay.isChecked():
+                self._apply_cached_dc_overlay()
         else:
             QMessageBox.warning(
                 self, "Simulation Error", f"Simulation failed:\n{result.error_message}"
@@ -2421,6 +2559,20 @@ class MainWindow(QMainWindow):
 
         self._update_scope_results()
 
+    def _pwm_frequency(self) -> float | None:
+        """Highest PWM generator frequency of the current circuit, or None."""
+        circuit = self._current_circuit()
+        frequencies = []
+        for component in circuit.components.values() if circuit is not None else ():
+            if component.type != ComponentType.PWM_GENERATOR:
+                continue
+            try:
+                frequencies.append(float(component.parameters.get("frequency", 0.0)))
+            except (TypeError, ValueError):
+                continue
+        frequency = max(frequencies, default=0.0)
+        return frequency if frequency > 0.0 else None
+
     def _result_with_probe_signals(self, result: SimulationResult) -> SimulationResult:
         """Build an enriched result view with probe-exported scope channels."""
         circuit = self._current_circuit()
@@ -2525,8 +2677,28 @@ class MainWindow(QMainWindow):
                 self, "DC Analysis Error", f"DC analysis failed:\n{result.error_message}"
             )
 
+    def _on_ac_partial(self, result) -> None:
+        """Show decade chunks of a running AC sweep as they complete."""
+        if not result.is_valid:
+            return
+        if self._streaming_bode_dialog is None:
+            self._streaming_bode_dialog = BodePlotDialog(result, self)
+            self._streaming_bode_dialog.update_result(result, partial=True)
+            self._streaming_bode_dialog.show()
+        else:
+            self._streaming_bode_dialog.update_result(result, partial=True)
+
     def _on_ac_finished(self, result) -> None:
         """Handle AC analysis completion."""
+        streaming_dialog = self._streaming_bode_dialog
+        self._streaming_bode_dialog = None
+        if streaming_dialog is not None:
+            streaming_dialog.update_result(result)
+            if not result.is_valid:
+                QMessageBox.warning(
+                    self, "AC Analysis Error", f"AC analysis failed:\n{result.error_message}"
+                )
+            return
         if result.is_valid:
             # Show Bode plot dialog
             dialog = BodePlotDialog(result, self)
@@ -2536,6 +2708,16 @@ class MainWindow(QMainWindow):
                 self, "AC Analysis Error", f"AC analysis failed:\n{result.error_message}"
             )
 
+    def _on_dc_sweep_finished(self, result) -> None:
+        """Show the DC sweep transfer characteristic."""
+        if result.is_valid:
+            dialog = DCSweepResultsDialog(result, self)
+            dialog.exec()
+        else:
+            QMessageBox.warning(
+                self, "DC Sweep Error", f"DC sweep failed:\n{result.error_message}"
+            )
+
     def _on_parameter_sweep_finished(self, result: ParameterSweepResult) -> None:
         """Handle parameter sweep completion."""
         if not result.runs:
@@ -2623,8 +2805,8 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Export Error", f"Failed to export SVG:\n{e}")
 
-    def _on_export_csv(self) -> None:
-        """Export waveforms to CSV file."""
+    def _on_export_waveforms(self) -> None:
+        """Export waveforms to CSV, NPZ or the columnar format on a worker thread."""
         result = self._simulation_service.last_result
         if result is None or not result.is_valid:
             QMessageBox.warning(
@@ -2635,17 +2817,107 @@ class MainWindow(QMainWindow):
             )
             return
 
-        path, _ = QFileDialog.getSaveFileName(
+        options_dialog = WaveformExportDialog(
+            list(result.signals),
+            (float(result.time[0]), float(result.time[-1])),
+            len(result.time),
+            parent=self,
+        )
+        if options_dialog.exec() != WaveformExportDialog.DialogCode.Accepted:
+            return
+        options = options_dialog.get_options()
+
+        filters = {
+            "CSV File (*.csv)": ".csv",
+            "NumPy Archive (*.npz)": ".npz",
+            f"Pulsim Waveform Columns (*{COLUMNAR_EXTENSION})": COLUMNAR_EXTENSION,
+        }
+        path, selected_filter = QFileDialog.getSaveFileName(
             self,
-            "Export Waveforms as CSV",
+            "Export Waveforms",
             self._settings.get_default_project_location(),
-            "CSV File (*.csv);;All Files (*)",
+            ";;".join(filters),
         )
-        if path:
-            if not path.endswith(".csv"):
-                path += ".csv"
-            try:
-                ExportService.export_waveforms_csv(result, path)
-                self.statusBar().showMessage(f"Exported waveforms: {path}", 3000)
-            except Exception as e:
-                QMessageBox.critical(self, "Export Error", f"Failed to export CSV:\n{e}")
+        if not path:
+            return
+        extension = filters.get(selected_filter, ".csv")
+        if not path.lower().endswith(tuple(filters.values())):
+            path += extension
+
+        progress = QProgressDialog("Exporting waveforms...", "Cancel", 0, 100, self)
+        progress.setWindowTitle("Export Waveforms")
+        progress.setMinimumDuration(300)
+        worker = WaveformExportWorker(result, path, options, parent=self)
+        worker.progress.connect(lambda value, _message: progress.setValue(int(value)))
+        worker.finished_signal.connect(
+            lambda saved, rows: self.statusBar().showMessage(
+                f"Exported {rows:,} rows of waveforms: {saved}", 3000
+            )
+        )
+        worker.error.connect(
+            lambda message: QMessageBox.critical(
+                self, "Export Error", f"Failed to export waveforms:\n{message}"
+            )
+        )
+        progress.canceled.connect(worker.cancel)
+        worker.finished.connect(progress.reset)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _on_import_reference(self) -> None:
+        """Import a lab capture or another tool's output as a reference overlay.
+
+        The file is memory-mapped on a worker thread (CSV is converted once
+        into a cached sidecar) and overlaid in the waveform viewer and every
+        scope window.
+        """
+        patterns = " ".join(f"*{extension}" for extension in REFERENCE_FORMATS)
+        path, _selected_filter = QFileDialog.getOpenFileName(
+            self,
+            "Import Reference Waveform",
+            self._settings.get_default_project_location(),
+            f"Waveform Files ({patterns});;All Files (*)",
+        )
+        if not path:
+            return
+
+        progress = QProgressDialog("Importing reference waveform...", "Cancel", 0, 100, self)
+        progress.setWindowTitle("Import Reference Waveform")
+        progress.setMinimumDuration(300)
+        worker = ReferenceImportWorker(path, parent=self)
+        worker.progress.connect(lambda value, _message: progress.setValue(int(value)))
+        worker.finished_signal.connect(self._add_reference)
+        worker.error.connect(
+            lambda message: QMessageBox.critical(
+                self, "Import Error", f"Failed to import reference waveform:\n{message}"
+            )
+        )
+        progress.canceled.connect(worker.cancel)
+        worker.finished.connect(progress.reset)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _add_reference(self, path: str, result: SimulationResult) -> None:
+        """Overlay an imported reference in the viewer and the scope windows."""
+        label = base = Path(path).stem
+        index = 2
+        while label in self._waveform_viewer.overlay_labels():
+            label = f"{base} ({index})"
+            index += 1
+        self._reference_results[label] = result
+        for window in self._scope_windows.values():
+            window.add_reference(label, result)
+        self._waveform_viewer.add_reference(label, result)
+        self.waveform_dock.show()
+        self.statusBar().showMessage(
+            f"Imported reference {label}: {len(result.signals)} signal(s), "
+            f"{len(result.time):,} samples",
+            3000,
+        )
+
+    def _on_references_changed(self, labels: list[str]) -> None:
+        """Drop references removed in the viewer from the scope windows too."""
+        for label in [label for label in self._reference_results if label not in labels]:
+            del self._reference_results[label]
+            for window in self._scope_windows.values():
+                window.remove_reference(label)
@@ -1134,6 +1134,12 @@ class PropertiesPanel(QWidget):
             "lm": "H",
             "frequency": "Hz",
             "amplitude": "V",
+            "rth_jc": "K/W",
+            "tau_jc": "s",
+            "rth_cs": "K/W",
+            "cth_case": "J/K",
+            "rth_sa": "K/W",
+            "cth_sink": "J/K",
         }
         return units.get(name, "")
 
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+
 import numpy as np
 import pyqtgraph as pg
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QBrush, QCloseEvent, QColor, QMouseEvent, QPainter, QPen
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -21,6 +24,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QScrollArea,
+    QSizePolicy,
     QSlider,
     QSpinBox,
     QSplitter,
@@ -31,18 +35,106 @@ from PySide6.QtWidgets import (
 )
 
 from pulsimgui.models.component import ComponentType
+from pulsimgui.services.result_store import ResultStore, SignalView
+from pulsimgui.services.scope_trigger import TriggeredFrame, TriggerSettings
+from pulsimgui.services.signal_math import MathEngine, MathExpression
 from pulsimgui.services.simulation_service import SimulationResult
 from pulsimgui.services.theme_service import Theme, ThemeService
 from pulsimgui.views.waveform import WaveformViewer
+from pulsimgui.views.waveform.spectrum_view import SpectrumPanel
+from pulsimgui.views.waveform.trigger_view import TriggerControls, TriggerPanel
+from pulsimgui.views.waveform.xy_view import XYPlotPanel
 from pulsimgui.views.waveform.waveform_viewer import (
+    CURSOR_UPDATE_INTERVAL_MS,
     MeasurementsPanel,
     SignalListPanel,
     TRACE_COLORS,
+    interpolate_at,
+    resample_to_window,
 )
 
 from .bindings import ScopeChannelBinding, ScopeSignal
 
 
+@dataclass
+class _StackedPanel:
+    """Widgets of one retained stacked-scope panel, reused across refreshes."""
+
+    frame: QFrame
+    header: QWidget
+    title: QLabel
+    stats: QLabel
+    plot: pg.PlotWidget
+    trace: pg.PlotDataItem
+    cursors: tuple[pg.InfiniteLine, pg.InfiniteLine]
+    style_key: tuple | None = None
+    x_link: pg.PlotWidget | None = None
+    shows_time_axis: bool | None = None
+
+
+class _StackedSignals(Mapping[str, np.ndarray]):
+    """Stacked channel arrays plus math traces evaluated only when read.
+
+    Math traces stay expressions of a bound :class:`MathEngine`. Indexing one
+    evaluates the whole record, which the engine caches, while :meth:`window`
+    and :meth:`value_at` read only the samples they need.
+    """
+
+    def __init__(
+        self,
+        arrays: Mapping[str, np.ndarray] | None = None,
+        engine: MathEngine | None = None,
+    ) -> None:
+        self._arrays = dict(arrays or {})
+        self._engine = engine
+        self._math: dict[str, MathExpression] = {}
+
+    def add_math(self, name: str, expression: MathExpression) -> None:
+        """Append math trace ``name`` evaluated from ``expression``."""
+        self._math[name] = expression
+
+    def is_math(self, name: str) -> bool:
+        """True when ``name`` is a math trace rather than a stored array."""
+        return name in self._math
+
+    @property
+    def math_names(self) -> list[str]:
+        """Math trace names in creation order."""
+        return list(self._math)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name in self._math:
+            return self.window(name, 0, None)
+        return self._arrays[name]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._arrays
+        yield from self._math
+
+    def __len__(self) -> int:
+        return len(self._arrays) + len(self._math)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._arrays or name in self._math
+
+    def window(self, name: str, start: int, stop: int | None) -> np.ndarray:
+        """Return samples ``[start, stop)`` of ``name``; empty when it cannot be evaluated."""
+        expression = self._math.get(name)
+        if expression is None:
+            return self._arrays[name][start:stop]
+        try:
+            return self._engine.evaluate(expression, start, stop)
+        except ValueError:
+            return np.empty(0)
+
+    def value_at(self, name: str, t: float) -> float | None:
+        """Interpolate math trace ``name`` at ``t`` from its two bracketing samples."""
+        try:
+            return self._engine.value_at(self._math[name], t)
+        except ValueError:
+            return None
+
+
 class MathSignalDialog(QDialog):
     def __init__(
         self,
@@ -76,12 +168,13 @@ class MathSignalDialog(QDialog):
         inputs_form.setFormAlignment(Qt.AlignmentFlag.AlignTop)
         inputs_form.setHorizontalSpacing(10)
         inputs_form.setVerticalSpacing(8)
+        self._source_a_label = QLabel("Signal A")
         self._source_a_combo = QComboBox()
         self._source_a_combo.addItems(signal_names)
         idx = self._source_a_combo.findText(default_signal)
         if idx >= 0:
             self._source_a_combo.setCurrentIndex(idx)
-        inputs_form.addRow("Signal A", self._source_a_combo)
+        inputs_form.addRow(self._source_a_label, self._source_a_combo)
 
         self._source_b_label = QLabel("Signal B")
         self._source_b_combo = QComboBox()
@@ -116,8 +209,14 @@ class MathSignalDialog(QDialog):
         self._operation_combo.addItem("Square (A²)", "SQR")
         self._operation_combo.addItem("Derivative (dA/dt)", "DER")
         self._operation_combo.addItem("Integral (∫A dt)", "INT")
+        self._operation_combo.addItem("Expression", "EXPR")
         transform_form.addRow("Operation", self._operation_combo)
 
+        self._expression_label = QLabel("Expression")
+        self._expression_edit = QLineEdit()
+        self._expression_edit.setPlaceholderText('e.g. "CH1: V(out)" * I(L1) or avg(V(sw), period=10u)')
+        transform_form.addRow(self._expression_label, self._expression_edit)
+
         self._window_label = QLabel("Window")
         self._window_spin = QSpinBox()
         self._window_spin.setRange(2, 5000)
@@ -176,6 +275,7 @@ class MathSignalDialog(QDialog):
         self._gain_spin.valueChanged.connect(self._update_state)
         self._offset_spin.valueChanged.connect(self._update_state)
         self._window_spin.valueChanged.connect(self._update_state)
+        self._expression_edit.textChanged.connect(self._update_state)
 
         if theme is not None:
             c = theme.colors
@@ -261,6 +361,11 @@ class MathSignalDialog(QDialog):
         op_code = self._current_operation()
         needs_b = self._operation_needs_b(op_code)
         needs_window = self._operation_needs_window(op_code)
+        is_expression = op_code == "EXPR"
+        self._source_a_label.setVisible(not is_expression)
+        self._source_a_combo.setVisible(not is_expression)
+        self._expression_label.setVisible(is_expression)
+        self._expression_edit.setVisible(is_expression)
         self._source_b_label.setVisible(needs_b)
         self._source_b_combo.setVisible(needs_b)
         self._swap_sources_btn.setVisible(needs_b)
@@ -272,7 +377,9 @@ class MathSignalDialog(QDialog):
         gain = self._gain_spin.value()
         offset = self._offset_spin.value()
 
-        if needs_b:
+        if is_expression:
+            expr = self._expression_edit.text().strip() or "--"
+        elif needs_b:
             expr = f"{source_a} {op_code} {source_b}"
         elif needs_window:
             expr = f"AVG({source_a}, N={self._window_spin.value()})"
@@ -302,6 +409,7 @@ class MathSignalDialog(QDialog):
             "offset": float(self._offset_spin.value()),
             "window": int(self._window_spin.value()),
             "custom_name": custom_name,
+            "expression": self._expression_edit.text().strip(),
             "needs_b": self._operation_needs_b(op_code),
             "needs_window": self._operation_needs_window(op_code),
         }
@@ -468,12 +576,47 @@ class ScopeWindow(QWidget):
         self._theme_service = theme_service
         self._theme: Theme | None = None
         self._bindings: list[ScopeChannelBinding] = []
-        self._current_result: SimulationResult | None = None
+        self._result_store: ResultStore | None = None
+        self._signal_refs: dict[str, SignalView] = {}
+        # Math traces are kept as expressions, evaluated only over the shown range.
+        self._math_signals: dict[str, str] = {}
+        self._math_engine = MathEngine()
+        self._spectrum_panel: SpectrumPanel | None = None
+        self._xy_panel: XYPlotPanel | None = None
+        # Triggered live view while a run streams; samples are batched per display frame
+        self._triggers = TriggerControls(
+            self,
+            lambda: list(self._live_signal_labels().values()),
+            self.set_trigger,
+            self.rearm_trigger,
+        )
+        self._live_time: list[float] = []
+        self._live_signals: dict[str, list[float]] = {}
+        self._live_last_time: float | None = None
+        self._live_timer = QTimer(self)
+        self._live_timer.setInterval(CURSOR_UPDATE_INTERVAL_MS)
+        self._live_timer.timeout.connect(self._flush_live_data)
+        # Imported reference records, drawn dashed on the panels they match
+        self._reference_stores: dict[str, ResultStore] = {}
+        self._reference_traces: dict[tuple[str, str], pg.PlotDataItem] = {}
+        self._reference_update_timer = QTimer(self)
+        self._reference_update_timer.setSingleShot(True)
+        self._reference_update_timer.setInterval(CURSOR_UPDATE_INTERVAL_MS)
+        self._reference_update_timer.timeout.connect(self._refresh_windowed_traces)
+        # Coalesces cursor drags into one readout per display frame
+        self._stacked_measurement_timer = QTimer(self)
+        self._stacked_measurement_timer.setSingleShot(True)
+        self._stacked_measurement_timer.setInterval(CURSOR_UPDATE_INTERVAL_MS)
+        self._stacked_measurement_timer.timeout.connect(self._update_stacked_measurements)
         self._plot_widgets: list[pg.PlotWidget] = []
+        self._stacked_panels: dict[str, _StackedPanel] = {}
         self._default_mode_set = False
         self._stacked_time: np.ndarray = np.array([], dtype=float)
-        self._stacked_signals: dict[str, np.ndarray] = {}
+        self._stacked_signals = _StackedSignals()
+        # Filled on demand by _stacked_stats; cleared when the signals change.
         self._stacked_signal_stats: dict[str, dict[str, float]] = {}
+        # (time axis, channel sources) the math engine is bound to.
+        self._math_binding: tuple[np.ndarray, tuple] | None = None
         self._stacked_active_signal: str | None = None
         self._math_signal_counter = 0
         self._stacked_cursors_enabled = False
@@ -559,6 +702,21 @@ class ScopeWindow(QWidget):
         self._create_math_signal_btn.setMinimumWidth(112)
         self._create_math_signal_btn.clicked.connect(self._on_create_math_signal_clicked)
         sidebar_actions_layout.addWidget(self._create_math_signal_btn, stretch=1)
+        self._spectrum_btn = QPushButton("Spectrum")
+        self._spectrum_btn.setObjectName("scopeSpectrumBtn")
+        self._spectrum_btn.setToolTip("FFT and THD of the cursor span or visible window")
+        self._spectrum_btn.clicked.connect(self.show_spectrum)
+        sidebar_actions_layout.addWidget(self._spectrum_btn, stretch=1)
+        self._xy_btn = QPushButton("XY")
+        self._xy_btn.setObjectName("scopeXYBtn")
+        self._xy_btn.setToolTip("Plot one channel against another")
+        self._xy_btn.clicked.connect(self.show_xy_plot)
+        sidebar_actions_layout.addWidget(self._xy_btn, stretch=1)
+        self._trigger_btn = QPushButton("Trigger")
+        self._trigger_btn.setObjectName("scopeTriggerBtn")
+        self._trigger_btn.setToolTip("Show triggered sweeps while the simulation streams")
+        self._trigger_btn.clicked.connect(self.show_trigger_controls)
+        sidebar_actions_layout.addWidget(self._trigger_btn, stretch=1)
         stacked_sidebar_layout.addWidget(sidebar_top, stretch=0)
         stacked_sidebar_layout.addWidget(sidebar_actions, stretch=0)
 
@@ -647,7 +805,13 @@ class ScopeWindow(QWidget):
         self._stacked_layout = QVBoxLayout(self._stacked_content)
         self._stacked_layout.setContentsMargins(8, 8, 8, 8)
         self._stacked_layout.setSpacing(8)
-        self._stacked_layout.addStretch()
+        self._stacked_placeholder = QLabel()
+        self._stacked_placeholder.setWordWrap(True)
+        self._stacked_layout.addWidget(self._stacked_placeholder)
+        # Takes the spare height while the placeholder is shown, like a stretch.
+        self._stacked_filler = QWidget()
+        self._stacked_filler.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        self._stacked_layout.addWidget(self._stacked_filler)
         self._stacked_scroll.setWidget(self._stacked_content)
 
         self._stacked_splitter.addWidget(self._stacked_sidebar)
@@ -781,21 +945,271 @@ class ScopeWindow(QWidget):
             entries.append(f"{binding.channel_label}={targets}")
         self._mapping_label.setText(f"Channels: {' | '.join(entries)}")
 
-    def apply_simulation_result(self, result: SimulationResult | None) -> None:
-        """Filter the supplied result down to the window's bindings."""
-
-        if not result or not result.time:
-            self._current_result = SimulationResult()
-            self._refresh_stacked_sidebar(self._current_result)
-            self._rebuild_stacked_plots(self._current_result)
+    def apply_simulation_result(self, result: SimulationResult | ResultStore | None) -> None:
+        """Resolve the window's bindings against the supplied result.
+
+        Results are shared through :meth:`ResultStore.for_result`, so every
+        scope window showing the same run references one copy of its data.
+        """
+        self._stop_live_view()
+        if isinstance(result, ResultStore):
+            store = result
+        elif result and result.time:
+            store = ResultStore.for_result(result)
+        else:
+            store = None
+
+        self._result_store = store
+        if store is None or store.sample_count == 0:
+            self._signal_refs = {}
+            self._refresh_stacked_sidebar()
+            self._update_analysis_sources()
+            self._refresh_stacked_plots()
             self._message_label.setText("No simulation data available yet.")
             return
 
-        subset = SimulationResult()
-        subset.time = list(result.time)
-        subset.signals = {}
-        subset.statistics = dict(result.statistics)
+        found_channels, missing_channels = self._resolve_signal_refs()
+        self._refresh_stacked_sidebar()
+        self._update_analysis_sources()
+        self._refresh_stacked_plots()
+
+        self._message_label.setText(self._format_status(found_channels, missing_channels))
+
+    # ------------------------------------------------------------------
+    # Triggered live view
+    # ------------------------------------------------------------------
+    @property
+    def trigger_settings(self) -> TriggerSettings | None:
+        """Trigger of the live view, or None when scopes update only at the end."""
+        return self._triggers.settings
+
+    def set_trigger(self, settings: TriggerSettings | None) -> None:
+        """Show triggered sweeps of streamed data using ``settings``.
+
+        ``settings.source`` is a channel label as listed in the sidebar. With
+        None, streamed samples are ignored and the scope waits for the result.
+        """
+        if settings is None:
+            self._stop_live_view()
+        self._triggers.apply(settings)
+
+    def rearm_trigger(self) -> None:
+        """Arm the trigger again after a Single sweep."""
+        self._triggers.rearm()
+
+    def show_trigger_controls(self) -> TriggerPanel:
+        """Open (or raise) the trigger settings window."""
+        return self._triggers.show()
+
+    def add_data_point(self, time: float, signals: dict) -> None:
+        """Collect streamed samples for the triggered live view.
+
+        Accepts the single-point and appended-chunk payloads of
+        :class:`WaveformViewer.add_data_point`; other payloads are left to
+        the final result. Samples are ignored while no trigger is set.
+        """
+        if self._triggers.trigger is None:
+            return
+        labels = self._live_signal_labels()
+        if "_chunk_time" in signals:
+            if signals.get("_replace", False):
+                return
+            chunk_time = list(signals["_chunk_time"])
+            if not chunk_time:
+                return
+            self._begin_live_samples(float(chunk_time[0]))
+            start = len(self._live_time)
+            self._live_time.extend(chunk_time)
+            for key, values in signals.get("_chunk_signals", {}).items():
+                label = labels.get(key)
+                if label is not None:
+                    series = self._live_signals.setdefault(label, [])
+                    series.extend([np.nan] * (start - len(series)))
+                    series.extend(values)
+        elif any(name.startswith("_") for name in signals):
+            return
+        else:
+            self._begin_live_samples(float(time))
+            start = len(self._live_time)
+            self._live_time.append(float(time))
+            for key, label in labels.items():
+                value = signals.get(key)
+                if value is None or not np.isscalar(value):
+                    continue
+                series = self._live_signals.setdefault(label, [])
+                series.extend([np.nan] * (start - len(series)))
+                series.append(float(value))
+        self._live_last_time = float(self._live_time[-1])
+        if not self._live_timer.isActive():
+            self._live_timer.start()
+
+    def _begin_live_samples(self, first_time: float) -> None:
+        """Restart triggering when time runs backwards (a new run started)."""
+        if self._live_last_time is not None and first_time < self._live_last_time:
+            self._live_time = []
+            self._live_signals = {}
+            self._triggers.trigger.reset()
+
+    def _live_signal_labels(self) -> dict[str, str]:
+        """Map bound signal keys to the channel labels shown in the sidebar."""
+        labels: dict[str, str] = {}
+        used: dict[str, object] = {}
+        for binding in self._bindings:
+            for idx, signal in enumerate(binding.signals):
+                label = self._ensure_unique_label(self._format_signal_label(binding, signal, idx), used)
+                used[label] = None
+                if signal.signal_key:
+                    labels.setdefault(signal.signal_key, label)
+        return labels
+
+    def _flush_live_data(self) -> None:
+        """Feed the samples collected since the last frame to the trigger."""
+        if self._triggers.trigger is None or not self._live_time:
+            self._live_timer.stop()
+            return
+        count = len(self._live_time)
+        time = np.asarray(self._live_time, dtype=np.float64)
+        chunk = {}
+        for label, values in self._live_signals.items():
+            array = np.full(count, np.nan)
+            array[: len(values)] = values
+            chunk[label] = array
+        self._live_time = []
+        self._live_signals = {}
+
+        frame = self._triggers.trigger.process(time, chunk)
+        self._triggers.refresh_panel()
+        if frame is not None:
+            self._show_live_frame(frame)
+
+    def _show_live_frame(self, frame: TriggeredFrame) -> None:
+        """Display one sweep; its time axis is relative to the trigger."""
+        signals = {name: values for name, values in frame.signals.items() if values.size}
+        if not signals or frame.time.size == 0:
+            return
+        new_channels = list(signals) != list(self._stacked_signals)
+        self._stacked_time = frame.time
+        self._stacked_signals = _StackedSignals(signals)
+        self._rebuild_stacked_statistics_cache()
+        if new_channels:
+            self._stacked_signal_list.set_signals(list(signals))
+            self._apply_stacked_trace_colors()
+            if self._stacked_active_signal not in signals:
+                self._stacked_active_signal = next(iter(signals))
+            self._sync_scope_selector()
+        self._refresh_stacked_plots()
+        self._message_label.setText(
+            f"Live: sweep {frame.sweeps}" if frame.triggered else "Live: waiting for trigger (auto)"
+        )
+
+    def _stop_live_view(self) -> None:
+        self._live_timer.stop()
+        self._live_time = []
+        self._live_signals = {}
+        self._live_last_time = None
+        if self._triggers.trigger is not None:
+            self._triggers.trigger.reset()
+
+    # ------------------------------------------------------------------
+    # Reference overlays
+    # ------------------------------------------------------------------
+    def reference_labels(self) -> list[str]:
+        """Labels of the reference records currently overlaid."""
+        return list(self._reference_stores)
+
+    def add_reference(self, label: str, result: SimulationResult) -> None:
+        """Overlay an imported reference record on the matching panels.
+
+        A reference signal matches a panel when its name equals the panel
+        label, the bound signal key or the channel label (``CH1`` matches
+        ``CH1: V(out)``), ignoring case. Matches are resampled onto each
+        panel's visible window, so memory-mapped records stay on disk.
+        """
+        self._reference_stores[label] = ResultStore.for_result(result)
+        self._refresh_reference_traces()
+
+    def remove_reference(self, label: str) -> None:
+        """Stop overlaying the reference ``label``."""
+        if self._reference_stores.pop(label, None) is not None:
+            self._refresh_reference_traces()
+
+    def clear_references(self) -> None:
+        """Remove every reference overlay."""
+        self._reference_stores.clear()
+        self._refresh_reference_traces()
+
+    def _reference_signal_for(self, store: ResultStore, panel_name: str) -> str | None:
+        """Name of the reference signal drawn on ``panel_name``, if any."""
+        candidates = {panel_name.casefold()}
+        ref = self._signal_refs.get(panel_name)
+        if ref is not None:
+            candidates.add(ref.key.casefold())
+        if ": " in panel_name:
+            candidates.add(panel_name.split(": ", 1)[0].casefold())
+        for signal_name in store.keys():
+            if signal_name.casefold() in candidates:
+                return signal_name
+        return None
+
+    def _schedule_windowed_refresh(self, *_args) -> None:
+        if self._reference_stores or self._stacked_signals.math_names:
+            self._reference_update_timer.start()
+
+    def _refresh_windowed_traces(self) -> None:
+        """Redraw the traces that only hold the visible window after a pan or zoom."""
+        self._refresh_math_traces()
+        if self._reference_stores or self._reference_traces:
+            self._refresh_reference_traces()
+
+    def _refresh_reference_traces(self) -> None:
+        """Resample the references onto the visible window of each shown panel."""
+        self._reference_update_timer.stop()
+        wanted: dict[tuple[str, str], str] = {}
+        for label, store in self._reference_stores.items():
+            for panel_name, panel in self._stacked_panels.items():
+                if not panel.frame.isHidden():
+                    signal_name = self._reference_signal_for(store, panel_name)
+                    if signal_name is not None:
+                        wanted[(label, panel_name)] = signal_name
+        for key in [key for key in self._reference_traces if key not in wanted]:
+            item = self._reference_traces.pop(key)
+            panel = self._stacked_panels.get(key[1])
+            if panel is not None:
+                panel.plot.removeItem(item)
+
+        for (label, panel_name), signal_name in sorted(wanted.items()):
+            store = self._reference_stores[label]
+            panel = self._stacked_panels[panel_name]
+            values = store.get(signal_name)
+            if values is None or values.shape != store.time.shape:
+                continue
+            view_box = panel.plot.getViewBox()
+            start, stop = view_box.viewRange()[0]
+            x, y = resample_to_window(
+                store.time,
+                values,
+                start,
+                stop,
+                max(int(view_box.width()), 200),
+                store.pyramid(signal_name),
+            )
+            item = self._reference_traces.get((label, panel_name))
+            if item is None:
+                color = WaveformViewer._extract_pen_color(panel.trace) or self._trace_palette()[0]
+                item = panel.plot.plot(
+                    x,
+                    y,
+                    pen=pg.mkPen(color=color, width=1, style=Qt.PenStyle.DashLine),
+                    skipFiniteCheck=True,
+                )
+                self._reference_traces[(label, panel_name)] = item
+            else:
+                item.setData(x, y, skipFiniteCheck=True)
 
+    def _resolve_signal_refs(self) -> tuple[list[str], list[str]]:
+        """Map channel labels to signal views in the current store; no data is copied."""
+        store = self._result_store
+        refs: dict[str, SignalView] = {}
         found_channels: list[str] = []
         missing_channels: list[str] = []
 
@@ -806,22 +1220,19 @@ class ScopeWindow(QWidget):
 
             for idx, signal in enumerate(binding.signals):
                 base_label = self._format_signal_label(binding, signal, idx)
-                label = self._ensure_unique_label(base_label, subset.signals)
+                label = self._ensure_unique_label(base_label, refs)
                 if not signal.signal_key:
                     missing_channels.append(label)
                     continue
-                series = result.signals.get(signal.signal_key)
-                if series:
-                    subset.signals[label] = list(series)
+                view = store.view(signal.signal_key) if store is not None else None
+                if view is not None and view.values.size:
+                    refs[label] = view
                     found_channels.append(label)
                 else:
                     missing_channels.append(label)
 
-        self._current_result = subset if subset.signals else SimulationResult(time=subset.time, signals={})
-        self._refresh_stacked_sidebar(self._current_result)
-        self._rebuild_stacked_plots(self._current_result)
-
-        self._message_label.setText(self._format_status(found_channels, missing_channels))
+        self._signal_refs = refs
+        return found_channels, missing_channels
 
     @staticmethod
     def _infer_signal_categories(signal_names: list[str]) -> dict[str, str]:
@@ -860,6 +1271,7 @@ class ScopeWindow(QWidget):
     # ------------------------------------------------------------------
     def closeEvent(self, event: QCloseEvent) -> None:  # noqa: D401 - Qt override
         self.closed.emit(self._component_id, self.capture_geometry_state())
+        self._viewer.shutdown_background_jobs()
         super().closeEvent(event)
 
     # ------------------------------------------------------------------
@@ -882,6 +1294,10 @@ class ScopeWindow(QWidget):
         self._apply_stacked_trace_colors()
         self._stacked_signal_list.apply_theme(theme)
         self._stacked_measurements.apply_theme(theme, cursor_palette=self._cursor_palette())
+        if self._spectrum_panel is not None:
+            self._spectrum_panel.apply_theme(theme)
+        if self._xy_panel is not None:
+            self._xy_panel.apply_theme(theme)
         self.setStyleSheet(f"""
             QWidget#scopePlotSurface {{
                 background: {c.background};
@@ -1001,6 +1417,9 @@ class ScopeWindow(QWidget):
                 min-width: 112px;
                 font-size: 11px;
             }}
+            QPushButton#scopeSpectrumBtn {{
+                font-size: 11px;
+            }}
             QComboBox {{
                 background-color: {c.input_background};
                 color: {c.foreground};
@@ -1019,7 +1438,7 @@ class ScopeWindow(QWidget):
             handle_border=QColor(c.primary),
         )
         self._sync_trace_style_controls()
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
 
     def _apply_stacked_cursor_positions(self, c1: float, c2: float) -> None:
         if len(self._stacked_time) == 0:
@@ -1050,14 +1469,12 @@ class ScopeWindow(QWidget):
             t_min, t_max = t_max, t_min
         return float(min(max(value, t_min), t_max))
 
-    def _clear_stacked_plots(self) -> None:
-        while self._stacked_layout.count():
-            item = self._stacked_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-        self._plot_widgets.clear()
-        self._stacked_cursor_lines.clear()
+    def _remove_stacked_panel(self, name: str) -> None:
+        panel = self._stacked_panels.pop(name, None)
+        if panel is None:
+            return
+        self._stacked_layout.removeWidget(panel.frame)
+        panel.frame.deleteLater()
 
     def _trace_palette(self) -> list[tuple[int, int, int]]:
         if (
@@ -1085,8 +1502,8 @@ class ScopeWindow(QWidget):
         return None
 
     def _trace_signal_names(self) -> list[str]:
-        if self._current_result and self._current_result.signals:
-            return list(self._current_result.signals.keys())
+        if self._signal_refs or self._math_signals:
+            return [*self._signal_refs, *self._math_signals]
         return list(self._stacked_signals.keys())
 
     def _default_trace_color(self, signal_name: str) -> tuple[int, int, int]:
@@ -1214,7 +1631,7 @@ class ScopeWindow(QWidget):
         style["width"] = max(0.5, float(value))
         self._prune_trace_style(signal_name)
         self._apply_trace_styles_to_viewer()
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
 
     def _on_trace_color_clicked(self) -> None:
         signal_name = self._selected_trace_signal()
@@ -1241,7 +1658,7 @@ class ScopeWindow(QWidget):
         self._apply_trace_styles_to_viewer()
         self._apply_stacked_trace_colors()
         self._set_trace_controls_for_signal(signal_name)
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
 
     def _on_trace_style_reset(self) -> None:
         signal_name = self._selected_trace_signal()
@@ -1252,7 +1669,7 @@ class ScopeWindow(QWidget):
         self._apply_trace_styles_to_viewer()
         self._apply_stacked_trace_colors()
         self._set_trace_controls_for_signal(signal_name)
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
 
     def _on_add_scope_clicked(self) -> None:
         if not self._stacked_signals:
@@ -1281,7 +1698,7 @@ class ScopeWindow(QWidget):
         self._stacked_signal_list.set_signal_visible(next_signal, True)
         self._stacked_active_signal = next_signal
         self._sync_scope_selector()
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
         self._update_stacked_measurements()
 
     def _on_toggle_left_panel_clicked(self, checked: bool) -> None:
@@ -1377,7 +1794,7 @@ class ScopeWindow(QWidget):
             return
         self._stacked_active_signal = signal_name
         self._stacked_signal_list.set_signal_visible(signal_name, True)
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
         self._update_stacked_measurements()
 
     def _on_create_math_signal_clicked(self) -> None:
@@ -1403,93 +1820,40 @@ class ScopeWindow(QWidget):
         op_code = str(config["operation"])
         source_a = str(config["source_a"])
         source_b = str(config["source_b"])
-        gain = float(config["gain"])
-        offset = float(config["offset"])
         window = int(config["window"])
         needs_b = bool(config["needs_b"])
         needs_window = bool(config["needs_window"])
         custom_name = str(config["custom_name"])
 
-        if source_a not in self._stacked_signals:
-            QMessageBox.information(self, "Math Signal", "Invalid Source A signal.")
-            return
-
-        a_values = self._stacked_signals[source_a]
-        if len(a_values) == 0:
-            return
-
-        if needs_b:
-            if source_b not in self._stacked_signals:
-                QMessageBox.information(self, "Math Signal", "Invalid Source B signal.")
-                return
-            b_values = self._stacked_signals[source_b]
-            if len(b_values) != len(a_values):
-                QMessageBox.information(
-                    self,
-                    "Math Signal",
-                    "Source signals must have the same sample count.",
-                )
-                return
-        else:
-            b_values = None
-
-        if op_code == "ADD":
-            result = a_values + b_values
-        elif op_code == "SUB":
-            result = a_values - b_values
-        elif op_code == "MUL":
-            result = a_values * b_values
-        elif op_code == "DIV":
-            safe = np.abs(b_values) > 1e-15
-            result = np.divide(a_values, b_values, out=np.zeros_like(a_values), where=safe)
-        elif op_code == "AVG":
-            if len(a_values) < 2:
-                QMessageBox.information(self, "Math Signal", "Not enough samples for moving average.")
-                return
-            kernel_size = max(2, min(window, len(a_values)))
-            kernel = np.ones(kernel_size, dtype=float) / float(kernel_size)
-            result = np.convolve(a_values, kernel, mode="same")
-        elif op_code == "NEG":
-            result = -a_values
-        elif op_code == "ABS":
-            result = np.abs(a_values)
-        elif op_code == "SQR":
-            result = np.square(a_values)
-        elif op_code == "DER":
-            if len(self._stacked_time) < 2:
-                QMessageBox.information(self, "Math Signal", "Not enough samples for derivative.")
-                return
-            result = np.gradient(a_values, self._stacked_time)
-        elif op_code == "INT":
-            if len(self._stacked_time) < 2:
-                QMessageBox.information(self, "Math Signal", "Not enough samples for integral.")
-                return
-            dt = np.diff(self._stacked_time, prepend=self._stacked_time[0])
-            result = np.cumsum(a_values * dt)
-        else:
-            QMessageBox.information(self, "Math Signal", "Unsupported operation.")
+        try:
+            expression = self._math_expression_for(config)
+            parsed = self._math_engine.parse(expression)
+            missing = self._missing_math_sources(parsed)
+            if missing:
+                raise ValueError(f"Unknown signal(s): {', '.join(missing)}")
+            # Two samples are enough to surface mismatched sources; the trace
+            # itself is evaluated only where it is shown.
+            self._math_engine.evaluate(parsed, 0, 2)
+        except ValueError as exc:
+            QMessageBox.information(self, "Math Signal", str(exc))
             return
 
-        result = (result * gain) + offset
-
         self._math_signal_counter += 1
         if custom_name:
             name = f"MATH_{self._math_signal_counter}:{custom_name}"
+        elif op_code == "EXPR":
+            name = f"MATH_{self._math_signal_counter}:{str(config['expression'])}"
         elif needs_b:
             name = f"MATH_{self._math_signal_counter}:{op_code}({source_a},{source_b})"
         elif needs_window:
             name = f"MATH_{self._math_signal_counter}:{op_code}({source_a},N={window})"
         else:
             name = f"MATH_{self._math_signal_counter}:{op_code}({source_a})"
-        self._stacked_signals[name] = np.asarray(result, dtype=float)
+        self._math_signals[name] = expression
+        self._stacked_signals.add_math(name, parsed)
+        self._update_analysis_sources()
         self._rebuild_stacked_statistics_cache()
 
-        if self._current_result is None:
-            self._current_result = SimulationResult()
-            self._current_result.time = list(self._stacked_time)
-            self._current_result.signals = {}
-        self._current_result.signals[name] = list(self._stacked_signals[name])
-
         visible = set(self._stacked_signal_list.get_visible_signals())
         visible.add(name)
         self._stacked_signal_list.set_signals(list(self._stacked_signals.keys()))
@@ -1500,9 +1864,151 @@ class ScopeWindow(QWidget):
         self._stacked_active_signal = name
         self._sync_scope_selector()
         self._sync_trace_style_controls()
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
         self._update_stacked_measurements()
 
+    @staticmethod
+    def _math_expression_for(config: dict[str, object]) -> str:
+        """Translate a :class:`MathSignalDialog` configuration into an expression."""
+        op_code = str(config["operation"])
+        if op_code == "EXPR":
+            expression = str(config["expression"]).strip()
+        else:
+            a = f'"{config["source_a"]}"'
+            b = f'"{config["source_b"]}"'
+            binary = {"ADD": "+", "SUB": "-", "MUL": "*", "DIV": "/"}
+            unary = {"ABS": "abs", "SQR": "sq", "DER": "der", "INT": "integ"}
+            if op_code in binary:
+                expression = f"{a} {binary[op_code]} {b}"
+            elif op_code in unary:
+                expression = f"{unary[op_code]}({a})"
+            elif op_code == "AVG":
+                expression = f"avg({a}, n={int(config['window'])})"
+            elif op_code == "NEG":
+                expression = f"-{a}"
+            else:
+                raise ValueError("Unsupported operation.")
+
+        gain = float(config["gain"])
+        offset = float(config["offset"])
+        if gain != 1.0:
+            expression = f"({expression}) * {gain!r}"
+        if offset != 0.0:
+            expression = f"({expression}) + {offset!r}"
+        return expression
+
+    def _resolve_math_source(self, name: str) -> np.ndarray | None:
+        """Look up a math-expression operand by window label, then by result key."""
+        values = self._stacked_signals.get(name)
+        if values is not None:
+            return values
+        if self._result_store is not None:
+            return self._result_store.get(name)
+        return None
+
+    def _missing_math_sources(self, expression: MathExpression) -> list[str]:
+        """Return operands of ``expression`` that neither the window nor the result has.
+
+        Unlike :meth:`MathEngine.missing_signals` this does not read the
+        operands, so a math trace built on another one is not evaluated.
+        """
+        store = self._result_store
+        return [
+            name
+            for name in expression.signals
+            if name not in self._stacked_signals and (store is None or name not in store)
+        ]
+
+    def _bind_math_signals(
+        self, time: np.ndarray, arrays: dict[str, np.ndarray]
+    ) -> _StackedSignals:
+        """Return ``arrays`` plus the math traces whose operands are available.
+
+        The engine is rebound, dropping its cached evaluations, only when the
+        time axis or a channel's source signal changed. A math trace may
+        reference earlier ones, so they are added in creation order. Traces
+        whose sources are missing from the current result are skipped but
+        kept for later results. Nothing is evaluated here.
+        """
+        sources = tuple(
+            (name, id(ref.store), ref.key, ref.start, ref.stop)
+            for name, ref in self._signal_refs.items()
+            if name in arrays
+        )
+        binding = self._math_binding
+        if binding is None or binding[0] is not time or binding[1] != sources:
+            self._math_engine.bind(time, self._resolve_math_source)
+            self._math_binding = (time, sources)
+
+        signals = _StackedSignals(arrays, self._math_engine)
+        self._stacked_signals = signals
+        for name, expression in self._math_signals.items():
+            try:
+                parsed = self._math_engine.parse(expression)
+            except ValueError:
+                continue
+            if not self._missing_math_sources(parsed):
+                signals.add_math(name, parsed)
+        return signals
+
+    def show_spectrum(self) -> SpectrumPanel:
+        """Open the spectrum analyzer for the active stacked signal."""
+        if self._spectrum_panel is None:
+            self._spectrum_panel = SpectrumPanel(theme=self._theme, parent=self)
+            self._spectrum_panel.setWindowFlag(Qt.WindowType.Window, True)
+            self._spectrum_panel.set_source(self._stacked_time, self._stacked_signals)
+        if self._stacked_active_signal:
+            self._spectrum_panel.select_signal(self._stacked_active_signal)
+        self._spectrum_panel.show()
+        self._spectrum_panel.raise_()
+        self._sync_spectrum_range()
+        return self._spectrum_panel
+
+    def show_xy_plot(self) -> XYPlotPanel:
+        """Open the XY plot of the stacked channels."""
+        if self._xy_panel is None:
+            self._xy_panel = XYPlotPanel(theme=self._theme, parent=self)
+            self._xy_panel.setWindowFlag(Qt.WindowType.Window, True)
+            self._xy_panel.set_source(self._stacked_time, self._stacked_signals)
+        self._xy_panel.show()
+        self._xy_panel.raise_()
+        self._sync_xy_cursors()
+        return self._xy_panel
+
+    def _update_analysis_sources(self) -> None:
+        """Hand the stacked arrays to the open spectrum and XY windows."""
+        if self._spectrum_panel is not None:
+            self._spectrum_panel.set_source(self._stacked_time, self._stacked_signals)
+            self._sync_spectrum_range()
+        if self._xy_panel is not None:
+            self._xy_panel.set_source(self._stacked_time, self._stacked_signals)
+            self._sync_xy_cursors()
+
+    def _sync_xy_cursors(self) -> None:
+        """Mark the stacked cursor positions on the XY trajectory."""
+        if self._xy_panel is None:
+            return
+        if self._stacked_cursors_enabled and len(self._stacked_time) > 0:
+            self._xy_panel.set_cursor_times(
+                [self._c1_spin.value(), self._c2_spin.value()],
+                self._cursor_palette() or [(255, 0, 0), (0, 0, 255)],
+            )
+        else:
+            self._xy_panel.set_cursor_times(None)
+
+    def _sync_spectrum_range(self) -> None:
+        """Point the spectrum at the cursor span, or else the visible window."""
+        panel = self._spectrum_panel
+        if panel is None or not panel.isVisible():
+            return
+        if self._stacked_cursors_enabled and len(self._stacked_time) > 0:
+            panel.set_range(self._c1_spin.value(), self._c2_spin.value())
+        elif self._plot_widgets:
+            x_range, _y_range = self._plot_widgets[0].getViewBox().viewRange()
+            panel.set_range(float(x_range[0]), float(x_range[1]))
+        else:
+            panel.set_range(None, None)
+
     def _zoom_window_fraction(self) -> float:
         if not hasattr(self, "_zoom_slider"):
             return 1.0
@@ -1585,6 +2091,70 @@ class ScopeWindow(QWidget):
 
         self._timeline_slider.setValues(new_low, new_high)
 
+    def _timeline_window(self) -> tuple[float, float]:
+        """Return the ``(start, end)`` time range selected by the timeline slider."""
+        if len(self._stacked_time) == 0:
+            return 0.0, 0.0
+        t_min = float(self._stacked_time[0])
+        t_max = float(self._stacked_time[-1])
+        span = max(t_max - t_min, 1e-15)
+
+        low_unit = self._timeline_slider.lowValue()
+        high_unit = self._timeline_slider.highValue()
+        if high_unit <= low_unit:
+            high_unit = min(1000, low_unit + 1)
+            self._timeline_slider.setValues(low_unit, high_unit)
+
+        start = t_min + span * (low_unit / 1000.0)
+        end = t_min + span * (high_unit / 1000.0)
+        if end <= start:
+            end = min(t_max, start + (span / 1000.0))
+        return start, end
+
+    def _math_trace_data(
+        self, name: str, start: float, end: float, max_points: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Evaluate math trace ``name`` over ``[start, end]`` only and decimate it.
+
+        One sample beyond each edge keeps the line running off the view. The
+        full-resolution window also refreshes the trace's cached statistics.
+        """
+        time = self._stacked_time
+        lo, hi = self._window_indices(start, end)
+        values = self._stacked_signals.window(name, lo, hi)
+        if values.size != hi - lo:
+            return np.empty(0), np.empty(0)
+        self._stacked_signal_stats[name] = self._series_stats(values)
+        return self._decimate_stacked_for_display(time[lo:hi], values, max_points)
+
+    def _window_indices(self, start: float, end: float) -> tuple[int, int]:
+        """Sample range covering ``[start, end]`` plus one sample beyond each edge."""
+        time = self._stacked_time
+        lo = max(0, int(np.searchsorted(time, start, side="left")) - 1)
+        hi = min(len(time), int(np.searchsorted(time, end, side="right")) + 1)
+        return lo, hi
+
+    def _refresh_math_traces(self) -> None:
+        """Re-evaluate shown math traces over each panel's visible window."""
+        signals = self._stacked_signals
+        names = [
+            name
+            for name in signals.math_names
+            if name in self._stacked_panels and not self._stacked_panels[name].frame.isHidden()
+        ]
+        if not names or len(self._stacked_time) == 0:
+            return
+        points = self._stacked_target_points_per_signal(len(self._plot_widgets))
+        for name in names:
+            panel = self._stacked_panels[name]
+            start, end = panel.plot.getViewBox().viewRange()[0]
+            t, values = self._math_trace_data(name, start, end, points)
+            panel.trace.setData(t, values)
+            self._configure_stacked_trace_performance(panel.trace, len(t))
+            self._show_stacked_panel_stats(panel, self._stacked_signal_stats.get(name))
+        if not self._stacked_measurement_timer.isActive():
+            self._stacked_measurement_timer.start()
+
     def _apply_bottom_viewport_controls(self) -> None:
         if not self._plot_widgets or len(self._stacked_time) < 2:
             self._timeline_slider.setEnabled(False)
@@ -1609,20 +2179,11 @@ class ScopeWindow(QWidget):
         t_min = float(self._stacked_time[0])
         t_max = float(self._stacked_time[-1])
         span = max(t_max - t_min, 1e-15)
-
-        low_unit = self._timeline_slider.lowValue()
-        high_unit = self._timeline_slider.highValue()
-        if high_unit <= low_unit:
-            high_unit = min(1000, low_unit + 1)
-            self._timeline_slider.setValues(low_unit, high_unit)
-
-        start = t_min + span * (low_unit / 1000.0)
-        end = t_min + span * (high_unit / 1000.0)
-        if end <= start:
-            end = min(t_max, start + (span / 1000.0))
+        start, end = self._timeline_window()
 
         first = self._plot_widgets[0]
         first.setXRange(start, end, padding=0)
+        self._sync_spectrum_range()
         self._timeline_range_label.setText(
             f"{self._format_time_display(start)} to {self._format_time_display(end)}"
         )
@@ -1716,10 +2277,10 @@ class ScopeWindow(QWidget):
 
     @staticmethod
     def _configure_stacked_trace_performance(trace: pg.PlotDataItem, point_count: int) -> None:
-        if point_count < 5000:
-            return
-        trace.setClipToView(True)
-        trace.setDownsampling(auto=True, method="peak")
+        # Retained traces get new data, so the mode is set both ways.
+        large = point_count >= 5000
+        trace.setClipToView(large)
+        trace.setDownsampling(auto=large, method="peak")
 
     def _stacked_target_points_per_signal(self, visible_count: int) -> int:
         if visible_count <= 0:
@@ -1729,21 +2290,43 @@ class ScopeWindow(QWidget):
         return max(self.STACKED_MIN_POINTS_PER_SIGNAL, bounded)
 
     def _rebuild_stacked_statistics_cache(self) -> None:
+        """Drop cached statistics; :meth:`_stacked_stats` recomputes them on demand."""
         self._stacked_signal_stats = {}
-        for signal_name, values in self._stacked_signals.items():
-            if len(values) == 0:
-                continue
-            min_val = float(np.min(values))
-            max_val = float(np.max(values))
-            mean_val = float(np.mean(values))
-            rms_val = float(np.sqrt(np.mean(values ** 2)))
-            self._stacked_signal_stats[signal_name] = {
-                "min": min_val,
-                "max": max_val,
-                "mean": mean_val,
-                "rms": rms_val,
-                "pkpk": max_val - min_val,
-            }
+
+    def _stacked_stats(self, signal_name: str) -> dict[str, float] | None:
+        """Return statistics of ``signal_name``, computing them once.
+
+        Stored channels cover the whole record. Math traces cover the window
+        they were last evaluated over, the timeline window until then, so
+        they are never evaluated over the whole record here.
+        """
+        signals = self._stacked_signals
+        if signal_name in self._stacked_signal_stats or signal_name not in signals:
+            return self._stacked_signal_stats.get(signal_name)
+        if signals.is_math(signal_name):
+            values = signals.window(signal_name, *self._window_indices(*self._timeline_window()))
+        else:
+            values = signals[signal_name]
+        stats = self._series_stats(values)
+        self._stacked_signal_stats[signal_name] = stats
+        return stats
+
+    @staticmethod
+    def _series_stats(values: np.ndarray) -> dict[str, float] | None:
+        """Min, max, mean, RMS and peak-to-peak of ``values``; None when empty."""
+        if len(values) == 0:
+            return None
+        min_val = float(np.min(values))
+        max_val = float(np.max(values))
+        mean_val = float(np.mean(values))
+        rms_val = float(np.sqrt(np.mean(values ** 2)))
+        return {
+            "min": min_val,
+            "max": max_val,
+            "mean": mean_val,
+            "rms": rms_val,
+            "pkpk": max_val - min_val,
+        }
 
     def _set_stacked_cursor_enabled(self, enabled: bool) -> None:
         final_enabled = bool(enabled) and self._stacked_cursors_enabled
@@ -1755,12 +2338,12 @@ class ScopeWindow(QWidget):
     def _on_stacked_cursor_toggled(self, checked: bool) -> None:
         self._stacked_cursors_enabled = checked
         self._set_stacked_cursor_enabled(len(self._stacked_time) > 0)
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
         self._update_stacked_measurements()
 
     def _on_stacked_grid_toggled(self, checked: bool) -> None:
         self._stacked_grid_enabled = checked
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
 
     def _auto_range_stacked(self) -> None:
         for plot in self._plot_widgets:
@@ -1799,12 +2382,14 @@ class ScopeWindow(QWidget):
             self._syncing_stacked_cursor_controls = False
         self._stacked_cursor_initialized = True
         self._sync_stacked_cursor_lines()
-        self._update_stacked_measurements()
+        if not self._stacked_measurement_timer.isActive():
+            self._stacked_measurement_timer.start()
 
-    def _refresh_stacked_sidebar(self, result: SimulationResult | None) -> None:
-        if not result or not result.time or not result.signals:
+    def _refresh_stacked_sidebar(self) -> None:
+        store = self._result_store
+        if store is None or store.sample_count == 0 or not self._signal_refs:
             self._stacked_time = np.array([], dtype=float)
-            self._stacked_signals = {}
+            self._stacked_signals = _StackedSignals()
             self._stacked_signal_stats = {}
             self._stacked_active_signal = None
             self._stacked_cursor_initialized = False
@@ -1818,16 +2403,15 @@ class ScopeWindow(QWidget):
             self._refresh_bottom_controls_enabled()
             return
 
-        time = np.asarray(result.time, dtype=float)
-        valid_signals: dict[str, np.ndarray] = {}
-        for name, values_raw in result.signals.items():
-            values = np.asarray(values_raw, dtype=float)
-            if len(values) == len(time) and len(values) > 0:
-                valid_signals[name] = values
+        time = store.time
+        valid_signals = self._bind_math_signals(
+            time,
+            {name: ref.values for name, ref in self._signal_refs.items() if ref.is_valid},
+        )
 
         if not valid_signals:
             self._stacked_time = np.array([], dtype=float)
-            self._stacked_signals = {}
+            self._stacked_signals = _StackedSignals()
             self._stacked_signal_stats = {}
             self._stacked_active_signal = None
             self._stacked_cursor_initialized = False
@@ -1932,7 +2516,7 @@ class ScopeWindow(QWidget):
         if self._stacked_active_signal not in visible and visible:
             self._stacked_active_signal = visible[0]
         self._sync_scope_selector()
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
         self._update_stacked_measurements()
 
     def _on_stacked_signal_selected(self, signal_name: str) -> None:
@@ -1986,13 +2570,15 @@ class ScopeWindow(QWidget):
         self._apply_trace_styles_to_viewer()
         self._apply_stacked_trace_colors()
         self._set_trace_controls_for_signal(signal_name)
-        self._rebuild_stacked_plots(self._current_result)
+        self._refresh_stacked_plots()
         self._update_stacked_measurements()
 
     def _on_stacked_cursor_changed(self, _value: float) -> None:
         self._stacked_cursor_initialized = True
-        if not self._syncing_stacked_cursor_controls:
-            self._sync_stacked_cursor_lines()
+        if self._syncing_stacked_cursor_controls:
+            # Dragged on a plot: that handler schedules the throttled readout.
+            return
+        self._sync_stacked_cursor_lines()
         self._update_stacked_measurements()
 
     def _update_stacked_measurements(self) -> None:
@@ -2007,8 +2593,7 @@ class ScopeWindow(QWidget):
             signal_name = next(iter(self._stacked_signals))
             self._stacked_active_signal = signal_name
 
-        values = self._stacked_signals[signal_name]
-        stats = self._stacked_signal_stats.get(signal_name)
+        stats = self._stacked_stats(signal_name)
         if stats is None:
             self._stacked_measurements.clear_statistics()
         else:
@@ -2022,21 +2607,25 @@ class ScopeWindow(QWidget):
         if self._stacked_cursors_enabled:
             t1 = self._c1_spin.value()
             t2 = self._c2_spin.value()
-            v1 = self._interpolate_stacked_value(t1, values)
-            v2 = self._interpolate_stacked_value(t2, values)
+            table = self._build_stacked_measurements_table(t1, t2)
+            if signal_name in table:
+                v1, v2 = table[signal_name]["c1"], table[signal_name]["c2"]
+            else:
+                readings = self._sample_stacked_signals([signal_name], [t1, t2])[0]
+                v1, v2 = (float(v) if np.isfinite(v) else None for v in readings)
             self._stacked_measurements.update_cursor1(t1, v1)
             self._stacked_measurements.update_cursor2(t2, v2)
             dt = t2 - t1
             dv = v2 - v1 if v1 is not None and v2 is not None else None
             self._stacked_measurements.update_delta(dt, dv, v1, v2)
-            self._stacked_measurements.set_multi_signal_measurements(
-                self._build_stacked_measurements_table(t1, t2)
-            )
+            self._stacked_measurements.set_multi_signal_measurements(table)
         else:
             self._stacked_measurements.clear_cursor_measurements()
             self._stacked_measurements.set_multi_signal_measurements(
                 self._build_stacked_measurements_table(None, None)
             )
+        self._sync_spectrum_range()
+        self._sync_xy_cursors()
 
     def _build_stacked_measurements_table(
         self,
@@ -2044,12 +2633,14 @@ class ScopeWindow(QWidget):
         t2: float | None,
     ) -> dict[str, dict[str, float | None]]:
         table: dict[str, dict[str, float | None]] = {}
-        for name, values in self._stacked_signals.items():
-            stats = self._stacked_signal_stats.get(name)
-            if stats is None:
-                continue
-            c1 = self._interpolate_stacked_value(t1, values) if t1 is not None else None
-            c2 = self._interpolate_stacked_value(t2, values) if t2 is not None else None
+        names = [name for name in self._stacked_signals if self._stacked_stats(name) is not None]
+        cursor_times = [t for t in (t1, t2) if t is not None]
+        sampled = self._sample_stacked_signals(names, cursor_times)
+        for row, name in enumerate(names):
+            stats = self._stacked_signal_stats[name]
+            readings = [float(v) if np.isfinite(v) else None for v in sampled[row]]
+            c1 = readings[0] if t1 is not None else None
+            c2 = readings[-1] if t2 is not None else None
             dv = c2 - c1 if c1 is not None and c2 is not None else None
             table[name] = {
                 "c1": c1,
@@ -2063,52 +2654,81 @@ class ScopeWindow(QWidget):
             }
         return table
 
-    def _interpolate_stacked_value(self, t: float, values: np.ndarray) -> float | None:
-        if len(self._stacked_time) == 0:
-            return None
-        t_min = float(self._stacked_time[0])
-        t_max = float(self._stacked_time[-1])
-        if t < t_min or t > t_max:
-            return None
-        return float(np.interp(t, self._stacked_time, values))
+    def _sample_stacked_signals(self, names: list[str], times: list[float]) -> np.ndarray:
+        """Interpolate ``names`` at ``times``; NaN outside the data.
+
+        Stored channels are sampled in one batch. Math traces read only the
+        two samples around each instant instead of their whole record.
+        """
+        signals = self._stacked_signals
+        rows = [row for row, name in enumerate(names) if not signals.is_math(name)]
+        out = np.full((len(names), len(times)), np.nan)
+        if rows:
+            out[rows] = interpolate_at(
+                self._stacked_time, [signals[names[row]] for row in rows], times
+            )
+        for row, name in enumerate(names):
+            if not signals.is_math(name):
+                continue
+            for column, t in enumerate(times):
+                value = signals.value_at(name, t)
+                if value is not None:
+                    out[row, column] = value
+        return out
+
+    def _show_stacked_placeholder(self, message: str) -> None:
+        for panel in self._stacked_panels.values():
+            panel.frame.hide()
+        self._plot_widgets = []
+        self._stacked_cursor_lines = []
+        self._stacked_placeholder.setText(message)
+        self._stacked_placeholder.show()
+        self._stacked_filler.show()
+        self._refresh_bottom_controls_enabled()
 
-    def _rebuild_stacked_plots(self, result: SimulationResult | None) -> None:
-        self._clear_stacked_plots()
+    def _refresh_stacked_plots(self) -> None:
+        """Update the retained stacked panels from the current signals.
 
-        if not result or len(self._stacked_time) == 0 or not self._stacked_signals:
-            empty = QLabel("No signals to plot. Connect scope channels and run simulation.")
-            empty.setWordWrap(True)
-            self._stacked_layout.addWidget(empty)
-            self._stacked_layout.addStretch()
-            self._refresh_bottom_controls_enabled()
+        Panels are created once per signal and reused: data goes through
+        ``setData``, hidden signals only hide their panel, and stylesheets are
+        reapplied only when the theme, color or active signal changes.
+        """
+        for name in [name for name in self._stacked_panels if name not in self._stacked_signals]:
+            self._remove_stacked_panel(name)
+
+        if len(self._stacked_time) == 0 or not self._stacked_signals:
+            self._show_stacked_placeholder("No signals to plot. Connect scope channels and run simulation.")
             return
 
-        time = self._stacked_time
-        palette = self._trace_palette()
-        first_plot: pg.PlotWidget | None = None
         visible = set(self._stacked_signal_list.get_visible_signals())
-        signal_items = [
-            (name, values)
-            for name, values in self._stacked_signals.items()
-            if not visible or name in visible
-        ]
-
+        signal_items = [name for name in self._stacked_signals if not visible or name in visible]
         if not signal_items:
-            empty = QLabel("No visible signals. Enable at least one signal in the list.")
-            empty.setWordWrap(True)
-            self._stacked_layout.addWidget(empty)
-            self._stacked_layout.addStretch()
-            self._refresh_bottom_controls_enabled()
+            self._show_stacked_placeholder("No visible signals. Enable at least one signal in the list.")
             return
 
+        self._stacked_placeholder.hide()
+        self._stacked_filler.hide()
+        self._order_stacked_panels()
+
+        time = self._stacked_time
+        palette = self._trace_palette()
         points_per_signal = self._stacked_target_points_per_signal(len(signal_items))
+        shown = set(signal_items)
+        window = self._timeline_window()
+        first_plot: pg.PlotWidget | None = None
+        self._plot_widgets = []
+        self._stacked_cursor_lines = []
 
-        for idx, (name, values) in enumerate(signal_items):
-            t, plot_values = self._decimate_stacked_for_display(
-                time,
-                values,
-                max_points=points_per_signal,
-            )
+        for idx, name in enumerate(signal_items):
+            panel = self._stacked_panels[name]
+            if self._stacked_signals.is_math(name):
+                t, plot_values = self._math_trace_data(name, *window, points_per_signal)
+            else:
+                t, plot_values = self._decimate_stacked_for_display(
+                    time,
+                    self._stacked_signals[name],
+                    max_points=points_per_signal,
+                )
 
             # Determine color for this signal
             color = self._stacked_signal_list.get_signal_color(name)
@@ -2116,144 +2736,206 @@ class ScopeWindow(QWidget):
                 color = palette[idx % len(palette)]
             color_override = self._trace_style_color(name)
             line_color = color_override if color_override is not None else color
-            r, g, b = line_color
-            hex_color = f"#{r:02x}{g:02x}{b:02x}"
-
-            # Stats for this signal
-            sig_stats = self._stacked_signal_stats.get(name, {})
-            is_active = (name == self._stacked_active_signal)
-
-            panel = QFrame()
-            panel_layout = QVBoxLayout(panel)
-            panel_layout.setContentsMargins(0, 0, 0, 0)
-            panel_layout.setSpacing(0)
-
-            # --- Header row: colored dot + name + mini stats ---
-            header_widget = QWidget()
-            header_layout = QHBoxLayout(header_widget)
-            header_layout.setContentsMargins(12, 8, 12, 6)
-            header_layout.setSpacing(8)
-
-            dot_and_name = QLabel(f'●  {name}')
-            dot_and_name.setObjectName("stackedPanelTitle")
-            header_layout.addWidget(dot_and_name, stretch=1)
-
-            # Mini stats row
-            if sig_stats:
-                fmt = "{:.4g}"
-                stats_str = (
-                    f"RMS: {fmt.format(sig_stats.get('rms', 0))}  "
-                    f"Peak: {fmt.format(sig_stats.get('max', 0))}  "
-                    f"Avg: {fmt.format(sig_stats.get('mean', 0))}"
-                )
-                stats_lbl = QLabel(stats_str)
-                stats_lbl.setObjectName("stackedPanelStats")
-                header_layout.addWidget(stats_lbl)
-
-            panel_layout.addWidget(header_widget)
-
-            # --- Plot ---
-            plot = pg.PlotWidget()
-            plot.setMinimumHeight(220)
-            grid_alpha = 0.18 if (self._theme and self._theme.is_dark) else 0.28
-            if not self._stacked_grid_enabled:
-                grid_alpha = 0.0
-            plot.showGrid(x=self._stacked_grid_enabled, y=self._stacked_grid_enabled, alpha=grid_alpha)
-            line_width = self._trace_style_width(name)
-            trace = plot.plot(
-                t,
-                plot_values,
-                pen=pg.mkPen(color=line_color, width=line_width),
-                skipFiniteCheck=True,
-            )
-            self._configure_stacked_trace_performance(trace, len(t))
-
-            item = plot.getPlotItem()
-            item.setLabel("left", "")
-            if idx == len(signal_items) - 1:
-                item.setLabel("bottom", "Time", units="s")
-            else:
-                item.getAxis("bottom").setStyle(showValues=False)
 
+            panel.trace.setData(t, plot_values)
+            panel.trace.setPen(pg.mkPen(color=line_color, width=self._trace_style_width(name)))
+            self._configure_stacked_trace_performance(panel.trace, len(t))
+            self._style_stacked_panel(panel, name, line_color)
+
+            is_last = idx == len(signal_items) - 1
+            if panel.shows_time_axis != is_last:
+                item = panel.plot.getPlotItem()
+                if is_last:
+                    item.getAxis("bottom").setStyle(showValues=True)
+                    item.setLabel("bottom", "Time", units="s")
+                else:
+                    item.setLabel("bottom", "")
+                    item.getAxis("bottom").setStyle(showValues=False)
+                panel.shows_time_axis = is_last
+
+            link = first_plot
+            if panel.x_link is not link:
+                panel.plot.setXLink(link)
+                panel.x_link = link
             if first_plot is None:
-                first_plot = plot
-            else:
-                plot.setXLink(first_plot)
-
+                first_plot = panel.plot
+
+            c1_line, c2_line = panel.cursors
+            for line, position in ((c1_line, self._c1_spin.value()), (c2_line, self._c2_spin.value())):
+                line.setVisible(self._stacked_cursors_enabled)
+                if self._stacked_cursors_enabled:
+                    line.blockSignals(True)
+                    line.setValue(position)
+                    line.blockSignals(False)
             if self._stacked_cursors_enabled:
-                cursor_palette = self._cursor_palette() or [(255, 0, 0), (0, 0, 255)]
-                c1_line = pg.InfiniteLine(
-                    pos=self._c1_spin.value(),
-                    angle=90,
-                    movable=True,
-                    pen=pg.mkPen(color=cursor_palette[0], width=1.8, style=Qt.PenStyle.DashLine),
-                )
-                c2_line = pg.InfiniteLine(
-                    pos=self._c2_spin.value(),
-                    angle=90,
-                    movable=True,
-                    pen=pg.mkPen(color=cursor_palette[1], width=1.8, style=Qt.PenStyle.DashLine),
-                )
-                c1_line.sigPositionChanged.connect(
-                    lambda *_args, line=c1_line: self._on_stacked_plot_cursor_moved(1, float(line.value()))
-                )
-                c2_line.sigPositionChanged.connect(
-                    lambda *_args, line=c2_line: self._on_stacked_plot_cursor_moved(2, float(line.value()))
-                )
-                plot.addItem(c1_line)
-                plot.addItem(c2_line)
-                self._stacked_cursor_lines.append((c1_line, c2_line))
-
-            panel_layout.addWidget(plot)
-
-            # --- Apply theming ---
-            if self._theme is not None:
-                c = self._theme.colors
-                plot.setBackground(c.plot_background)
-                for axis_name in ("left", "bottom"):
-                    axis = item.getAxis(axis_name)
-                    axis.setPen(pg.mkPen(c.plot_axis))
-                    axis.setTickPen(pg.mkPen(c.plot_axis))
-                    axis.setTextPen(pg.mkPen(c.plot_text))
-                plot.showGrid(
-                    x=self._stacked_grid_enabled,
-                    y=self._stacked_grid_enabled,
-                    alpha=0.18 if self._theme.is_dark else 0.28,
-                )
+                self._stacked_cursor_lines.append(panel.cursors)
 
-                header_bg = c.panel_header if is_active else c.panel_background
-                name_weight = "700" if is_active else "600"
-                dot_and_name.setStyleSheet(
-                    f"color: {hex_color}; font-weight: {name_weight}; font-size: 12px;"
-                )
-                if sig_stats:
-                    stats_lbl.setStyleSheet(
-                        f"color: {c.foreground_muted}; font-size: 10px; font-family: monospace; font-weight: 500;"
-                    )
-                # Panel border: slim left accent + softer card fill.
-                panel.setStyleSheet(
-                    f"""
-                    QFrame {{
-                        background-color: {c.panel_background};
-                        border: 1px solid {c.panel_border};
-                        border-left: 3px solid {hex_color};
-                        border-radius: 10px;
-                    }}
-                    """
-                )
-                header_widget.setStyleSheet(
-                    f"background-color: {header_bg}; border-radius: 7px; margin: 0; border: 1px solid {c.panel_border};"
-                )
-            else:
-                dot_and_name.setStyleSheet(f"color: {hex_color}; font-weight: 600; font-size: 12px;")
-                if sig_stats:
-                    stats_lbl.setStyleSheet("color: #666; font-size: 10px; font-family: monospace;")
+            panel.frame.show()
+            self._plot_widgets.append(panel.plot)
 
-            self._stacked_layout.addWidget(panel)
-            self._plot_widgets.append(plot)
+        for name, panel in self._stacked_panels.items():
+            if name not in shown:
+                panel.frame.hide()
 
         self._refresh_bottom_controls_enabled()
         self._apply_bottom_viewport_controls()
+        if self._reference_stores or self._reference_traces:
+            self._refresh_reference_traces()
+
+    def _order_stacked_panels(self) -> None:
+        """Create missing panels and keep the layout in signal order."""
+        for name in self._stacked_signals:
+            if name not in self._stacked_panels:
+                self._stacked_panels[name] = self._create_stacked_panel(name)
+
+        offset = 2  # placeholder and filler come first
+        current = [
+            self._stacked_layout.itemAt(index).widget()
+            for index in range(offset, self._stacked_layout.count())
+        ]
+        wanted = [self._stacked_panels[name].frame for name in self._stacked_signals]
+        if current == wanted:
+            return
+        for frame in current:
+            self._stacked_layout.removeWidget(frame)
+        for frame in wanted:
+            self._stacked_layout.addWidget(frame)
+
+    def _create_stacked_panel(self, name: str) -> _StackedPanel:
+        panel = QFrame()
+        panel_layout = QVBoxLayout(panel)
+        panel_layout.setContentsMargins(0, 0, 0, 0)
+        panel_layout.setSpacing(0)
+
+        # --- Header row: colored dot + name + mini stats ---
+        header_widget = QWidget()
+        header_layout = QHBoxLayout(header_widget)
+        header_layout.setContentsMargins(12, 8, 12, 6)
+        header_layout.setSpacing(8)
+
+        dot_and_name = QLabel(f'●  {name}')
+        dot_and_name.setObjectName("stackedPanelTitle")
+        header_layout.addWidget(dot_and_name, stretch=1)
+
+        stats_lbl = QLabel()
+        stats_lbl.setObjectName("stackedPanelStats")
+        header_layout.addWidget(stats_lbl)
+        panel_layout.addWidget(header_widget)
+
+        # --- Plot ---
+        plot = pg.PlotWidget()
+        plot.setMinimumHeight(220)
+        trace = plot.plot([], [], skipFiniteCheck=True)
+        plot.getPlotItem().setLabel("left", "")
+        plot.getViewBox().sigXRangeChanged.connect(self._schedule_windowed_refresh)
+
+        cursor_palette = self._cursor_palette() or [(255, 0, 0), (0, 0, 255)]
+        c1_line = pg.InfiniteLine(
+            pos=self._c1_spin.value(),
+            angle=90,
+            movable=True,
+            pen=pg.mkPen(color=cursor_palette[0], width=1.8, style=Qt.PenStyle.DashLine),
+        )
+        c2_line = pg.InfiniteLine(
+            pos=self._c2_spin.value(),
+            angle=90,
+            movable=True,
+            pen=pg.mkPen(color=cursor_palette[1], width=1.8, style=Qt.PenStyle.DashLine),
+        )
+        c1_line.sigPositionChanged.connect(
+            lambda *_args, line=c1_line: self._on_stacked_plot_cursor_moved(1, float(line.value()))
+        )
+        c2_line.sigPositionChanged.connect(
+            lambda *_args, line=c2_line: self._on_stacked_plot_cursor_moved(2, float(line.value()))
+        )
+        c1_line.setVisible(False)
+        c2_line.setVisible(False)
+        plot.addItem(c1_line)
+        plot.addItem(c2_line)
+
+        panel_layout.addWidget(plot)
+        panel.hide()
+        return _StackedPanel(
+            frame=panel,
+            header=header_widget,
+            title=dot_and_name,
+            stats=stats_lbl,
+            plot=plot,
+            trace=trace,
+            cursors=(c1_line, c2_line),
+        )
+
+    @staticmethod
+    def _show_stacked_panel_stats(panel: _StackedPanel, stats: dict[str, float] | None) -> None:
+        """Show ``stats`` in the panel header, or hide the header stats."""
+        if stats:
+            fmt = "{:.4g}"
+            panel.stats.setText(
+                f"RMS: {fmt.format(stats.get('rms', 0))}  "
+                f"Peak: {fmt.format(stats.get('max', 0))}  "
+                f"Avg: {fmt.format(stats.get('mean', 0))}"
+            )
+        panel.stats.setVisible(bool(stats))
+
+    def _style_stacked_panel(
+        self,
+        panel: _StackedPanel,
+        name: str,
+        line_color: tuple[int, int, int],
+    ) -> None:
+        """Apply header text, theme and grid to a panel when any of them changed."""
+        self._show_stacked_panel_stats(panel, self._stacked_stats(name))
+
+        is_active = (name == self._stacked_active_signal)
+        key = (id(self._theme), tuple(line_color), is_active, self._stacked_grid_enabled)
+        if panel.style_key == key:
+            return
+        panel.style_key = key
+
+        r, g, b = line_color
+        hex_color = f"#{r:02x}{g:02x}{b:02x}"
+        plot = panel.plot
+        cursor_palette = self._cursor_palette() or [(255, 0, 0), (0, 0, 255)]
+        for line, cursor_color in zip(panel.cursors, cursor_palette):
+            line.setPen(pg.mkPen(color=cursor_color, width=1.8, style=Qt.PenStyle.DashLine))
+        grid_alpha = 0.18 if (self._theme and self._theme.is_dark) else 0.28
+        plot.showGrid(x=self._stacked_grid_enabled, y=self._stacked_grid_enabled, alpha=grid_alpha)
+
+        if self._theme is not None:
+            c = self._theme.colors
+            item = plot.getPlotItem()
+            plot.setBackground(c.plot_background)
+            for axis_name in ("left", "bottom"):
+                axis = item.getAxis(axis_name)
+                axis.setPen(pg.mkPen(c.plot_axis))
+                axis.setTickPen(pg.mkPen(c.plot_axis))
+                axis.setTextPen(pg.mkPen(c.plot_text))
+
+            header_bg = c.panel_header if is_active else c.panel_background
+            name_weight = "700" if is_active else "600"
+            panel.title.setStyleSheet(
+                f"color: {hex_color}; font-weight: {name_weight}; font-size: 12px;"
+            )
+            panel.stats.setStyleSheet(
+                f"color: {c.foreground_muted}; font-size: 10px; font-family: monospace; font-weight: 500;"
+            )
+            # Panel border: slim left accent + softer card fill.
+            panel.frame.setStyleSheet(
+                f"""
+                QFrame {{
+                    background-color: {c.panel_background};
+                    border: 1px solid {c.panel_border};
+                    border-left: 3px solid {hex_color};
+                    border-radius: 10px;
+                }}
+                """
+            )
+            panel.header.setStyleSheet(
+                f"background-color: {header_bg}; border-radius: 7px; margin: 0; border: 1px solid {c.panel_border};"
+            )
+        else:
+            panel.title.setStyleSheet(f"color: {hex_color}; font-weight: 600; font-size: 12px;")
+            panel.stats.setStyleSheet("color: #666; font-size: 10px; font-family: monospace;")
 
     def _format_status(self, found: list[str], missing: list[str]) -> str:
         found_count = len(found)
@@ -2274,7 +2956,7 @@ class ScopeWindow(QWidget):
         return f"{binding.display_name}/{suffix}"
 
     @staticmethod
-    def _ensure_unique_label(label: str, existing: dict[str, list[float]]) -> str:
+    def _ensure_unique_label(label: str, existing: dict[str, object]) -> str:
         if label not in existing:
             return label
         idx = 2
@@ -0,0 +1,244 @@
+"""Per-cycle measurement table for the waveform viewer."""
+
+from __future__ import annotations
+
+from typing import Mapping
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QGridLayout,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from pulsimgui.services.cycle_measurements import CycleMeasurements, measure_cycles
+from pulsimgui.utils.si_prefix import format_si_value
+
+_NONE = "(none)"
+
+#: Units shown for the fixed reference columns.
+_COLUMN_UNITS = {
+    "period": "s",
+    "frequency": "Hz",
+    "rise_time": "s",
+    "fall_time": "s",
+    "P_in": "W",
+    "P_out": "W",
+}
+
+
+def _format_cell(column: str, value: float) -> str:
+    if not np.isfinite(value):
+        return "--"
+    if column in ("duty", "efficiency"):
+        return f"{100.0 * value:.2f} %"
+    return format_si_value(float(value), _COLUMN_UNITS.get(column, ""))
+
+
+class CycleTableModel(QAbstractTableModel):
+    """Read-only model over :class:`CycleMeasurements` arrays.
+
+    Cells are formatted on demand, so tables with millions of cycles stay
+    responsive; the view only asks for the rows on screen.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._measurements: CycleMeasurements | None = None
+        self._columns: list[str] = []
+
+    def set_measurements(self, measurements: CycleMeasurements | None) -> None:
+        """Show ``measurements`` (or nothing)."""
+        self.beginResetModel()
+        self._measurements = measurements
+        self._columns = list(measurements.columns) if measurements is not None else []
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802 - Qt override
+        if (parent is not None and parent.isValid()) or self._measurements is None:
+            return 0
+        return self._measurements.count
+
+    def columnCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802 - Qt override
+        if (parent is not None and parent.isValid()) or self._measurements is None:
+            return 0
+        return len(self._columns) + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or self._measurements is None:
+            return None
+        row, column = index.row(), index.column()
+        if column == 0:
+            return format_si_value(float(self._measurements.start[row]), "s")
+        name = self._columns[column - 1]
+        return _format_cell(name, float(self._measurements.columns[name][row]))
+
+    def headerData(  # noqa: N802 - Qt override
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Vertical:
+            return str(section + 1)
+        return "start" if section == 0 else self._columns[section - 1]
+
+
+class CycleMeasurementsPanel(QWidget):
+    """Per-switching-cycle metrics of the viewer's signals.
+
+    Signals:
+        derived_signals_requested: Emitted with ``{name: samples}`` when the
+            user adds the per-cycle metrics as signals.
+    """
+
+    derived_signals_requested = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Cycle Measurements")
+        self.resize(860, 480)
+
+        self._time = np.empty(0)
+        self._signals: Mapping[str, np.ndarray] = {}
+        self._measurements: CycleMeasurements | None = None
+        self._setup_ui()
+
+    def _setup_ui(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+
+        form = QGridLayout()
+        self._reference_combo = QComboBox()
+        self._reference_combo.setToolTip("Signal whose rising crossings delimit the cycles")
+        self._signal_combo = QComboBox()
+        self._v_in_combo, self._i_in_combo = QComboBox(), QComboBox()
+        self._v_out_combo, self._i_out_combo = QComboBox(), QComboBox()
+        rows = (
+            ("Cycle reference", self._reference_combo, "Measured signal", self._signal_combo),
+            ("Input voltage", self._v_in_combo, "Input current", self._i_in_combo),
+            ("Output voltage", self._v_out_combo, "Output current", self._i_out_combo),
+        )
+        for row, (left_label, left, right_label, right) in enumerate(rows):
+            form.addWidget(QLabel(left_label), row, 0)
+            form.addWidget(left, row, 1)
+            form.addWidget(QLabel(right_label), row, 2)
+            form.addWidget(right, row, 3)
+        layout.addLayout(form)
+
+        actions = QHBoxLayout()
+        self._measure_btn = QPushButton("Measure")
+        self._measure_btn.clicked.connect(self.measure)
+        actions.addWidget(self._measure_btn)
+        self._add_signals_btn = QPushButton("Add as Signals")
+        self._add_signals_btn.setToolTip("Plot each per-cycle metric held over its cycle")
+        self._add_signals_btn.setEnabled(False)
+        self._add_signals_btn.clicked.connect(self._on_add_signals)
+        actions.addWidget(self._add_signals_btn)
+        actions.addStretch()
+        layout.addLayout(actions)
+
+        self._summary_label = QLabel("No cycles measured.")
+        self._summary_label.setWordWrap(True)
+        layout.addWidget(self._summary_label)
+
+        self._model = CycleTableModel(self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
+        self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        layout.addWidget(self._table, stretch=1)
+
+    @property
+    def measurements(self) -> CycleMeasurements | None:
+        """Latest measurements, or None."""
+        return self._measurements
+
+    def set_source(self, time: np.ndarray, signals: Mapping[str, np.ndarray]) -> None:
+        """Offer ``signals`` sampled on ``time``; clears previous measurements."""
+        self._time = np.asarray(time, dtype=float)
+        self._signals = signals
+        names = list(signals)
+        for combo, optional in (
+            (self._reference_combo, False),
+            (self._signal_combo, True),
+            (self._v_in_combo, True),
+            (self._i_in_combo, True),
+            (self._v_out_combo, True),
+            (self._i_out_combo, True),
+        ):
+            current = combo.currentText()
+            combo.clear()
+            combo.addItems(([_NONE] if optional else []) + names)
+            index = combo.findText(current)
+            combo.setCurrentIndex(max(0, index))
+        self._show(None, "No cycles measured.")
+
+    def select_reference(self, name: str) -> None:
+        """Use ``name`` as the cycle reference when it is available."""
+        index = self._reference_combo.findText(name)
+        if index >= 0:
+            self._reference_combo.setCurrentIndex(index)
+
+    def _selected(self, combo: QComboBox) -> np.ndarray | None:
+        name = combo.currentText()
+        return None if name in ("", _NONE) else self._signals.get(name)
+
+    def measure(self) -> CycleMeasurements | None:
+        """Measure the selected signals and refresh the table."""
+        reference = self._selected(self._reference_combo)
+        if reference is None:
+            self._show(None, "Select a cycle reference.")
+            return None
+
+        measured = self._signal_combo.currentText()
+        signals = {measured: self._signals[measured]} if self._selected(self._signal_combo) is not None else {}
+        v_in, i_in = self._selected(self._v_in_combo), self._selected(self._i_in_combo)
+        v_out, i_out = self._selected(self._v_out_combo), self._selected(self._i_out_combo)
+        power_in = v_in * i_in if v_in is not None and i_in is not None else None
+        power_out = v_out * i_out if v_out is not None and i_out is not None else None
+
+        try:
+            measurements = measure_cycles(
+                self._time, reference, signals, power_in=power_in, power_out=power_out
+            )
+        except ValueError as exc:
+            self._show(None, str(exc))
+            return None
+
+        if measurements.count == 0:
+            self._show(None, "No complete cycles found in the reference signal.")
+            return None
+        summary = ", ".join(
+            f"{name}: {_format_cell(name, value)}" for name, value in measurements.summary().items()
+        )
+        self._show(measurements, f"{measurements.count} cycles. Average {summary}")
+        return measurements
+
+    def _show(self, measurements: CycleMeasurements | None, summary: str) -> None:
+        self._measurements = measurements
+        self._model.set_measurements(measurements)
+        self._summary_label.setText(summary)
+        self._add_signals_btn.setEnabled(measurements is not None)
+
+    def derived_signals(self) -> dict[str, np.ndarray]:
+        """Per-cycle metrics as sample-and-hold signals on the source time axis."""
+        if self._measurements is None:
+            return {}
+        return {
+            f"CYCLE:{name}": self._measurements.as_signal(name, self._time, hold_edges=True)
+            for name in self._measurements.columns
+        }
+
+    def _on_add_signals(self) -> None:
+        signals = self.derived_signals()
+        if signals:
+            self.derived_signals_requested.emit(signals)
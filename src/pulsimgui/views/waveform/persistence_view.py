@@ -0,0 +1,196 @@
+"""Persistence (eye-diagram) panel for the waveform viewer."""
+
+from __future__ import annotations
+
+from typing import Mapping
+
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtCore import QRectF
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from pulsimgui.services.persistence import (
+    PersistenceAccumulator,
+    PersistenceMap,
+    detect_period,
+)
+from pulsimgui.services.theme_service import Theme
+from pulsimgui.utils.si_prefix import format_si_value, parse_si_value
+from pulsimgui.views.waveform.plot_theme import apply_plot_theme
+
+
+class PersistencePanel(QWidget):
+    """Cycles of one signal folded by the switching period and shown as intensity.
+
+    The period comes from the field when the user typed one, else from the
+    circuit's PWM frequency (:meth:`set_switching_frequency`), else from the
+    signal's own edges. When the source grows (a streamed or extended run),
+    only the new samples are folded in.
+    """
+
+    def __init__(self, theme: Theme | None = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Persistence")
+        self.resize(720, 520)
+
+        self._time = np.empty(0)
+        self._signals: Mapping[str, np.ndarray] = {}
+        self._switching_period: float | None = None
+        self._accumulator: PersistenceAccumulator | None = None
+        self._accumulated_signal: str | None = None
+        self._last_folded_time: float | None = None
+
+        self._setup_ui()
+        if theme is not None:
+            self.apply_theme(theme)
+
+    def _setup_ui(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Signal:"))
+        self._signal_combo = QComboBox()
+        self._signal_combo.setMinimumWidth(160)
+        self._signal_combo.currentTextChanged.connect(self._restart)
+        controls.addWidget(self._signal_combo)
+
+        controls.addWidget(QLabel("Period:"))
+        self._period_edit = QLineEdit()
+        self._period_edit.setPlaceholderText("auto")
+        self._period_edit.setToolTip("Folding period, e.g. 10u (empty = PWM frequency or auto-detect)")
+        self._period_edit.setMaximumWidth(110)
+        self._period_edit.editingFinished.connect(self._restart)
+        controls.addWidget(self._period_edit)
+
+        self._auto_btn = QPushButton("Auto")
+        self._auto_btn.setToolTip("Clear the period and detect it again")
+        self._auto_btn.clicked.connect(self._on_auto_period)
+        controls.addWidget(self._auto_btn)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self._plot_widget = pg.PlotWidget()
+        self._plot_widget.setLabel("bottom", "Phase", units="s")
+        self._plot_widget.setLabel("left", "Value")
+        self._image = pg.ImageItem()
+        self._image.setColorMap(pg.colormap.get("inferno"))
+        self._plot_widget.addItem(self._image)
+        layout.addWidget(self._plot_widget, stretch=1)
+
+        self._status_label = QLabel("No signal.")
+        layout.addWidget(self._status_label)
+
+    @property
+    def persistence_map(self) -> PersistenceMap | None:
+        """Map currently displayed, or None."""
+        if self._accumulator is None or self._accumulator.consumed == 0:
+            return None
+        return self._accumulator.map
+
+    def set_source(self, time: np.ndarray, signals: Mapping[str, np.ndarray]) -> None:
+        """Fold ``signals`` sampled on ``time``.
+
+        When ``time`` extends the record folded so far, only the new samples
+        are processed; any other record starts a fresh map.
+        """
+        time = np.asarray(time, dtype=float)
+        consumed = self._accumulator.consumed if self._accumulator is not None else 0
+        extends = (
+            consumed > 0
+            and len(time) > consumed
+            and float(time[consumed - 1]) == self._last_folded_time
+        )
+        self._time = time
+        self._signals = signals
+
+        current = self._signal_combo.currentText()
+        self._signal_combo.blockSignals(True)
+        self._signal_combo.clear()
+        self._signal_combo.addItems(list(signals))
+        self._signal_combo.setCurrentIndex(max(0, self._signal_combo.findText(current)))
+        self._signal_combo.blockSignals(False)
+
+        if not (extends and self._signal_combo.currentText() == self._accumulated_signal):
+            self._accumulator = None
+        self.refresh()
+
+    def select_signal(self, name: str) -> None:
+        """Fold ``name`` when it is one of the source signals."""
+        index = self._signal_combo.findText(name)
+        if index >= 0:
+            self._signal_combo.setCurrentIndex(index)
+
+    def set_switching_frequency(self, frequency: float | None) -> None:
+        """Use the circuit's PWM ``frequency`` (Hz) unless a period was typed."""
+        period = 1.0 / frequency if frequency else None
+        if period != self._switching_period:
+            self._switching_period = period
+            self._restart()
+
+    def _on_auto_period(self) -> None:
+        self._period_edit.clear()
+        self._restart()
+
+    def _restart(self, *_args) -> None:
+        self._accumulator = None
+        self.refresh()
+
+    def _resolve_period(self, values: np.ndarray) -> float | None:
+        text = self._period_edit.text().strip()
+        if text:
+            try:
+                period = parse_si_value(text)
+            except ValueError:
+                return None
+            return period if period > 0.0 else None
+        if self._switching_period is not None:
+            return self._switching_period
+        return detect_period(self._time, values)
+
+    def refresh(self) -> None:
+        """Fold any samples not folded yet and redraw."""
+        name = self._signal_combo.currentText()
+        values = self._signals.get(name) if name else None
+        if values is None or len(values) != len(self._time) or len(self._time) < 2:
+            self._accumulator = None
+            self._image.clear()
+            self._status_label.setText("No signal.")
+            return
+
+        if self._accumulator is None:
+            period = self._resolve_period(values)
+            if period is None:
+                self._image.clear()
+                self._status_label.setText("No period: enter one or use a periodic signal.")
+                return
+            self._accumulator = PersistenceAccumulator(period)
+            self._accumulated_signal = name
+
+        persistence = self._accumulator.update(self._time, values)
+        self._last_folded_time = float(self._time[self._accumulator.consumed - 1])
+        self._show(persistence)
+
+    def _show(self, persistence: PersistenceMap) -> None:
+        low, high = persistence.value_range
+        self._image.setImage(persistence.intensity(), autoLevels=False, levels=(0.0, 1.0))
+        self._image.setRect(QRectF(0.0, low, persistence.period, high - low))
+        self._plot_widget.setXRange(0.0, persistence.period, padding=0.0)
+        self._plot_widget.setYRange(low, high, padding=0.0)
+        self._status_label.setText(
+            f"{persistence.cycles:.0f} cycles folded, period "
+            f"{format_si_value(persistence.period, 's')}"
+        )
+
+    def apply_theme(self, theme: Theme) -> None:
+        """Apply plot colors from ``theme``."""
+        apply_plot_theme(self._plot_widget, theme)
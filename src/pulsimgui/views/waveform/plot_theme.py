@@ -0,0 +1,21 @@
+"""Theme colors shared by the analysis plot panels."""
+
+from __future__ import annotations
+
+import pyqtgraph as pg
+
+from pulsimgui.services.theme_service import Theme
+
+
+def apply_plot_theme(plot_widget: pg.PlotWidget, theme: Theme) -> None:
+    """Color the background and the left and bottom axes of ``plot_widget``."""
+    c = theme.colors
+    plot_widget.setBackground(c.plot_background)
+    plot_item = plot_widget.getPlotItem()
+    for axis_name in ("left", "bottom"):
+        axis = plot_item.getAxis(axis_name)
+        axis.setPen(pg.mkPen(c.plot_axis))
+        axis.setTextPen(pg.mkPen(c.plot_text))
+
+
+__all__ = ["apply_plot_theme"]
@@ -0,0 +1,216 @@
+"""Spectrum analyzer panel for waveform and scope views."""
+
+from __future__ import annotations
+
+from typing import Mapping
+
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from pulsimgui.services.spectrum import WINDOW_NAMES, Spectrum, SpectrumAnalyzer
+from pulsimgui.services.theme_service import Theme
+from pulsimgui.utils.si_prefix import format_si_value
+from pulsimgui.views.waveform.plot_theme import apply_plot_theme
+
+#: Delay coalescing range updates (cursor drags, zooms) into one recompute.
+SPECTRUM_UPDATE_DELAY_MS = 60
+
+
+class SpectrumPanel(QWidget):
+    """Amplitude spectrum, harmonics and THD of one signal over a time range.
+
+    The host window feeds the signals with :meth:`set_source` and the
+    analysed range with :meth:`set_range`, typically the cursor span or the
+    visible window. Spectra are cached by :class:`SpectrumAnalyzer`, so
+    revisiting a range or switching back to a signal is free.
+    """
+
+    def __init__(self, theme: Theme | None = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Spectrum")
+        self.resize(720, 520)
+
+        self._analyzer = SpectrumAnalyzer()
+        self._time = np.empty(0)
+        self._signals: Mapping[str, np.ndarray] = {}
+        self._range: tuple[float | None, float | None] = (None, None)
+        self._spectrum: Spectrum | None = None
+
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(SPECTRUM_UPDATE_DELAY_MS)
+        self._update_timer.timeout.connect(self.refresh)
+
+        self._setup_ui()
+        if theme is not None:
+            self.apply_theme(theme)
+
+    def _setup_ui(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Signal:"))
+        self._signal_combo = QComboBox()
+        self._signal_combo.setMinimumWidth(160)
+        self._signal_combo.currentTextChanged.connect(self._schedule_refresh)
+        controls.addWidget(self._signal_combo)
+
+        controls.addWidget(QLabel("Window:"))
+        self._window_combo = QComboBox()
+        self._window_combo.addItems(list(WINDOW_NAMES))
+        self._window_combo.currentTextChanged.connect(self._schedule_refresh)
+        controls.addWidget(self._window_combo)
+
+        controls.addWidget(QLabel("Welch segments:"))
+        self._segments_spin = QSpinBox()
+        self._segments_spin.setRange(1, 64)
+        self._segments_spin.setValue(1)
+        self._segments_spin.setToolTip("Average half-overlapping segments (1 = single FFT)")
+        self._segments_spin.valueChanged.connect(self._schedule_refresh)
+        controls.addWidget(self._segments_spin)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self._range_label = QLabel("Range: --")
+        layout.addWidget(self._range_label)
+
+        self._plot_widget = pg.PlotWidget()
+        self._plot_widget.setLabel("bottom", "Frequency", units="Hz")
+        self._plot_widget.setLabel("left", "Amplitude")
+        self._plot_widget.setLogMode(x=False, y=True)
+        self._plot_widget.showGrid(x=True, y=True, alpha=0.3)
+        self._trace = self._plot_widget.plot([], [], pen=pg.mkPen((31, 119, 180), width=1))
+        layout.addWidget(self._plot_widget, stretch=1)
+
+        self._thd_label = QLabel("THD: --")
+        self._thd_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        layout.addWidget(self._thd_label)
+
+        self._harmonics_table = QTableWidget(0, 4)
+        self._harmonics_table.setHorizontalHeaderLabels(["Order", "Frequency", "Amplitude", "% of H1"])
+        self._harmonics_table.verticalHeader().setVisible(False)
+        self._harmonics_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._harmonics_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._harmonics_table.setMaximumHeight(180)
+        layout.addWidget(self._harmonics_table)
+
+    @property
+    def spectrum(self) -> Spectrum | None:
+        """Spectrum currently displayed, or None."""
+        return self._spectrum
+
+    def set_source(self, time: np.ndarray, signals: Mapping[str, np.ndarray]) -> None:
+        """Analyse ``signals`` sampled on ``time``; drops every cached spectrum."""
+        self._time = np.asarray(time, dtype=float)
+        self._signals = signals
+        self._analyzer.clear()
+
+        current = self._signal_combo.currentText()
+        self._signal_combo.blockSignals(True)
+        self._signal_combo.clear()
+        self._signal_combo.addItems(list(signals))
+        index = self._signal_combo.findText(current)
+        self._signal_combo.setCurrentIndex(max(0, index))
+        self._signal_combo.blockSignals(False)
+        self._schedule_refresh()
+
+    def select_signal(self, name: str) -> None:
+        """Show the spectrum of ``name`` when it is one of the source signals."""
+        index = self._signal_combo.findText(name)
+        if index >= 0:
+            self._signal_combo.setCurrentIndex(index)
+
+    def set_range(self, start: float | None, stop: float | None) -> None:
+        """Analyse ``[start, stop]``; None uses the whole record."""
+        if start is not None and stop is not None and stop < start:
+            start, stop = stop, start
+        if (start, stop) != self._range:
+            self._range = (start, stop)
+            self._schedule_refresh()
+
+    def _schedule_refresh(self, *_args) -> None:
+        self._update_timer.start()
+
+    def refresh(self) -> None:
+        """Recompute (or fetch from the cache) and display the spectrum now."""
+        self._update_timer.stop()
+        name = self._signal_combo.currentText()
+        values = self._signals.get(name) if name else None
+        start, stop = self._range
+        self._range_label.setText(
+            "Range: "
+            + ("start" if start is None else format_si_value(start, "s"))
+            + " to "
+            + ("end" if stop is None else format_si_value(stop, "s"))
+        )
+        if values is None:
+            self._show_spectrum(None, "THD: --")
+            return
+
+        try:
+            spectrum = self._analyzer.analyze(
+                name,
+                self._time,
+                values,
+                start=start,
+                stop=stop,
+                window=self._window_combo.currentText(),
+                segments=self._segments_spin.value(),
+            )
+        except ValueError as exc:
+            self._show_spectrum(None, f"THD: -- ({exc})")
+            return
+
+        if spectrum.thd_percent is None:
+            summary = "THD: --"
+        else:
+            summary = (
+                f"THD: {spectrum.thd_percent:.3f} %   "
+                f"Fundamental: {format_si_value(spectrum.fundamental or 0.0, 'Hz')}   "
+                f"Resolution: {format_si_value(spectrum.resolution, 'Hz')}"
+            )
+        self._show_spectrum(spectrum, summary)
+
+    def _show_spectrum(self, spectrum: Spectrum | None, summary: str) -> None:
+        self._spectrum = spectrum
+        self._thd_label.setText(summary)
+        if spectrum is None:
+            self._trace.setData([], [])
+            self._harmonics_table.setRowCount(0)
+            return
+
+        # Log axes cannot show zeros; clamp to a floor far below the peak.
+        floor = max(float(np.max(spectrum.amplitudes)) * 1e-12, 1e-300)
+        self._trace.setData(spectrum.frequencies, np.maximum(spectrum.amplitudes, floor))
+
+        fundamental = spectrum.harmonics[0].amplitude if spectrum.harmonics else 0.0
+        self._harmonics_table.setRowCount(len(spectrum.harmonics))
+        for row, harmonic in enumerate(spectrum.harmonics):
+            ratio = 100.0 * harmonic.amplitude / fundamental if fundamental > 0.0 else 0.0
+            cells = (
+                str(harmonic.order),
+                format_si_value(harmonic.frequency, "Hz"),
+                format_si_value(harmonic.amplitude),
+                f"{ratio:.3f}",
+            )
+            for column, text in enumerate(cells):
+                self._harmonics_table.setItem(row, column, QTableWidgetItem(text))
+
+    def apply_theme(self, theme: Theme) -> None:
+        """Apply plot colors from ``theme``."""
+        apply_plot_theme(self._plot_widget, theme)
@@ -0,0 +1,264 @@
+"""Trigger controls for triggered streaming displays."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
+    QFormLayout,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QSpinBox,
+    QVBoxLayout,
+    QWidget,
+)
+
+from pulsimgui.services.scope_trigger import (
+    TRIGGER_MODES,
+    TRIGGER_SLOPES,
+    StreamTrigger,
+    TriggerSettings,
+)
+from pulsimgui.utils.si_prefix import parse_si_value
+
+
+class TriggerPanel(QWidget):
+    """Edge trigger settings for a streaming plot.
+
+    Emits :attr:`settings_changed` with a :class:`TriggerSettings`, or None
+    when triggering is switched off or the fields do not parse.
+    """
+
+    settings_changed = Signal(object)
+    rearm_requested = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Trigger")
+        self._setup_ui()
+
+    def _setup_ui(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+
+        self._enabled_check = QCheckBox("Trigger live display")
+        self._enabled_check.setToolTip("Show only the window around each trigger while streaming")
+        self._enabled_check.toggled.connect(self._emit_settings)
+        layout.addWidget(self._enabled_check)
+
+        form = QFormLayout()
+        self._source_combo = QComboBox()
+        self._source_combo.setMinimumWidth(160)
+        self._source_combo.currentTextChanged.connect(self._emit_settings)
+        form.addRow("Source:", self._source_combo)
+
+        self._slope_combo = QComboBox()
+        self._slope_combo.addItems([slope.capitalize() for slope in TRIGGER_SLOPES])
+        self._slope_combo.currentIndexChanged.connect(self._emit_settings)
+        form.addRow("Slope:", self._slope_combo)
+
+        self._level_edit = QLineEdit("0")
+        self._level_edit.setToolTip("Trigger level, e.g. 2.5 or 500m")
+        self._level_edit.editingFinished.connect(self._emit_settings)
+        form.addRow("Level:", self._level_edit)
+
+        self._window_edit = QLineEdit("100u")
+        self._window_edit.setToolTip("Displayed time span, e.g. 50u")
+        self._window_edit.editingFinished.connect(self._emit_settings)
+        form.addRow("Window:", self._window_edit)
+
+        self._pre_spin = QSpinBox()
+        self._pre_spin.setRange(0, 100)
+        self._pre_spin.setValue(25)
+        self._pre_spin.setSuffix(" %")
+        self._pre_spin.setToolTip("Part of the window shown before the trigger")
+        self._pre_spin.valueChanged.connect(self._emit_settings)
+        form.addRow("Pre-trigger:", self._pre_spin)
+
+        self._holdoff_edit = QLineEdit("0")
+        self._holdoff_edit.setToolTip("Minimum time between triggers, e.g. 20u")
+        self._holdoff_edit.editingFinished.connect(self._emit_settings)
+        form.addRow("Holdoff:", self._holdoff_edit)
+
+        self._mode_combo = QComboBox()
+        self._mode_combo.addItems([mode.capitalize() for mode in TRIGGER_MODES])
+        self._mode_combo.currentIndexChanged.connect(self._emit_settings)
+        form.addRow("Mode:", self._mode_combo)
+        layout.addLayout(form)
+
+        buttons = QHBoxLayout()
+        self._arm_btn = QPushButton("Arm")
+        self._arm_btn.setToolTip("Wait for the next trigger (Single mode)")
+        self._arm_btn.clicked.connect(self.rearm_requested.emit)
+        buttons.addWidget(self._arm_btn)
+        buttons.addStretch()
+        layout.addLayout(buttons)
+
+        self._status_label = QLabel("Off")
+        layout.addWidget(self._status_label)
+        layout.addStretch()
+
+    def set_sources(self, names: list[str]) -> None:
+        """Offer ``names`` as trigger sources, keeping the current choice."""
+        current = self._source_combo.currentText()
+        if [self._source_combo.itemText(i) for i in range(self._source_combo.count())] == names:
+            return
+        self._source_combo.blockSignals(True)
+        self._source_combo.clear()
+        self._source_combo.addItems(names)
+        self._source_combo.setCurrentIndex(max(0, self._source_combo.findText(current)))
+        self._source_combo.blockSignals(False)
+        if self._source_combo.currentText() != current:
+            self._emit_settings()
+
+    def set_settings(self, settings: TriggerSettings | None) -> None:
+        """Show ``settings`` in the fields; None switches triggering off."""
+        widgets = (
+            self._enabled_check,
+            self._source_combo,
+            self._slope_combo,
+            self._level_edit,
+            self._window_edit,
+            self._pre_spin,
+            self._holdoff_edit,
+            self._mode_combo,
+        )
+        for widget in widgets:
+            widget.blockSignals(True)
+        self._enabled_check.setChecked(settings is not None)
+        if settings is not None:
+            if self._source_combo.findText(settings.source) < 0:
+                self._source_combo.addItem(settings.source)
+            self._source_combo.setCurrentText(settings.source)
+            self._slope_combo.setCurrentIndex(TRIGGER_SLOPES.index(settings.slope))
+            self._level_edit.setText(f"{settings.level:g}")
+            self._window_edit.setText(f"{settings.window:g}")
+            self._pre_spin.setValue(round(settings.pre_trigger * 100))
+            self._holdoff_edit.setText(f"{settings.holdoff:g}")
+            self._mode_combo.setCurrentIndex(TRIGGER_MODES.index(settings.mode))
+        for widget in widgets:
+            widget.blockSignals(False)
+
+    def settings(self) -> TriggerSettings | None:
+        """Settings entered in the fields, or None when off or invalid."""
+        source = self._source_combo.currentText()
+        if not self._enabled_check.isChecked() or not source:
+            return None
+        try:
+            return TriggerSettings(
+                source=source,
+                level=parse_si_value(self._level_edit.text().strip() or "0"),
+                slope=TRIGGER_SLOPES[self._slope_combo.currentIndex()],
+                mode=TRIGGER_MODES[self._mode_combo.currentIndex()],
+                window=parse_si_value(self._window_edit.text().strip()),
+                pre_trigger=self._pre_spin.value() / 100.0,
+                holdoff=parse_si_value(self._holdoff_edit.text().strip() or "0"),
+            )
+        except ValueError:
+            return None
+
+    def set_status(self, text: str) -> None:
+        """Show ``text`` below the controls (sweep count, armed state)."""
+        self._status_label.setText(text)
+
+    def _emit_settings(self, *_args) -> None:
+        settings = self.settings()
+        if settings is None:
+            self.set_status("Off" if not self._enabled_check.isChecked() else "Invalid settings")
+        else:
+            self.set_status("Armed")
+        self.settings_changed.emit(settings)
+
+
+class TriggerControls:
+    """Trigger of a streaming display and its settings window.
+
+    Shared by the waveform viewer and the scope windows, which only decide
+    what switching the trigger on or off means for their own buffers.
+
+    Args:
+        parent: Widget owning the settings window.
+        sources: Returns the signal names offered as trigger sources.
+        set_trigger: The display's ``set_trigger``, called when the
+            settings window changes the trigger.
+        rearm: The display's ``rearm_trigger``, called by the Arm button.
+    """
+
+    def __init__(
+        self,
+        parent: QWidget,
+        sources: Callable[[], list[str]],
+        set_trigger: Callable[[TriggerSettings | None], None],
+        rearm: Callable[[], None],
+    ) -> None:
+        self._parent = parent
+        self._sources = sources
+        self._set_trigger = set_trigger
+        self._rearm = rearm
+        self.trigger: StreamTrigger | None = None
+        self.panel: TriggerPanel | None = None
+
+    @property
+    def settings(self) -> TriggerSettings | None:
+        """Current trigger settings, or None when triggering is off."""
+        return self.trigger.settings if self.trigger is not None else None
+
+    def apply(self, settings: TriggerSettings | None) -> bool:
+        """Switch the trigger to ``settings`` and show them in the window.
+
+        Returns:
+            True when triggering was switched on or off, False when only the
+            settings of a running trigger changed.
+        """
+        switched = (settings is None) != (self.trigger is None)
+        if settings is None:
+            self.trigger = None
+        elif self.trigger is None:
+            self.trigger = StreamTrigger(settings)
+        else:
+            self.trigger.settings = settings
+        if self.panel is not None:
+            if self.panel.settings() != settings:
+                self.panel.set_settings(settings)
+            self.panel.set_status(self.status())
+        return switched
+
+    def rearm(self) -> None:
+        """Arm the trigger again after a Single sweep."""
+        if self.trigger is not None:
+            self.trigger.rearm()
+
+    def status(self) -> str:
+        """Sweep count and armed state, as shown in the window."""
+        trigger = self.trigger
+        if trigger is None:
+            return "Off"
+        if not trigger.armed:
+            return f"Stopped ({trigger.sweeps} sweeps)"
+        return f"Armed ({trigger.sweeps} sweeps)"
+
+    def refresh_panel(self) -> None:
+        """Update the sources and status of an open settings window."""
+        if self.panel is not None:
+            self.panel.set_sources(self._sources())
+            self.panel.set_status(self.status())
+
+    def show(self) -> TriggerPanel:
+        """Open (or raise) the trigger settings window."""
+        if self.panel is None:
+            self.panel = TriggerPanel(parent=self._parent)
+            self.panel.setWindowFlag(Qt.WindowType.Window, True)
+            self.panel.settings_changed.connect(self._set_trigger)
+            self.panel.rearm_requested.connect(self._rearm)
+        self.panel.set_sources(self._sources())
+        self.panel.set_settings(self.settings)
+        self.panel.set_status(self.status())
+        self.panel.show()
+        self.panel.raise_()
+        return self.panel
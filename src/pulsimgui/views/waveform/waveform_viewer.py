@@ -1,9 +1,15 @@
 """Waveform viewer widget for displaying simulation results."""
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import Sequence
+
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtCore import Qt, Signal, QTimer, QMimeData
-from PySide6.QtGui import QDrag, QColor, QPalette
+from PySide6.QtCore import Qt, Signal, QTimer, QMimeData, QEventLoop
+from PySide6.QtGui import QCloseEvent, QDrag, QColor, QPalette
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -11,6 +17,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QComboBox,
     QLabel,
+    QMenu,
     QCheckBox,
     QGroupBox,
     QSplitter,
@@ -26,8 +33,21 @@ from PySide6.QtWidgets import (
     QTableWidgetItem,
 )
 
+from pulsimgui.services.result_store import (
+    PYRAMID_BASE,
+    PYRAMID_FACTOR,
+    MinMaxPyramid,
+    ResultStore,
+)
+from pulsimgui.services.run_history import RunHistory
+from pulsimgui.services.scope_trigger import TriggeredFrame, TriggerSettings
 from pulsimgui.services.simulation_service import SimulationResult
 from pulsimgui.services.theme_service import ThemeService, Theme
+from pulsimgui.views.waveform.cycle_view import CycleMeasurementsPanel
+from pulsimgui.views.waveform.persistence_view import PersistencePanel
+from pulsimgui.views.waveform.spectrum_view import SpectrumPanel
+from pulsimgui.views.waveform.trigger_view import TriggerControls, TriggerPanel
+from pulsimgui.views.waveform.xy_view import XYPlotPanel
 
 
 # Maximum points to display before decimation kicks in
@@ -56,6 +76,245 @@ CURSOR_COLORS = [
     (0, 0, 255),     # Blue for cursor 2
 ]
 
+# Cursor readouts are recomputed at most once per display frame (~60 Hz)
+CURSOR_UPDATE_INTERVAL_MS = 16
+# Results with more samples than this (time points x signals) prepare their
+# arrays, statistics and display decimation off the GUI thread
+BACKGROUND_CACHE_SAMPLES = 250_000
+# Animated reveal of a finished run: about four seconds at 60 Hz, but never
+# more than ANIMATION_FRAME_BUDGET new samples per frame, and never more than
+# ANIMATION_MAX_POINTS drawn points per trace
+ANIMATION_FRAME_INTERVAL_MS = 16
+ANIMATION_FRAMES = 240
+ANIMATION_FRAME_BUDGET = 1 << 18
+ANIMATION_MAX_POINTS = MAX_DISPLAY_POINTS
+
+
+def signal_statistics(values: np.ndarray) -> dict[str, float]:
+    """Min, max, mean, RMS and peak-to-peak of the finite samples of ``values``."""
+    finite = values[np.isfinite(values)] if not np.all(np.isfinite(values)) else values
+    if finite.size == 0:
+        nan = float("nan")
+        return {"min": nan, "max": nan, "mean": nan, "rms": nan, "pkpk": nan}
+    min_val = float(np.min(finite))
+    max_val = float(np.max(finite))
+    return {
+        "min": min_val,
+        "max": max_val,
+        "mean": float(np.mean(finite)),
+        "rms": float(np.sqrt(np.mean(finite**2))),
+        "pkpk": max_val - min_val,
+    }
+
+
+def decimate_min_max(
+    time: np.ndarray, values: np.ndarray, max_points: int = MAX_DISPLAY_POINTS
+) -> tuple[np.ndarray, np.ndarray]:
+    """Min-max bucket decimation for display, preserving peaks.
+
+    Each bucket contributes its minimum and maximum sample in time order.
+    Buckets are reduced with one ``argmin``/``argmax`` over a reshaped view.
+    """
+    n_points = len(time)
+    if n_points <= max_points:
+        return time, values
+
+    n_buckets = max_points // 2  # Each bucket contributes 2 points (min, max)
+    bucket_size = n_points // n_buckets
+    buckets = values[: n_buckets * bucket_size].reshape(n_buckets, bucket_size)
+    starts = np.arange(n_buckets) * bucket_size
+    lo = starts + np.argmin(buckets, axis=1)
+    hi = starts + np.argmax(buckets, axis=1)
+    index = np.column_stack((np.minimum(lo, hi), np.maximum(lo, hi))).ravel()
+    return time[index], values[index]
+
+
+@dataclass
+class PreparedSignal:
+    """Arrays of one signal ready for display and measurement.
+
+    Attributes:
+        values: Full-resolution samples.
+        statistics: Output of :func:`signal_statistics`.
+        display_time: Decimated time axis for plotting.
+        display_values: Decimated samples for plotting.
+    """
+
+    values: np.ndarray
+    statistics: dict[str, float]
+    display_time: np.ndarray
+    display_values: np.ndarray
+
+
+def prepare_signal(time: np.ndarray, raw: Sequence[float] | np.ndarray) -> PreparedSignal | None:
+    """Convert, measure and decimate one signal; None when it does not match ``time``.
+
+    Pure NumPy, so it runs equally on the GUI thread or a worker thread.
+    """
+    values = np.asarray(raw, dtype=float)
+    if len(values) != len(time) or len(values) == 0:
+        return None
+    display_time, display_values = decimate_min_max(time, values)
+    return PreparedSignal(values, signal_statistics(values), display_time, display_values)
+
+
+def interpolate_at(
+    time: np.ndarray,
+    signals: Sequence[np.ndarray],
+    times: Sequence[float],
+) -> np.ndarray:
+    """Linearly interpolate many signals sharing ``time`` at a few instants.
+
+    One ``searchsorted`` locates every instant on the shared time axis. Only
+    the two bracketing samples of each signal are gathered, and one
+    vectorized blend interpolates the whole ``(signals, instants)`` block.
+    The cost is therefore nearly independent of signal length and count.
+
+    Args:
+        time: Monotonic time axis shared by all signals.
+        signals: Arrays with the same length as ``time``.
+        times: Instants to sample.
+
+    Returns:
+        Array of shape ``(len(signals), len(times))``. Instants outside the
+        time axis are NaN.
+    """
+    times = np.asarray(times, dtype=float)
+    out = np.full((len(signals), times.size), np.nan)
+    n = len(time)
+    if n == 0 or not signals or times.size == 0:
+        return out
+
+    inside = (times >= time[0]) & (times <= time[-1])
+    if n == 1:
+        out[:, inside] = np.array([values[0] for values in signals], dtype=float)[:, None]
+        return out
+
+    upper = np.clip(np.searchsorted(time, times), 1, n - 1)
+    lower = upper - 1
+    t0, t1 = time[lower], time[upper]
+    span = t1 - t0
+    frac = np.divide(times - t0, span, out=np.zeros_like(times), where=span > 0)
+
+    pairs = np.concatenate((lower, upper))
+    gathered = np.array([values[pairs] for values in signals], dtype=float)
+    v0, v1 = gathered[:, : times.size], gathered[:, times.size :]
+    out[:, inside] = (v0 + (v1 - v0) * frac)[:, inside]
+    return out
+
+
+def resample_to_window(
+    time: np.ndarray,
+    values: np.ndarray,
+    start: float,
+    stop: float,
+    pixels: int,
+    pyramid: MinMaxPyramid | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Samples of one series over ``[start, stop]`` at the plot's pixel resolution.
+
+    Only the samples inside the window are read, so memory-mapped records
+    stay on disk. When they outnumber the pixels, each pixel column keeps
+    its minimum and maximum at the column centre. Runs with different time
+    bases then share one grid and keep their peaks. With the series'
+    ``pyramid``, wide windows are reduced from the coarsest level that still
+    has two buckets per pixel instead of from every sample.
+    """
+    n_points = len(time)
+    if n_points == 0 or not stop > start:
+        return np.empty(0), np.empty(0)
+    pixels = max(int(pixels), 1)
+    lo = int(np.searchsorted(time, start, side="left"))
+    hi = int(np.searchsorted(time, stop, side="right"))
+    if hi - lo <= 2 * pixels:
+        # Sparse window: the samples themselves, plus one neighbour per side
+        # so the line reaches the edges of the plot.
+        lo, hi = max(lo - 1, 0), min(hi + 1, n_points)
+        return np.asarray(time[lo:hi], dtype=float), np.asarray(values[lo:hi], dtype=float)
+
+    level = pyramid.level_for(hi - lo, 2 * pixels) if pyramid is not None else None
+    if level is None:
+        t = np.asarray(time[lo:hi], dtype=float)
+        low = high = np.asarray(values[lo:hi], dtype=float)
+    else:
+        first, last = lo // level.bucket, -(-hi // level.bucket)
+        t = level.time[first:last]
+        low, high = level.lows[first:last], level.highs[first:last]
+    width = (stop - start) / pixels
+    # A bucket straddling the window start falls into the first column.
+    column = np.clip(((t - start) / width).astype(np.int64), 0, pixels - 1)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(column)) + 1))
+    centres = start + (column[starts] + 0.5) * width
+    lows = np.minimum.reduceat(low, starts)
+    highs = np.maximum.reduceat(high, starts)
+    return np.repeat(centres, 2), np.column_stack((lows, highs)).ravel()
+
+
+def reveal_bucket(n_samples: int, max_points: int = ANIMATION_MAX_POINTS) -> int:
+    """Samples per min/max bucket when animating ``n_samples`` into view.
+
+    One when the raw samples fit ``max_points``, otherwise the finest
+    :class:`MinMaxPyramid` bucket size whose envelope fits.
+    """
+    if n_samples <= max_points:
+        return 1
+    bucket = PYRAMID_BASE
+    while 2 * -(-n_samples // bucket) > max_points:
+        bucket *= PYRAMID_FACTOR
+    return bucket
+
+
+def reveal_envelope(
+    time: np.ndarray, values: np.ndarray, bucket: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Minimum and maximum of every ``bucket`` samples, in time order.
+
+    Unlike :func:`decimate_min_max` a short last bucket is kept, so blocks
+    reduced one after another join into the envelope of the whole run.
+    """
+    if bucket == 1:
+        return np.asarray(time, dtype=float), np.asarray(values, dtype=float)
+    values = np.asarray(values, dtype=float)
+    n_buckets = -(-len(values) // bucket)
+    buckets = values
+    if len(values) % bucket:
+        # Pad the short bucket with its own first sample, which argmin and
+        # argmax never prefer over it.
+        buckets = np.empty(n_buckets * bucket)
+        buckets[: len(values)] = values
+        buckets[len(values) :] = values[(n_buckets - 1) * bucket]
+    buckets = buckets.reshape(n_buckets, bucket)
+    starts = np.arange(n_buckets) * bucket
+    lo = starts + np.argmin(buckets, axis=1)
+    hi = starts + np.argmax(buckets, axis=1)
+    index = np.column_stack((np.minimum(lo, hi), np.maximum(lo, hi))).ravel()
+    return np.asarray(time, dtype=float)[index], values[index]
+
+
+@dataclass
+class _Reveal:
+    """State of an animated reveal of a finished run.
+
+    Each signal's envelope at ``bucket`` samples per bucket is appended to
+    preallocated buffers, and traces draw views of their first ``filled``
+    points. A frame therefore reduces at most ``step`` new samples and draws
+    at most the envelope, however far the reveal has progressed.
+    """
+
+    time: np.ndarray
+    signals: dict[str, np.ndarray]
+    bucket: int
+    step: int
+    display_time: dict[str, np.ndarray]
+    display_values: dict[str, np.ndarray]
+    revealed: int = 0
+    filled: int = 0
+    frames: int = 0
+
+
+def _finite_or_none(value: float) -> float | None:
+    return float(value) if np.isfinite(value) else None
+
 
 class DraggableCursor(pg.InfiniteLine):
     """A draggable vertical cursor line."""
@@ -864,7 +1123,23 @@ class SignalListPanel(QFrame):
 
 
 class WaveformViewer(QWidget):
-    """Widget for displaying simulation waveforms using PyQtGraph."""
+    """Widget for displaying simulation waveforms using PyQtGraph.
+
+    Signals:
+        caches_ready: Emitted once every signal of the current result has
+            been converted, measured and decimated for display.
+        reference_import_requested: Emitted when the user asks to import a
+            reference waveform file from the Compare menu.
+        references_changed: Emitted with the labels of the overlaid
+            reference records whenever one is added or removed.
+    """
+
+    caches_ready = Signal()
+    reference_import_requested = Signal()
+    references_changed = Signal(list)
+    # Cross-thread delivery of background cache results: (generation, name, payload)
+    _signal_prepared = Signal(int, str, object)
+    _caches_finished = Signal(int)
 
     def __init__(self, theme_service: ThemeService | None = None, parent=None):
         super().__init__(parent)
@@ -883,6 +1158,16 @@ class WaveformViewer(QWidget):
         self._time_array: np.ndarray | None = None
         self._signal_arrays: dict[str, np.ndarray] = {}
         self._signal_statistics: dict[str, dict[str, float]] = {}
+        self._display_cache: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+        # Large results are prepared by a background job; every set_result
+        # bumps the generation so results of superseded jobs are dropped
+        self._cache_generation = 0
+        self._cache_executor: ThreadPoolExecutor | None = None
+        self._cache_pending = False
+        self._pending_traces: list[str] = []
+        self._signal_prepared.connect(self._on_signal_prepared)
+        self._caches_finished.connect(self._on_caches_finished)
 
         # Cursors
         self._cursor1: DraggableCursor | None = None
@@ -899,8 +1184,10 @@ class WaveformViewer(QWidget):
 
         # Streaming data buffers
         self._streaming = False
-        self._streaming_time: list[float] = []
-        self._streaming_signals: dict[str, list[float]] = {}
+        # Lists while samples stream in; a finished reveal leaves its arrays
+        # here, turned into lists only if more samples are appended
+        self._streaming_time: list[float] | np.ndarray = []
+        self._streaming_signals: dict[str, list[float] | np.ndarray] = {}
         self._streaming_traces: dict[str, pg.PlotDataItem] = {}
         self._auto_scroll = True
         self._scroll_window = 0.001  # Default 1ms window
@@ -912,12 +1199,54 @@ class WaveformViewer(QWidget):
         self._pending_updates = False
         self._last_displayed_index = 0  # Track how much data we've shown
 
+        # Animated reveal of a finished run, one bounded step per frame
+        self._reveal: _Reveal | None = None
+        self._anim_timer = QTimer()
+        self._anim_timer.setInterval(ANIMATION_FRAME_INTERVAL_MS)
+        self._anim_timer.timeout.connect(self._animate_frame)
+
+        # Triggered live display: only the sweep around the latest trigger is drawn
+        self._triggers = TriggerControls(
+            self,
+            lambda: list(self._streaming_signals) or list(self._signal_arrays),
+            self.set_trigger,
+            self.rearm_trigger,
+        )
+        self._trigger_consumed = 0  # Streamed samples already fed to the trigger
+
+        # Throttle for cursor drags: coalesce position events into one readout per frame
+        self._cursor_update_timer = QTimer(self)
+        self._cursor_update_timer.setSingleShot(True)
+        self._cursor_update_timer.setInterval(CURSOR_UPDATE_INTERVAL_MS)
+        self._cursor_update_timer.timeout.connect(self._apply_cursor_move)
+
         # Stats overlay text item (top-right corner of plot)
         self._stats_overlay: pg.TextItem | None = None
         # Hover line and tooltip for mouse-over inspection
         self._hover_vline: pg.InfiniteLine | None = None
         self._hover_tooltip: pg.TextItem | None = None
 
+        # Runs from the history overlaid on the plotted signals, by label.
+        # History runs are kept by id and looked up on each refresh, so an
+        # overlay never keeps an evicted run in memory. Imported references
+        # are overlays too, but draw all of their signals.
+        self._run_history: RunHistory | None = None
+        self._overlay_runs: dict[str, ResultStore] = {}
+        self._overlay_run_ids: dict[str, int] = {}
+        self._reference_labels: set[str] = set()
+        self._overlay_traces: dict[tuple[str, str], pg.PlotDataItem] = {}
+        self._overlay_update_timer = QTimer(self)
+        self._overlay_update_timer.setSingleShot(True)
+        self._overlay_update_timer.setInterval(CURSOR_UPDATE_INTERVAL_MS)
+        self._overlay_update_timer.timeout.connect(self._refresh_overlays)
+
+        # Spectrum analyzer, cycle measurement and persistence windows, created on first use
+        self._spectrum_panel: SpectrumPanel | None = None
+        self._cycle_panel: CycleMeasurementsPanel | None = None
+        self._persistence_panel: PersistencePanel | None = None
+        self._xy_panel: XYPlotPanel | None = None
+        self._switching_frequency: float | None = None
+
         # Configure pyqtgraph
         pg.setConfigOptions(antialias=False)
 
@@ -1071,6 +1400,38 @@ class WaveformViewer(QWidget):
         self._auto_scroll_checkbox.toggled.connect(self._toggle_auto_scroll)
         controls_layout.addWidget(self._auto_scroll_checkbox)
 
+        self._spectrum_btn = QPushButton("Spectrum")
+        self._spectrum_btn.setToolTip("FFT and THD of the cursor span or visible window")
+        self._spectrum_btn.clicked.connect(self.show_spectrum)
+        controls_layout.addWidget(self._spectrum_btn)
+
+        self._cycles_btn = QPushButton("Cycles")
+        self._cycles_btn.setToolTip("Per-switching-cycle ripple, duty, frequency and efficiency")
+        self._cycles_btn.clicked.connect(self.show_cycle_measurements)
+        controls_layout.addWidget(self._cycles_btn)
+
+        self._persistence_btn = QPushButton("Persistence")
+        self._persistence_btn.setToolTip("Fold every switching cycle into one intensity plot")
+        self._persistence_btn.clicked.connect(self.show_persistence)
+        controls_layout.addWidget(self._persistence_btn)
+
+        self._xy_btn = QPushButton("XY")
+        self._xy_btn.setToolTip("Plot one signal against another (B-H loops, I-V trajectories)")
+        self._xy_btn.clicked.connect(self.show_xy_plot)
+        controls_layout.addWidget(self._xy_btn)
+
+        self._trigger_btn = QPushButton("Trigger")
+        self._trigger_btn.setToolTip("Trigger the live display on a signal edge while streaming")
+        self._trigger_btn.clicked.connect(self.show_trigger_controls)
+        controls_layout.addWidget(self._trigger_btn)
+
+        self._compare_btn = QPushButton("Compare")
+        self._compare_btn.setToolTip("Overlay earlier runs or imported reference waveforms")
+        self._compare_menu = QMenu(self._compare_btn)
+        self._compare_menu.aboutToShow.connect(self._populate_compare_menu)
+        self._compare_btn.setMenu(self._compare_menu)
+        controls_layout.addWidget(self._compare_btn)
+
         controls_layout.addStretch()
 
         plot_layout.addWidget(controls)
@@ -1154,12 +1515,12 @@ class WaveformViewer(QWidget):
         # Build tooltip text
         if self._time_array is not None and len(self._time_array) > 0:
             lines = [f"Time: {self._fmt_time(t)}"]
-            for name, values in self._signal_arrays.items():
-                if name not in self._traces:
-                    continue
-                val = self._interpolate_value(self._time_array, values, t)
-                if val is not None:
-                    color = self._signal_list_panel.get_signal_color(name)
+            names = [name for name in self._signal_arrays if name in self._traces]
+            sampled = interpolate_at(
+                self._time_array, [self._signal_arrays[name] for name in names], [t]
+            )
+            for name, val in zip(names, sampled[:, 0]):
+                if np.isfinite(val):
                     lines.append(f"{name}: {val:.6g}")
             self._hover_tooltip.setText("\n".join(lines))
 
@@ -1263,11 +1624,21 @@ class WaveformViewer(QWidget):
         trace.setClipToView(True)
         trace.setDownsampling(auto=True, method="peak")
 
-    def _rebuild_result_caches(self) -> None:
-        """Cache numeric arrays and per-signal statistics for fast cursor/UI updates."""
+    def _clear_result_caches(self) -> None:
         self._time_array = None
         self._signal_arrays = {}
         self._signal_statistics = {}
+        self._display_cache = {}
+        self._pending_traces = []
+
+    def _store_prepared_signal(self, signal_name: str, prepared: PreparedSignal) -> None:
+        self._signal_arrays[signal_name] = prepared.values
+        self._signal_statistics[signal_name] = prepared.statistics
+        self._display_cache[signal_name] = (prepared.display_time, prepared.display_values)
+
+    def _rebuild_result_caches(self) -> None:
+        """Cache numeric arrays and per-signal statistics for fast cursor/UI updates."""
+        self._clear_result_caches()
 
         if not self._result or not self._result.time:
             return
@@ -1278,21 +1649,109 @@ class WaveformViewer(QWidget):
         self._time_array = time
 
         for signal_name, values_raw in self._result.signals.items():
-            values = np.asarray(values_raw, dtype=float)
-            if len(values) != len(time) or len(values) == 0:
-                continue
-            self._signal_arrays[signal_name] = values
-            min_val = float(np.min(values))
-            max_val = float(np.max(values))
-            mean_val = float(np.mean(values))
-            rms_val = float(np.sqrt(np.mean(values ** 2)))
-            self._signal_statistics[signal_name] = {
-                "min": min_val,
-                "max": max_val,
-                "mean": mean_val,
-                "rms": rms_val,
-                "pkpk": max_val - min_val,
-            }
+            prepared = prepare_signal(time, values_raw)
+            if prepared is not None:
+                self._store_prepared_signal(signal_name, prepared)
+
+    @staticmethod
+    def _needs_background_caches(result: SimulationResult) -> bool:
+        return len(result.time) * len(result.signals) > BACKGROUND_CACHE_SAMPLES
+
+    def _start_cache_job(self, result: SimulationResult, priority: list[str]) -> None:
+        """Prepare the result's signals off the GUI thread, ``priority`` first."""
+        if self._cache_executor is None:
+            self._cache_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pulsim-waveform-cache"
+            )
+            # Embedded viewers are destroyed with their window without a close
+            # event of their own; the hook must not reference ``self``
+            self.destroyed.connect(
+                partial(self._cache_executor.shutdown, wait=False, cancel_futures=True)
+            )
+        order = priority + [name for name in result.signals if name not in priority]
+        signals = {name: result.signals[name] for name in order}
+        self._cache_pending = True
+        self._cache_executor.submit(self._prepare_caches, self._cache_generation, result.time, signals)
+
+    def shutdown_background_jobs(self) -> None:
+        """Stop the background cache worker and drop its queued jobs.
+
+        A later :meth:`set_result` starts a new worker when needed.
+        """
+        executor, self._cache_executor = self._cache_executor, None
+        if executor is None:
+            return
+        self._cache_generation += 1  # The running job stops at its next signal
+        self._cache_pending = False
+        self._pending_traces.clear()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def closeEvent(self, event: QCloseEvent) -> None:  # noqa: D401 - Qt override
+        self.shutdown_background_jobs()
+        super().closeEvent(event)
+
+    def _prepare_caches(self, generation: int, raw_time, signals: dict) -> None:
+        """Worker-thread body: prepare each signal and hand it to the GUI thread."""
+        try:
+            time = np.asarray(raw_time, dtype=float)
+            for signal_name, values_raw in signals.items():
+                if generation != self._cache_generation:
+                    return  # Superseded by a newer result
+                prepared = prepare_signal(time, values_raw)
+                if prepared is not None:
+                    self._signal_prepared.emit(generation, signal_name, (time, prepared))
+        finally:
+            try:
+                self._caches_finished.emit(generation)
+            except RuntimeError:
+                pass  # Viewer deleted while the job was running
+
+    def _on_signal_prepared(self, generation: int, signal_name: str, payload: object) -> None:
+        if generation != self._cache_generation:
+            return
+        time, prepared = payload
+        if self._time_array is None:
+            self._time_array = time
+        self._store_prepared_signal(signal_name, prepared)
+
+        if signal_name in self._pending_traces:
+            self._pending_traces.remove(signal_name)
+            first_trace = not self._traces
+            self.add_trace(signal_name)
+            if first_trace:
+                self._auto_range()
+
+    def _on_caches_finished(self, generation: int) -> None:
+        if generation != self._cache_generation:
+            return
+        self._cache_pending = False
+        self._pending_traces.clear()
+        if self._cursor1 is not None and self._cursor2 is not None:
+            self._refresh_measurements_table(self._cursor1.value(), self._cursor2.value())
+        else:
+            self._refresh_measurements_table()
+        self._refresh_analysis_sources()
+        self.caches_ready.emit()
+
+    @property
+    def caches_pending(self) -> bool:
+        """Whether a background job is still preparing the current result."""
+        return self._cache_pending
+
+    def wait_for_caches(self, timeout_ms: int = 5000) -> bool:
+        """Process events until the current result is fully prepared.
+
+        Returns:
+            True when every signal is ready, False on timeout.
+        """
+        if not self._cache_pending:
+            return True
+        loop = QEventLoop()
+        self.caches_ready.connect(loop.quit)
+        QTimer.singleShot(timeout_ms, loop.quit)
+        loop.exec()
+        self.caches_ready.disconnect(loop.quit)
+        return not self._cache_pending
 
     def cursor_state(self) -> tuple[bool, float | None, float | None]:
         """Return cursor enabled flag and current positions."""
@@ -1340,6 +1799,8 @@ class WaveformViewer(QWidget):
             self._cursor1.blockSignals(False)
             self._cursor2.blockSignals(False)
         self._update_cursor_values()
+        self._sync_spectrum_range()
+        self._sync_xy_cursors()
 
     def _clamp_cursor_time(self, value: float) -> float:
         if not self._result or not self._result.time:
@@ -1386,6 +1847,12 @@ class WaveformViewer(QWidget):
         self._refresh_signal_list_colors()
         self._signal_list_panel.apply_theme(theme)
         self._measurements_panel.apply_theme(theme, cursor_palette=self._cursor_palette)
+        if self._spectrum_panel is not None:
+            self._spectrum_panel.apply_theme(theme)
+        if self._persistence_panel is not None:
+            self._persistence_panel.apply_theme(theme)
+        if self._xy_panel is not None:
+            self._xy_panel.apply_theme(theme)
 
         self.setStyleSheet(f"""
             QWidget#WaveformViewerRoot {{
@@ -1469,9 +1936,20 @@ class WaveformViewer(QWidget):
             self._hover_vline.setPen(pg.mkPen(color=c.plot_axis, width=1, style=Qt.PenStyle.DashLine))
 
     def set_result(self, result: SimulationResult) -> None:
-        """Set the simulation result to display."""
+        """Set the simulation result to display.
+
+        Large results are converted, measured and decimated by a background
+        job; their traces appear as each signal becomes ready and
+        :attr:`caches_ready` fires when the job completes.
+        """
         self._result = result
-        self._rebuild_result_caches()
+        self._cache_generation += 1
+        background = self._needs_background_caches(result)
+        if background:
+            self._clear_result_caches()
+        else:
+            self._cache_pending = False
+            self._rebuild_result_caches()
         self._update_signal_combo()
 
         # Clear existing traces and zoom history
@@ -1491,21 +1969,42 @@ class WaveformViewer(QWidget):
             first_signal = signal_names[0]
             self._active_signal = first_signal
 
-            if self._auto_show_all_signals:
-                for signal_name in signal_names:
-                    self.add_trace(signal_name)
-                    self._signal_list_panel.set_signal_visible(signal_name, True)
+            # Auto-add first signal (or all of them) if available
+            initial = signal_names if self._auto_show_all_signals else [first_signal]
+            if background:
+                # Traces are added as the job delivers them, in this order
+                self._pending_traces = list(initial)
+                self._start_cache_job(result, initial)
             else:
-                # Auto-add first signal if available
-                self.add_trace(first_signal)
-                self._signal_list_panel.set_signal_visible(first_signal, True)
+                for signal_name in initial:
+                    self.add_trace(signal_name)
+            for signal_name in initial:
+                self._signal_list_panel.set_signal_visible(signal_name, True)
 
             # Auto-range to fit new data (ensures time axis updates)
-            self._auto_range()
+            if not background:
+                self._auto_range()
         else:
             self._signal_list_panel.clear()
             self._active_signal = None
+            self._cache_pending = False
         self._refresh_measurements_table()
+        if not self._cache_pending:
+            self._refresh_analysis_sources()
+            self.caches_ready.emit()
+
+    def _refresh_analysis_sources(self) -> None:
+        """Hand the prepared arrays to the open spectrum and cycle windows."""
+        if self._spectrum_panel is not None:
+            self._spectrum_panel.set_source(self._time_array, self._signal_arrays)
+            self._sync_spectrum_range()
+        if self._cycle_panel is not None:
+            self._cycle_panel.set_source(self._time_array, self._signal_arrays)
+        if self._persistence_panel is not None and self._persistence_panel.isVisible():
+            self._persistence_panel.set_source(self._time_array, self._signal_arrays)
+        if self._xy_panel is not None:
+            self._xy_panel.set_source(self._time_array, self._signal_arrays)
+            self._sync_xy_cursors()
 
     def _update_signal_combo(self) -> None:
         """Update the signal combo box with available signals."""
@@ -1525,14 +2024,16 @@ class WaveformViewer(QWidget):
             return {}
 
         measurements: dict[str, dict[str, float | None]] = {}
-        time = self._time_array
-        for signal_name, values in self._signal_arrays.items():
-            stats = self._signal_statistics.get(signal_name)
-            if stats is None:
-                continue
-
-            c1_val = self._interpolate_value(time, values, t1) if t1 is not None else None
-            c2_val = self._interpolate_value(time, values, t2) if t2 is not None else None
+        names = [name for name in self._signal_arrays if name in self._signal_statistics]
+        cursor_times = [t for t in (t1, t2) if t is not None]
+        sampled = interpolate_at(
+            self._time_array, [self._signal_arrays[name] for name in names], cursor_times
+        )
+        for row, signal_name in enumerate(names):
+            stats = self._signal_statistics[signal_name]
+            readings = iter(sampled[row])
+            c1_val = _finite_or_none(next(readings)) if t1 is not None else None
+            c2_val = _finite_or_none(next(readings)) if t2 is not None else None
             dv = c2_val - c1_val if c1_val is not None and c2_val is not None else None
             measurements[signal_name] = {
                 "c1": c1_val,
@@ -1557,22 +2058,30 @@ class WaveformViewer(QWidget):
 
     def add_trace(self, signal_name: str) -> None:
         """Add a trace for the specified signal."""
-        if not self._result or signal_name not in self._result.signals:
+        if not self._result or (
+            signal_name not in self._result.signals and signal_name not in self._signal_arrays
+        ):
             return
 
         if signal_name in self._traces:
             return
 
-        raw_time = self._time_array if self._time_array is not None else np.asarray(self._result.time, dtype=float)
-        raw_values = self._signal_arrays.get(signal_name)
-        if raw_values is None:
-            raw_values = np.asarray(self._result.signals[signal_name], dtype=float)
-        time = raw_time
-        values = raw_values
+        if self._cache_pending and signal_name not in self._signal_arrays:
+            # Not prepared yet: plot it when the background job delivers it
+            if signal_name not in self._pending_traces:
+                self._pending_traces.append(signal_name)
+            return
 
-        # Decimate if too many points to prevent GUI freeze
-        if len(time) > MAX_DISPLAY_POINTS:
-            time, values = self._decimate_for_display(time, values)
+        raw_time = self._time_array if self._time_array is not None else np.asarray(self._result.time, dtype=float)
+        display = self._display_cache.get(signal_name)
+        if display is not None:
+            time, values = display
+        else:
+            raw_values = self._signal_arrays.get(signal_name)
+            if raw_values is None:
+                raw_values = np.asarray(self._result.signals[signal_name], dtype=float)
+            # Decimate if too many points to prevent GUI freeze
+            time, values = self._decimate_for_display(raw_time, raw_values)
 
         # Get color from signal list panel if available, otherwise use default
         color = self._signal_list_panel.get_signal_color(signal_name)
@@ -1587,6 +2096,8 @@ class WaveformViewer(QWidget):
         )
         self._configure_trace_performance(trace, len(raw_time))
         self._traces[signal_name] = trace
+        if self._overlay_runs or self._overlay_run_ids:
+            self._refresh_overlays()
 
         # Update statistics
         self._update_statistics(signal_name)
@@ -1602,41 +2113,17 @@ class WaveformViewer(QWidget):
 
         Preserves peaks and visual features while reducing point count.
         """
-        n_points = len(time)
-        if n_points <= MAX_DISPLAY_POINTS:
-            return time, values
-
-        # Calculate bucket size
-        n_buckets = MAX_DISPLAY_POINTS // 2  # Each bucket contributes 2 points (min, max)
-        bucket_size = n_points // n_buckets
-
-        decimated_time = []
-        decimated_values = []
-
-        for i in range(n_buckets):
-            start = i * bucket_size
-            end = min(start + bucket_size, n_points)
-            bucket_values = values[start:end]
-
-            if len(bucket_values) > 0:
-                min_idx = start + np.argmin(bucket_values)
-                max_idx = start + np.argmax(bucket_values)
-
-                # Add min and max in time order
-                if min_idx <= max_idx:
-                    decimated_time.extend([time[min_idx], time[max_idx]])
-                    decimated_values.extend([values[min_idx], values[max_idx]])
-                else:
-                    decimated_time.extend([time[max_idx], time[min_idx]])
-                    decimated_values.extend([values[max_idx], values[min_idx]])
-
-        return np.array(decimated_time), np.array(decimated_values)
+        return decimate_min_max(time, values)
 
     def remove_trace(self, signal_name: str) -> None:
         """Remove a trace from the plot."""
+        if signal_name in self._pending_traces:
+            self._pending_traces.remove(signal_name)
         if signal_name in self._traces:
             self._plot_widget.removeItem(self._traces[signal_name])
             del self._traces[signal_name]
+            if self._overlay_runs or self._overlay_run_ids:
+                self._refresh_overlays()
             if self._active_signal == signal_name:
                 self._active_signal = next(iter(self._traces), None)
             if self._cursor1 is not None and self._cursor2 is not None:
@@ -1649,6 +2136,9 @@ class WaveformViewer(QWidget):
         for trace in self._traces.values():
             self._plot_widget.removeItem(trace)
         self._traces.clear()
+        for overlay in self._overlay_traces.values():
+            self._plot_widget.removeItem(overlay)
+        self._overlay_traces.clear()
         self._color_index = 0
         self._legend.clear()
         self._measurements_panel.clear_statistics()
@@ -1692,6 +2182,290 @@ class WaveformViewer(QWidget):
             self._remove_cursors()
             self._measurements_panel.clear_cursor_measurements()
             self._refresh_measurements_table()
+        self._sync_spectrum_range()
+        self._sync_xy_cursors()
+
+    def show_spectrum(self) -> SpectrumPanel:
+        """Open the spectrum analyzer for the active signal."""
+        if self._spectrum_panel is None:
+            self._spectrum_panel = SpectrumPanel(theme=self._theme, parent=self)
+            self._spectrum_panel.setWindowFlag(Qt.WindowType.Window, True)
+            self._spectrum_panel.set_source(
+                self._time_array if self._time_array is not None else np.empty(0),
+                self._signal_arrays,
+            )
+        if self._active_signal:
+            self._spectrum_panel.select_signal(self._active_signal)
+        self._spectrum_panel.show()
+        self._spectrum_panel.raise_()
+        self._sync_spectrum_range()
+        return self._spectrum_panel
+
+    def show_cycle_measurements(self) -> CycleMeasurementsPanel:
+        """Open the per-cycle measurement table, using the active signal as reference."""
+        if self._cycle_panel is None:
+            self._cycle_panel = CycleMeasurementsPanel(parent=self)
+            self._cycle_panel.setWindowFlag(Qt.WindowType.Window, True)
+            self._cycle_panel.derived_signals_requested.connect(self.add_derived_signals)
+            self._cycle_panel.set_source(
+                self._time_array if self._time_array is not None else np.empty(0),
+                self._signal_arrays,
+            )
+        if self._active_signal:
+            self._cycle_panel.select_reference(self._active_signal)
+        self._cycle_panel.show()
+        self._cycle_panel.raise_()
+        return self._cycle_panel
+
+    def show_xy_plot(self) -> XYPlotPanel:
+        """Open the XY plot with the active signal on the Y axis."""
+        if self._xy_panel is None:
+            self._xy_panel = XYPlotPanel(theme=self._theme, parent=self)
+            self._xy_panel.setWindowFlag(Qt.WindowType.Window, True)
+            self._xy_panel.set_source(
+                self._time_array if self._time_array is not None else np.empty(0),
+                self._signal_arrays,
+            )
+            if self._active_signal:
+                self._xy_panel.select_signals(y_name=self._active_signal)
+        self._xy_panel.show()
+        self._xy_panel.raise_()
+        self._sync_xy_cursors()
+        return self._xy_panel
+
+    def _sync_xy_cursors(self) -> None:
+        """Mark the time cursor positions on the XY trajectory."""
+        panel = self._xy_panel
+        if panel is None:
+            return
+        if self._cursors_visible and self._cursor1 is not None and self._cursor2 is not None:
+            panel.set_cursor_times(
+                [float(self._cursor1.value()), float(self._cursor2.value())],
+                self._cursor_palette,
+            )
+        else:
+            panel.set_cursor_times(None)
+
+    def show_persistence(self) -> PersistencePanel:
+        """Open the persistence view of the active signal."""
+        if self._persistence_panel is None:
+            self._persistence_panel = PersistencePanel(theme=self._theme, parent=self)
+            self._persistence_panel.setWindowFlag(Qt.WindowType.Window, True)
+            self._persistence_panel.set_switching_frequency(self._switching_frequency)
+        self._persistence_panel.set_source(
+            self._time_array if self._time_array is not None else np.empty(0),
+            self._signal_arrays,
+        )
+        if self._active_signal:
+            self._persistence_panel.select_signal(self._active_signal)
+        self._persistence_panel.show()
+        self._persistence_panel.raise_()
+        return self._persistence_panel
+
+    def set_switching_frequency(self, frequency: float | None) -> None:
+        """Set the circuit's PWM frequency (Hz), used to fold persistence views."""
+        self._switching_frequency = frequency or None
+        if self._persistence_panel is not None:
+            self._persistence_panel.set_switching_frequency(self._switching_frequency)
+
+    def set_run_history(self, history: RunHistory | None) -> None:
+        """Offer the runs of ``history`` in the Compare menu."""
+        self._run_history = history
+
+    def _populate_compare_menu(self) -> None:
+        self._compare_menu.clear()
+        runs = [
+            record
+            for record in (self._run_history.runs() if self._run_history is not None else [])
+            if record.result is None or record.result is not self._result
+        ]
+        if not runs:
+            placeholder = self._compare_menu.addAction("No earlier runs")
+            placeholder.setEnabled(False)
+        for record in runs:
+            stamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+            text = f"{record.label} ({stamp})" + ("" if record.in_memory else " [on disk]")
+            action = self._compare_menu.addAction(text)
+            action.setCheckable(True)
+            action.setChecked(self._overlay_run_ids.get(record.label) == record.run_id)
+            action.toggled.connect(
+                lambda checked, run_id=record.run_id, label=record.label: self._toggle_overlay_run(
+                    run_id, label, checked
+                )
+            )
+        self._compare_menu.addSeparator()
+        for label in sorted(self._reference_labels):
+            action = self._compare_menu.addAction(f"{label} [reference]")
+            action.setCheckable(True)
+            action.setChecked(True)
+            action.toggled.connect(lambda checked, label=label: checked or self.remove_overlay(label))
+        self._compare_menu.addAction("Import Reference...", self.reference_import_requested.emit)
+        self._compare_menu.addSeparator()
+        self._compare_menu.addAction("Clear Overlays", self.clear_overlays)
+
+    def _toggle_overlay_run(self, run_id: int, label: str, checked: bool) -> None:
+        if not checked:
+            self.remove_overlay(label)
+            return
+        self.add_run_overlay(label, run_id)
+
+    def overlay_labels(self) -> list[str]:
+        """Labels of the runs and references currently overlaid."""
+        return [*self._overlay_run_ids, *self._overlay_runs]
+
+    def reference_labels(self) -> list[str]:
+        """Labels of the imported references currently overlaid."""
+        return [label for label in self._overlay_runs if label in self._reference_labels]
+
+    def add_overlay(self, label: str, result: SimulationResult) -> None:
+        """Overlay the plotted signals of another run, drawn dashed.
+
+        Each overlay is resampled onto the visible window's pixel grid when
+        the view changes, so records with other time bases or millions of
+        samples cost only what is on screen.
+        """
+        self._overlay_run_ids.pop(label, None)
+        self._overlay_runs[label] = ResultStore.for_result(result)
+        self._refresh_overlays()
+
+    def add_run_overlay(self, label: str, run_id: int) -> None:
+        """Overlay the plotted signals of run ``run_id`` from the run history.
+
+        The run is looked up on each refresh rather than held, so it is
+        still evicted and spilled as the history's limits require. A
+        spilled run is read from its memory-mapped files.
+        """
+        if self._run_history is None or self._run_history.record(run_id) is None:
+            return
+        self._overlay_runs.pop(label, None)
+        self._overlay_run_ids[label] = run_id
+        self._refresh_overlays()
+
+    def add_reference(self, label: str, result: SimulationResult) -> None:
+        """Overlay every signal of an imported reference record, drawn dashed.
+
+        Unlike run overlays, a reference's signals need not match a plotted
+        signal: lab captures are named after probe channels. A signal that
+        does match takes the color of the plotted trace. References are
+        usually memory-mapped (see
+        :func:`~pulsimgui.services.reference_import.load_reference`) and are
+        resampled onto the visible window like any overlay, so only the
+        samples on screen are read from disk.
+        """
+        self._reference_labels.add(label)
+        self.add_overlay(label, result)
+        self.references_changed.emit(self.reference_labels())
+
+    def remove_overlay(self, label: str) -> None:
+        """Stop overlaying the run or reference ``label``."""
+        removed = self._overlay_runs.pop(label, None) is not None
+        if self._overlay_run_ids.pop(label, None) is not None or removed:
+            self._refresh_overlays()
+        if label in self._reference_labels:
+            self._reference_labels.discard(label)
+            self.references_changed.emit(self.reference_labels())
+
+    def clear_overlays(self) -> None:
+        """Remove every overlaid run and reference."""
+        self._overlay_runs.clear()
+        self._overlay_run_ids.clear()
+        self._refresh_overlays()
+        if self._reference_labels:
+            self._reference_labels.clear()
+            self.references_changed.emit([])
+
+    def _overlay_stores(self) -> dict[str, ResultStore]:
+        """Stores of every overlay; history runs that were forgotten are dropped."""
+        stores: dict[str, ResultStore] = {}
+        for label, run_id in list(self._overlay_run_ids.items()):
+            result = self._run_history.peek(run_id) if self._run_history is not None else None
+            if result is None:
+                del self._overlay_run_ids[label]
+            else:
+                stores[label] = ResultStore.for_result(result)
+        stores.update(self._overlay_runs)
+        return stores
+
+    def _refresh_overlays(self) -> None:
+        """Resample each overlaid run onto the visible window of the plotted signals."""
+        self._overlay_update_timer.stop()
+        stores = self._overlay_stores()
+        wanted = {
+            (label, signal_name)
+            for label, store in stores.items()
+            for signal_name in (store.keys() if label in self._reference_labels else self._traces)
+            if signal_name in store
+        }
+        for key in [key for key in self._overlay_traces if key not in wanted]:
+            self._plot_widget.removeItem(self._overlay_traces.pop(key))
+        if not wanted:
+            return
+
+        view_box = self._plot_widget.getViewBox()
+        start, stop = view_box.viewRange()[0]
+        pixels = max(int(view_box.width()), 200)
+        for label, signal_name in sorted(wanted):
+            store = stores[label]
+            values = store.get(signal_name)
+            if values is None or values.shape != store.time.shape:
+                continue
+            x, y = resample_to_window(
+                store.time, values, start, stop, pixels, store.pyramid(signal_name)
+            )
+            item = self._overlay_traces.get((label, signal_name))
+            if item is None:
+                trace = self._traces.get(signal_name)
+                color = self._extract_pen_color(trace) if trace is not None else None
+                if color is None:
+                    index = store.keys().index(signal_name) + len(self._traces)
+                    color = self._trace_palette[index % len(self._trace_palette)]
+                pen = pg.mkPen(color=color, width=1, style=Qt.PenStyle.DashLine)
+                item = self._plot_widget.plot(
+                    x, y, pen=pen, name=f"{signal_name} [{label}]", skipFiniteCheck=True
+                )
+                self._overlay_traces[(label, signal_name)] = item
+            else:
+                item.setData(x, y, skipFiniteCheck=True)
+
+    def add_derived_signals(self, signals: dict[str, np.ndarray]) -> None:
+        """Add signals computed from the current result and plot them.
+
+        Derived signals live alongside the result's own signals until the
+        next :meth:`set_result`; the result itself is not modified.
+        """
+        if self._time_array is None:
+            return
+        for name, raw in signals.items():
+            values = np.asarray(raw, dtype=float)
+            if values.shape != self._time_array.shape:
+                continue
+            self._signal_arrays[name] = values
+            self._display_cache.pop(name, None)
+            if np.isfinite(values).any():
+                self._signal_statistics[name] = signal_statistics(values)
+            if self._signal_combo.findText(name) < 0:
+                self._signal_combo.addItem(name)
+            self.remove_trace(name)
+
+        visible = set(self._signal_list_panel.get_visible_signals()) | set(signals)
+        self._signal_list_panel.set_signals(list(self._signal_arrays))
+        self._refresh_signal_list_colors()
+        for name in self._signal_arrays:
+            self._signal_list_panel.set_signal_visible(name, name in visible)
+        for name in signals:
+            if name in self._signal_arrays:
+                self.add_trace(name)
+
+    def _sync_spectrum_range(self) -> None:
+        """Point the spectrum at the cursor span, or else the visible window."""
+        panel = self._spectrum_panel
+        if panel is None or not panel.isVisible():
+            return
+        if self._cursors_visible and self._cursor1 is not None and self._cursor2 is not None:
+            panel.set_range(float(self._cursor1.value()), float(self._cursor2.value()))
+            return
+        x_range, _y_range = self._plot_widget.getViewBox().viewRange()
+        panel.set_range(float(x_range[0]), float(x_range[1]))
 
     def _create_cursors(self) -> None:
         """Create the two measurement cursors."""
@@ -1735,8 +2509,14 @@ class WaveformViewer(QWidget):
             self._cursor2 = None
 
     def _on_cursor_moved(self, pos: float) -> None:
-        """Handle cursor movement."""
+        """Handle cursor movement; readouts refresh at most once per frame."""
+        if not self._cursor_update_timer.isActive():
+            self._cursor_update_timer.start()
+
+    def _apply_cursor_move(self) -> None:
         self._update_cursor_values()
+        self._sync_spectrum_range()
+        self._sync_xy_cursors()
 
     def _update_cursor_values(self) -> None:
         """Update cursor value displays."""
@@ -1749,7 +2529,7 @@ class WaveformViewer(QWidget):
             self._refresh_measurements_table()
             return
 
-        if self._active_signal not in self._result.signals:
+        if self._active_signal not in self._signal_arrays:
             self._measurements_panel.clear_cursor_measurements()
             self._refresh_measurements_table()
             return
@@ -1763,15 +2543,18 @@ class WaveformViewer(QWidget):
             self._measurements_panel.clear_cursor_measurements()
             self._refresh_measurements_table()
             return
-        time = self._time_array
 
         # Get cursor positions
         t1 = self._cursor1.value()
         t2 = self._cursor2.value()
 
-        # Interpolate values at cursor positions
-        v1 = self._interpolate_value(time, values, t1)
-        v2 = self._interpolate_value(time, values, t2)
+        # One batched interpolation serves the table and the active signal
+        table = self._build_per_signal_measurements(t1, t2)
+        active = table.get(self._active_signal)
+        if active is not None:
+            v1, v2 = active["c1"], active["c2"]
+        else:
+            v1, v2 = (_finite_or_none(v) for v in interpolate_at(self._time_array, [values], [t1, t2])[0])
 
         # Update display
         self._measurements_panel.update_cursor1(t1, v1)
@@ -1781,7 +2564,7 @@ class WaveformViewer(QWidget):
         dt = t2 - t1
         dv = v2 - v1 if v1 is not None and v2 is not None else None
         self._measurements_panel.update_delta(dt, dv, v1, v2)
-        self._refresh_measurements_table(t1, t2)
+        self._measurements_panel.set_multi_signal_measurements(table)
 
         self._update_cursor_label_positions()
 
@@ -1796,34 +2579,6 @@ class WaveformViewer(QWidget):
         if self._cursor2:
             self._cursor2.set_label_y(y_top)
 
-    def _interpolate_value(
-        self, time: np.ndarray, values: np.ndarray, t: float
-    ) -> float | None:
-        """Interpolate signal value at time t."""
-        if len(time) == 0:
-            return None
-
-        if t < time[0] or t > time[-1]:
-            return None
-
-        # Find index
-        idx = np.searchsorted(time, t)
-
-        if idx == 0:
-            return float(values[0])
-        if idx >= len(time):
-            return float(values[-1])
-
-        # Linear interpolation
-        t0, t1 = time[idx - 1], time[idx]
-        v0, v1 = values[idx - 1], values[idx]
-
-        if t1 == t0:
-            return float(v0)
-
-        frac = (t - t0) / (t1 - t0)
-        return float(v0 + frac * (v1 - v0))
-
     def _update_statistics(self, signal_name: str) -> None:
         """Update statistics for the specified signal."""
         stats = self._signal_statistics.get(signal_name)
@@ -1846,6 +2601,9 @@ class WaveformViewer(QWidget):
 
     def _on_range_changed(self) -> None:
         """Handle view range change - record for zoom history."""
+        self._sync_spectrum_range()
+        if self._overlay_runs or self._overlay_run_ids:
+            self._overlay_update_timer.start()
         if not self._recording_zoom:
             return
 
@@ -1920,6 +2678,7 @@ class WaveformViewer(QWidget):
         self._streaming_signals = {}
         self._last_displayed_index = 0
         self._y_range_set = False  # Reset Y auto-range flag
+        self._reset_trigger()
 
         # Clear existing streaming traces
         for trace in self._streaming_traces.values():
@@ -1988,13 +2747,10 @@ class WaveformViewer(QWidget):
                 self._streaming_signals = {
                     name: list(values) for name, values in chunk_signals.items()
                 }
+                self._reset_trigger()
             else:
                 # Append mode (incremental streaming)
-                if not isinstance(self._streaming_time, list):
-                    self._streaming_time = []
-                if not self._streaming_signals:
-                    self._streaming_signals = {}
-
+                self._ensure_list_buffers()
                 self._streaming_time.extend(chunk_time)
                 for name, values in chunk_signals.items():
                     if name not in self._streaming_signals:
@@ -2021,13 +2777,12 @@ class WaveformViewer(QWidget):
             elif "_time" in full_data:
                 self._streaming_time = full_data.get("_time", [])
                 self._streaming_signals = full_data.get("_signals", {})
+            self._reset_trigger()
             self._pending_updates = True
             return
 
         # Mode 4: Legacy single point
-        if not isinstance(self._streaming_time, list):
-            self._streaming_time = []
-
+        self._ensure_list_buffers()
         current_length = len(self._streaming_time)
         # Keep existing series length-aligned with time before appending.
         for series in self._streaming_signals.values():
@@ -2052,6 +2807,14 @@ class WaveformViewer(QWidget):
 
         self._pending_updates = True
 
+    def _ensure_list_buffers(self) -> None:
+        """Make the streaming buffers appendable lists, keeping their samples."""
+        if not isinstance(self._streaming_time, list):
+            self._streaming_time = np.asarray(self._streaming_time, dtype=float).tolist()
+        for name, values in self._streaming_signals.items():
+            if not isinstance(values, list):
+                self._streaming_signals[name] = np.asarray(values, dtype=float).tolist()
+
     @staticmethod
     def _coerce_stream_value(value: object) -> float | None:
         """Convert supported scalar-like values to float for plotting."""
@@ -2070,6 +2833,9 @@ class WaveformViewer(QWidget):
         """Start animated display of complete simulation data.
 
         Uses QTimer for smooth 60 FPS animation without blocking the UI.
+        Traces grow append-only along a min/max envelope at a pyramid bucket
+        size (see :func:`reveal_bucket`), so every frame costs about the same
+        and large runs animate as steadily as small ones.
 
         Args:
             time_array: Complete time data as numpy array
@@ -2079,21 +2845,32 @@ class WaveformViewer(QWidget):
         if time_array is None or len(time_array) == 0:
             return
 
-        # Store the complete data for animation
-        self._anim_time = time_array
-        self._anim_signals = signal_arrays
-        self._anim_total_points = total_points
-        self._anim_current_index = 0
-
-        # Calculate animation parameters (~4 second animation at 60 FPS)
-        animation_duration = 4.0  # seconds (slower, more satisfying animation)
-        fps = 60
-        total_frames = int(animation_duration * fps)
-        self._anim_points_per_frame = max(1, total_points // total_frames)
-        self._anim_frame_count = 0
+        time = np.asarray(time_array, dtype=float)
+        if total_points:
+            time = time[: int(total_points)]
+        n_points = len(time)
+        signals = {
+            name: np.asarray(values, dtype=float)
+            for name, values in signal_arrays.items()
+            if len(values) >= n_points
+        }
+
+        bucket = reveal_bucket(n_points)
+        # Whole buckets per frame, so only the last frame reduces a short one
+        step = max(1, min(-(-n_points // ANIMATION_FRAMES), ANIMATION_FRAME_BUDGET))
+        step = -(-step // bucket) * bucket
+        capacity = n_points if bucket == 1 else 2 * -(-n_points // bucket)
+        self._reveal = _Reveal(
+            time=time,
+            signals={name: values[:n_points] for name, values in signals.items()},
+            bucket=bucket,
+            step=step,
+            display_time={name: np.empty(capacity) for name in signals},
+            display_values={name: np.empty(capacity) for name in signals},
+        )
 
         # Create traces for each signal (if not already present)
-        for name in signal_arrays.keys():
+        for name in signals:
             if name not in self._streaming_traces:
                 color = self._trace_palette[self._color_index % len(self._trace_palette)]
                 self._color_index += 1
@@ -2103,67 +2880,65 @@ class WaveformViewer(QWidget):
                     [], [], pen=pen, name=name,
                     skipFiniteCheck=True,
                 )
-                self._configure_trace_performance(trace, total_points)
+                self._configure_trace_performance(trace, capacity)
                 self._streaming_traces[name] = trace
 
-        # Set up animation timer (separate from regular update timer)
-        if not hasattr(self, '_anim_timer'):
-            self._anim_timer = QTimer()
-            self._anim_timer.timeout.connect(self._animate_frame)
-
-        self._anim_timer.start(16)  # 60 FPS
+        self._anim_timer.start()
 
     def _animate_frame(self) -> None:
-        """Render one frame of the animation."""
-        if not hasattr(self, '_anim_time') or self._anim_time is None:
-            if hasattr(self, '_anim_timer'):
-                self._anim_timer.stop()
-            return
-
-        # Calculate how much data to show this frame
-        self._anim_current_index = min(
-            self._anim_current_index + self._anim_points_per_frame,
-            self._anim_total_points
-        )
+        """Render one frame of the animation.
 
-        # Get current slice of data
-        end_idx = self._anim_current_index
-        time_slice = self._anim_time[:end_idx]
+        Reduces the next ``step`` samples of every signal, appends their
+        envelope to the display buffers and redraws views of the buffers.
+        """
+        reveal = self._reveal
+        if reveal is None:
+            self._anim_timer.stop()
+            return
 
-        # Update each trace with current data slice
-        for name, full_values in self._anim_signals.items():
-            if name in self._streaming_traces:
-                values_slice = full_values[:end_idx]
-                self._streaming_traces[name].setData(time_slice, values_slice)
+        start = reveal.revealed
+        stop = min(start + reveal.step, len(reveal.time))
+        filled = reveal.filled
+        for name, values in reveal.signals.items():
+            t, v = reveal_envelope(reveal.time[start:stop], values[start:stop], reveal.bucket)
+            reveal.display_time[name][filled : filled + len(t)] = t
+            reveal.display_values[name][filled : filled + len(v)] = v
+            reveal.filled = filled + len(t)
+        reveal.revealed = stop
+
+        for name in reveal.signals:
+            trace = self._streaming_traces.get(name)
+            if trace is not None:
+                trace.setData(
+                    reveal.display_time[name][: reveal.filled],
+                    reveal.display_values[name][: reveal.filled],
+                )
 
         # Update X range to show waveform growing
-        if len(time_slice) > 0:
-            t_start = float(time_slice[0])
-            t_current = float(time_slice[-1])
-            t_range = t_current - t_start
-            if t_range > 0:
-                t_end = t_current + t_range * 0.1
-                self._recording_zoom = False
-                self._plot_widget.setXRange(t_start, t_end, padding=0)
-                self._recording_zoom = True
+        t_start = float(reveal.time[0])
+        t_current = float(reveal.time[stop - 1])
+        t_range = t_current - t_start
+        if t_range > 0:
+            t_end = t_current + t_range * 0.1
+            self._recording_zoom = False
+            self._plot_widget.setXRange(t_start, t_end, padding=0)
+            self._recording_zoom = True
 
         # Auto-range Y only on first frame
-        if self._anim_frame_count == 0:
+        if reveal.frames == 0:
             self._plot_widget.enableAutoRange(axis='y')
 
-        self._anim_frame_count += 1
+        reveal.frames += 1
 
         # Check if animation is complete
-        if self._anim_current_index >= self._anim_total_points:
+        if stop >= len(reveal.time):
             self._anim_timer.stop()
-            # Store final data for result display
-            self._streaming_time = self._anim_time.tolist()
-            self._streaming_signals = {
-                name: values.tolist() for name, values in self._anim_signals.items()
-            }
-            # Clean up animation data
-            self._anim_time = None
-            self._anim_signals = None
+            # Hand the full-resolution arrays on as they are; converting them
+            # to lists would stall the last frame. Later appends convert them
+            # once (see _ensure_list_buffers).
+            self._streaming_time = reveal.time
+            self._streaming_signals = dict(reveal.signals)
+            self._reveal = None
 
     def _flush_streaming_data(self) -> None:
         """Flush buffered streaming data to the plot.
@@ -2175,7 +2950,11 @@ class WaveformViewer(QWidget):
             return
 
         time_data = self._streaming_time
-        if not time_data or len(time_data) == 0:
+        if len(time_data) == 0:
+            return
+
+        if self._triggers.trigger is not None:
+            self._flush_triggered_data()
             return
 
         self._pending_updates = False
@@ -2227,6 +3006,93 @@ class WaveformViewer(QWidget):
                 self._plot_widget.enableAutoRange(axis='y')
                 self._y_range_set = True
 
+    def _reset_trigger(self) -> None:
+        """Restart triggering from the beginning of the streamed record."""
+        self._trigger_consumed = 0
+        if self._triggers.trigger is not None:
+            self._triggers.trigger.reset()
+
+    def _flush_triggered_data(self) -> None:
+        """Feed newly streamed samples to the trigger and draw its latest sweep.
+
+        Only samples not seen yet are converted, and only one window is drawn,
+        so a refresh costs the same early and late in a long run.
+        """
+        self._pending_updates = False
+        total = len(self._streaming_time)
+        if total < self._trigger_consumed:
+            self._reset_trigger()
+        start = self._trigger_consumed
+        if total <= start:
+            return
+
+        time_chunk = np.asarray(self._streaming_time[start:total], dtype=np.float64)
+        chunk: dict[str, np.ndarray] = {}
+        for name, values in self._streaming_signals.items():
+            offset = total - len(values)  # Series that appeared late are shorter
+            tail = values[max(start - offset, 0) : total - offset]
+            array = np.asarray(tail, dtype=np.float64).reshape(-1)
+            if array.size < time_chunk.size:
+                padded = np.full(time_chunk.size, np.nan)
+                padded[time_chunk.size - array.size :] = array
+                array = padded
+            chunk[name] = array
+        self._trigger_consumed = total
+
+        frame = self._triggers.trigger.process(time_chunk, chunk)
+        self._triggers.refresh_panel()
+        if frame is not None:
+            self._show_triggered_frame(frame)
+
+    def _show_triggered_frame(self, frame: TriggeredFrame) -> None:
+        for name, values in frame.signals.items():
+            trace = self._streaming_traces.get(name)
+            if trace is None:
+                color = self._trace_palette[self._color_index % len(self._trace_palette)]
+                self._color_index += 1
+                trace = self._plot_widget.plot(
+                    [], [], pen=self._resolve_trace_pen(name, color), name=name,
+                    skipFiniteCheck=True,
+                )
+                self._streaming_traces[name] = trace
+            trace.setData(frame.time, values)
+
+        settings = self._triggers.trigger.settings
+        self._recording_zoom = False
+        self._plot_widget.setXRange(
+            -settings.pre_trigger_time, settings.post_trigger_time, padding=0
+        )
+        self._recording_zoom = True
+        if not getattr(self, "_y_range_set", False):
+            self._plot_widget.enableAutoRange(axis="y")
+            self._y_range_set = True
+
+    @property
+    def trigger_settings(self) -> TriggerSettings | None:
+        """Trigger of the live display, or None when it shows the whole run."""
+        return self._triggers.settings
+
+    def set_trigger(self, settings: TriggerSettings | None) -> None:
+        """Trigger the live display with ``settings``; None shows the whole run.
+
+        While triggered, each refresh draws only the sweep around the latest
+        trigger event, on a time axis relative to the trigger.
+        """
+        if self._triggers.apply(settings):
+            if settings is None:
+                self._trigger_consumed = 0
+            else:
+                self._reset_trigger()
+            self._pending_updates = len(self._streaming_time) > 0
+
+    def rearm_trigger(self) -> None:
+        """Arm the trigger again after a Single sweep."""
+        self._triggers.rearm()
+
+    def show_trigger_controls(self) -> TriggerPanel:
+        """Open (or raise) the trigger settings window."""
+        return self._triggers.show()
+
     def _decimate_data(
         self, time_data: list[float], signals_data: dict[str, list[float]]
     ) -> tuple[list[float], dict[str, list[float]]]:
@@ -2392,6 +3258,8 @@ class WaveformViewer(QWidget):
             result: The complete simulation result
         """
         self.stop_streaming()
+        self._anim_timer.stop()
+        self._reveal = None
 
         # Clear streaming traces
         for trace in self._streaming_traces.values():
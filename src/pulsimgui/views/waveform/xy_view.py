@@ -0,0 +1,214 @@
+"""XY (signal versus signal) panel for the waveform viewer and scopes."""
+
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from pulsimgui.services.theme_service import Theme
+from pulsimgui.utils.si_prefix import format_si_value
+from pulsimgui.views.waveform.plot_theme import apply_plot_theme
+
+#: Points drawn per trajectory after decimation.
+MAX_PATH_POINTS = 20000
+
+_PATH_COLOR = (31, 119, 180)
+
+
+def decimate_path(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_points: int = MAX_PATH_POINTS,
+) -> np.ndarray:
+    """Indices of an XY trajectory thinned evenly along its drawn length.
+
+    Both axes are scaled to unit range before measuring, so kept points are
+    spread evenly over the curve as it appears on screen rather than over
+    time: slow stretches that retrace the same path give up points, fast
+    excursions keep theirs. Non-finite samples are dropped. The first and
+    last samples are always kept.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    finite = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    if finite.size <= max_points:
+        return finite
+
+    fx, fy = x[finite], y[finite]
+    x_scale = float(np.ptp(fx)) or 1.0
+    y_scale = float(np.ptp(fy)) or 1.0
+    distance = np.empty(finite.size)
+    distance[0] = 0.0
+    np.cumsum(np.hypot(np.diff(fx) / x_scale, np.diff(fy) / y_scale), out=distance[1:])
+    if distance[-1] <= 0.0:
+        return finite[[0, -1]]
+
+    targets = np.linspace(0.0, distance[-1], max_points)
+    picks = np.searchsorted(distance, targets, side="left")
+    picks[-1] = finite.size - 1
+    return finite[np.unique(picks)]
+
+
+class XYPlotPanel(QWidget):
+    """One signal plotted against another, with the time cursors marked on the path.
+
+    Useful for B-H loops, I-V trajectories and phase portraits. Long records
+    are thinned with :func:`decimate_path`, while cursor markers are
+    interpolated on the full-resolution samples.
+    """
+
+    def __init__(self, theme: Theme | None = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("XY Plot")
+        self.resize(620, 560)
+
+        self._time = np.empty(0)
+        self._signals: Mapping[str, np.ndarray] = {}
+        self._cursor_times: list[float] = []
+        self._cursor_colors: list[tuple[int, int, int]] = []
+        self._cursor_points: list[tuple[float, float]] = []
+
+        self._setup_ui()
+        if theme is not None:
+            self.apply_theme(theme)
+
+    def _setup_ui(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("X:"))
+        self._x_combo = QComboBox()
+        self._x_combo.setMinimumWidth(140)
+        self._x_combo.currentTextChanged.connect(self.refresh)
+        controls.addWidget(self._x_combo)
+
+        controls.addWidget(QLabel("Y:"))
+        self._y_combo = QComboBox()
+        self._y_combo.setMinimumWidth(140)
+        self._y_combo.currentTextChanged.connect(self.refresh)
+        controls.addWidget(self._y_combo)
+
+        self._swap_btn = QPushButton("Swap")
+        self._swap_btn.setToolTip("Exchange the X and Y signals")
+        self._swap_btn.clicked.connect(self._swap_axes)
+        controls.addWidget(self._swap_btn)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self._plot_widget = pg.PlotWidget()
+        self._plot_widget.showGrid(x=True, y=True, alpha=0.3)
+        self._path = self._plot_widget.plot([], [], pen=pg.mkPen(_PATH_COLOR, width=1.5))
+        self._path.setSkipFiniteCheck(True)
+        self._markers = pg.ScatterPlotItem(size=11, pen=pg.mkPen("w", width=1.5))
+        self._markers.setZValue(10)
+        self._plot_widget.addItem(self._markers)
+        layout.addWidget(self._plot_widget, stretch=1)
+
+        self._status_label = QLabel("No signals.")
+        layout.addWidget(self._status_label)
+
+    @property
+    def cursor_points(self) -> list[tuple[float, float]]:
+        """``(x, y)`` of each cursor on the trajectory."""
+        return list(self._cursor_points)
+
+    def set_source(self, time: np.ndarray, signals: Mapping[str, np.ndarray]) -> None:
+        """Plot from ``signals`` sampled on ``time``, keeping the chosen axes."""
+        self._time = np.asarray(time, dtype=float)
+        self._signals = signals
+        names = list(signals)
+        x_current, y_current = self._x_combo.currentText(), self._y_combo.currentText()
+        for combo, current, fallback in (
+            (self._x_combo, x_current, 0),
+            (self._y_combo, y_current, 1),
+        ):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(names)
+            index = combo.findText(current)
+            combo.setCurrentIndex(index if index >= 0 else min(fallback, len(names) - 1))
+            combo.blockSignals(False)
+        self.refresh()
+
+    def select_signals(self, x_name: str | None = None, y_name: str | None = None) -> None:
+        """Choose the X and/or Y signal by name."""
+        for combo, name in ((self._x_combo, x_name), (self._y_combo, y_name)):
+            if name is not None and combo.findText(name) >= 0:
+                combo.blockSignals(True)
+                combo.setCurrentText(name)
+                combo.blockSignals(False)
+        self.refresh()
+
+    def set_cursor_times(
+        self,
+        times: Sequence[float] | None,
+        colors: Sequence[tuple[int, int, int]] | None = None,
+    ) -> None:
+        """Mark the trajectory at ``times`` (the time cursors); None clears."""
+        self._cursor_times = [float(t) for t in times] if times else []
+        if colors is not None:
+            self._cursor_colors = list(colors)
+        self._update_markers()
+
+    def _swap_axes(self) -> None:
+        x_name, y_name = self._x_combo.currentText(), self._y_combo.currentText()
+        self.select_signals(y_name, x_name)
+
+    def _axes(self) -> tuple[np.ndarray, np.ndarray] | None:
+        x = self._signals.get(self._x_combo.currentText())
+        y = self._signals.get(self._y_combo.currentText())
+        if x is None or y is None or len(x) != len(self._time) or len(y) != len(self._time):
+            return None
+        return np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+
+    def refresh(self, *_args) -> None:
+        """Redraw the trajectory and cursor markers."""
+        axes = self._axes()
+        if axes is None or len(self._time) < 2:
+            self._path.setData([], [])
+            self._markers.setData([])
+            self._cursor_points = []
+            self._status_label.setText("No signals.")
+            return
+
+        x, y = axes
+        keep = decimate_path(x, y)
+        self._path.setData(x[keep], y[keep])
+        self._plot_widget.setLabel("bottom", self._x_combo.currentText())
+        self._plot_widget.setLabel("left", self._y_combo.currentText())
+        self._status_label.setText(
+            f"{len(keep)} of {len(x)} points drawn over "
+            f"{format_si_value(float(self._time[-1] - self._time[0]), 's')}"
+        )
+        self._update_markers()
+
+    def _update_markers(self) -> None:
+        axes = self._axes()
+        self._cursor_points = []
+        if axes is None or len(self._time) < 2 or not self._cursor_times:
+            self._markers.setData([])
+            return
+        x, y = axes
+        spots = []
+        for index, t in enumerate(self._cursor_times):
+            point = (float(np.interp(t, self._time, x)), float(np.interp(t, self._time, y)))
+            self._cursor_points.append(point)
+            color = self._cursor_colors[index % len(self._cursor_colors)] if self._cursor_colors else (255, 0, 0)
+            spots.append({"pos": point, "brush": pg.mkBrush(*color)})
+        self._markers.setData(spots)
+
+    def apply_theme(self, theme: Theme) -> None:
+        """Apply plot colors from ``theme``."""
+        apply_plot_theme(self._plot_widget, theme)
@@ -9,15 +9,30 @@ These tests measure:
 
 from __future__ import annotations
 
+import math
+import os
 import time
 from typing import Callable
 
+import numpy as np
 import pytest
 
+from pulsimgui.services.ac_sweep import ChunkedACExecutor
 from pulsimgui.services.backend_adapter import PlaceholderBackend
-from pulsimgui.services.backend_types import DCSettings, ACSettings
+from pulsimgui.services.backend_types import DCSettings, ACResult, ACSettings
+from pulsimgui.services.cycle_measurements import measure_cycles
+from pulsimgui.services.export_service import ExportService
+from pulsimgui.services.persistence import PersistenceAccumulator
+from pulsimgui.services.reference_import import load_reference
+from pulsimgui.services.result_store import ResultStore
+from pulsimgui.services.scope_trigger import StreamTrigger, TriggerSettings
 from pulsimgui.services.backend_adapter import BackendCallbacks
-from pulsimgui.services.simulation_service import SimulationSettings
+from pulsimgui.services.simulation_service import SimulationResult, SimulationSettings
+from pulsimgui.services.thermal_coupling import heatsink_network
+from pulsimgui.services.thermal_network import ThermalNetworkBatch
+from pulsimgui.views.waveform import WaveformViewer
+from pulsimgui.views.waveform.waveform_viewer import interpolate_at, resample_to_window
+from pulsimgui.views.waveform.xy_view import MAX_PATH_POINTS, decimate_path
 
 from .example_circuits import (
     voltage_divider,
@@ -314,6 +329,480 @@ class TestScalability:
         assert len(result.frequencies) > 100
         print(f"Wide AC sweep ({len(result.frequencies)} points): {elapsed:.2f}ms")
 
+    def test_chunked_ac_sweep_scaling(self) -> None:
+        """Benchmark decade-chunked AC sweeps across worker counts.
+
+        Each frequency point is a real complex solve of a 200-section RC
+        ladder's nodal equations; LAPACK releases the GIL while it
+        factorises, as the native solver does.
+
+        GUI Validation:
+        1. Run AC analysis from 1Hz to 1GHz
+        2. The Bode plot should fill in decade by decade while the sweep runs
+        """
+        sections = 200
+        conductance = np.full(sections, 1e-3)
+        capacitance = np.full(sections, 1e-13)
+        diagonal = np.diag(2 * conductance)
+        diagonal[-1, -1] = conductance[-1]
+        coupling = -np.diag(conductance[1:], 1) - np.diag(conductance[1:], -1)
+        excitation = np.zeros(sections, dtype=complex)
+        excitation[0] = conductance[0]
+
+        def run_chunk(chunk: ACSettings) -> ACResult:
+            decades = math.log10(chunk.f_stop / chunk.f_start)
+            count = max(1, int(round(decades * chunk.points_per_decade)) + 1)
+            freqs = np.logspace(math.log10(chunk.f_start), math.log10(chunk.f_stop), count)
+            response = np.empty(count, dtype=complex)
+            for index, freq in enumerate(freqs):
+                admittance = diagonal + coupling + np.diag(2j * np.pi * freq * capacitance)
+                response[index] = np.linalg.solve(admittance, excitation)[-1]
+            return ACResult(
+                frequencies=freqs.tolist(),
+                magnitude={"V(out)": (20 * np.log10(np.abs(response))).tolist()},
+                phase={"V(out)": np.degrees(np.angle(response)).tolist()},
+            )
+
+        settings = ACSettings(f_start=1.0, f_stop=1e8, points_per_decade=20)
+        serial = run_chunk(settings)
+        timings: dict[int, float] = {}
+        for workers in (1, 2, 4, 8):
+            executor = ChunkedACExecutor(run_chunk, max_workers=workers)
+            start = time.perf_counter()
+            result = executor.run(settings)
+            timings[workers] = (time.perf_counter() - start) * 1000
+            assert result.is_valid
+            np.testing.assert_allclose(result.frequencies, serial.frequencies)
+            np.testing.assert_allclose(result.magnitude["V(out)"], serial.magnitude["V(out)"])
+
+        cores = os.cpu_count() or 1
+        print(f"\n=== Chunked AC sweep scaling (8 decades, {cores} cores) ===")
+        for workers, elapsed in timings.items():
+            print(f"{workers} worker(s): {elapsed:8.2f} ms  speedup {timings[1] / elapsed:4.2f}x")
+
+        if cores >= 4:
+            assert timings[4] < timings[1] / 1.5
+
+    def test_vectorized_thermal_integration(self) -> None:
+        """Benchmark the batched Foster integrator on 20 devices x 1M samples.
+
+        The per-sample reference runs the same exact update in a Python loop
+        over a prefix of the run and is extrapolated to the full size.
+
+        GUI Validation:
+        1. Run a long transient on a converter with many switches
+        2. Open the Thermal Viewer
+        3. Junction traces should appear without a noticeable pause
+        """
+        devices, samples = 20, 1_000_000
+        time_axis = np.linspace(0.0, 1.0, samples)
+        rng = np.random.default_rng(7)
+        power = rng.uniform(0.0, 20.0, (devices, samples))
+        stages = [
+            [(0.1 * (k + 1), 1e-3 * 10**k / (0.1 * (k + 1))) for k in range(4)]
+            for _ in range(devices)
+        ]
+        batch = ThermalNetworkBatch.from_foster([f"Q{i}" for i in range(devices)], stages)
+
+        start = time.perf_counter()
+        temperatures = batch.simulate(time_axis, power, ambient=25.0)
+        vectorized = time.perf_counter() - start
+
+        prefix = 20_000
+        reference = np.empty(prefix)
+        rise = [0.0] * 4
+        start = time.perf_counter()
+        reference[0] = 25.0
+        for k in range(1, prefix):
+            dt = time_axis[k] - time_axis[k - 1]
+            for j, (r, c) in enumerate(stages[0]):
+                a = math.exp(-dt / (r * c))
+                rise[j] = a * rise[j] + r * (1.0 - a) * power[0, k]
+            reference[k] = 25.0 + sum(rise)
+        loop = (time.perf_counter() - start) * (samples / prefix) * devices
+
+        print("\n=== Thermal integration (20 devices x 1M samples, 4 stages) ===")
+        print(f"Vectorized: {vectorized * 1000:10.1f} ms")
+        print(f"Per-sample: {loop * 1000:10.1f} ms (extrapolated)")
+
+        assert temperatures.shape == (devices, samples)
+        np.testing.assert_allclose(temperatures[0, :prefix], reference, atol=1e-6)
+        assert vectorized < loop / 5
+
+    def test_coupled_cold_plate_thermal(self) -> None:
+        """Benchmark 50 devices on one heatsink against one device per sample.
+
+        The coupled case/heatsink network is integrated in modal form; the
+        reference is a single isolated device on the per-sample update.
+
+        GUI Validation:
+        1. Wire the thermal ports of many switches to one thermal scope
+        2. Run a long transient and open the Thermal Viewer
+        3. Coupled junction traces should appear as quickly as one device's
+        """
+        devices, samples = 50, 200_000
+        time_axis = np.linspace(0.0, 2.0, samples)
+        power = np.random.default_rng(11).uniform(0.0, 20.0, (devices, samples))
+        stages = [(0.1, 0.1), (0.3, 0.05 / 0.3)]
+        names = [f"Q{i}" for i in range(devices)]
+
+        start = time.perf_counter()
+        junction = ThermalNetworkBatch.from_foster(names, [stages] * devices).simulate(
+            time_axis, power
+        )
+        network = heatsink_network(names, 0.1, 2.0, 0.05, 500.0)
+        junction += network.simulate(time_axis, power, 0.0)[:devices]
+        coupled = time.perf_counter() - start
+
+        prefix = 20_000
+        rise = [0.0] * len(stages)
+        start = time.perf_counter()
+        for k in range(1, prefix):
+            dt = time_axis[k] - time_axis[k - 1]
+            for j, (r, c) in enumerate(stages):
+                a = math.exp(-dt / (r * c))
+                rise[j] = a * rise[j] + r * (1.0 - a) * power[0, k]
+        single = (time.perf_counter() - start) * (samples / prefix)
+
+        print("\n=== Coupled cold plate (50 devices x 200k samples) ===")
+        print(f"Coupled, 50 devices:     {coupled * 1000:10.1f} ms")
+        print(f"Per-sample, one device:  {single * 1000:10.1f} ms (extrapolated)")
+
+        assert np.all(np.isfinite(junction))
+        assert coupled < 3.0 * single  # same order as one device, with timing noise
+
+    def test_cycle_measurements_on_millions_of_samples(self) -> None:
+        """Benchmark per-cycle metrics over a 4M-sample switching waveform.
+
+        GUI Validation:
+        1. Run a long buck converter transient and open Cycles in the viewer
+        2. Pick the gate as reference and V(out) as the measured signal
+        3. The table should fill without a noticeable pause
+        """
+        samples, frequency = 4_000_000, 100e3
+        time_axis = np.linspace(0.0, 0.02, samples)
+        gate = np.where((time_axis * frequency) % 1.0 < 0.45, 10.0, 0.0)
+        v_out = 5.0 + 0.05 * np.sin(2 * np.pi * frequency * time_axis)
+
+        start = time.perf_counter()
+        result = measure_cycles(time_axis, gate, {"V(out)": v_out})
+        elapsed = time.perf_counter() - start
+
+        print("\n=== Cycle measurements (4M samples, 2000 cycles) ===")
+        print(f"measure_cycles:  {elapsed * 1000:8.1f} ms")
+
+        assert result.count == 1999
+        np.testing.assert_allclose(result.columns["duty"], 0.45, atol=1e-3)
+        assert elapsed < 2.0
+
+    def test_batched_cursor_interpolation(self) -> None:
+        """Benchmark cursor readouts of 100 signals against one signal.
+
+        GUI Validation:
+        1. Open a scope showing many probes and enable the cursors
+        2. Drag a cursor across the plot
+        3. The measurement table should follow without lag
+        """
+        samples, signals = 100_000, 100
+        time_axis = np.linspace(0.0, 1e-3, samples)
+        arrays = [np.sin(time_axis * (k + 1) * 1e4) for k in range(signals)]
+        cursors = [2.5e-4, 7.5e-4]
+        repeats = 200
+
+        def _timed(series: list[np.ndarray]) -> float:
+            start = time.perf_counter()
+            for _ in range(repeats):
+                interpolate_at(time_axis, series, cursors)
+            return (time.perf_counter() - start) / repeats
+
+        one = _timed(arrays[:1])
+        batched = _timed(arrays)
+
+        start = time.perf_counter()
+        for _ in range(repeats // 10):
+            for values in arrays:
+                for t in cursors:
+                    np.interp(t, time_axis, values)
+        per_signal = (time.perf_counter() - start) / (repeats // 10)
+
+        print("\n=== Cursor readouts (100 signals x 100k samples, 2 cursors) ===")
+        print(f"Batched, 1 signal:     {one * 1e6:8.1f} us")
+        print(f"Batched, 100 signals:  {batched * 1e6:8.1f} us")
+        print(f"Per-signal np.interp:  {per_signal * 1e6:8.1f} us")
+
+        # 100x the signals for a small multiple of the single-signal cost.
+        assert batched < 5 * one
+        assert batched < per_signal
+
+    def test_set_result_returns_before_caches_are_ready(self, qapp) -> None:
+        """Benchmark set_result on a large result against full preparation.
+
+        GUI Validation:
+        1. Run a long transient with many probes
+        2. The waveform viewer should stay responsive when the result arrives
+        3. Traces should appear one after another as they are prepared
+        """
+        samples, signals = 1_000_000, 8
+        time_axis = np.linspace(0.0, 1e-2, samples)
+        result = SimulationResult(
+            time=time_axis,
+            signals={f"V(n{k})": np.sin(time_axis * 1e4 * (k + 1)) for k in range(signals)},
+        )
+        viewer = WaveformViewer()
+
+        start = time.perf_counter()
+        viewer.set_result(result)
+        returned = time.perf_counter() - start
+        assert viewer.wait_for_caches(timeout_ms=30_000)
+        ready = time.perf_counter() - start
+
+        print("\n=== set_result (8 signals x 1M samples) ===")
+        print(f"GUI thread blocked:   {returned * 1e3:8.1f} ms")
+        print(f"All caches prepared:  {ready * 1e3:8.1f} ms")
+
+        assert len(viewer._signal_arrays) == signals
+        assert returned < ready
+        viewer.close()
+
+    def test_persistence_of_100k_cycles(self) -> None:
+        """Benchmark folding 100k switching cycles into a persistence map.
+
+        GUI Validation:
+        1. Run a long switching converter transient
+        2. Open Persistence in the waveform viewer on the switch node
+        3. The intensity plot should appear in well under a second
+        """
+        cycles, per_cycle, period = 100_000, 50, 1e-5
+        time_axis = np.arange(cycles * per_cycle + 1) * (period / per_cycle)
+        node = 400.0 * (np.mod(time_axis, period) < 0.4 * period) + np.sin(time_axis * 3e5)
+
+        start = time.perf_counter()
+        persistence = PersistenceAccumulator(period).update(time_axis, node)
+        elapsed = time.perf_counter() - start
+
+        print("\n=== Persistence map (100k cycles, 5M samples) ===")
+        print(f"Folded in: {elapsed * 1e3:8.1f} ms")
+
+        assert persistence.cycles == pytest.approx(cycles, rel=1e-6)
+        assert elapsed < 1.0
+
+    def test_triggered_refresh_cost_is_independent_of_run_length(self) -> None:
+        """Benchmark triggered live refreshes early and late in a long stream.
+
+        GUI Validation:
+        1. Open Trigger in the waveform viewer, pick the gate signal, enable it
+        2. Run a long switching transient with streaming
+        3. The live view should stay equally smooth at the end of the run
+        """
+        period, dt, frame_samples = 1e-5, 1e-8, 20_000
+        settings = TriggerSettings("gate", level=0.5, window=2 * period)
+        trigger = StreamTrigger(settings)
+        phase = np.mod(np.arange(frame_samples) * dt, period)
+        gate = (phase < 0.4 * period).astype(float)
+        node = 400.0 * gate
+
+        def frame_time(index: int) -> float:
+            time_axis = (index * frame_samples + np.arange(frame_samples)) * dt
+            start = time.perf_counter()
+            trigger.process(time_axis, {"gate": gate, "node": node})
+            return time.perf_counter() - start
+
+        early = min(frame_time(index) for index in range(10))
+        for index in range(10, 500):  # 10M samples streamed in between
+            frame_time(index)
+        late = min(frame_time(index) for index in range(500, 510))
+
+        print("\n=== Triggered refresh (20k new samples per frame) ===")
+        print(f"Early in run: {early * 1e3:8.3f} ms")
+        print(f"After 10M samples: {late * 1e3:8.3f} ms")
+
+        assert trigger.sweeps > 0
+        assert late < max(5 * early, 0.005)
+
+    def test_xy_path_decimation_of_1m_points(self) -> None:
+        """Benchmark thinning a million-point B-H trajectory for the XY plot.
+
+        GUI Validation:
+        1. Run a transformer or inductor transient with many cycles
+        2. Open XY, put the magnetizing current on X and the flux on Y
+        3. The loop should appear and redraw without a visible pause
+        """
+        time_axis = np.linspace(0.0, 1e-1, 1_000_001)
+        h = np.sin(2 * np.pi * 1e3 * time_axis)
+        b = np.tanh(3.0 * np.sin(2 * np.pi * 1e3 * time_axis - 0.4))
+
+        start = time.perf_counter()
+        keep = decimate_path(h, b)
+        elapsed = time.perf_counter() - start
+
+        print("\n=== XY path decimation (1M points) ===")
+        print(f"Kept {keep.size} points in: {elapsed * 1e3:8.1f} ms")
+
+        assert keep.size <= MAX_PATH_POINTS
+        assert elapsed < 0.5
+
+    def test_streaming_waveform_export(self, tmp_path) -> None:
+        """Benchmark exporting a large result to the binary formats and CSV.
+
+        GUI Validation:
+        1. Run a long transient with many probed signals
+        2. File > Export > Export Waveforms..., keep every signal
+        3. NPZ and .pwf exports should finish in about a second; CSV should
+           show progress and stay cancellable
+        """
+        samples, signals = 1_000_000, 20
+        time_axis = np.linspace(0.0, 1e-1, samples)
+        result = SimulationResult(
+            time=time_axis,
+            signals={f"V(n{k})": np.sin(time_axis * 1e3 * (k + 1)) for k in range(signals)},
+        )
+
+        timings = {}
+        for name in ("waves.npz", "waves.pwf"):
+            start = time.perf_counter()
+            ExportService.export_waveforms(result, str(tmp_path / name))
+            timings[name] = time.perf_counter() - start
+        csv_result = SimulationResult(
+            time=time_axis[:100_000],
+            signals={name: values[:100_000] for name, values in result.signals.items()},
+        )
+        start = time.perf_counter()
+        ExportService.export_waveforms(csv_result, str(tmp_path / "waves.csv"))
+        timings["waves.csv"] = time.perf_counter() - start
+
+        print("\n=== Waveform export (20 signals) ===")
+        print(f"NPZ, 1M samples:      {timings['waves.npz'] * 1e3:8.1f} ms")
+        print(f"Columnar, 1M samples: {timings['waves.pwf'] * 1e3:8.1f} ms")
+        print(f"CSV, 100k samples:    {timings['waves.csv'] * 1e3:8.1f} ms")
+
+        assert timings["waves.npz"] < 3.0
+        assert timings["waves.pwf"] < 3.0
+        assert timings["waves.csv"] < 10.0
+
+
+    def test_memory_mapped_reference_import(self, tmp_path) -> None:
+        """Benchmark mapping and drawing a large reference capture.
+
+        GUI Validation:
+        1. Export a long run as NPZ, or take a lab capture with millions of points
+        2. File > Import Reference Waveform..., pick the file
+        3. The import should finish at once and the overlay should pan and
+           zoom as smoothly as the simulated traces
+        4. Importing a CSV converts it once; importing it again is instant
+        """
+        samples = 10_000_000
+        time_axis = np.linspace(0.0, 1.0, samples)
+        ExportService.export_waveforms_npz(
+            SimulationResult(time=time_axis, signals={"CH1": np.sin(time_axis * 2e3)}),
+            str(tmp_path / "capture.npz"),
+        )
+        del time_axis
+
+        start = time.perf_counter()
+        reference = load_reference(tmp_path / "capture.npz")
+        map_time = time.perf_counter() - start
+
+        values = reference.signals["CH1"]
+        store = ResultStore.for_result(reference)
+        start = time.perf_counter()
+        pyramid = store.pyramid("CH1")
+        pyramid_time = time.perf_counter() - start
+        start = time.perf_counter()
+        x_scan, _ = resample_to_window(reference.time, values, 0.0, 1.0, 1600)
+        scan_time = time.perf_counter() - start
+        start = time.perf_counter()
+        x_full, _ = resample_to_window(reference.time, values, 0.0, 1.0, 1600, pyramid)
+        full_time = time.perf_counter() - start
+        start = time.perf_counter()
+        x_zoom, _ = resample_to_window(reference.time, values, 0.5, 0.501, 1600, pyramid)
+        zoom_time = time.perf_counter() - start
+
+        rows = 200_000
+        csv_axis = np.linspace(0.0, 1e-2, rows)
+        np.savetxt(
+            tmp_path / "capture.csv",
+            np.column_stack([csv_axis, np.sin(csv_axis * 1e4), np.cos(csv_axis * 1e4)]),
+            delimiter=",",
+            header="Time,CH1,CH2",
+            comments="",
+        )
+        start = time.perf_counter()
+        load_reference(tmp_path / "capture.csv")
+        convert_time = time.perf_counter() - start
+        start = time.perf_counter()
+        load_reference(tmp_path / "capture.csv")
+        cached_time = time.perf_counter() - start
+
+        print("\n=== Reference import ===")
+        print(f"Map 10M-sample NPZ:           {map_time * 1e3:8.1f} ms")
+        print(f"Build min/max pyramid (once): {pyramid_time * 1e3:8.1f} ms")
+        print(f"Draw full window, scan:       {scan_time * 1e3:8.1f} ms ({len(x_scan)} points)")
+        print(f"Draw full window, pyramid:    {full_time * 1e3:8.1f} ms ({len(x_full)} points)")
+        print(f"Draw 0.1% window, pyramid:    {zoom_time * 1e3:8.1f} ms ({len(x_zoom)} points)")
+        print(f"Convert 200k-row CSV:         {convert_time * 1e3:8.1f} ms")
+        print(f"Re-import converted CSV:      {cached_time * 1e3:8.1f} ms")
+
+        assert isinstance(values, np.memmap)
+        assert len(x_full) <= 2 * 1600 and len(x_zoom) <= 2 * 1600
+        assert map_time < 2.0
+        assert full_time < 0.05
+        assert zoom_time < 0.05
+        assert cached_time < 0.5
+
+
+    def test_animated_reveal_frame_cost_stays_flat(self, qapp) -> None:
+        """Benchmark animating a large finished run into view.
+
+        GUI Validation:
+        1. Run a transient long enough to produce millions of points
+        2. Watch the waveform viewer draw the finished run
+        3. The traces should grow at a steady frame rate to the end, with no
+           slowdown late in the reveal and no stall on the last frame
+        """
+        samples = 5_000_000
+        time_axis = np.linspace(0.0, 1.0, samples)
+        signals = {"V(out)": np.sin(time_axis * 2e3), "I(L1)": np.cos(time_axis * 2e3)}
+        viewer = WaveformViewer()
+        try:
+            viewer.add_data_point(
+                1.0,
+                {
+                    "_animate": True,
+                    "_time_array": time_axis,
+                    "_signal_arrays": signals,
+                    "_total_points": samples,
+                },
+            )
+            viewer._anim_timer.stop()
+            frame_times = []
+            while viewer._reveal is not None:
+                start = time.perf_counter()
+                viewer._animate_frame()
+                frame_times.append(time.perf_counter() - start)
+
+            # The old reveal re-set every revealed sample on each frame.
+            start = time.perf_counter()
+            for name, values in signals.items():
+                viewer._streaming_traces[name].setData(time_axis, values)
+            full_time = time.perf_counter() - start
+            x, _ = viewer._streaming_traces["V(out)"].getData()
+        finally:
+            viewer.close()
+
+        early = float(np.median(frame_times[1:21]))
+        late = float(np.median(frame_times[-21:-1]))
+        print("\n=== Animated reveal ===")
+        print(f"Frames:                       {len(frame_times):8d}")
+        print(f"Frame, first 10% (median):    {early * 1e3:8.2f} ms")
+        print(f"Frame, last 10% (median):     {late * 1e3:8.2f} ms")
+        print(f"Last frame (handoff):         {frame_times[-1] * 1e3:8.2f} ms")
+        print(f"Re-set full 5M samples:       {full_time * 1e3:8.2f} ms")
+
+        assert len(x) == samples
+        assert max(frame_times) < 0.05
+        assert late < 4 * early + 0.002
+        assert max(frame_times) < full_time
+
 
 class TestBenchmarkSummary:
     """Summary benchmark for overall performance."""
@@ -0,0 +1,264 @@
+"""Tests for decade-chunked AC sweep execution."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.ac_sweep import (
+    ChunkedACExecutor,
+    merge_ac_chunks,
+    select_refinement_frequencies,
+    split_decade_chunks,
+)
+from pulsimgui.services.backend_adapter import BackendInfo, PlaceholderBackend, PulsimBackend
+from pulsimgui.services.backend_types import ACResult, ACSettings
+
+
+def test_split_decade_chunks_aligns_on_decades() -> None:
+    chunks = split_decade_chunks(ACSettings(f_start=2.0, f_stop=5e3, points_per_decade=7))
+
+    assert [(c.f_start, c.f_stop) for c in chunks] == [
+        (2.0, 10.0),
+        (10.0, 100.0),
+        (100.0, 1000.0),
+        (1000.0, 5e3),
+    ]
+    assert all(c.points_per_decade == 7 for c in chunks)
+
+
+@pytest.mark.parametrize(
+    ("f_start", "f_stop"),
+    [(10.0, 100.0), (20.0, 50.0), (0.0, 10.0)],
+)
+def test_split_decade_chunks_keeps_narrow_ranges_whole(f_start: float, f_stop: float) -> None:
+    settings = ACSettings(f_start=f_start, f_stop=f_stop)
+    assert split_decade_chunks(settings) == [settings]
+
+
+def test_merge_sorts_dedupes_boundaries_and_pads_missing_signals() -> None:
+    high = ACResult(
+        frequencies=[10.0, 100.0],
+        magnitude={"V(out)": [-1.0, -2.0], "V(fb)": [3.0, 4.0]},
+        phase={"V(out)": [-10.0, -20.0], "V(fb)": [30.0, 40.0]},
+    )
+    low = ACResult(
+        frequencies=[1.0, 10.0],
+        magnitude={"V(out)": [0.0, -1.0]},
+        phase={"V(out)": [0.0, -10.0]},
+    )
+
+    merged = merge_ac_chunks([high, low])
+
+    assert merged.frequencies == [1.0, 10.0, 100.0]
+    assert merged.magnitude["V(out)"] == [0.0, -1.0, -2.0]
+    assert math.isnan(merged.magnitude["V(fb)"][0])
+    assert merged.phase["V(fb)"][1:] == [30.0, 40.0]
+    assert merged.is_valid
+
+
+def test_executor_runs_chunks_concurrently_and_streams_partials() -> None:
+    backend = PlaceholderBackend()
+    settings = ACSettings(f_start=1.0, f_stop=1e4, points_per_decade=5)
+    threads: set[int] = set()
+    barrier = threading.Barrier(2, timeout=5.0)
+
+    def run_chunk(chunk: ACSettings) -> ACResult:
+        threads.add(threading.get_ident())
+        barrier.wait()  # Only passes if two chunks run at the same time
+        return backend.run_ac({}, chunk)
+
+    partials: list[tuple[int, int]] = []
+    merged = ChunkedACExecutor(run_chunk, max_workers=2).run(
+        settings,
+        on_chunk=lambda _result, done, total: partials.append((done, total)),
+    )
+
+    assert len(threads) == 2
+    assert partials[-1] == (4, 4)
+    assert merged.is_valid
+    assert merged.frequencies == sorted(merged.frequencies)
+    assert merged.frequencies[0] == pytest.approx(1.0)
+    assert merged.frequencies[-1] == pytest.approx(1e4)
+    assert len(set(merged.frequencies)) == len(merged.frequencies)
+
+
+def test_executor_stops_submitting_after_cancel() -> None:
+    backend = PlaceholderBackend()
+    calls: list[ACSettings] = []
+
+    def run_chunk(chunk: ACSettings) -> ACResult:
+        calls.append(chunk)
+        return backend.run_ac({}, chunk)
+
+    merged = ChunkedACExecutor(run_chunk, max_workers=1).run(
+        ACSettings(f_start=1.0, f_stop=1e6),
+        is_cancelled=lambda: len(calls) >= 1,
+    )
+
+    assert len(calls) < 6
+    assert len(merged.frequencies) < 60
+
+
+def _loop_gain_chunk(chunk: ACSettings) -> ACResult:
+    """Evaluate L(s) = K / (s (1 + s/w1) (1 + s/w2)) on the chunk's grid."""
+    if chunk.frequencies:
+        freqs = np.asarray(chunk.frequencies, dtype=float)
+    else:
+        decades = math.log10(chunk.f_stop / chunk.f_start)
+        count = max(1, int(round(decades * chunk.points_per_decade)) + 1)
+        freqs = np.logspace(math.log10(chunk.f_start), math.log10(chunk.f_stop), count)
+    s = 2j * np.pi * freqs
+    response = 2e4 / (s * (1 + s / (2 * np.pi * 1e3)) * (1 + s / (2 * np.pi * 2e4)))
+    return ACResult(
+        frequencies=freqs.tolist(),
+        magnitude={"L": (20 * np.log10(np.abs(response))).tolist()},
+        phase={"L": np.degrees(np.angle(response)).tolist()},
+    )
+
+
+def _crossing(freqs: np.ndarray, values: np.ndarray, level: float) -> float:
+    idx = int(np.flatnonzero(np.diff(np.sign(values - level)))[0])
+    t = (level - values[idx]) / (values[idx + 1] - values[idx])
+    return float(10 ** (np.log10(freqs[idx]) + t * np.log10(freqs[idx + 1] / freqs[idx])))
+
+
+def test_adaptive_refinement_localises_crossovers_with_few_solves() -> None:
+    settings = ACSettings(f_start=1.0, f_stop=1e6, points_per_decade=5, adaptive=True)
+
+    result = ChunkedACExecutor(_loop_gain_chunk, max_workers=4).run(settings)
+
+    freqs = np.asarray(result.frequencies)
+    mag = np.asarray(result.magnitude["L"])
+    phase = np.unwrap(np.radians(result.phase["L"]))
+    gain_crossover = _crossing(freqs, mag, 0.0)
+    phase_crossover = _crossing(freqs, np.degrees(phase), -180.0)
+
+    exact = _loop_gain_chunk(
+        ACSettings(f_start=1.0, f_stop=1e6, points_per_decade=200_000)
+    )
+    exact_f = np.asarray(exact.frequencies)
+    exact_gc = _crossing(exact_f, np.asarray(exact.magnitude["L"]), 0.0)
+    exact_pc = _crossing(
+        exact_f, np.degrees(np.unwrap(np.radians(exact.phase["L"]))), -180.0
+    )
+
+    assert gain_crossover == pytest.approx(exact_gc, rel=1e-3)
+    assert phase_crossover == pytest.approx(exact_pc, rel=1e-3)
+    assert freqs.size < 400
+    assert np.all(np.diff(freqs) > 0)
+
+
+def test_refinement_batches_each_pass_and_stops_at_the_point_budget() -> None:
+    calls: list[ACSettings] = []
+
+    def run_chunk(chunk: ACSettings) -> ACResult:
+        calls.append(chunk)
+        return _loop_gain_chunk(chunk)
+
+    settings = ACSettings(
+        f_start=1.0,
+        f_stop=1e6,
+        points_per_decade=5,
+        adaptive=True,
+        magnitude_tolerance_db=0.01,
+        max_points=300,
+    )
+    result = ChunkedACExecutor(run_chunk, max_workers=2).run(settings)
+    coarse = [c for c in calls if not c.frequencies]
+    refined = sum(len(c.frequencies) for c in calls if c.frequencies)
+    assert len(coarse) == 6 and refined == len(result.frequencies) - 31
+    assert len(result.frequencies) <= 300
+    # At most one batch per worker and pass, never one call per point.
+    assert len(calls) - len(coarse) < refined / 4
+
+    # A coarse grid already past the budget gets no refinement at all.
+    calls.clear()
+    capped = ChunkedACExecutor(run_chunk, max_workers=2).run(
+        ACSettings(f_start=1.0, f_stop=1e6, points_per_decade=5, adaptive=True, max_points=20)
+    )
+    assert not any(c.frequencies for c in calls) and len(capped.frequencies) == 31
+
+
+def test_pulsim_backend_solves_a_batch_on_one_circuit() -> None:
+    builds: list[dict] = []
+    solved: list[float] = []
+
+    class _Converter:
+        def build(self, circuit_data):  # noqa: ANN001
+            builds.append(circuit_data)
+            return SimpleNamespace()
+
+    def run_ac(circuit, opts):  # noqa: ANN001
+        solved.append(opts.fstart)
+        return SimpleNamespace(
+            frequencies=[opts.fstart], magnitude={"V(out)": [-opts.fstart]}, phase={}
+        )
+
+    module = SimpleNamespace(
+        ACOptions=lambda: SimpleNamespace(fstart=0.0, fstop=0.0, npoints=0), run_ac=run_ac
+    )
+    backend = PulsimBackend(
+        module, BackendInfo(identifier="pulsim", name="Pulsim", version="1", status="available")
+    )
+    backend._cached_capabilities = {"transient", "ac"}
+    backend._converter = _Converter()
+
+    result = backend.run_ac({}, ACSettings(frequencies=[30.0, 10.0, 20.0]))
+
+    assert len(builds) == 1 and solved == [30.0, 10.0, 20.0]
+    assert result.frequencies == [10.0, 20.0, 30.0]
+    assert result.magnitude["V(out)"] == [-10.0, -20.0, -30.0]
+
+
+def test_refinement_targets_crossings_first_and_respects_tolerances() -> None:
+    coarse = ACResult(
+        frequencies=[1.0, 10.0, 100.0, 1000.0],
+        magnitude={"L": [20.0, 10.0, -10.0, -30.0]},
+        phase={"L": [-90.0, -90.0, -90.0, -90.0]},
+    )
+    settings = ACSettings(adaptive=True, magnitude_tolerance_db=50.0)
+
+    targets = select_refinement_frequencies(coarse, settings)
+
+    assert targets == [pytest.approx(math.sqrt(10.0 * 100.0))]
+
+    settings.crossing_tolerance = 100.0  # Interval already narrow enough
+    assert select_refinement_frequencies(coarse, settings) == []
+
+
+def test_concurrent_pulsim_chunks_build_circuits_one_at_a_time() -> None:
+    active: list[int] = []
+    overlaps: list[int] = []
+
+    class _Converter:
+        def build(self, circuit_data):  # noqa: ANN001
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.01)
+            active.pop()
+            return SimpleNamespace()
+
+    module = SimpleNamespace(
+        ACOptions=lambda: SimpleNamespace(fstart=0.0, fstop=0.0, npoints=0),
+        run_ac=lambda circuit, opts: SimpleNamespace(
+            frequencies=[opts.fstart, opts.fstop], magnitude={"V(out)": [0.0, -1.0]}, phase={}
+        ),
+    )
+    backend = PulsimBackend(
+        module, BackendInfo(identifier="pulsim", name="Pulsim", version="1", status="available")
+    )
+    backend._cached_capabilities = {"transient", "ac"}
+    backend._converter = _Converter()
+
+    merged = ChunkedACExecutor(lambda chunk: backend.run_ac({}, chunk), max_workers=4).run(
+        ACSettings(f_start=1.0, f_stop=1e4, points_per_decade=1)
+    )
+
+    assert merged.is_valid and len(overlaps) == 4
+    assert max(overlaps) == 1
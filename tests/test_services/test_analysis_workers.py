@@ -0,0 +1,151 @@
+"""Tests for DC/AC analyses running on worker threads."""
+
+from __future__ import annotations
+
+import threading
+
+from pulsimgui.services.backend_adapter import BackendInfo
+from pulsimgui.services.backend_types import ACResult as BackendACResult
+from pulsimgui.services.backend_types import DCResult as BackendDCResult
+from pulsimgui.services.simulation_service import (
+    ACResult,
+    DCResult,
+    SimulationService,
+    SimulationState,
+)
+
+
+class _AnalysisBackend:
+    def __init__(self) -> None:
+        self.info = BackendInfo(
+            identifier="fake",
+            name="Fake",
+            version="1.0",
+            status="available",
+            capabilities={"dc", "ac"},
+        )
+        self.release = threading.Event()
+        self.release.set()
+        self.call_threads: list[int] = []
+
+    def has_capability(self, name: str) -> bool:
+        return name in self.info.capabilities
+
+    def run_dc(self, circuit_data, settings):  # noqa: ANN001
+        self.call_threads.append(threading.get_ident())
+        self.release.wait(5.0)
+        return BackendDCResult(
+            node_voltages={"V(out)": 2.5},
+            branch_currents={"I(R1)": 1e-3},
+            convergence_info="converged",
+        )
+
+    def run_ac(self, circuit_data, settings):  # noqa: ANN001
+        self.call_threads.append(threading.get_ident())
+        self.release.wait(5.0)
+        return BackendACResult(
+            frequencies=[settings.f_start, settings.f_stop],
+            magnitude={"V(out)": [0.0, -3.0]},
+            phase={"V(out)": [0.0, -45.0]},
+        )
+
+    def request_stop(self, run_id: int | None = None) -> None:
+        self.release.set()
+
+
+class _Loader:
+    def __init__(self, preferred_backend_id: str | None = None) -> None:
+        self.backend = _AnalysisBackend()
+        self.available_backends = [self.backend.info]
+        self.active_backend_id = self.backend.info.identifier
+
+
+def test_dc_runs_off_the_gui_thread(monkeypatch, qtbot) -> None:
+    monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _Loader)
+    service = SimulationService()
+    results: list[DCResult] = []
+    service.dc_finished.connect(results.append)
+
+    service.run_dc_operating_point({"components": []})
+    assert service.state == SimulationState.RUNNING
+
+    qtbot.waitUntil(lambda: len(results) == 1)
+    assert results[0].node_voltages == {"V(out)": 2.5}
+    assert service.last_convergence_info == "converged"
+    assert service.state == SimulationState.COMPLETED
+    assert service.backend.call_threads[0] != threading.get_ident()
+
+
+def test_ac_runs_off_the_gui_thread(monkeypatch, qtbot) -> None:
+    monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _Loader)
+    service = SimulationService()
+    results: list[ACResult] = []
+    service.ac_finished.connect(results.append)
+
+    service.run_ac_analysis({"components": []}, 1.0, 10.0, 1)
+
+    qtbot.waitUntil(lambda: len(results) == 1)
+    assert results[0].frequencies == [1.0, 10.0]
+    assert results[0].phase["V(out)"] == [0.0, -45.0]
+    assert service.state == SimulationState.COMPLETED
+
+
+def test_multi_decade_ac_streams_partial_results(monkeypatch, qtbot) -> None:
+    monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _Loader)
+    service = SimulationService()
+    partials: list[ACResult] = []
+    results: list[ACResult] = []
+    service.ac_partial.connect(partials.append)
+    service.ac_finished.connect(results.append)
+
+    service.run_ac_analysis({"components": []}, 1.0, 1e3, 1)
+
+    qtbot.waitUntil(lambda: len(results) == 1)
+    assert results[0].frequencies == [1.0, 10.0, 100.0, 1000.0]
+    assert len(service.backend.call_threads) == 3
+    assert partials
+    assert all(len(p.frequencies) < 4 for p in partials)
+
+
+def test_stop_cancels_running_analysis(monkeypatch, qtbot) -> None:
+    monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _Loader)
+    service = SimulationService()
+    service.backend.release.clear()
+    results: list[DCResult] = []
+    service.dc_finished.connect(results.append)
+
+    service.run_dc_operating_point({"components": []})
+    qtbot.waitUntil(lambda: bool(service.backend.call_threads))
+    service.stop()
+
+    qtbot.waitUntil(lambda: service._analysis_worker is None)
+    assert service.state == SimulationState.CANCELLED
+    assert results == []
+
+
+def test_abandoned_analysis_keeps_the_service_busy_until_the_call_returns(
+    monkeypatch, qtbot
+) -> None:
+    monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _Loader)
+    service = SimulationService()
+    backend = service.backend
+    backend.release.clear()
+    backend.request_stop = lambda run_id=None: None  # The native call ignores stop requests
+    errors: list[str] = []
+    messages: list[str] = []
+    service.error.connect(errors.append)
+    service.progress.connect(lambda _value, message: messages.append(message))
+
+    service.run_dc_operating_point({"components": []})
+    qtbot.waitUntil(lambda: bool(backend.call_threads))
+    service.stop()
+    qtbot.waitUntil(lambda: any(m.startswith("Abandoning DC") for m in messages))
+
+    # A second native call must not start while the first is still inside the backend.
+    assert service.is_running
+    service.run_dc_operating_point({"components": []})
+    assert errors and len(backend.call_threads) == 1
+
+    backend.release.set()
+    qtbot.waitUntil(lambda: service._analysis_worker is None)
+    assert service.state == SimulationState.CANCELLED
@@ -0,0 +1,83 @@
+"""Tests for vectorized per-switching-cycle measurements."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.cycle_measurements import find_edges, measure_cycles
+
+FREQUENCY = 100e3
+DUTY = 0.3
+EDGE = 20e-9
+
+
+def _converter(samples: int = 400_000, noise: float = 0.0) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Trapezoidal 10 V gate, rippled output and the matching power flows."""
+    time = np.linspace(0.0, 2e-4, samples)
+    phase = (time * FREQUENCY) % 1.0
+    ramp = EDGE * FREQUENCY
+    gate = 10.0 * np.clip(np.minimum(phase / ramp, (DUTY - phase) / ramp + 1.0), 0.0, 1.0)
+    gate += np.random.default_rng(3).normal(0.0, noise, samples) if noise else 0.0
+    v_out = 5.0 + 0.05 * np.sin(2 * np.pi * FREQUENCY * time)
+    return time, {"gate": gate, "V(out)": v_out}
+
+
+def test_edges_are_interpolated_between_samples() -> None:
+    time = np.array([0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    values = np.array([0.0, 0.0, 4.0, 4.0, 0.0, 0.0])
+
+    edges = find_edges(time, values, level=1.0, hysteresis=0.0)
+
+    np.testing.assert_allclose(edges.rising, [1.25])
+    np.testing.assert_allclose(edges.falling, [3.75])
+    assert (edges.low, edges.high) == (0.0, 4.0)
+
+
+def test_hysteresis_rejects_chatter_on_a_noisy_edge() -> None:
+    time = np.arange(9.0)
+    values = np.array([0.0, 0.9, 1.1, 0.9, 1.1, 2.0, 2.0, 0.0, 0.0])
+
+    assert find_edges(time, values, level=1.0, hysteresis=0.0).rising.size == 2
+    edges = find_edges(time, values, level=1.0, hysteresis=0.5)
+    # The accepted edge is timed at its last crossing of the level.
+    np.testing.assert_allclose(edges.rising, [3.5])
+    assert edges.falling.size == 1
+
+
+def test_switching_metrics_per_cycle() -> None:
+    time, signals = _converter(noise=0.1)
+
+    result = measure_cycles(
+        time,
+        signals["gate"],
+        {"V(out)": signals["V(out)"]},
+        power_in=signals["V(out)"] * 2.1,
+        power_out=signals["V(out)"] * 2.0,
+    )
+
+    assert result.count == 19
+    np.testing.assert_allclose(result.columns["frequency"], FREQUENCY, rtol=1e-3)
+    np.testing.assert_allclose(result.columns["duty"], DUTY, atol=2e-3)
+    np.testing.assert_allclose(result.columns["rise_time"], 0.8 * EDGE, rtol=0.1)
+    np.testing.assert_allclose(result.columns["fall_time"], 0.8 * EDGE, rtol=0.1)
+    np.testing.assert_allclose(result.columns["V(out) mean"], 5.0, atol=1e-6)
+    np.testing.assert_allclose(result.columns["V(out) ripple"], 0.1, rtol=1e-3)
+    np.testing.assert_allclose(result.columns["efficiency"], 2.0 / 2.1, rtol=1e-9)
+    assert result.summary()["V(out) rms"] == pytest.approx(np.sqrt(25.0 + 0.05**2 / 2), rel=1e-6)
+
+
+def test_cycle_values_expand_to_signals() -> None:
+    time, signals = _converter(samples=20_000)
+    result = measure_cycles(time, signals["gate"])
+
+    held = result.as_signal("period", time)
+    assert np.isnan(held[0]) and np.isnan(held[-1])
+    inside = (time >= result.start[0]) & (time < result.stop[-1])
+    np.testing.assert_allclose(held[inside], 1.0 / FREQUENCY, rtol=1e-3)
+    assert np.all(np.isfinite(result.as_signal("period", time, hold_edges=True)))
+
+    flat = measure_cycles(time, np.ones_like(time))
+    assert flat.count == 0 and flat.columns == {}
+    with pytest.raises(ValueError):
+        measure_cycles(time, signals["gate"], {"short": np.ones(3)})
@@ -0,0 +1,271 @@
+"""Tests for DC sweeps with natural-parameter continuation."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.backend_adapter import (
+    BackendCallbacks,
+    BackendInfo,
+    PlaceholderBackend,
+    PulsimBackend,
+)
+from pulsimgui.services.backend_types import DCSweepResult, DCSweepSettings
+from pulsimgui.services.simulation_service import SimulationService, SimulationState
+
+#: Largest source step the fake Newton solver converges from.
+_NEWTON_REACH = 1.0
+
+
+class _FakeCircuit:
+    def __init__(self) -> None:
+        self._nodes: dict[str, int] = {}
+        self.source_value = 0.0
+
+    @staticmethod
+    def ground() -> int:
+        return 0
+
+    def add_node(self, name: str) -> int:
+        return self._nodes.setdefault(name, len(self._nodes) + 1)
+
+    def add_voltage_source(self, name: str, npos: int, nneg: int, value: float) -> None:
+        self.source_value = float(value)
+
+    def add_resistor(self, name: str, n1: int, n2: int, resistance: float) -> None:
+        _ = (name, n1, n2, resistance)
+
+    @staticmethod
+    def system_size() -> int:
+        return 2
+
+    def node_names(self) -> list[str]:
+        return ["OUT"]
+
+    def signal_names(self) -> list[str]:
+        return ["V(OUT)", "I(V1)"]
+
+
+class _FakeNewtonOptions:
+    def __init__(self) -> None:
+        self.max_iterations = 0
+        self.enable_limiting = False
+        self.max_voltage_step = 0.0
+
+
+def _circuit_data() -> dict[str, Any]:
+    return {
+        "components": [
+            {
+                "id": "v1",
+                "type": "VOLTAGE_SOURCE",
+                "name": "V1",
+                "parameters": {"waveform": {"type": "dc", "value": 5.0}},
+                "pin_nodes": ["1", "0"],
+            },
+            {
+                "id": "r1",
+                "type": "RESISTOR",
+                "name": "R1",
+                "parameters": {"resistance": 1000.0},
+                "pin_nodes": ["1", "0"],
+            },
+        ],
+        "node_map": {"v1": ["1", "0"], "r1": ["1", "0"]},
+        "node_aliases": {"1": "OUT", "0": "0"},
+        "wires": [],
+    }
+
+
+def _backend(calls: dict[str, int]) -> PulsimBackend:
+    def _solution(circuit: _FakeCircuit) -> list[float]:
+        return [circuit.source_value, -circuit.source_value / 1000.0]
+
+    def dc_operating_point(circuit, config):  # noqa: ANN001
+        calls["full"] += 1
+        return SimpleNamespace(
+            success=True,
+            newton_result=SimpleNamespace(solution=_solution(circuit), iterations=12),
+            message="",
+        )
+
+    def solve_dc(circuit, x0, options):  # noqa: ANN001
+        calls["seeded"] += 1
+        converged = abs(circuit.source_value - float(x0[0])) <= _NEWTON_REACH
+        return SimpleNamespace(
+            solution=_solution(circuit) if converged else list(x0),
+            converged=converged,
+            iterations=3,
+        )
+
+    module = SimpleNamespace(
+        __version__="2.0.0",
+        Circuit=_FakeCircuit,
+        NewtonOptions=_FakeNewtonOptions,
+        DCConvergenceConfig=SimpleNamespace,
+        dc_operating_point=dc_operating_point,
+        solve_dc=solve_dc,
+    )
+    return PulsimBackend(
+        module,
+        BackendInfo(identifier="pulsim", name="Pulsim", version="2.0.0", status="available"),
+    )
+
+
+def test_settings_apply_value_targets_source_dc_level() -> None:
+    data = _circuit_data()
+    DCSweepSettings(component_id="v1", start_value=0.0, stop_value=1.0).apply_value(data, 2.5)
+    DCSweepSettings(
+        component_id="r1", start_value=0.0, stop_value=1.0, parameter_name="resistance"
+    ).apply_value(data, 50.0)
+
+    assert data["components"][0]["parameters"]["waveform"] == {"type": "dc", "value": 2.5}
+    assert data["components"][1]["parameters"]["resistance"] == 50.0
+    with pytest.raises(ValueError):
+        DCSweepSettings(component_id="x", start_value=0.0, stop_value=1.0).apply_value(data, 1.0)
+
+
+def test_sweep_seeds_each_point_from_the_previous_solution() -> None:
+    calls = {"full": 0, "seeded": 0}
+    backend = _backend(calls)
+    settings = DCSweepSettings(component_id="v1", start_value=0.0, stop_value=10.0, points=11)
+
+    result = backend.run_dc_sweep(_circuit_data(), settings)
+
+    assert result.is_valid
+    assert calls == {"full": 1, "seeded": 10}
+    xs, ys = result.xy("V(OUT)")
+    np.testing.assert_allclose(xs, np.linspace(0.0, 10.0, 11))
+    np.testing.assert_allclose(ys, xs)
+    np.testing.assert_allclose(result.signals["I(V1)"], -xs / 1000.0)
+    assert result.statistics["step_halvings"] == 0
+
+
+def test_sweep_halves_steps_that_newton_cannot_bridge() -> None:
+    calls = {"full": 0, "seeded": 0}
+    backend = _backend(calls)
+    settings = DCSweepSettings(component_id="v1", start_value=0.0, stop_value=8.0, points=3)
+
+    result = backend.run_dc_sweep(_circuit_data(), settings)
+
+    assert result.converged.all()
+    np.testing.assert_allclose(result.signals["V(OUT)"], [0.0, 4.0, 8.0])
+    assert result.statistics["step_halvings"] > 0
+    assert result.statistics["full_solves"] == 1  # Continuation never gave up
+
+
+def test_sweep_falls_back_to_full_solve_when_halving_budget_runs_out() -> None:
+    calls = {"full": 0, "seeded": 0}
+    backend = _backend(calls)
+    settings = DCSweepSettings(
+        component_id="v1", start_value=0.0, stop_value=8.0, points=2, max_halvings=1
+    )
+
+    result = backend.run_dc_sweep(_circuit_data(), settings)
+
+    assert result.converged.all()
+    assert result.signals["V(OUT)"][-1] == pytest.approx(8.0)
+    assert calls["full"] == 2
+
+
+def test_sweep_updates_one_built_circuit_in_place() -> None:
+    class _SettableCircuit(_FakeCircuit):
+        def set_source_value(self, name: str, value: float) -> None:
+            assert name == "V1"
+            self.source_value = float(value)
+
+    calls = {"full": 0, "seeded": 0}
+    backend = _backend(calls)
+    backend._module.Circuit = _SettableCircuit
+    settings = DCSweepSettings(component_id="v1", start_value=0.0, stop_value=8.0, points=3)
+
+    result = backend.run_dc_sweep(_circuit_data(), settings)
+
+    assert result.converged.all()
+    np.testing.assert_allclose(result.signals["V(OUT)"], [0.0, 4.0, 8.0])
+    assert result.statistics["step_halvings"] > 0
+    assert result.statistics["circuit_builds"] == 1
+
+
+def test_sweep_without_seeded_overload_solves_each_point_once() -> None:
+    calls = {"full": 0, "seeded": 0}
+    backend = _backend(calls)
+
+    def solve_dc(circuit, options):  # noqa: ANN001
+        raise AssertionError("the sweep never calls the unseeded solve_dc")
+
+    def counting_solve_dc(*args):  # noqa: ANN002
+        calls["seeded"] += 1
+        return solve_dc(*args)  # TypeError for the seeded (circuit, x0, options) call
+
+    backend._module.solve_dc = counting_solve_dc
+    settings = DCSweepSettings(component_id="v1", start_value=0.0, stop_value=10.0, points=11)
+
+    result = backend.run_dc_sweep(_circuit_data(), settings)
+
+    assert result.converged.all()
+    np.testing.assert_allclose(result.signals["V(OUT)"], np.linspace(0.0, 10.0, 11))
+    assert calls == {"full": 11, "seeded": 1}
+    assert result.statistics["step_halvings"] == 0
+    assert result.statistics["circuit_builds"] == 11
+
+
+def test_sweep_stops_when_cancelled() -> None:
+    backend = _backend({"full": 0, "seeded": 0})
+    polls: list[int] = []
+
+    def check_cancelled() -> bool:
+        polls.append(1)
+        return len(polls) > 3
+
+    callbacks = BackendCallbacks(
+        progress=lambda *_: None,
+        data_point=lambda *_: None,
+        check_cancelled=check_cancelled,
+        wait_if_paused=lambda: None,
+    )
+    settings = DCSweepSettings(component_id="v1", start_value=0.0, stop_value=10.0, points=11)
+
+    result = backend.run_dc_sweep(_circuit_data(), settings, callbacks)
+
+    assert result.error_message == "DC sweep cancelled"
+    assert int(result.converged.sum()) == 3
+
+
+def test_service_runs_sweep_on_worker_thread(monkeypatch, qtbot) -> None:
+    class _Loader:
+        def __init__(self, preferred_backend_id: str | None = None) -> None:
+            self.backend = _backend({"full": 0, "seeded": 0})
+            self.available_backends = [self.backend.info]
+            self.active_backend_id = self.backend.info.identifier
+
+    monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _Loader)
+    service = SimulationService()
+    results: list[DCSweepResult] = []
+    service.dc_sweep_finished.connect(results.append)
+
+    service.run_dc_sweep(
+        _circuit_data(),
+        DCSweepSettings(component_id="v1", start_value=-5.0, stop_value=5.0, points=21),
+    )
+    assert service.state == SimulationState.RUNNING
+
+    qtbot.waitUntil(lambda: len(results) == 1)
+    assert service.state == SimulationState.COMPLETED
+    xs, ys = results[0].xy("V(OUT)")
+    assert xs.size == 21
+    np.testing.assert_allclose(ys, xs)
+
+
+def test_placeholder_sweep_is_monotonic() -> None:
+    settings = DCSweepSettings(component_id="v1", start_value=-5.0, stop_value=5.0, points=21)
+
+    result = PlaceholderBackend().run_dc_sweep(_circuit_data(), settings)
+
+    xs, ys = result.xy("V(out)")
+    assert xs.size == 21
+    assert np.all(np.diff(ys) > 0)
@@ -0,0 +1,164 @@
+"""Tests for switching-period loss averaging and mission-profile extrapolation."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.backend_adapter import BackendInfo, PulsimBackend
+from pulsimgui.services.backend_types import ThermalSettings, TransientResult
+from pulsimgui.services.loss_averaging import (
+    MissionSegment,
+    average_losses,
+    boundaries_from_edges,
+    boundaries_from_frequency,
+    integrate_over_intervals,
+    mission_profile_power,
+)
+
+
+def _backend() -> PulsimBackend:
+    return PulsimBackend(
+        SimpleNamespace(__version__="2.0.0"),
+        BackendInfo(identifier="pulsim", name="Pulsim", version="2.0.0", status="available"),
+    )
+
+
+def _switching_loss(time_axis: np.ndarray, frequency: float, duty: float = 0.3) -> np.ndarray:
+    """10 W while on, plus a 200 W spike over 0.2% of the period at turn-on."""
+    phase = np.mod(time_axis * frequency, 1.0)
+    return np.where(phase < duty, 10.0, 0.0) + np.where(phase < 2e-3, 200.0, 0.0)
+
+
+def test_interval_integral_is_exact_for_piecewise_linear_samples() -> None:
+    time_axis = np.array([0.0, 1.0, 3.0, 4.0])
+    values = np.array([[0.0, 2.0, 2.0, 0.0]])
+
+    integral = integrate_over_intervals(time_axis, values, [0.5, 1.5, 3.5, 4.0])
+
+    np.testing.assert_allclose(integral[0], [1.75, 3.75, 0.25])
+
+
+def test_boundaries_follow_frequency_and_detected_edges() -> None:
+    time_axis = np.linspace(0.0, 1e-3, 20_001)
+    gate = np.sin(2 * np.pi * 20e3 * time_axis + 0.3)
+
+    from_frequency = boundaries_from_frequency(time_axis, 20e3)
+    from_edges = boundaries_from_edges(time_axis, gate)
+
+    assert from_frequency.size == 21
+    assert from_frequency[-1] == pytest.approx(1e-3)
+    np.testing.assert_allclose(np.diff(from_edges), 50e-6, rtol=1e-4)  # interpolated
+    assert boundaries_from_edges(time_axis, np.ones_like(time_axis)).size == 0
+
+
+def test_period_averages_match_per_period_energy() -> None:
+    frequency = 10e3
+    time_axis = np.linspace(0.0, 2e-3, 400_001)
+    losses = _switching_loss(time_axis, frequency)[None, :]
+
+    averaged = average_losses(
+        time_axis,
+        {"total": losses},
+        boundaries_from_frequency(time_axis, frequency),
+        ["Q1"],
+    )
+
+    assert averaged.period_count == 20
+    # 10 W for 30% of the period plus 200 W for 0.2% of it, to within a sample.
+    np.testing.assert_allclose(averaged.total[0], 3.4, rtol=5e-3)
+    assert averaged.steady_state()["total"][0] == pytest.approx(3.4, rel=5e-3)
+
+
+def test_mission_profile_holds_scaled_steady_loss_per_segment() -> None:
+    time_axis, power = mission_profile_power(
+        np.array([2.0, 4.0]),
+        [MissionSegment(10.0, 1.0), MissionSegment(5.0, 0.5)],
+        repeats=2,
+        samples_per_segment=4,
+        start_time=1.0,
+    )
+
+    assert time_axis[0] == 1.0
+    assert time_axis[-1] == pytest.approx(31.0)
+    assert power.shape == (2, 17)
+    np.testing.assert_allclose(power[0, 1:5], 2.0)
+    np.testing.assert_allclose(power[1, 5:9], 2.0)
+
+
+def test_cycle_averaged_thermal_tracks_full_resolution_run() -> None:
+    frequency = 20e3
+    time_axis = np.linspace(0.0, 0.1, 400_001)
+    power = _switching_loss(time_axis, frequency)
+    circuit_data = {
+        "components": [
+            {"id": "m1", "type": "MOSFET_N", "name": "M1"},
+            {
+                "id": "pwm",
+                "type": "PWM_GENERATOR",
+                "name": "PWM",
+                "parameters": {"frequency": frequency},
+            },
+        ]
+    }
+    electrical = TransientResult(time=time_axis.tolist(), signals={"P(M1)": power.tolist()})
+    backend = _backend()
+
+    full = backend._run_thermal_from_waveforms(circuit_data, electrical, ThermalSettings())
+    averaged = backend._run_thermal_from_waveforms(
+        circuit_data, electrical, ThermalSettings(cycle_average=True)
+    )
+
+    assert len(averaged.time) == 2001
+    full_temps = np.interp(averaged.time, full.time, full.devices[0].junction_temperature)
+    # The 20 ms network filters the 50 us ripple; only the ripple itself differs.
+    np.testing.assert_allclose(averaged.devices[0].junction_temperature, full_temps, atol=0.05)
+
+
+def test_edge_detection_and_mission_profile_extend_the_thermal_run() -> None:
+    time_axis = np.linspace(0.0, 0.01, 100_001)
+    power = _switching_loss(time_axis, 5e3)
+    circuit_data = {"components": [{"id": "m1", "type": "MOSFET_N", "name": "M1"}]}
+    electrical = TransientResult(time=time_axis.tolist(), signals={"P(M1)": power.tolist()})
+    settings = ThermalSettings(
+        cycle_average=True,
+        mission_profile=[(0.5, 1.0), (0.5, 0.0)],
+        mission_repeats=3,
+    )
+
+    result = _backend()._run_thermal_from_waveforms(circuit_data, electrical, settings)
+
+    assert result.time[-1] == pytest.approx(3.01)
+    temps = np.asarray(result.devices[0].junction_temperature)
+    heated = np.interp(0.51, result.time, temps)
+    cooled = np.interp(1.01, result.time, temps)
+    # 0.5 s (25 time constants) of full load settles at Rth * P: 0.8 K/W * 3.4 W above ambient.
+    assert heated == pytest.approx(25.0 + 0.8 * 3.4, abs=0.05)
+    assert cooled == pytest.approx(25.0, abs=0.01)
+
+
+def test_cycle_average_drives_with_per_device_loss_components() -> None:
+    frequency = 5e3
+    time_axis = np.linspace(0.0, 2e-3, 40_001)
+    phase = np.mod(time_axis * frequency, 1.0)
+    components = {
+        # Q1 conducts 10 W for 30% of each period and switches 200 W for 0.2%.
+        "conduction": np.vstack([np.where(phase < 0.3, 10.0, 0.0), np.full_like(phase, 1.5)]),
+        "switching": np.vstack([np.where(phase < 2e-3, 200.0, 0.0), np.zeros_like(phase)]),
+    }
+    settings = ThermalSettings(cycle_average=True, mission_profile=[(1.0, 2.0)])
+
+    thermal_time, thermal_power = _backend()._thermal_drive(
+        {"components": []}, ["Q1", "D1"], time_axis, components, settings
+    )
+
+    # Period edges come from Q1's switching losses, not D1's flat conduction.
+    periods = thermal_time[thermal_time <= time_axis[-1]]
+    np.testing.assert_allclose(np.diff(periods[1:-1]), 1.0 / frequency, rtol=1e-3)
+    assert thermal_power[0, 5] == pytest.approx(3.0 + 0.4, rel=1e-2)
+    assert thermal_power[1, 5] == pytest.approx(1.5)
+    # The mission profile scales the summed steady-state components.
+    assert thermal_power[0, -1] == pytest.approx(2.0 * 3.4, rel=1e-2)
+    assert thermal_power[1, -1] == pytest.approx(3.0)
@@ -0,0 +1,130 @@
+"""Tests for waveform-based conduction and switching loss extraction."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.backend_adapter import BackendInfo, PulsimBackend
+from pulsimgui.services.backend_types import ThermalSettings, TransientResult
+from pulsimgui.services.loss_extraction import (
+    DeviceTerminals,
+    extract_device_losses,
+    extract_losses,
+)
+
+PERIOD = 10e-6
+RISE = 100e-9
+V_BUS = 400.0
+I_LOAD = 10.0
+V_ON = 0.1  # 10 A through 10 mOhm
+
+
+def _hard_switched_mosfet(periods: int = 5) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Gate at 1-6 us of every period with linear 100 ns v/i ramps."""
+    time_axis = np.linspace(0.0, periods * PERIOD, periods * 10_000 + 1)
+    phase = np.mod(time_axis, PERIOD)
+    corners = [0.0, 1e-6, 1e-6 + RISE, 6e-6, 6e-6 + RISE, PERIOD]
+    voltage = np.interp(phase, corners, [V_BUS, V_BUS, V_ON, V_ON, V_BUS, V_BUS])
+    current = np.interp(phase, corners, [0.0, 0.0, I_LOAD, I_LOAD, 0.0, 0.0])
+    gate = np.where((phase >= 1e-6 - 1e-12) & (phase < 6e-6 - 1e-12), 10.0, 0.0)
+    return time_axis, {"V(sw)": voltage, "V(gate)": gate, "I(M1)": current}
+
+
+def _mosfet_component() -> dict:
+    return {
+        "id": "m1",
+        "type": "MOSFET_N",
+        "name": "M1",
+        "parameters": {"vth": 2.0, "rds_on": 0.01},
+        "pin_nodes": ["2", "3", "0"],
+    }
+
+
+def test_transition_energies_match_linear_ramps() -> None:
+    time_axis, signals = _hard_switched_mosfet()
+    terminals = DeviceTerminals.from_component(
+        _mosfet_component(), node_aliases={"2": "sw", "3": "gate"}
+    )
+
+    losses = extract_device_losses(time_axis, signals, terminals)
+
+    # Integral of (V - (V - v_on) s) * I s over a ramp of length RISE.
+    ramp_energy = I_LOAD * RISE * (V_BUS / 2 - (V_BUS - V_ON) / 3)
+    assert losses.turn_on_energy.size == 5 and losses.turn_off_energy.size == 5
+    np.testing.assert_allclose(losses.turn_on_energy, ramp_energy, rtol=0.01)
+    np.testing.assert_allclose(losses.turn_off_energy, ramp_energy, rtol=0.01)
+    breakdown = losses.breakdown()
+    assert breakdown.conduction == pytest.approx(V_ON * I_LOAD * 0.49, rel=0.02)
+    assert breakdown.switching_on == pytest.approx(ramp_energy / PERIOD, rel=0.01)
+    dt = np.diff(time_axis)
+    total = np.sum(0.5 * (losses.power[1:] + losses.power[:-1]) * dt) / time_axis[-1]
+    assert breakdown.total == pytest.approx(total, rel=1e-9)
+    split = losses.components()
+    np.testing.assert_array_equal(split["conduction"] + split["switching"], losses.power)
+    assert not np.any(split["switching"][~losses.switching_mask])
+    assert not np.any(losses.components(include_switching=False)["switching"])
+
+
+def test_terminals_follow_pin_layout_aliases_and_ground() -> None:
+    pmos = DeviceTerminals.from_component(
+        {"type": "MOSFET_P", "name": "M2", "pin_nodes": ["1", "4", "5"]},
+        node_aliases={"5": "vdd rail"},
+    )
+    switch = DeviceTerminals.from_component(
+        {"type": "SWITCH", "name": "S1", "pin_nodes": ["7", "8", "0"]}
+    )
+
+    assert (pmos.positive, pmos.negative) == ("V(vdd_rail)", "V(N1)")
+    assert (pmos.gate, pmos.gate_reference, pmos.gate_threshold) == ("V(N4)", "V(vdd_rail)", -2.0)
+    assert (switch.positive, switch.negative, switch.gate) == ("V(N8)", None, "V(N7)")
+    assert switch.g_on == pytest.approx(1e3)
+    assert DeviceTerminals.from_component({"type": "RESISTOR", "name": "R1"}) is None
+
+
+def test_diode_without_current_signal_uses_conductance_model() -> None:
+    time_axis = np.linspace(0.0, 1e-3, 1001)
+    anode = np.where(np.sin(2 * np.pi * 5e3 * time_axis) > 0, 0.01, -50.0)
+    component = {
+        "type": "DIODE",
+        "name": "D1",
+        "parameters": {"ron": 0.01, "roff": 1e6},
+        "pin_nodes": ["1", "0"],
+    }
+
+    losses = extract_losses({"components": [component]}, time_axis, {"V(N1)": anode})
+
+    power = losses["D1"].power
+    np.testing.assert_allclose(power[anode > 0], 0.01**2 / 0.01)
+    np.testing.assert_allclose(power[anode < 0], 50.0**2 / 1e6)
+    assert losses["D1"].turn_on_energy.size == 5
+
+
+def test_thermal_breakdown_uses_extracted_losses() -> None:
+    time_axis, signals = _hard_switched_mosfet()
+    circuit_data = {
+        "components": [_mosfet_component()],
+        "node_aliases": {"2": "sw", "3": "gate"},
+    }
+    electrical = TransientResult(
+        time=time_axis.tolist(),
+        signals={key: values.tolist() for key, values in signals.items()},
+    )
+    backend = PulsimBackend(
+        SimpleNamespace(__version__="2.0.0"),
+        BackendInfo(identifier="pulsim", name="Pulsim", version="2.0.0", status="available"),
+    )
+
+    full = backend._run_thermal_from_waveforms(circuit_data, electrical, ThermalSettings())
+    conduction_only = backend._run_thermal_from_waveforms(
+        circuit_data, electrical, ThermalSettings(include_switching_losses=False)
+    )
+
+    losses = full.devices[0].losses
+    assert not full.is_synthetic
+    assert losses.switching_on == pytest.approx(losses.switching_off, rel=0.01)
+    assert losses.switching_total > losses.conduction > 0.0
+    assert conduction_only.devices[0].losses.switching_total == 0.0
+    assert conduction_only.devices[0].peak_temperature < full.devices[0].peak_temperature
@@ -0,0 +1,180 @@
+"""Tests for the operating-point cache and its reuse by the backends."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from pulsimgui.services.backend_adapter import (
+    BackendCallbacks,
+    BackendInfo,
+    PlaceholderBackend,
+    PulsimBackend,
+)
+from pulsimgui.services.backend_types import DCSettings
+from pulsimgui.services.operating_point_cache import (
+    OperatingPoint,
+    OperatingPointCache,
+    circuit_fingerprint,
+)
+from pulsimgui.services.simulation_service import SimulationService, SimulationSettings
+
+
+class _FakeCircuit:
+    def __init__(self) -> None:
+        self._nodes: dict[str, int] = {}
+
+    @staticmethod
+    def ground() -> int:
+        return 0
+
+    def add_node(self, name: str) -> int:
+        return self._nodes.setdefault(name, len(self._nodes) + 1)
+
+    def add_voltage_source(self, name: str, npos: int, nneg: int, value: float) -> None:
+        _ = (name, npos, nneg, value)
+
+    def add_resistor(self, name: str, n1: int, n2: int, resistance: float) -> None:
+        _ = (name, n1, n2, resistance)
+
+    def node_names(self) -> list[str]:
+        return ["OUT"]
+
+    def signal_names(self) -> list[str]:
+        return ["V(OUT)", "I(V1)"]
+
+
+class _FakeNewtonOptions:
+    def __init__(self) -> None:
+        self.max_iterations = 0
+        self.enable_limiting = False
+        self.max_voltage_step = 0.0
+
+
+def _circuit_data(resistance: float = 1000.0) -> dict[str, Any]:
+    return {
+        "components": [
+            {
+                "id": "v1",
+                "type": "VOLTAGE_SOURCE",
+                "name": "V1",
+                "parameters": {"waveform": {"type": "dc", "value": 5.0}},
+                "pin_nodes": ["1", "0"],
+                "x": 0.0,
+            },
+            {
+                "id": "r1",
+                "type": "RESISTOR",
+                "name": "R1",
+                "parameters": {"resistance": resistance},
+                "pin_nodes": ["1", "0"],
+                "x": 40.0,
+            },
+        ],
+        "node_map": {"v1": ["1", "0"], "r1": ["1", "0"]},
+        "node_aliases": {"1": "OUT", "0": "0"},
+        "wires": [],
+    }
+
+
+def _callbacks() -> BackendCallbacks:
+    return BackendCallbacks(
+        progress=lambda *_: None,
+        data_point=lambda *_: None,
+        check_cancelled=lambda: False,
+        wait_if_paused=lambda: None,
+    )
+
+
+def _backend(calls: dict[str, list]) -> PulsimBackend:
+    def dc_operating_point(circuit, config):  # noqa: ANN001
+        calls["dc"].append(circuit)
+        return SimpleNamespace(
+            success=True,
+            newton_result=SimpleNamespace(solution=[5.0, -0.005], iterations=3),
+            message="",
+        )
+
+    def run_transient_streaming(circuit, t_start, t_stop, dt, *args):  # noqa: ANN001
+        calls["x0"].append(list(args[0]) if len(args) == 6 else None)
+        return [t_start, t_stop], [[5.0, -0.005], [5.0, -0.005]], True, ""
+
+    module = SimpleNamespace(
+        __version__="2.0.0",
+        Circuit=_FakeCircuit,
+        NewtonOptions=_FakeNewtonOptions,
+        DCConvergenceConfig=SimpleNamespace,
+        dc_operating_point=dc_operating_point,
+        run_transient_streaming=run_transient_streaming,
+    )
+    return PulsimBackend(
+        module,
+        BackendInfo(identifier="pulsim", name="Pulsim", version="2.0.0", status="available"),
+    )
+
+
+def test_fingerprint_ignores_layout_but_tracks_parameters() -> None:
+    base = _circuit_data()
+    moved = _circuit_data()
+    moved["components"][1]["x"] = 400.0
+
+    assert circuit_fingerprint(base) == circuit_fingerprint(moved)
+    assert circuit_fingerprint(base) != circuit_fingerprint(_circuit_data(2000.0))
+
+
+def test_cache_lookup_prefers_strategy_and_keeps_dc_over_transient() -> None:
+    cache = OperatingPointCache(max_entries=2)
+    cache.store(OperatingPoint("a", "gmin", state=[1.0]))
+    cache.store(OperatingPoint("a", "gmin", state=[9.0], source="transient"))
+    cache.store(OperatingPoint("a", "auto", state=[2.0]))
+
+    assert cache.lookup("a", "source").state == [2.0]
+    assert cache.get("a", "gmin").state == [1.0]
+    assert cache.lookup("b") is None
+
+    cache.store(OperatingPoint("b", "auto"))
+    assert len(cache) == 2
+    assert cache.get("a", "auto") is None  # least recently used was evicted
+
+    cache.invalidate("b")
+    assert cache.lookup("b") is None
+
+
+def test_transient_reuses_cached_operating_point_until_circuit_changes() -> None:
+    calls: dict[str, list] = {"dc": [], "x0": []}
+    backend = _backend(calls)
+    settings = SimulationSettings(t_start=0.0, t_stop=1e-3, t_step=1e-6, max_step=5e-6)
+
+    backend.run_transient(_circuit_data(), settings, _callbacks())
+    backend.run_transient(_circuit_data(), settings, _callbacks())
+    dc_result = backend.run_dc(_circuit_data(), DCSettings())
+
+    assert len(calls["dc"]) == 1
+    assert calls["x0"] == [[5.0, -0.005], [5.0, -0.005]]
+    assert dc_result.is_valid
+    assert dc_result.node_voltages == {"V(OUT)": 5.0}
+    assert dc_result.convergence_info.strategy_used == "cached"
+
+    backend.run_transient(_circuit_data(2000.0), settings, _callbacks())
+    assert len(calls["dc"]) == 2
+
+
+def test_service_serves_overlay_from_cache(monkeypatch) -> None:
+    class _Loader:
+        def __init__(self, preferred_backend_id: str | None = None) -> None:
+            self.backend = PlaceholderBackend()
+            self.available_backends = [self.backend.info]
+            self.active_backend_id = self.backend.info.identifier
+
+    monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _Loader)
+    service = SimulationService()
+    circuit_data = _circuit_data()
+
+    assert service.cached_dc_result(circuit_data) is None
+
+    service.backend.run_dc(circuit_data, DCSettings())
+    cached = service.cached_dc_result(circuit_data)
+
+    assert cached is not None
+    assert cached.branch_currents["I(R1)"] == 0.005
+    assert service.cached_dc_result(_circuit_data(2000.0)) is None
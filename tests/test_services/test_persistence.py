@@ -0,0 +1,55 @@
+"""Tests for folding periodic waveforms into persistence maps."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.persistence import PersistenceAccumulator, detect_period
+
+
+def _pwm(cycles: int, period: float = 1e-5, samples_per_cycle: int = 100) -> tuple[np.ndarray, np.ndarray]:
+    time = np.arange(cycles * samples_per_cycle + 1) * (period / samples_per_cycle)
+    gate = (np.mod(time, period) < 0.3 * period).astype(float)
+    return time, gate
+
+
+def test_detect_period_of_a_pwm_gate() -> None:
+    time, gate = _pwm(50)
+    assert detect_period(time, gate) == pytest.approx(1e-5)
+    assert detect_period(time, np.ones_like(time)) is None
+
+
+def test_folded_pwm_spends_duty_cycle_high() -> None:
+    time, gate = _pwm(200)
+    # Half a sample of phase offset keeps samples off the column edges.
+    accumulator = PersistenceAccumulator(1e-5, phase_bins=100, value_bins=10, origin=-5e-8)
+    persistence = accumulator.update(time, gate)
+
+    assert persistence.cycles == pytest.approx(200.0, rel=1e-3)
+    assert persistence.counts.sum() == pytest.approx(time[-1] - time[0])
+    low, high = persistence.value_range
+    assert low < 0.0 and high > 1.0
+    # Every phase column holds one cycle's worth of time per folded cycle.
+    per_column = persistence.counts.sum(axis=1)
+    np.testing.assert_allclose(per_column, per_column[0], rtol=1e-6)
+    high_rows = persistence.counts[:, persistence.value_edges[:-1] > 0.5].sum()
+    assert high_rows / persistence.counts.sum() == pytest.approx(0.3, abs=0.01)
+
+
+def test_growing_records_fold_only_new_samples() -> None:
+    time, gate = _pwm(100)
+    incremental = PersistenceAccumulator(1e-5, value_range=(-0.5, 1.5))
+    incremental.update(time[:3_001], gate[:3_001])
+    assert incremental.consumed == 3_000
+    incremental.update(time, gate)
+
+    whole = PersistenceAccumulator(1e-5, value_range=(-0.5, 1.5)).update(time, gate)
+    np.testing.assert_allclose(incremental.map.counts, whole.counts)
+
+
+def test_invalid_period_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        PersistenceAccumulator(0.0)
+    with pytest.raises(ValueError):
+        PersistenceAccumulator(1.0).update(np.arange(3.0), np.arange(2.0))
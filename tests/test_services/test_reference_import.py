@@ -0,0 +1,178 @@
+"""Tests for memory-mapped import of reference waveforms."""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from pulsimgui.services import reference_import
+from pulsimgui.services.export_service import ExportCancelled, ExportService
+from pulsimgui.services.reference_import import (
+    ReferenceImportWorker,
+    load_reference,
+    reference_cache_path,
+)
+from pulsimgui.services.result_store import ResultStore
+from pulsimgui.services.simulation_service import SimulationResult
+
+SAMPLES = 20_001
+
+
+@pytest.fixture
+def waves() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    time = np.linspace(0.0, 1e-3, SAMPLES)
+    return time, np.sin(time * 1e4) * 12.0, np.cos(time * 1e4) * 3.0
+
+
+def test_exported_and_fortran_ordered_files_map_in_place(waves, tmp_path) -> None:
+    time, v_out, i_l = waves
+    run = SimulationResult(time=time, signals={"V(out)": v_out, "I(L1)": i_l})
+    ExportService.export_waveforms_npz(run, str(tmp_path / "run.npz"))
+    ExportService.export_waveforms_columnar(run, str(tmp_path / "run.pwf"))
+    np.save(tmp_path / "scope.npy", np.asfortranarray(np.column_stack([time, v_out, i_l])))
+
+    npz = load_reference(tmp_path / "run.npz")
+    npy = load_reference(tmp_path / "scope.npy")
+    pwf = load_reference(tmp_path / "run.pwf")
+
+    assert list(npz.signals) == list(pwf.signals) == ["V(out)", "I(L1)"]
+    assert list(npy.signals) == ["ch1", "ch2"]
+    for result in (npz, npy, pwf):
+        assert isinstance(result.time, np.memmap) and result.time.flags.aligned
+        assert all(isinstance(values, np.memmap) for values in result.signals.values())
+        np.testing.assert_array_equal(result.time, time)
+    np.testing.assert_array_equal(npz.signals["I(L1)"], i_l)
+    np.testing.assert_array_equal(npy.signals["ch1"], v_out)
+    # Mapped in place: nothing was converted next to the sources.
+    assert sorted(os.listdir(tmp_path)) == ["run.npz", "run.pwf", "scope.npy"]
+
+    store = ResultStore.for_result(npz)
+    assert not store.get("V(out)").flags.writeable
+    assert np.shares_memory(store.get("V(out)"), npz.signals["V(out)"])
+
+
+def test_exported_npz_members_are_aligned_for_mapping(waves, tmp_path, monkeypatch) -> None:
+    time, v_out, i_l = waves
+    run = SimulationResult(time=time, signals={"V(out)": v_out, "I(L1)": i_l, "x" * 37: v_out})
+    path = tmp_path / "run.npz"
+    ExportService.export_waveforms_npz(run, str(path))
+    conversions: list[str] = []
+    monkeypatch.setattr(
+        reference_import, "_converted_sidecar", lambda *args: conversions.append("npz")
+    )
+
+    result = load_reference(path, cache_dir=tmp_path / "cache")
+
+    for values in [result.time, *result.signals.values()]:
+        assert isinstance(values, np.memmap) and values.offset % 64 == 0
+        assert str(values.filename) == str(path.resolve())
+    np.testing.assert_array_equal(result.signals["x" * 37], v_out)
+    assert conversions == [] and not (tmp_path / "cache").exists()
+    with np.load(path) as archive:
+        np.testing.assert_array_equal(archive["I(L1)"], i_l)
+
+
+def test_csv_is_converted_once_into_a_cached_sidecar(waves, tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(reference_import, "CONVERT_CHUNK_ROWS", 999)
+    time, v_out, i_l = waves
+    path = tmp_path / "capture.csv"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Lab capture,bench 3\nSample rate,20M\nTime (s),CH1,CH2\n")
+        for index in range(SAMPLES):
+            i_field = "" if index == 7 else repr(float(i_l[index]))
+            f.write(f"{float(time[index])!r},{float(v_out[index])!r},{i_field}\n")
+    fractions: list[float] = []
+
+    result = load_reference(path, progress=fractions.append)
+
+    sidecar = reference_cache_path(path)
+    assert sidecar.name == "capture.csv.pwf" and sidecar.is_file()
+    assert list(result.signals) == ["CH1", "CH2"]
+    assert isinstance(result.signals["CH1"], np.memmap)
+    np.testing.assert_array_equal(result.time, time)
+    np.testing.assert_array_equal(result.signals["CH1"], v_out)
+    assert np.isnan(result.signals["CH2"][7]) and result.signals["CH2"][8] == i_l[8]
+    assert fractions == sorted(fractions) and fractions[-1] == 1.0
+
+    # A second import maps the sidecar without parsing the text again, until
+    # the source changes.
+    parses: list[str] = []
+    parse = reference_import._csv_blocks
+    monkeypatch.setattr(
+        reference_import, "_csv_blocks", lambda *args: parses.append("csv") or parse(*args)
+    )
+    again = load_reference(path)
+    np.testing.assert_array_equal(again.signals["CH1"], v_out)
+    assert parses == []
+    os.utime(path, ns=(0, 0))
+    load_reference(path)
+    assert parses == ["csv"]
+
+
+def test_unmappable_binaries_convert_to_a_cache_dir(waves, tmp_path) -> None:
+    time, v_out, _i_l = waves
+    # Compressed, single precision, misaligned members and row-major columns
+    # would all be copied on every redraw if mapped as they are.
+    np.savez_compressed(tmp_path / "packed.npz", time=time, **{"V(out)": v_out.astype(np.float32)})
+    np.savez(tmp_path / "plain.npz", time=time, **{"V(out)": v_out})
+    np.save(tmp_path / "single.npy", np.column_stack([time, v_out]).astype(np.float32))
+    np.save(tmp_path / "rows.npy", np.column_stack([time, v_out]))
+    cache = tmp_path / "cache"
+
+    results = {
+        name: load_reference(tmp_path / name, cache_dir=cache)
+        for name in ("packed.npz", "plain.npz", "single.npy", "rows.npy")
+    }
+
+    for name, result in results.items():
+        values = next(iter(result.signals.values()))
+        assert isinstance(values, np.memmap) and values.flags.aligned and values.flags.c_contiguous
+        np.testing.assert_allclose(result.time, time, rtol=1e-6)
+        np.testing.assert_allclose(values, v_out, rtol=1e-6)
+        assert reference_cache_path(tmp_path / name, cache).is_file()
+    assert len(list(cache.iterdir())) == 4
+
+
+def test_malformed_files_raise_and_cancel_leaves_no_sidecar(waves, tmp_path, monkeypatch) -> None:
+    time, v_out, _i_l = waves
+    with pytest.raises(ValueError):
+        load_reference(tmp_path / "capture.xlsx")
+    np.savez(tmp_path / "untimed.npz", v=v_out)
+    with pytest.raises(ValueError):
+        load_reference(tmp_path / "untimed.npz")
+    np.savez(tmp_path / "backwards.npz", time=time[::-1].copy(), v=v_out)
+    with pytest.raises(ValueError):
+        load_reference(tmp_path / "backwards.npz")
+    np.savez(tmp_path / "short.npz", time=time, v=v_out[:10])
+    with pytest.raises(ValueError):
+        load_reference(tmp_path / "short.npz")
+    (tmp_path / "words.csv").write_text("a,b\nc,d\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_reference(tmp_path / "words.csv")
+
+    monkeypatch.setattr(reference_import, "CONVERT_CHUNK_ROWS", 1000)
+    np.savetxt(tmp_path / "big.csv", np.column_stack([time, v_out]), delimiter=",")
+    calls = iter([False, False, True])
+    with pytest.raises(ExportCancelled):
+        load_reference(tmp_path / "big.csv", is_cancelled=lambda: next(calls))
+    assert sorted(os.listdir(tmp_path)) == [
+        "backwards.npz", "big.csv", "short.npz", "untimed.npz", "words.csv"
+    ]
+
+
+def test_worker_reports_progress_and_result(qapp, waves, tmp_path) -> None:
+    time, v_out, _i_l = waves
+    path = str(tmp_path / "capture.csv")
+    np.savetxt(path, np.column_stack([time, v_out]), delimiter=",", header="t,probe", comments="")
+    worker = ReferenceImportWorker(path, cache_dir=str(tmp_path / "cache"))
+    progress: list[float] = []
+    finished: list[tuple[str, SimulationResult]] = []
+    worker.progress.connect(lambda value, _message: progress.append(value))
+    worker.finished_signal.connect(lambda source, result: finished.append((source, result)))
+
+    worker.run()
+
+    assert progress[0] == 0.0 and progress[-1] == 100.0
+    assert finished[0][0] == path and list(finished[0][1].signals) == ["probe"]
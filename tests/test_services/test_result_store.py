@@ -0,0 +1,92 @@
+"""Tests for the shared read-only result store."""
+
+from __future__ import annotations
+
+import gc
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.result_store import PYRAMID_BASE, PYRAMID_FACTOR, ResultStore
+from pulsimgui.services.simulation_service import SimulationResult
+
+
+def _result() -> SimulationResult:
+    return SimulationResult(
+        time=[0.0, 1.0, 2.0, 3.0],
+        signals={"V(out)": [1.0, 2.0, 3.0, 4.0], "I(L1)": [0.5, 0.5]},
+    )
+
+
+def test_store_is_shared_per_result_and_read_only() -> None:
+    result = _result()
+
+    store = ResultStore.for_result(result)
+    values = store.get("V(out)")
+
+    assert ResultStore.for_result(result) is store
+    assert store.get("V(out)") is values
+    assert store.get("missing") is None
+    with pytest.raises(ValueError):
+        values[0] = 10.0
+    assert ResultStore.for_result(_result()) is not store
+
+
+def test_views_slice_without_copying() -> None:
+    store = ResultStore(np.arange(5.0), {"x": np.arange(5.0) * 2})
+
+    view = store.view("x", 1, 4)
+
+    np.testing.assert_array_equal(view.values, [2.0, 4.0, 6.0])
+    np.testing.assert_array_equal(view.time, [1.0, 2.0, 3.0])
+    assert np.shares_memory(view.values, store.get("x"))
+    assert view.is_valid
+    assert not store.view("missing").is_valid
+
+
+def test_caller_arrays_stay_writable() -> None:
+    time_axis = np.linspace(0.0, 1.0, 3)
+
+    store = ResultStore(time_axis, {})
+    time_axis[0] = -1.0
+
+    assert not store.time.flags.writeable
+    assert store.time[0] == -1.0  # Shares the buffer rather than copying it.
+
+
+def test_grown_result_gets_fresh_store_and_dead_results_are_dropped() -> None:
+    result = _result()
+    store = ResultStore.for_result(result)
+    result.time.append(4.0)
+
+    grown = ResultStore.for_result(result)
+    assert grown is not store and grown.sample_count == 5
+
+    key = id(result)
+    del result
+    gc.collect()
+    assert key not in ResultStore._shared
+
+
+def test_pyramid_levels_hold_bucket_extremes() -> None:
+    samples = 100_003
+    time = np.arange(samples, dtype=float)
+    values = np.sin(time / 500.0) + (time % 7 == 0)
+    store = ResultStore(time, {"v": values, "short": values[:10]})
+
+    pyramid = store.pyramid("v")
+
+    assert store.pyramid("v") is pyramid and store.pyramid("short") is None
+    levels = pyramid.levels
+    assert [level.bucket for level in levels[:2]] == [PYRAMID_BASE, PYRAMID_BASE * PYRAMID_FACTOR]
+    for level in levels:
+        assert len(level.lows) == -(-samples // level.bucket)
+        assert level.lows[-1] == values[(len(level.lows) - 1) * level.bucket :].min()
+        np.testing.assert_array_equal(level.time, time[:: level.bucket])
+    fine = levels[0]
+    np.testing.assert_array_equal(fine.highs[:3], values[: 3 * PYRAMID_BASE].reshape(3, -1).max(axis=1))
+    assert levels[-1].highs.max() == values.max()
+    assert pyramid.level_for(samples, 1000) is fine
+    assert pyramid.level_for(samples, 100) is levels[1]
+    assert pyramid.level_for(1000, 1000) is None
+    assert ResultStore(time[:100], {"v": values[:100]}).pyramid("v").levels == []
@@ -0,0 +1,130 @@
+"""Tests for the LRU run history."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.run_history import RunHistory, result_nbytes
+from pulsimgui.services.simulation_service import SimulationResult
+
+
+def _run(samples: int = 100, offset: float = 0.0) -> SimulationResult:
+    time = np.linspace(0.0, 1.0, samples)
+    return SimulationResult(
+        time=time.tolist(),
+        signals={"V(out)": (time + offset).tolist(), "I(L1)": (2 * time).tolist()},
+        statistics={"time_steps": samples, "solver": "trapezoidal"},
+    )
+
+
+def test_runs_are_evicted_by_count_in_lru_order() -> None:
+    history = RunHistory(max_runs=2)
+    first = history.add(_run())
+    second = history.add(_run())
+
+    assert history.get(first.run_id) is not None  # first is now most recent
+    third = history.add(_run())
+
+    assert [record.run_id for record in history.runs()] == [third.run_id, first.run_id]
+    assert history.get(second.run_id) is None
+
+
+def test_byte_budget_keeps_the_newest_run_even_when_oversized() -> None:
+    small = _run(100)
+    history = RunHistory(max_runs=10, max_bytes=result_nbytes(small) * 2)
+    history.add(small)
+    history.add(_run(100))
+    large = history.add(_run(10_000))
+
+    assert [record.run_id for record in history.runs()] == [large.run_id]
+    assert history.memory_bytes == result_nbytes(large.result)
+
+
+def test_evicted_runs_spill_to_disk_and_map_back(tmp_path) -> None:
+    history = RunHistory(max_runs=1, spill_dir=tmp_path)
+    original = _run(500, offset=3.0)
+    first = history.add(original)
+    history.add(_run())
+
+    assert not first.in_memory
+    assert first.spill_path is not None and first.spill_path.is_dir()
+    restored = history.get(first.run_id)
+
+    assert isinstance(restored.time, np.memmap)
+    np.testing.assert_array_equal(restored.signals["V(out)"], original.signals["V(out)"])
+    assert restored.statistics == {"time_steps": 500, "solver": "trapezoidal"}
+    assert len(history) == 2
+
+    history.clear()
+    assert not first.spill_path.exists()
+
+
+def test_re_adding_a_held_result_refreshes_it() -> None:
+    history = RunHistory()
+    result = _run(100)
+    record = history.add(result, label="baseline")
+    result.append_segment(
+        SimulationResult(time=[1.0, 2.0], signals={"V(out)": [1.0, 2.0], "I(L1)": [2.0, 4.0]})
+    )
+
+    assert history.add(result) is record
+    assert record.label == "baseline"
+    assert record.nbytes == result_nbytes(result)
+    assert len(history) == 1
+
+
+def test_invalid_limits_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        RunHistory(max_runs=0)
+    with pytest.raises(ValueError):
+        RunHistory().set_limits(max_bytes=-1)
+
+
+def test_result_nbytes_counts_boxed_list_samples() -> None:
+    listed = _run(10_000)
+    arrays = SimulationResult(
+        time=np.asarray(listed.time),
+        signals={name: np.asarray(values) for name, values in listed.signals.items()},
+    )
+
+    assert result_nbytes(arrays) == 3 * 8 * 10_000
+    # A list of floats holds a pointer and a boxed float per sample.
+    assert result_nbytes(listed) >= 3 * 32 * 10_000
+
+
+def test_peek_maps_spilled_runs_without_reloading_them(tmp_path) -> None:
+    history = RunHistory(max_runs=1, spill_dir=tmp_path)
+    first = history.add(_run(500, offset=3.0))
+    second = history.add(_run())
+
+    mapped = history.peek(first.run_id)
+    assert isinstance(mapped.time, np.memmap) and history.peek(first.run_id) is mapped
+    assert not first.in_memory and second.in_memory
+    assert [record.run_id for record in history.runs()] == [second.run_id, first.run_id]
+    assert history.peek(second.run_id) is second.result
+
+    history.set_limits(max_spilled_runs=0)
+    assert history.peek(first.run_id) is None and len(history) == 1
+
+
+
+def test_histories_sharing_a_spill_dir_keep_their_own_runs(tmp_path) -> None:
+    first_history = RunHistory(max_runs=1, spill_dir=tmp_path)
+    second_history = RunHistory(max_runs=1, spill_dir=tmp_path)
+    mine = first_history.add(_run(3, offset=1.0))
+    first_history.add(_run())
+    theirs = second_history.add(_run(2, offset=9.0))
+    second_history.add(_run())
+
+    assert mine.run_id == theirs.run_id
+    assert mine.spill_path.parent != theirs.spill_path.parent
+    mapped = first_history.peek(mine.run_id)
+    np.testing.assert_array_equal(mapped.signals["V(out)"], [1.0, 1.5, 2.0])
+
+    del mapped
+    first_history.clear()
+    assert not mine.spill_path.parent.exists()
+    np.testing.assert_array_equal(second_history.peek(theirs.run_id).signals["V(out)"], [9.0, 10.0])
+    second_history.clear()
+    assert list(tmp_path.iterdir()) == []
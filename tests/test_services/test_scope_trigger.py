@@ -0,0 +1,122 @@
+"""Tests for oscilloscope-style triggering of streamed samples."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.scope_trigger import StreamBuffer, StreamTrigger, TriggerSettings
+
+PERIOD = 10e-6
+DT = 1e-7
+
+
+def _square(start: float, stop: float) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """A 100 kHz, 0/1 square wave and a sawtooth sampled every 100 ns."""
+    time = np.arange(round(start / DT), round(stop / DT)) * DT
+    phase = np.mod(time + DT / 2, PERIOD) / PERIOD
+    return time, {"gate": (phase < 0.3).astype(float), "ramp": phase}
+
+
+def test_settings_reject_invalid_values() -> None:
+    with pytest.raises(ValueError):
+        TriggerSettings("gate", slope="sideways")
+    with pytest.raises(ValueError):
+        TriggerSettings("gate", mode="roll")
+    with pytest.raises(ValueError):
+        TriggerSettings("gate", window=0.0)
+    with pytest.raises(ValueError):
+        TriggerSettings("gate", pre_trigger=1.5)
+    with pytest.raises(ValueError):
+        TriggerSettings("gate", holdoff=-1.0)
+
+
+def test_buffer_stays_bounded_and_pads_missing_series() -> None:
+    buffer = StreamBuffer(capacity=100)
+    buffer.append(np.arange(60.0), {"a": np.arange(60.0)})
+    buffer.append(np.arange(60.0, 90.0), {"b": np.ones(30)})
+    buffer.append(np.arange(90.0, 150.0), {"a": np.arange(90.0, 150.0), "b": np.ones(60)})
+
+    assert len(buffer) <= 100
+    assert buffer.time[-1] == 149.0
+    np.testing.assert_array_equal(np.diff(buffer.time), 1.0)
+    a = buffer.values("a")
+    assert np.isnan(a[(buffer.time >= 60) & (buffer.time < 90)]).all()
+    np.testing.assert_array_equal(a[buffer.time >= 90], np.arange(90.0, 150.0))
+
+
+def test_rising_trigger_aligns_sweeps_on_the_edge() -> None:
+    settings = TriggerSettings("gate", level=0.5, window=2 * PERIOD, pre_trigger=0.25)
+    trigger = StreamTrigger(settings)
+
+    frame = None
+    for start in np.arange(0.0, 20 * PERIOD, 3.3 * PERIOD):
+        frame = trigger.process(*_square(start, min(start + 3.3 * PERIOD, 20 * PERIOD))) or frame
+
+    assert frame is not None and frame.triggered
+    assert frame.time[0] >= -settings.pre_trigger_time - DT
+    assert frame.time[-1] <= settings.post_trigger_time + DT
+    # The trigger lands on a rising edge of the gate.
+    cycles = frame.trigger_time / PERIOD
+    assert cycles - round(cycles) == pytest.approx(0.0, abs=DT / PERIOD)
+    gate = frame.signals["gate"]
+    assert gate[frame.time < -DT][-1] == 0.0
+    assert gate[frame.time > DT][0] == 1.0
+
+
+def test_falling_slope_and_holdoff() -> None:
+    settings = TriggerSettings(
+        "gate",
+        level=0.5,
+        slope="falling",
+        mode="normal",
+        window=PERIOD,
+        pre_trigger=0.5,
+        holdoff=2.5 * PERIOD,
+    )
+    trigger = StreamTrigger(settings)
+    triggers = []
+    for start in np.arange(0.0, 30 * PERIOD, PERIOD / 2):
+        frame = trigger.process(*_square(start, start + PERIOD / 2))
+        if frame is not None:
+            triggers.append(frame.trigger_time)
+
+    assert len(triggers) >= 5
+    # Falling edge at 30 % of the period; holdoff skips two edges out of three.
+    phases = np.mod(np.asarray(triggers) + DT / 2, PERIOD) / PERIOD
+    np.testing.assert_allclose(phases, 0.3, atol=0.02)
+    np.testing.assert_allclose(np.diff(triggers), 3 * PERIOD, rtol=1e-6)
+
+
+def test_modes_without_and_after_triggers() -> None:
+    time, signals = _square(0.0, 10 * PERIOD)
+    flat = {"gate": np.zeros_like(time)}
+
+    auto = StreamTrigger(TriggerSettings("gate", level=0.5, window=PERIOD))
+    frame = auto.process(time, flat)
+    assert frame is not None and not frame.triggered
+    assert frame.time[-1] == pytest.approx(auto.settings.post_trigger_time)
+
+    normal = StreamTrigger(TriggerSettings("gate", level=0.5, window=PERIOD, mode="normal"))
+    assert normal.process(time, flat) is None
+
+    single = StreamTrigger(TriggerSettings("gate", level=0.5, window=PERIOD, mode="single"))
+    assert single.process(time, signals) is not None
+    assert not single.armed
+    assert single.process(*_square(10 * PERIOD, 20 * PERIOD)) is None
+    single.rearm()
+    assert single.process(*_square(20 * PERIOD, 30 * PERIOD)).sweeps == 2
+
+
+def test_processing_cost_does_not_grow_with_history() -> None:
+    settings = TriggerSettings("gate", level=0.5, window=2 * PERIOD)
+    trigger = StreamTrigger(settings, capacity=1 << 16)
+    chunk = PERIOD * 5
+    sizes = []
+    for index in range(400):
+        frame = trigger.process(*_square(index * chunk, (index + 1) * chunk))
+        if frame is not None:
+            sizes.append(frame.time.size)
+
+    assert len(trigger.buffer) <= 1 << 16
+    assert max(sizes) <= round(settings.window / DT) + 2
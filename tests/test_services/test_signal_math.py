@@ -0,0 +1,115 @@
+"""Tests for the lazy math-expression engine."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.signal_math import MathEngine, MathExpression
+
+
+def _engine(signals: dict[str, np.ndarray], time: np.ndarray) -> MathEngine:
+    engine = MathEngine()
+    engine.bind(time, signals.get)
+    return engine
+
+
+@pytest.fixture
+def waveforms() -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    time = np.linspace(0.0, 1e-3, 4001)
+    return time, {
+        "V(out)": 12.0 + np.sin(2 * np.pi * 5e3 * time),
+        "I(L1)": 2.0 + 0.5 * np.cos(2 * np.pi * 5e3 * time),
+        "V(sw)": np.where((time * 1e5) % 1.0 < 0.25, 48.0, 0.0),
+        "CH1: V(out)": 12.0 + np.sin(2 * np.pi * 5e3 * time),
+    }
+
+
+def test_parse_normalises_syntax_into_one_digest() -> None:
+    first = MathExpression.parse("V(out)*I(L1)")
+    second = MathExpression.parse("  V(out) * I(L1) ")
+    quoted = MathExpression.parse('"CH1: V(out)" / 2k + t')
+
+    assert first.digest == second.digest
+    assert list(first.signals) == ["V(out)", "I(L1)"]
+    assert list(quoted.signals) == ["CH1: V(out)"]
+    assert MathExpression.parse("avg(V(sw), period=10u)").digest != MathExpression.parse(
+        "avg(V(sw), period=20u)"
+    ).digest
+
+    for bad in ("", "1+", "V(out) *", "foo(V(out))", "avg(V(out), width=2)", "abs(1, 2)", "(1"):
+        with pytest.raises(ValueError):
+            MathExpression.parse(bad)
+
+
+def test_expressions_match_numpy_reference(waveforms) -> None:
+    time, signals = waveforms
+    engine = _engine(signals, time)
+
+    np.testing.assert_allclose(
+        engine.evaluate("V(out)*I(L1)"), signals["V(out)"] * signals["I(L1)"]
+    )
+    np.testing.assert_allclose(
+        engine.evaluate('"CH1: V(out)" - 2 * 500m'), signals["V(out)"] - 1.0
+    )
+    np.testing.assert_allclose(engine.evaluate("der(V(out))"), np.gradient(signals["V(out)"], time))
+    np.testing.assert_allclose(
+        engine.evaluate("avg(V(sw), n=16)"),
+        np.convolve(signals["V(sw)"], np.ones(16) / 16, mode="same"),
+        atol=1e-12,
+    )
+    # Averaging over one full period removes the ripple.
+    assert engine.evaluate("avg(V(out), period=200u)")[-1] == pytest.approx(12.0, rel=1e-6)
+    assert engine.evaluate("rms(V(out) - 12, period=200u)")[-1] == pytest.approx(
+        np.sqrt(0.5), rel=1e-3
+    )
+    assert engine.evaluate("integ(I(L1))")[-1] == pytest.approx(2e-3, rel=1e-6)
+    assert np.all(engine.evaluate("V(out) / (I(L1) - I(L1))") == 0.0)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "V(out)*I(L1)",
+        "der(V(out)) * 1u",
+        "avg(V(sw), n=7)",
+        "avg(V(sw), period=10u)",
+        "rms(V(out), period=25u)",
+        "integ(I(L1))",
+    ],
+)
+def test_range_evaluation_matches_full_evaluation(waveforms, expression) -> None:
+    time, signals = waveforms
+    full = _engine(signals, time).evaluate(expression)
+    window = _engine(signals, time).evaluate(expression, 1200, 1300)
+
+    np.testing.assert_allclose(window, full[1200:1300], rtol=1e-12, atol=1e-12)
+    assert not window.flags.writeable
+
+
+def test_cache_is_reused_until_the_source_changes(waveforms) -> None:
+    time, signals = waveforms
+    calls: list[str] = []
+
+    def _resolve(name: str) -> np.ndarray | None:
+        calls.append(name)
+        return signals.get(name)
+
+    engine = MathEngine()
+    engine.bind(time, _resolve)
+    first = engine.evaluate("V(out) * I(L1) + 1")
+    resolved = len(calls)
+    assert engine.evaluate("V(out)*I(L1)+1") is first
+    assert len(calls) == resolved
+
+    assert engine.value_at("V(out)*I(L1)", time[10]) == pytest.approx(first[10] - 1.0)
+
+    generation = engine.generation
+    engine.bind(time, {name: 2 * values for name, values in signals.items()}.get)
+    assert engine.generation == generation + 1
+    assert engine.cache_bytes == 0
+    np.testing.assert_allclose(engine.evaluate("V(out) * I(L1) + 1"), 4 * (first - 1) + 1)
+
+    assert engine.missing_signals("V(out) + V(nope)") == ["V(nope)"]
+    with pytest.raises(ValueError):
+        engine.evaluate("V(nope)")
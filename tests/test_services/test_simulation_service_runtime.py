@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import pytest
+
 from pulsimgui.services.backend_adapter import BackendInfo
 from pulsimgui.services.backend_runtime_service import (
     DEFAULT_BACKEND_TARGET_VERSION,
@@ -44,6 +46,7 @@ class _FakeSettingsService:
     sim_settings: dict | None = None
     solver_settings: dict | None = None
     runtime_settings: dict | None = None
+    run_history_settings: dict | None = None
     backend_preference: str | None = None
 
     def get_backend_preference(self):
@@ -61,6 +64,9 @@ class _FakeSettingsService:
     def get_backend_runtime_settings(self):
         return self.runtime_settings or {}
 
+    def get_run_history_settings(self):
+        return self.run_history_settings or {}
+
     def set_simulation_settings(self, settings: dict):
         self.sim_settings = settings
 
@@ -70,6 +76,26 @@ class _FakeSettingsService:
     def set_backend_runtime_settings(self, settings: dict):
         self.runtime_settings = settings
 
+    def set_run_history_settings(self, settings: dict):
+        self.run_history_settings = settings
+
+
+def test_run_history_limits_are_loaded_and_persisted(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _DummyLoader)
+    fake_settings = _FakeSettingsService(
+        run_history_settings={"max_runs": 3, "max_bytes": 1024, "spill_dir": str(tmp_path)}
+    )
+    service = SimulationService(settings_service=fake_settings)
+
+    history = service.run_history
+    assert (history.max_runs, history.max_bytes, history.spill_dir) == (3, 1024, tmp_path)
+
+    service.update_run_history_settings({"max_spilled_runs": 5, "spill_dir": ""})
+    assert history.max_spilled_runs == 5 and history.spill_dir is None
+    assert fake_settings.run_history_settings == {"max_spilled_runs": 5, "spill_dir": ""}
+    with pytest.raises(ValueError):
+        service.update_run_history_settings({"max_runs": 0})
+
 
 def test_settings_assignment_persists_simulation_and_solver(monkeypatch) -> None:
     monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _DummyLoader)
@@ -0,0 +1,87 @@
+"""Tests for the FFT / THD spectrum analyzer."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from pulsimgui.services import spectrum as spectrum_module
+from pulsimgui.services.spectrum import SpectrumAnalyzer, compute_spectrum, resample_uniform
+
+
+def _distorted_wave(samples: int = 40_000) -> tuple[np.ndarray, np.ndarray]:
+    """1 kHz tone with 10 % 3rd and 5 % 5th harmonics on a jittered time axis."""
+    rng = np.random.default_rng(7)
+    time = np.sort(np.concatenate(([0.0, 1e-2], rng.uniform(0.0, 1e-2, samples))))
+    values = (
+        1.0
+        + 10.0 * np.sin(2 * np.pi * 1e3 * time)
+        + 1.0 * np.sin(2 * np.pi * 3e3 * time + 0.3)
+        + 0.5 * np.sin(2 * np.pi * 5e3 * time)
+    )
+    return time, values
+
+
+EXPECTED_THD = np.sqrt(1.0**2 + 0.5**2) / 10.0
+
+
+def test_resample_uniform_builds_an_even_grid() -> None:
+    time = np.array([0.0, 0.1, 0.15, 0.4, 1.0])
+    grid, values = resample_uniform(time, 2.0 * time, 0.1, 0.9, points=9)
+
+    np.testing.assert_allclose(np.diff(grid), 0.1)
+    np.testing.assert_allclose(values, 2.0 * grid)
+    with pytest.raises(ValueError):
+        resample_uniform(time, time, 0.5, 0.5)
+    with pytest.raises(ValueError):
+        resample_uniform(time, time[:-1])
+
+
+@pytest.mark.parametrize("window", ["hann", "blackman"])
+def test_harmonics_and_thd_on_non_uniform_steps(window: str) -> None:
+    time, values = _distorted_wave()
+
+    # The range holds a non-integer number of periods, so tones fall between bins.
+    result = compute_spectrum(time, values, start=1.3e-3, stop=8.77e-3, window=window)
+
+    assert result.fundamental == pytest.approx(1e3, rel=1e-3)
+    amplitudes = [harmonic.amplitude for harmonic in result.harmonics[:5]]
+    np.testing.assert_allclose(amplitudes, [10.0, 0.0, 1.0, 0.0, 0.5], atol=0.03)
+    assert result.thd == pytest.approx(EXPECTED_THD, rel=1e-3)
+    assert result.amplitudes[0] == pytest.approx(1.0, rel=0.02)
+
+
+def test_welch_averaging_lowers_resolution_but_keeps_thd() -> None:
+    time, values = _distorted_wave()
+
+    single = compute_spectrum(time, values)
+    welch = compute_spectrum(time, values, segments=4)
+
+    assert welch.segments == 4
+    assert welch.resolution == pytest.approx(single.resolution * 2.5, rel=1e-3)
+    assert welch.thd == pytest.approx(EXPECTED_THD, rel=1e-3)
+    with pytest.raises(ValueError):
+        compute_spectrum(time, values, window="kaiser")
+    with pytest.raises(ValueError):
+        compute_spectrum(time[:20], values[:20], segments=8)
+
+
+def test_analyzer_caches_per_signal_range_and_window() -> None:
+    time, values = _distorted_wave(4_000)
+    analyzer = SpectrumAnalyzer(max_entries=2)
+
+    with patch.object(
+        spectrum_module, "compute_spectrum", wraps=spectrum_module.compute_spectrum
+    ) as compute:
+        first = analyzer.analyze("V(out)", time, values, start=0.0, stop=5e-3)
+        assert analyzer.analyze("V(out)", time, values, start=0.0, stop=5e-3) is first
+        analyzer.analyze("I(L1)", time, values, start=0.0, stop=5e-3)
+        analyzer.analyze("V(out)", time, values, start=0.0, stop=5e-3, window="blackman")
+        assert compute.call_count == 3
+        assert len(analyzer) == 2
+
+        analyzer.clear()
+        analyzer.analyze("V(out)", time, values, start=0.0, stop=5e-3)
+        assert compute.call_count == 4
@@ -0,0 +1,158 @@
+"""Tests for coupled case/heatsink thermal networks."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.backend_adapter import BackendInfo, PulsimBackend
+from pulsimgui.services.backend_types import ThermalSettings, TransientResult
+from pulsimgui.services.thermal_coupling import (
+    CoupledThermalNetwork,
+    DeviceThermalParameters,
+    device_thermal_parameters,
+    heatsink_network,
+    thermal_port_groups,
+)
+
+
+def _mosfet(name: str, th_node: str) -> dict:
+    pins = [{"index": i, "name": pin} for i, pin in enumerate(("D", "G", "S", "TH"))]
+    return {
+        "id": name.lower(),
+        "type": "MOSFET_N",
+        "name": name,
+        "pins": pins,
+        "pin_nodes": ["", "", "", th_node],
+    }
+
+
+def test_steady_state_shares_heatsink_rise() -> None:
+    network = heatsink_network(["Q1", "Q2"], 0.2, 1.0, 0.5, 10.0)
+
+    temps = network.simulate([0.0, 1e4], [[10.0, 10.0], [30.0, 30.0]], ambient=25.0)
+
+    # Case = own loss through Rcs plus the total loss through the shared Rsa.
+    np.testing.assert_allclose(temps[:, -1], [25.0 + 2.0 + 20.0, 25.0 + 6.0 + 20.0, 45.0])
+
+
+def test_modal_integration_matches_fine_explicit_solution() -> None:
+    network = CoupledThermalNetwork()
+    a = network.add_node("a", 0.5)
+    b = network.add_node("b", 2.0)
+    c = network.add_node("c", 8.0)
+    network.connect(a, b, 0.3)
+    network.connect(b, c, 0.4)
+    network.connect(a, c, 1.5)
+    network.connect(c, None, 0.6)
+    network.add_device(a)
+    network.add_device(b)
+
+    dt, steps = 1e-4, 40_000
+    time_axis = np.arange(steps + 1) * dt
+    power = np.vstack([
+        10.0 + 5.0 * np.sign(np.sin(2 * np.pi * 2.0 * time_axis)),
+        np.full(time_axis.size, 4.0),
+    ])
+    temps = network.simulate(time_axis, power, ambient=0.0)
+
+    g = network.conductance_matrix()
+    capacitance = np.asarray(network.capacitances)
+    state = np.zeros(3)
+    for k in range(1, steps + 1):
+        injected = np.array([power[0, k], power[1, k], 0.0])
+        state = state + dt * (injected - g @ state) / capacitance
+    np.testing.assert_allclose(temps[:, -1], state, rtol=2e-3)
+
+
+def test_floating_node_is_rejected() -> None:
+    network = CoupledThermalNetwork()
+    network.add_node("a", 1.0)
+    network.add_device(0)
+
+    with pytest.raises(ValueError):
+        network.simulate([0.0, 1.0], [[1.0, 1.0]])
+
+
+def test_groups_come_from_shared_thermal_port_nets() -> None:
+    circuit_data = {
+        "components": [
+            _mosfet("Q1", "7"),
+            _mosfet("Q2", "7"),
+            _mosfet("Q3", "9"),
+            _mosfet("Q4", ""),
+        ]
+    }
+
+    groups = thermal_port_groups(circuit_data, ["Q1", "Q2", "Q3", "Q4"])
+
+    assert groups == [["Q1", "Q2"]]
+
+
+def test_waveform_thermal_couples_devices_on_one_heatsink() -> None:
+    backend = PulsimBackend(
+        SimpleNamespace(__version__="2.0.0"),
+        BackendInfo(identifier="pulsim", name="Pulsim", version="2.0.0", status="available"),
+    )
+    circuit_data = {
+        "components": [_mosfet("Q1", "7"), _mosfet("Q2", "7"), _mosfet("Q3", "9")]
+    }
+    time_axis = np.linspace(0.0, 2000.0, 2001)
+    electrical = TransientResult(
+        time=time_axis.tolist(),
+        signals={
+            "P(Q1)": [20.0] * time_axis.size,
+            "P(Q2)": [0.0] * time_axis.size,
+            "P(Q3)": [0.0] * time_axis.size,
+        },
+    )
+
+    result = backend._run_thermal_from_waveforms(circuit_data, electrical, ThermalSettings())
+
+    q1, q2, q3 = (device.steady_state_temperature for device in result.devices)
+    assert q1 == pytest.approx(25.0 + 20.0 * (0.8 + 0.1 + 0.5), abs=1e-6)
+    assert q2 == pytest.approx(25.0 + 20.0 * 0.5, abs=1e-6)  # heated through the sink
+    assert q3 == pytest.approx(25.0)
+
+
+def test_device_and_heatsink_parameters_come_from_the_components() -> None:
+    backend = PulsimBackend(
+        SimpleNamespace(__version__="2.0.0"),
+        BackendInfo(identifier="pulsim", name="Pulsim", version="2.0.0", status="available"),
+    )
+    q1, q2, q3 = _mosfet("Q1", "7"), _mosfet("Q2", "7"), _mosfet("Q3", "9")
+    q1["parameters"] = {"rth_jc": 0.3, "tau_jc": 0.5, "rth_cs": 0.05, "rth_sa": 1.2}
+    q2["parameters"] = {"rth_jc": "bad", "cth_sink": 40.0}
+    q3["parameters"] = {"rth_jc": 2.0, "tau_jc": -1.0}
+    circuit_data = {"components": [q1, q2, q3]}
+
+    parameters = device_thermal_parameters(circuit_data, ["Q1", "Q2", "Q3", "Q4"])
+
+    assert parameters["Q1"] == DeviceThermalParameters(0.3, 0.5, 0.05, None, 1.2, None)
+    assert parameters["Q2"] == DeviceThermalParameters(heatsink_capacitance=40.0)
+    assert parameters["Q3"].junction_resistance == 2.0
+    assert parameters["Q3"].junction_tau == DeviceThermalParameters().junction_tau
+    assert parameters["Q4"] == DeviceThermalParameters()
+    assert backend._thermal_ladder("Q1", parameters["Q1"], ThermalSettings()) == (
+        "foster",
+        [(0.3, 0.5 / 0.3)],
+    )
+
+    time_axis = np.linspace(0.0, 5000.0, 2001)
+    electrical = TransientResult(
+        time=time_axis.tolist(),
+        signals={
+            "P(Q1)": [20.0] * time_axis.size,
+            "P(Q2)": [10.0] * time_axis.size,
+            "P(Q3)": [10.0] * time_axis.size,
+        },
+    )
+    result = backend._run_thermal_from_waveforms(circuit_data, electrical, ThermalSettings())
+
+    t1, t2, t3 = (device.steady_state_temperature for device in result.devices)
+    # Rsa from Q1 carries both devices' loss; Q2 keeps the default Rcs and Rjc.
+    assert t1 == pytest.approx(25.0 + 20.0 * (0.3 + 0.05) + 30.0 * 1.2, abs=1e-6)
+    assert t2 == pytest.approx(25.0 + 10.0 * (0.8 + 0.1) + 30.0 * 1.2, abs=1e-6)
+    assert t3 == pytest.approx(25.0 + 10.0 * 2.0, abs=1e-6)
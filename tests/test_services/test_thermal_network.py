@@ -0,0 +1,131 @@
+"""Tests for the vectorized RC thermal network integrator."""
+
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.backend_adapter import BackendInfo, PulsimBackend
+from pulsimgui.services.backend_types import ThermalSettings, TransientResult
+from pulsimgui.services.thermal_network import (
+    ThermalNetworkBatch,
+    cauer_to_foster,
+    integrate_foster,
+)
+
+
+def _reference_foster(time, power, stages, ambient=25.0):
+    """Per-sample exact update, the loop the batch integrator replaces."""
+    rise = [0.0] * len(stages)
+    temps = [ambient]
+    for k in range(1, len(time)):
+        dt = time[k] - time[k - 1]
+        for j, (r, c) in enumerate(stages):
+            a = math.exp(-dt / (r * c))
+            rise[j] = a * rise[j] + r * (1.0 - a) * power[k]
+        temps.append(ambient + sum(rise))
+    return np.asarray(temps)
+
+
+def test_step_response_is_exact_for_any_step_size() -> None:
+    batch = ThermalNetworkBatch.from_foster(["Q1"], [[(2.0, 0.5)]])  # tau = 1 s
+    time_axis = np.array([0.0, 1e-3, 0.5, 3.0, 40.0])
+
+    temps = batch.simulate(time_axis, np.full((1, 5), 10.0), ambient=25.0)
+
+    expected = 25.0 + 20.0 * (1.0 - np.exp(-time_axis))
+    np.testing.assert_allclose(temps[0], expected, rtol=1e-9)  # steps keep ~8 digits
+
+
+def test_batch_matches_per_sample_update_on_irregular_steps() -> None:
+    rng = np.random.default_rng(3)
+    time_axis = np.concatenate([[0.0], np.cumsum(rng.uniform(1e-6, 2e-4, 3000))])
+    power = rng.uniform(0.0, 40.0, (3, time_axis.size))
+    stages = [
+        [(0.4, 0.01), (0.9, 0.2)],
+        [(0.3, 1e-12), (0.5, 0.05), (1.2, 2.0)],  # first stage settles every step
+        [(1.5, 0.004)],
+    ]
+
+    temps = ThermalNetworkBatch.from_foster(["A", "B", "C"], stages).simulate(
+        time_axis, power
+    )
+
+    for index, device_stages in enumerate(stages):
+        expected = _reference_foster(time_axis, power[index], device_stages)
+        np.testing.assert_allclose(temps[index], expected, atol=1e-9)
+
+
+def test_continuing_from_final_state_matches_single_run() -> None:
+    time_axis = np.linspace(0.0, 0.2, 20_001)
+    power = np.abs(np.sin(2 * np.pi * 50 * time_axis))[None, :] * 30.0
+    resistances = np.array([[0.2, 0.6]])
+    time_constants = np.array([[1e-3, 0.05]])
+
+    whole, _ = integrate_foster(time_axis, power, resistances, time_constants)
+    head, state = integrate_foster(
+        time_axis[:10_001], power[:, :10_001], resistances, time_constants
+    )
+    tail, _ = integrate_foster(
+        time_axis[10_000:], power[:, 10_000:], resistances, time_constants, state
+    )
+
+    np.testing.assert_allclose(np.concatenate([head, tail[:, 1:]], axis=1), whole, atol=1e-12)
+
+
+def test_cauer_conversion_preserves_resistance_and_junction_response() -> None:
+    ladder_r = [0.3, 0.5, 1.0]
+    ladder_c = [0.01, 0.1, 1.0]
+    foster_r, foster_tau = cauer_to_foster(ladder_r, ladder_c)
+
+    assert foster_r.sum() == pytest.approx(sum(ladder_r))
+    assert np.all(foster_tau > 0.0)
+
+    # Junction temperature of the ladder from a fine explicit integration.
+    dt, steps = 1e-5, 200_000
+    nodes = np.zeros(3)
+    for _ in range(steps):
+        to_next = np.append(nodes[:-1] - nodes[1:], nodes[-1]) / np.asarray(ladder_r)
+        inflow = np.concatenate([[1.0], to_next[:-1]]) - to_next
+        nodes = nodes + dt * inflow / np.asarray(ladder_c)
+
+    batch = ThermalNetworkBatch.from_cauer(["Q1"], [list(zip(ladder_r, ladder_c))])
+    temps = batch.simulate([0.0, dt * steps], [[1.0, 1.0]], ambient=0.0)
+    assert temps[0, -1] == pytest.approx(nodes[0], rel=1e-3)
+
+
+def test_rejects_mismatched_power_shape() -> None:
+    batch = ThermalNetworkBatch.from_foster(["Q1", "Q2"], [[(1.0, 1.0)], [(1.0, 1.0)]])
+
+    with pytest.raises(ValueError):
+        batch.simulate([0.0, 1.0], [[1.0, 1.0]])
+
+
+def test_waveform_thermal_runs_without_native_simulator() -> None:
+    def create_simple_thermal_model(rth, tau, name):  # noqa: ANN001
+        stage = SimpleNamespace(Rth=rth, Cth=lambda: tau / rth, tau=tau)
+        return SimpleNamespace(stages=lambda: [stage])
+
+    module = SimpleNamespace(
+        __version__="2.0.0",
+        create_simple_thermal_model=create_simple_thermal_model,
+    )
+    backend = PulsimBackend(
+        module,
+        BackendInfo(identifier="pulsim", name="Pulsim", version="2.0.0", status="available"),
+    )
+    time_axis = np.linspace(0.0, 0.1, 1001)
+    circuit_data = {"components": [{"id": "m1", "type": "MOSFET_N", "name": "M1"}]}
+    electrical = TransientResult(time=time_axis.tolist(), signals={"P(M1)": [5.0] * 1001})
+
+    result = backend._run_thermal_from_waveforms(circuit_data, electrical, ThermalSettings())
+
+    assert result is not None and not result.is_synthetic
+    device = result.devices[0]
+    expected = 25.0 + 5.0 * 0.8 * (1.0 - np.exp(-time_axis / 0.02))
+    np.testing.assert_allclose(device.junction_temperature, expected, rtol=1e-8)
+    assert device.foster_stages[0].resistance == pytest.approx(0.8)
+    assert device.foster_stages[0].time_constant == pytest.approx(0.02)
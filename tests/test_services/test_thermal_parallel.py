@@ -0,0 +1,224 @@
+"""Tests for the parallel, cancellable thermal analysis job."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from pulsimgui.models.circuit import Circuit
+from pulsimgui.models.component import Component, ComponentType
+from pulsimgui.services import backend_adapter, thermal_service
+from pulsimgui.services.backend_adapter import BackendInfo, PulsimBackend
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.services.thermal_service import (
+    ThermalAnalysisService,
+    ThermalAnalysisWorker,
+    partition_thermal_devices,
+)
+
+DEVICE_COUNT = 8
+
+
+def _mosfet(name: str, th_node: str) -> dict:
+    pins = [{"index": i, "name": pin} for i, pin in enumerate(("D", "G", "S", "TH"))]
+    return {
+        "id": name.lower(),
+        "type": "MOSFET_N",
+        "name": name,
+        "pins": pins,
+        "pin_nodes": ["", "", "", th_node],
+    }
+
+
+def _fixture() -> tuple[Circuit, dict, SimulationResult]:
+    names = [f"Q{index + 1}" for index in range(DEVICE_COUNT)]
+    circuit = Circuit(name="thermal")
+    for name in names:
+        circuit.add_component(Component(type=ComponentType.MOSFET_N, name=name))
+    # Q2 and Q7 share a heatsink, so they must be solved together.
+    circuit_data = {
+        "components": [
+            _mosfet(name, "7" if name in {"Q2", "Q7"} else "") for name in names
+        ]
+    }
+    time_axis = np.linspace(0.0, 1.0, 2001)
+    electrical = SimulationResult(
+        time=time_axis.tolist(),
+        signals={
+            f"P({name})": (5.0 + index + np.sin(40.0 * time_axis)).tolist()
+            for index, name in enumerate(names)
+        },
+    )
+    return circuit, circuit_data, electrical
+
+
+def _waveform_backend() -> MagicMock:
+    """Backend double running the NumPy waveform thermal path."""
+    engine = PulsimBackend(
+        SimpleNamespace(__version__="2.0.0"),
+        BackendInfo(identifier="pulsim", name="Pulsim", version="2.0.0", status="available"),
+    )
+    backend = MagicMock()
+    backend.has_capability.return_value = True
+    backend.run_thermal.side_effect = engine._run_thermal_from_waveforms
+    return backend
+
+
+def test_partition_keeps_heatsink_groups_together() -> None:
+    names = ["A", "B", "C", "D", "E", "F"]
+
+    chunks = partition_thermal_devices(names, [["B", "E"]], chunk_count=3)
+
+    assert chunks == [["A", "B", "E"], ["C", "D"], ["F"]]
+    assert partition_thermal_devices(names, chunk_count=1) == [names]
+    with pytest.raises(ValueError):
+        partition_thermal_devices(names, chunk_count=0)
+
+
+def test_parallel_run_matches_single_chunk_and_streams_partials() -> None:
+    circuit, circuit_data, electrical = _fixture()
+    sequential = ThermalAnalysisService(backend=_waveform_backend(), max_workers=1)
+    parallel_backend = _waveform_backend()
+    parallel = ThermalAnalysisService(backend=parallel_backend, max_workers=4)
+    partials: list[tuple[list[str], int, int]] = []
+
+    expected = sequential.build_result(circuit, electrical, circuit_data=circuit_data)
+    result = parallel.build_result(
+        circuit,
+        electrical,
+        circuit_data=circuit_data,
+        on_partial=lambda merged, done, total: partials.append(
+            (merged.device_names(), done, total)
+        ),
+    )
+
+    assert parallel_backend.run_thermal.call_count == 4
+    assert result.device_names() == expected.device_names()
+    for device, reference in zip(result.devices, expected.devices):
+        np.testing.assert_allclose(device.temperature_trace, reference.temperature_trace)
+        assert device.conduction_loss == pytest.approx(reference.conduction_loss)
+    # Chunks finishing together are reported in one callback.
+    completed = [done for _, done, _ in partials]
+    assert completed == sorted(set(completed)) and completed[-1] == partials[-1][2] == 4
+    counts = [len(names) for names, _, _ in partials]
+    assert counts == sorted(counts) and counts[-1] == DEVICE_COUNT
+    assert partials[-1][0] == expected.device_names()
+
+
+def test_cancel_returns_partial_result_without_fallback() -> None:
+    circuit, circuit_data, electrical = _fixture()
+    backend = _waveform_backend()
+    run_chunk = backend.run_thermal.side_effect
+    release = threading.Event()
+
+    def _gated_run(data, transient, settings):
+        # Only the chunk holding Q1 finishes before the job is cancelled.
+        if "Q1" not in settings.devices:
+            release.wait(timeout=10.0)
+        return run_chunk(data, transient, settings)
+
+    backend.run_thermal.side_effect = _gated_run
+    service = ThermalAnalysisService(backend=backend)
+    service.max_workers = 4
+    emitted: list[object] = []
+    service.result_generated.connect(emitted.append)
+    state = {"cancelled": False}
+
+    def _on_partial(_merged, _done, _total) -> None:
+        state["cancelled"] = True
+        release.set()
+
+    result = service.build_result(
+        circuit,
+        electrical,
+        circuit_data=circuit_data,
+        on_partial=_on_partial,
+        is_cancelled=lambda: state["cancelled"],
+    )
+
+    assert "cancelled" in result.error_message
+    assert not result.is_synthetic
+    assert result.device_names() == ["Q1", "Q2", "Q7"]
+    assert emitted == []
+
+
+def test_cancel_does_not_wait_for_running_chunks() -> None:
+    circuit, circuit_data, electrical = _fixture()
+    backend = _waveform_backend()
+    run_chunk = backend.run_thermal.side_effect
+    release = threading.Event()
+
+    def _blocked_run(data, transient, settings):
+        release.wait(timeout=10.0)
+        return run_chunk(data, transient, settings)
+
+    backend.run_thermal.side_effect = _blocked_run
+    service = ThermalAnalysisService(backend=backend, max_workers=2)
+    started = time.perf_counter()
+    try:
+        result = service.build_result(
+            circuit, electrical, circuit_data=circuit_data, is_cancelled=lambda: True
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        release.set()
+
+    assert "cancelled" in result.error_message and result.devices == []
+    assert elapsed < 5.0
+    # At most the chunks already running were started; queued ones were dropped.
+    assert backend.run_thermal.call_count <= 2
+
+
+def test_losses_are_extracted_once_and_split_per_chunk(monkeypatch) -> None:
+    circuit, circuit_data, electrical = _fixture()
+    expected = ThermalAnalysisService(backend=_waveform_backend(), max_workers=1).build_result(
+        circuit, electrical, circuit_data=circuit_data
+    )
+    calls: list[str] = []
+    extract = backend_adapter.extract_losses
+
+    def _counting(caller: str):
+        return lambda *args: calls.append(caller) or extract(*args)
+
+    monkeypatch.setattr(thermal_service, "extract_losses", _counting("service"))
+    monkeypatch.setattr(backend_adapter, "extract_losses", _counting("backend"))
+    backend = _waveform_backend()
+
+    result = ThermalAnalysisService(backend=backend, max_workers=4).build_result(
+        circuit, electrical, circuit_data=circuit_data
+    )
+
+    assert calls == ["service"]
+    assert backend.run_thermal.call_count == 4
+    for call in backend.run_thermal.call_args_list:
+        settings = call.args[2]
+        assert settings.losses is not None and set(settings.losses) <= set(settings.devices)
+    for device, reference in zip(result.devices, expected.devices):
+        np.testing.assert_allclose(device.temperature_trace, reference.temperature_trace)
+
+
+def test_worker_emits_partials_then_final_result() -> None:
+    circuit, circuit_data, electrical = _fixture()
+    service = ThermalAnalysisService(backend=_waveform_backend(), max_workers=2)
+    worker = ThermalAnalysisWorker(service, circuit, electrical, circuit_data=circuit_data)
+    partials: list[object] = []
+    finals: list[object] = []
+    worker.partial_result.connect(partials.append)
+    worker.finished_signal.connect(finals.append)
+
+    worker.run()  # Same thread, so the signals are delivered directly.
+
+    assert 1 <= len(partials) <= 2
+    assert len(partials[-1].devices) == DEVICE_COUNT
+    assert len(finals) == 1 and len(finals[0].devices) == DEVICE_COUNT
+
+    worker.cancel()
+    finals.clear()
+    worker.run()
+    assert worker.was_cancelled
+    assert finals == []
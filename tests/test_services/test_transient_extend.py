@@ -0,0 +1,288 @@
+"""Tests for transient checkpoints and extend-in-place runs."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from pulsimgui.services.backend_adapter import (
+    BackendCallbacks,
+    BackendInfo,
+    BackendRunResult,
+    PulsimBackend,
+)
+from pulsimgui.services.backend_types import TransientCheckpoint
+from pulsimgui.services.signal_evaluator import (
+    restore_evaluator_state,
+    snapshot_evaluator_state,
+)
+from pulsimgui.services.simulation_service import (
+    SimulationResult,
+    SimulationService,
+    SimulationSettings,
+    SimulationState,
+)
+
+
+class _FakeCircuit:
+    def __init__(self) -> None:
+        self._nodes: dict[str, int] = {}
+
+    @staticmethod
+    def ground() -> int:
+        return 0
+
+    def add_node(self, name: str) -> int:
+        return self._nodes.setdefault(name, len(self._nodes) + 1)
+
+    def add_voltage_source(self, name: str, npos: int, nneg: int, value: float) -> None:
+        _ = (name, npos, nneg, value)
+
+    def add_resistor(self, name: str, n1: int, n2: int, resistance: float) -> None:
+        _ = (name, n1, n2, resistance)
+
+    def signal_names(self) -> list[str]:
+        return ["V(OUT)", "I(V1)"]
+
+
+class _FakeNewtonOptions:
+    def __init__(self) -> None:
+        self.max_iterations = 0
+        self.enable_limiting = False
+        self.max_voltage_step = 0.0
+
+
+def _simple_circuit_data() -> dict[str, Any]:
+    return {
+        "components": [
+            {
+                "id": "v1",
+                "type": "VOLTAGE_SOURCE",
+                "name": "V1",
+                "parameters": {"waveform": {"type": "dc", "value": 5.0}},
+                "pin_nodes": ["1", "0"],
+            },
+            {
+                "id": "r1",
+                "type": "RESISTOR",
+                "name": "R1",
+                "parameters": {"resistance": 1000.0},
+                "pin_nodes": ["1", "0"],
+            },
+        ],
+        "node_map": {"v1": ["1", "0"], "r1": ["1", "0"]},
+        "node_aliases": {"1": "OUT", "0": "0"},
+        "wires": [],
+    }
+
+
+def _callbacks() -> BackendCallbacks:
+    return BackendCallbacks(
+        progress=lambda *_: None,
+        data_point=lambda *_: None,
+        check_cancelled=lambda: False,
+        wait_if_paused=lambda: None,
+    )
+
+
+def test_append_segment_drops_shared_boundary_and_holds_missing_signals() -> None:
+    base = SimulationResult(
+        time=[0.0, 1.0, 2.0],
+        signals={"V(out)": [0.0, 1.0, 2.0], "I(L1)": [5.0, 5.0, 5.0]},
+    )
+    segment = SimulationResult(
+        time=[2.0, 3.0, 4.0],
+        signals={"V(out)": [2.0, 3.0, 4.0]},
+        checkpoint=TransientCheckpoint(t_end=4.0, state=[4.0]),
+    )
+
+    added = base.append_segment(segment)
+
+    assert added == 2
+    assert base.time == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert base.signals["V(out)"] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert base.signals["I(L1)"] == [5.0] * 5
+    assert base.checkpoint is segment.checkpoint
+    assert base.statistics["extended_segments"] == 1
+
+
+def test_pulsim_backend_captures_and_resumes_from_checkpoint() -> None:
+    calls: list[dict[str, Any]] = []
+
+    def run_transient_streaming(circuit, t_start, t_stop, dt, *args):  # noqa: ANN001
+        x0 = args[0] if len(args) == 6 else None
+        calls.append({"t_start": t_start, "t_stop": t_stop, "dt": dt, "x0": x0})
+        return [t_start, t_stop], [[0.5, 0.01], [1.5, 0.02]], True, ""
+
+    fake_module = SimpleNamespace(
+        __version__="2.0.0",
+        Circuit=_FakeCircuit,
+        NewtonOptions=_FakeNewtonOptions,
+        run_transient_streaming=run_transient_streaming,
+    )
+    backend = PulsimBackend(
+        fake_module,
+        BackendInfo(identifier="pulsim", name="Pulsim", version="2.0.0", status="available"),
+    )
+    settings = SimulationSettings(t_start=0.0, t_stop=1e-3, t_step=1e-6, max_step=5e-6)
+
+    first = backend.run_transient(_simple_circuit_data(), settings, _callbacks())
+
+    assert first.error_message == ""
+    checkpoint = first.checkpoint
+    assert checkpoint is not None
+    assert checkpoint.t_end == 1e-3
+    assert checkpoint.state == [1.5, 0.02]
+    assert checkpoint.dt == settings.t_step
+
+    extended_settings = SimulationSettings(t_start=0.0, t_stop=2e-3, t_step=1e-6, max_step=5e-6)
+    second = backend.run_transient(
+        _simple_circuit_data(),
+        extended_settings,
+        _callbacks(),
+        checkpoint=checkpoint,
+    )
+
+    assert second.error_message == ""
+    assert calls[1]["t_start"] == 1e-3
+    assert calls[1]["t_stop"] == 2e-3
+    assert list(calls[1]["x0"]) == [1.5, 0.02]
+    assert second.checkpoint is not None
+    assert second.checkpoint.t_end == 2e-3
+    # The caller's settings object must not be mutated by the resume.
+    assert extended_settings.t_start == 0.0
+
+
+def test_evaluator_snapshot_round_trip_only_restores_known_blocks() -> None:
+    evaluator = SimpleNamespace(
+        _state={"pi": 0.4, "gain": 1.0},
+        _controllers={"pi": {"integral": 2.5, "t_prev": 1e-3}},
+    )
+    snapshot = snapshot_evaluator_state(evaluator)
+
+    rebuilt = SimpleNamespace(
+        _state={"pi": 0.0},
+        _controllers={"pi": {"integral": 0.0, "t_prev": -1.0}},
+    )
+    restore_evaluator_state(rebuilt, snapshot)
+
+    assert rebuilt._state == {"pi": 0.4}
+    assert rebuilt._controllers["pi"] == {"integral": 2.5, "t_prev": 1e-3}
+
+
+class _ResumableBackend:
+    def __init__(self) -> None:
+        self.info = BackendInfo(
+            identifier="fake",
+            name="Fake",
+            version="1.0",
+            status="available",
+        )
+        self.checkpoints: list[TransientCheckpoint | None] = []
+
+    def has_capability(self, name: str) -> bool:
+        return name == "transient"
+
+    def run_transient(self, circuit_data, settings, callbacks, *, checkpoint=None):  # noqa: ANN001
+        self.checkpoints.append(checkpoint)
+        t_start = checkpoint.t_end if checkpoint is not None else settings.t_start
+        steps = 4
+        dt = (settings.t_stop - t_start) / steps
+        time = [t_start + idx * dt for idx in range(steps + 1)]
+        values = [2.0 * t for t in time]
+        return BackendRunResult(
+            time=time,
+            signals={"V(out)": values},
+            checkpoint=TransientCheckpoint(t_end=time[-1], state=[values[-1]], dt=dt),
+        )
+
+
+class _Loader:
+    def __init__(self, preferred_backend_id: str | None = None) -> None:
+        self.backend = _ResumableBackend()
+        self.available_backends = [self.backend.info]
+        self.active_backend_id = self.backend.info.identifier
+
+
+def test_service_extend_appends_to_last_result(monkeypatch, qtbot) -> None:
+    monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _Loader)
+    service = SimulationService()
+    service.settings.t_stop = 1.0
+    finished: list[SimulationResult] = []
+    service.simulation_finished.connect(finished.append)
+    circuit_data = _simple_circuit_data()
+
+    assert not service.can_extend
+    service.run_transient(circuit_data)
+    qtbot.waitUntil(lambda: len(finished) == 1)
+    assert service.can_extend
+
+    service.extend_transient(circuit_data, 2.0)
+    qtbot.waitUntil(lambda: len(finished) == 2)
+
+    merged = finished[-1]
+    assert merged is service.last_result
+    assert merged.time[0] == 0.0
+    assert merged.time[-1] == 2.0
+    assert len(merged.time) == 9
+    assert merged.signals["V(out)"][-1] == 4.0
+    assert service.state == SimulationState.COMPLETED
+    # The extended run replaces its history entry rather than adding one.
+    assert [record.result for record in service.run_history.runs()] == [merged]
+    assert service.backend.checkpoints[1] is not None
+    assert service.backend.checkpoints[1].t_end == 1.0
+
+
+def test_service_extend_rejects_changed_circuit(monkeypatch, qtbot) -> None:
+    monkeypatch.setattr("pulsimgui.services.simulation_service.BackendLoader", _Loader)
+    service = SimulationService()
+    service.settings.t_stop = 1.0
+    errors: list[str] = []
+    finished: list[SimulationResult] = []
+    service.error.connect(errors.append)
+    service.simulation_finished.connect(finished.append)
+
+    circuit_data = _simple_circuit_data()
+    service.run_transient(circuit_data)
+    qtbot.waitUntil(lambda: len(finished) == 1)
+
+    circuit_data["components"][1]["parameters"]["resistance"] = 2000.0
+    service.extend_transient(circuit_data, 2.0)
+
+    assert errors and "circuit changed" in errors[-1]
+    assert len(service.backend.checkpoints) == 1
+
+
+class _NativePI:
+    """Stand-in for a pybind11 controller with a read-write integrator."""
+
+    def __init__(self) -> None:
+        self.integral = 0.0
+        self._gain = 1.0
+
+    @property
+    def kp(self) -> float:
+        return self._gain
+
+    def update(self, error: float, t: float) -> float:
+        return error
+
+
+def test_native_controller_state_round_trips_and_opaque_ones_are_listed() -> None:
+    native = _NativePI()
+    native.integral = 3.5
+    evaluator = SimpleNamespace(
+        _state={"pi": 0.4, "pid": 0.1}, _controllers={"pi": native, "pid": object()}
+    )
+    snapshot = snapshot_evaluator_state(evaluator)
+    assert snapshot["native"] == {"pi": {"attributes": {"integral": 3.5}}}
+    assert snapshot["uncaptured"] == ["pid"]
+
+    rebuilt = SimpleNamespace(_state={"pi": 0.0}, _controllers={"pi": _NativePI()})
+    restore_evaluator_state(rebuilt, snapshot)
+    assert rebuilt._controllers["pi"].integral == 3.5
+
+    checkpoint = PulsimBackend._build_checkpoint(
+        BackendRunResult(time=[0.0, 1e-3], signals={"V(out)": [0.0, 1.0]}), evaluator, 1e-6, "default"
+    )
+    assert checkpoint.step_info["restarted_controllers"] == ["pid"]
@@ -0,0 +1,163 @@
+"""Tests for streaming waveform export (CSV, NPZ and columnar)."""
+
+from __future__ import annotations
+
+import csv
+
+import numpy as np
+import pytest
+
+from pulsimgui.services import export_service
+from pulsimgui.services.export_service import (
+    ExportCancelled,
+    ExportService,
+    WaveformExportOptions,
+    WaveformExportWorker,
+)
+from pulsimgui.services.simulation_service import SimulationResult
+
+
+@pytest.fixture
+def result() -> SimulationResult:
+    time = np.linspace(0.0, 1e-3, 10_001)
+    return SimulationResult(
+        time=time.tolist(),
+        signals={
+            "V(out)": (np.sin(time * 1e4) * 12.0).tolist(),
+            "I(L1), A": (np.cos(time * 1e4) * 3.0).tolist(),
+            "short": [1.0, 2.0, 3.0],
+        },
+        statistics={"steps": 10_000, "solver": "trap", "matrix": [1, 2]},
+    )
+
+
+def test_options_reject_invalid_values() -> None:
+    with pytest.raises(ValueError):
+        WaveformExportOptions(decimation=0)
+    with pytest.raises(ValueError):
+        WaveformExportOptions(start=2.0, stop=1.0)
+
+
+def test_csv_export_writes_blocks_with_quoted_header(result, tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(export_service, "EXPORT_CHUNK_SAMPLES", 999)
+    path = tmp_path / "waves.csv"
+    fractions: list[float] = []
+
+    rows = ExportService.export_waveforms_csv(result, str(path), progress=fractions.append)
+
+    with open(path, newline="") as f:
+        table = list(csv.reader(f))
+    assert rows == 10_001 and len(table) == 10_002
+    assert table[0] == ["Time (s)", "V(out)", "I(L1), A", "short"]
+    # Missing samples of the short signal are empty cells, as before streaming.
+    assert [row[3] for row in table[1:5]] == ["1", "2", "3", ""]
+    assert all(row[3] == "" for row in table[4:])
+    data = np.array([row[:3] for row in table[1:]], dtype=float)
+    np.testing.assert_array_equal(data[:, 0], result.time)
+    np.testing.assert_array_equal(data[:, 1], result.signals["V(out)"])
+    assert fractions == sorted(fractions) and fractions[-1] == 1.0
+    assert len(fractions) == 11
+
+
+def test_range_subset_and_decimation_apply_to_every_format(result, tmp_path) -> None:
+    options = WaveformExportOptions(signals=["V(out)"], start=2e-4, stop=6e-4, decimation=7)
+    time = np.asarray(result.time)
+    selected = np.flatnonzero((time >= 2e-4) & (time <= 6e-4))[::7]
+    expected = np.asarray(result.signals["V(out)"])[selected]
+
+    for name in ("cut.csv", "cut.npz", "cut.pwf"):
+        rows = ExportService.export_waveforms(result, str(tmp_path / name), options)
+        assert rows == selected.size
+
+    csv_data = np.loadtxt(tmp_path / "cut.csv", delimiter=",", skiprows=1)
+    np.testing.assert_allclose(csv_data[:, 1], expected, rtol=1e-11)
+    with np.load(tmp_path / "cut.npz") as archive:
+        assert archive.files == ["time", "V(out)"]
+        np.testing.assert_array_equal(archive["time"], time[selected])
+        np.testing.assert_array_equal(archive["V(out)"], expected)
+    col_time, columns, header = ExportService.read_waveform_columns(str(tmp_path / "cut.pwf"))
+    np.testing.assert_array_equal(col_time, time[selected])
+    np.testing.assert_array_equal(columns["V(out)"], expected)
+    assert list(columns) == ["V(out)"]
+    assert header["statistics"] == {"steps": 10_000, "solver": "trap"}
+
+
+def test_columnar_file_maps_columns_without_reading_them(result, tmp_path) -> None:
+    path = tmp_path / "all.pwf"
+    ExportService.export_waveforms_columnar(result, str(path))
+
+    time, columns, header = ExportService.read_waveform_columns(str(path))
+    assert isinstance(time, np.memmap) and not time.flags.writeable
+    assert header["data_offset"] % 64 == 0
+    np.testing.assert_array_equal(columns["I(L1), A"], result.signals["I(L1), A"])
+    assert np.isnan(columns["short"][3:]).all()
+
+    (tmp_path / "bad.pwf").write_bytes(b"not a waveform file")
+    with pytest.raises(ValueError):
+        ExportService.read_waveform_columns(str(tmp_path / "bad.pwf"))
+
+
+def test_invalid_requests_raise_and_cancel_leaves_no_file(result, tmp_path, monkeypatch) -> None:
+    with pytest.raises(ValueError):
+        ExportService.export_waveforms(result, str(tmp_path / "waves.xlsx"))
+    with pytest.raises(ValueError):
+        ExportService.export_waveforms(
+            result, str(tmp_path / "w.csv"), WaveformExportOptions(signals=["V(missing)"])
+        )
+    with pytest.raises(ValueError):
+        ExportService.export_waveforms(
+            result, str(tmp_path / "w.csv"), WaveformExportOptions(start=1.0)
+        )
+    with pytest.raises(ValueError):
+        ExportService.export_waveforms_csv(SimulationResult(), str(tmp_path / "w.csv"))
+
+    monkeypatch.setattr(export_service, "EXPORT_CHUNK_SAMPLES", 1000)
+    calls = iter([False, False, True])
+    with pytest.raises(ExportCancelled):
+        ExportService.export_waveforms_npz(
+            result, str(tmp_path / "w.npz"), is_cancelled=lambda: next(calls)
+        )
+    assert not (tmp_path / "w.npz").exists()
+
+
+def test_failed_open_keeps_the_existing_file(result, tmp_path, monkeypatch) -> None:
+    def locked(*_args, **_kwargs):
+        raise PermissionError("locked by another program")
+
+    monkeypatch.setattr(export_service, "open", locked, raising=False)
+    monkeypatch.setattr(export_service.zipfile, "ZipFile", locked)
+    for name in ("kept.csv", "kept.npz", "kept.pwf"):
+        path = tmp_path / name
+        path.write_text("previous export")
+        with pytest.raises(PermissionError):
+            ExportService.export_waveforms(result, str(path))
+        assert path.read_text() == "previous export"
+
+
+def test_cancelled_overwrite_keeps_the_existing_file(result, tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(export_service, "EXPORT_CHUNK_SAMPLES", 1000)
+    for name in ("kept.csv", "kept.npz", "kept.pwf"):
+        path = tmp_path / name
+        path.write_text("previous export")
+        calls = iter([False, True])
+        with pytest.raises(ExportCancelled):
+            ExportService.export_waveforms(result, str(path), is_cancelled=lambda: next(calls))
+        assert path.read_text() == "previous export"
+
+    ExportService.export_waveforms(result, str(tmp_path / "kept.csv"))
+    assert (tmp_path / "kept.csv").read_text().startswith("Time (s),")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["kept.csv", "kept.npz", "kept.pwf"]
+
+
+def test_worker_reports_progress_and_completion(qapp, result, tmp_path) -> None:
+    path = str(tmp_path / "waves.npz")
+    worker = WaveformExportWorker(result, path, WaveformExportOptions(decimation=10))
+    progress: list[float] = []
+    finished: list[tuple[str, int]] = []
+    worker.progress.connect(lambda value, _message: progress.append(value))
+    worker.finished_signal.connect(lambda saved, rows: finished.append((saved, rows)))
+
+    worker.run()
+
+    assert finished == [(path, 1001)]
+    assert progress[0] == 0.0 and progress[-1] == 100.0
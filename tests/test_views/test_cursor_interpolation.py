@@ -0,0 +1,53 @@
+"""Tests for batched cursor interpolation in waveform and scope views."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.waveform import WaveformViewer
+from pulsimgui.views.waveform.waveform_viewer import interpolate_at
+
+
+def test_interpolate_at_matches_np_interp_for_every_signal() -> None:
+    rng = np.random.default_rng(5)
+    time = np.sort(rng.uniform(0.0, 1.0, 5_000))
+    signals = [rng.normal(size=time.size) for _ in range(40)]
+    instants = [time[0], 0.25, 0.5 + 1e-9, time[-1], time[-1] + 1.0, -1.0]
+
+    sampled = interpolate_at(time, signals, instants)
+
+    assert sampled.shape == (40, 6)
+    for row, values in enumerate(signals):
+        np.testing.assert_allclose(sampled[row, :4], np.interp(instants[:4], time, values))
+    assert np.all(np.isnan(sampled[:, 4:]))
+    assert interpolate_at(time, [], instants).shape == (0, 6)
+    assert np.isnan(interpolate_at(np.empty(0), signals[:1], [0.0])).all()
+
+
+def test_cursor_drags_are_coalesced_into_one_readout(qapp, monkeypatch) -> None:
+    time_axis = np.linspace(0.0, 1.0, 1_001)
+    viewer = WaveformViewer()
+    viewer.set_result(
+        SimulationResult(
+            time=time_axis.tolist(),
+            signals={f"V(n{i})": (i * time_axis).tolist() for i in range(1, 6)},
+        )
+    )
+    viewer._cursor_checkbox.setChecked(True)
+    calls: list[int] = []
+    original = viewer._update_cursor_values
+    monkeypatch.setattr(viewer, "_update_cursor_values", lambda: (calls.append(1), original()))
+
+    for position in np.linspace(0.1, 0.4, 25):
+        viewer._cursor1.setValue(float(position))
+
+    assert calls == []
+    viewer._cursor_update_timer.timeout.emit()
+    assert calls == [1]
+
+    table = viewer._build_per_signal_measurements(0.4, viewer._cursor2.value())
+    assert table["V(n3)"]["c1"] == pytest.approx(1.2)
+    assert table["V(n5)"]["dv"] == pytest.approx(5 * (viewer._cursor2.value() - 0.4))
+    viewer.close()
@@ -0,0 +1,35 @@
+"""Tests for the cycle measurement table in the waveform viewer."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.waveform import WaveformViewer
+
+
+def test_cycle_metrics_table_and_derived_signals(qapp) -> None:
+    time_axis = np.linspace(0.0, 1e-4, 50_001)
+    gate = np.where((time_axis * 1e5) % 1.0 < 0.4, 12.0, 0.0)
+    viewer = WaveformViewer()
+    viewer.set_result(
+        SimulationResult(
+            time=time_axis.tolist(),
+            signals={"V(gate)": gate.tolist(), "V(out)": (3.3 + 0.01 * gate).tolist()},
+        )
+    )
+
+    panel = viewer.show_cycle_measurements()
+    panel._signal_combo.setCurrentText("V(out)")
+    measurements = panel.measure()
+
+    assert measurements is not None and measurements.count == 9
+    assert panel._model.rowCount() == 9
+    assert panel._model.data(panel._model.index(0, 3)) == "40.00 %"
+
+    panel._on_add_signals()
+    assert "CYCLE:V(out) ripple" in viewer._traces
+    np.testing.assert_allclose(viewer._signal_arrays["CYCLE:duty"], 0.4, atol=1e-3)
+    assert "CYCLE:duty" in viewer._signal_list_panel.get_visible_signals()
+    panel.close()
+    viewer.close()
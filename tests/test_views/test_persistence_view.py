@@ -0,0 +1,52 @@
+"""Tests for the persistence panel of the waveform viewer."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.waveform import WaveformViewer
+
+
+def _switch_node(cycles: int, period: float = 1e-5) -> tuple[np.ndarray, np.ndarray]:
+    time = np.arange(cycles * 80 + 1) * (period / 80)
+    return time, 12.0 * (np.mod(time, period) < 0.25 * period)
+
+
+def test_viewer_opens_persistence_with_auto_and_pwm_periods(qapp) -> None:
+    time, node = _switch_node(100)
+    viewer = WaveformViewer()
+    viewer.set_result(SimulationResult(time=time.tolist(), signals={"V(sw)": node.tolist()}))
+
+    panel = viewer.show_persistence()
+    persistence = panel.persistence_map
+    assert persistence is not None
+    assert persistence.period == pytest.approx(1e-5)
+    assert persistence.cycles == pytest.approx(100.0, rel=1e-3)
+
+    viewer.set_switching_frequency(50e3)
+    assert panel.persistence_map.period == pytest.approx(2e-5)
+
+    panel._period_edit.setText("5u")
+    panel._restart()
+    assert panel.persistence_map.period == pytest.approx(5e-6)
+    viewer.close()
+
+
+def test_extended_source_folds_only_the_new_tail(qapp) -> None:
+    time, node = _switch_node(200)
+    viewer = WaveformViewer()
+    viewer.set_result(SimulationResult(time=time[:8_001].tolist(), signals={"V(sw)": node[:8_001].tolist()}))
+    panel = viewer.show_persistence()
+    accumulator = panel._accumulator
+
+    panel.set_source(time, {"V(sw)": node})
+
+    assert panel._accumulator is accumulator
+    assert accumulator.consumed == len(time) - 1
+    assert panel.persistence_map.cycles == pytest.approx(200.0, rel=1e-3)
+
+    panel.set_source(time + 1.0, {"V(sw)": node})
+    assert panel._accumulator is not accumulator
+    viewer.close()
@@ -0,0 +1,106 @@
+"""Tests for the append-only animated reveal of a finished run."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from pulsimgui.views.waveform import waveform_viewer
+from pulsimgui.views.waveform.waveform_viewer import (
+    WaveformViewer,
+    reveal_bucket,
+    reveal_envelope,
+)
+
+
+def _animate(viewer: WaveformViewer, time: np.ndarray, signals: dict[str, np.ndarray]) -> None:
+    viewer.add_data_point(
+        float(time[-1]),
+        {"_animate": True, "_time_array": time, "_signal_arrays": signals, "_total_points": len(time)},
+    )
+
+
+def test_reveal_bucket_and_envelope_match_blockwise_reduction() -> None:
+    assert reveal_bucket(10_000) == 1
+    assert reveal_bucket(10_001) == 64
+    assert reveal_bucket(1_000_000) == 512
+    assert 2 * -(-50_000_000 // reveal_bucket(50_000_000)) <= waveform_viewer.ANIMATION_MAX_POINTS
+
+    time = np.arange(1000.0)
+    values = np.sin(time / 7.0)
+    values[555] = 9.0
+    whole_t, whole_v = reveal_envelope(time, values, 64)
+    parts = [reveal_envelope(time[a : a + 128], values[a : a + 128], 64) for a in range(0, 1000, 128)]
+    np.testing.assert_array_equal(whole_t, np.concatenate([t for t, _ in parts]))
+    np.testing.assert_array_equal(whole_v, np.concatenate([v for _, v in parts]))
+    assert len(whole_v) == 2 * 16 and whole_v.max() == 9.0 and whole_t[-1] == 999.0
+    np.testing.assert_array_equal(values[whole_t.astype(int)], whole_v)
+
+
+def test_frames_append_a_bounded_envelope_until_the_run_is_shown(qapp, monkeypatch) -> None:
+    monkeypatch.setattr(waveform_viewer, "ANIMATION_FRAME_BUDGET", 512)
+    time = np.linspace(0.0, 1.0, 200_003)
+    signals = {"V(out)": np.sin(time * 40.0), "I(L1)": np.cos(time * 40.0)}
+    viewer = WaveformViewer()
+    try:
+        _animate(viewer, time, signals)
+        reveal = viewer._reveal
+        assert viewer._anim_timer.isActive() and reveal.bucket == 64 and reveal.step == 512
+
+        lengths = []
+        while viewer._reveal is not None:
+            viewer._animate_frame()
+            x, y = viewer._streaming_traces["V(out)"].getData()
+            lengths.append(len(x))
+            assert len(x) == len(y) and np.all(np.diff(x) >= 0)
+
+        # Each frame appends the same number of points, never the whole run.
+        assert len(lengths) == -(-200_003 // 512)
+        assert set(np.diff(lengths[:-1])) == {2 * 512 // 64}
+        assert lengths[-1] == 2 * -(-200_003 // 64) <= waveform_viewer.ANIMATION_MAX_POINTS
+        assert y.max() == signals["V(out)"].max() and y.min() == signals["V(out)"].min()
+        assert not viewer._anim_timer.isActive()
+        assert viewer._streaming_time is reveal.time and viewer._streaming_signals.keys() == signals.keys()
+        assert viewer._plot_widget.getViewBox().viewRange()[0][1] > 1.0
+    finally:
+        viewer.close()
+
+
+def test_short_runs_reveal_raw_samples(qapp) -> None:
+    time = np.linspace(0.0, 1e-3, 2_000)
+    viewer = WaveformViewer()
+    try:
+        _animate(viewer, time, {"V(out)": time * 2.0, "ragged": time[:10]})
+        assert viewer._reveal.bucket == 1 and list(viewer._reveal.signals) == ["V(out)"]
+        while viewer._reveal is not None:
+            viewer._animate_frame()
+        x, y = viewer._streaming_traces["V(out)"].getData()
+        np.testing.assert_array_equal(x, time)
+        np.testing.assert_array_equal(y, time * 2.0)
+    finally:
+        viewer.close()
+
+
+def test_streamed_samples_append_after_a_reveal(qapp) -> None:
+    time = np.linspace(0.0, 1e-3, 2_000)
+    viewer = WaveformViewer()
+    try:
+        _animate(viewer, time, {"V(out)": time * 2.0, "I(L1)": time})
+        while viewer._reveal is not None:
+            viewer._animate_frame()
+        assert isinstance(viewer._streaming_time, np.ndarray)
+
+        viewer.add_data_point(2e-3, {"V(out)": 4e-3})
+        viewer.add_data_point(
+            0.0, {"_chunk_time": [3e-3, 4e-3], "_chunk_signals": {"V(out)": [6e-3, 8e-3]}}
+        )
+
+        assert viewer._streaming_time[-3:] == [2e-3, 3e-3, 4e-3]
+        assert len(viewer._streaming_time) == 2_003
+        assert viewer._streaming_signals["V(out)"][:2_000] == (time * 2.0).tolist()
+        assert viewer._streaming_signals["V(out)"][-3:] == [4e-3, 6e-3, 8e-3]
+        assert np.isnan(viewer._streaming_signals["I(L1)"][-1])
+        viewer._flush_streaming_data()
+        x, _y = viewer._streaming_traces["V(out)"].getData()
+        assert x[-1] == 4e-3
+    finally:
+        viewer.close()
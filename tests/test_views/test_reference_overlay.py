@@ -0,0 +1,111 @@
+"""Tests for overlaying imported reference waveforms in the viewer and scopes."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from pulsimgui.models.component import ComponentType
+from pulsimgui.services.reference_import import load_reference
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.scope.bindings import ScopeChannelBinding, ScopeSignal
+from pulsimgui.views.scope.scope_window import ScopeWindow
+from pulsimgui.views.waveform import WaveformViewer
+
+
+def _reference(tmp_path) -> SimulationResult:
+    time = np.linspace(0.0, 1.0, 400_001)
+    np.savez(
+        tmp_path / "bench.npz",
+        time=time,
+        CH1=np.sin(2 * np.pi * 50 * time),
+        **{"V(out)": np.full(time.size, 4.0)},
+    )
+    return load_reference(tmp_path / "bench.npz")
+
+
+def _simulated() -> SimulationResult:
+    time = np.linspace(0.0, 1.0, 101)
+    return SimulationResult(time=time.tolist(), signals={"V(out)": np.full(101, 5.0).tolist()})
+
+
+def test_viewer_draws_every_reference_signal_in_the_visible_window(qapp, tmp_path) -> None:
+    viewer = WaveformViewer()
+    viewer.set_result(_simulated())
+    assert viewer.wait_for_caches()
+    changes: list[list[str]] = []
+    viewer.references_changed.connect(changes.append)
+
+    viewer.add_reference("bench", _reference(tmp_path))
+
+    assert viewer.reference_labels() == ["bench"] and changes == [["bench"]]
+    assert set(viewer._overlay_traces) == {("bench", "CH1"), ("bench", "V(out)")}
+    x, y = viewer._overlay_traces[("bench", "V(out)")].getData()
+    assert len(x) < 10_000 and np.all(y == 4.0)
+    viewer._plot_widget.setXRange(0.1, 0.2, padding=0.0)
+    viewer._overlay_update_timer.timeout.emit()
+    x, _ = viewer._overlay_traces[("bench", "CH1")].getData()
+    assert x[0] >= 0.1 - 1e-6 and x[-1] <= 0.2 + 1e-6
+
+    viewer._populate_compare_menu()
+    texts = [action.text() for action in viewer._compare_menu.actions()]
+    assert "bench [reference]" in texts and "Import Reference..." in texts
+    requested: list[bool] = []
+    viewer.reference_import_requested.connect(lambda: requested.append(True))
+    next(a for a in viewer._compare_menu.actions() if a.text() == "Import Reference...").trigger()
+    assert requested == [True]
+
+    viewer.remove_overlay("bench")
+    assert viewer._overlay_traces == {} and changes[-1] == []
+    viewer.close()
+
+
+def test_scope_overlays_reference_channels_on_matching_panels(qapp, tmp_path) -> None:
+    window = ScopeWindow("scope", "Scope", ComponentType.ELECTRICAL_SCOPE)
+    window.set_bindings(
+        [
+            ScopeChannelBinding(
+                index=0,
+                pin_index=0,
+                channel_label="CH1",
+                overlay=False,
+                node_id=None,
+                node_label=None,
+                signals=[ScopeSignal(label="V(gate)", signal_key="V(gate)", node_id=None, node_label=None)],
+            ),
+            ScopeChannelBinding(
+                index=1,
+                pin_index=1,
+                channel_label="CH2",
+                overlay=False,
+                node_id=None,
+                node_label=None,
+                signals=[ScopeSignal(label="out", signal_key="V(out)", node_id=None, node_label=None)],
+            ),
+        ]
+    )
+    time = np.linspace(0.0, 1.0, 101)
+    window.apply_simulation_result(
+        SimulationResult(
+            time=time.tolist(),
+            signals={"V(gate)": np.zeros(101).tolist(), "V(out)": np.full(101, 5.0).tolist()},
+        )
+    )
+
+    window.add_reference("bench", _reference(tmp_path))
+
+    # Only shown panels get overlays. CH1 matches by channel label, V(out)
+    # by the bound signal key.
+    assert set(window._reference_traces) == {("bench", "CH1: V(gate)")}
+    window._stacked_signal_list.set_signal_visible("CH2: out", True)
+    window._refresh_stacked_plots()
+    assert set(window._reference_traces) == {("bench", "CH1: V(gate)"), ("bench", "CH2: out")}
+    x, y = window._reference_traces[("bench", "CH2: out")].getData()
+    assert len(x) < 10_000 and np.all(y == 4.0)
+    window._stacked_panels["CH1: V(gate)"].plot.setXRange(0.5, 0.6, padding=0.0)
+    window._reference_update_timer.timeout.emit()
+    x, _ = window._reference_traces[("bench", "CH1: V(gate)")].getData()
+    assert x[0] >= 0.5 - 1e-6 and x[-1] <= 0.6 + 1e-6
+
+    window.remove_reference("bench")
+    assert window._reference_traces == {} and window.reference_labels() == []
+    window.close()
@@ -0,0 +1,185 @@
+"""Tests for expression-based math traces in scope windows."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from pulsimgui.models.component import ComponentType
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.scope import scope_window
+from pulsimgui.views.scope.bindings import ScopeChannelBinding, ScopeSignal
+from pulsimgui.views.scope.scope_window import ScopeWindow
+
+
+class _AcceptedDialog:
+    """Stand-in for MathSignalDialog returning a fixed configuration."""
+
+    config: dict[str, object] = {}
+
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+    def exec(self):
+        return scope_window.QDialog.DialogCode.Accepted
+
+    def selected_config(self) -> dict[str, object]:
+        return dict(self.config)
+
+
+def _binding(index: int, key: str) -> ScopeChannelBinding:
+    return ScopeChannelBinding(
+        index=index,
+        pin_index=index,
+        channel_label=f"CH{index + 1}",
+        overlay=False,
+        node_id=None,
+        node_label=None,
+        signals=[ScopeSignal(label=key, signal_key=key, node_id=None, node_label=None)],
+    )
+
+
+def _result(scale: float) -> SimulationResult:
+    time_axis = np.linspace(0.0, 1e-3, 1001)
+    return SimulationResult(
+        time=time_axis.tolist(),
+        signals={
+            "V(out)": (scale * np.sin(2e4 * time_axis)).tolist(),
+            "I(L1)": np.full(time_axis.size, 2.0).tolist(),
+        },
+    )
+
+
+def test_math_trace_is_recomputed_for_each_result(qapp, monkeypatch) -> None:
+    window = ScopeWindow("scope", "Scope", ComponentType.ELECTRICAL_SCOPE)
+    window.set_bindings([_binding(0, "V(out)"), _binding(1, "I(L1)")])
+    window.apply_simulation_result(_result(1.0))
+    monkeypatch.setattr(scope_window, "MathSignalDialog", _AcceptedDialog)
+    _AcceptedDialog.config = {
+        "operation": "EXPR",
+        "source_a": "CH1: V(out)",
+        "source_b": "",
+        "gain": 1.0,
+        "offset": 0.5,
+        "window": 8,
+        "custom_name": "power",
+        "expression": '"CH1: V(out)" * I(L1)',
+        "needs_b": False,
+        "needs_window": False,
+    }
+
+    window._on_create_math_signal_clicked()
+
+    name = "MATH_1:power"
+    expected = 2.0 * window._stacked_signals["CH1: V(out)"] + 0.5
+    np.testing.assert_allclose(window._stacked_signals[name], expected)
+
+    window.apply_simulation_result(_result(3.0))
+    np.testing.assert_allclose(
+        window._stacked_signals[name], 2.0 * window._stacked_signals["CH1: V(out)"] + 0.5
+    )
+    assert np.max(window._stacked_signals[name]) > 5.0
+    window.close()
+
+
+def test_fixed_operations_translate_to_expressions() -> None:
+    base = {"source_a": "CH1: V(out)", "source_b": "CH2: I(L1)", "gain": 1.0, "offset": 0.0, "window": 4}
+
+    assert ScopeWindow._math_expression_for({**base, "operation": "DIV"}) == (
+        '"CH1: V(out)" / "CH2: I(L1)"'
+    )
+    assert ScopeWindow._math_expression_for({**base, "operation": "AVG", "gain": 2.0}) == (
+        '(avg("CH1: V(out)", n=4)) * 2.0'
+    )
+    assert ScopeWindow._math_expression_for({**base, "operation": "INT"}) == 'integ("CH1: V(out)")'
+
+
+def test_math_trace_is_bound_once_and_plotted_over_the_shown_range(qapp, monkeypatch) -> None:
+    window = ScopeWindow("scope", "Scope", ComponentType.ELECTRICAL_SCOPE)
+    window.set_bindings([_binding(0, "V(out)"), _binding(1, "I(L1)")])
+    window.apply_simulation_result(_result(1.0))
+    monkeypatch.setattr(scope_window, "MathSignalDialog", _AcceptedDialog)
+    _AcceptedDialog.config = {
+        "operation": "EXPR",
+        "source_a": "CH1: V(out)",
+        "source_b": "",
+        "gain": 1.0,
+        "offset": 0.0,
+        "window": 8,
+        "custom_name": "double",
+        "expression": '2 * "CH1: V(out)"',
+        "needs_b": False,
+        "needs_window": False,
+    }
+    window._on_create_math_signal_clicked()
+    name = "MATH_1:double"
+    engine = window._math_engine
+
+    generation = engine.generation
+    window._refresh_stacked_sidebar()
+    assert engine.generation == generation
+
+    evaluated: list[tuple[int, int | None]] = []
+    evaluate = engine.evaluate
+
+    def counting_evaluate(expression, start=0, stop=None):
+        evaluated.append((start, stop))
+        return evaluate(expression, start, stop)
+
+    monkeypatch.setattr(engine, "evaluate", counting_evaluate)
+    window._timeline_slider.setValues(400, 500)
+    window._refresh_stacked_plots()
+    x, _y = window._stacked_panels[name].trace.getData()
+    assert evaluated and all(stop is not None and stop - start < 200 for start, stop in evaluated)
+    assert 0.39e-3 <= x[0] and x[-1] <= 0.51e-3
+
+    evaluated.clear()
+    readings = window._sample_stacked_signals([name, "CH1: V(out)"], [0.25e-3, 2e-3])
+    assert all(stop - start <= 2 for start, stop in evaluated)
+    np.testing.assert_allclose(readings[0, 0], 2.0 * readings[1, 0], rtol=1e-9)
+    assert np.isnan(readings[0, 1]) and np.isnan(readings[1, 1])
+    window.close()
+
+
+def test_math_trace_stats_cover_the_shown_window_only(qapp, monkeypatch) -> None:
+    window = ScopeWindow("scope", "Scope", ComponentType.ELECTRICAL_SCOPE)
+    window.set_bindings([_binding(0, "V(out)"), _binding(1, "I(L1)")])
+    window.apply_simulation_result(_result(1.0))
+    window._timeline_slider.setValues(400, 500)
+    monkeypatch.setattr(scope_window, "MathSignalDialog", _AcceptedDialog)
+    _AcceptedDialog.config = {
+        "operation": "EXPR",
+        "source_a": "CH1: V(out)",
+        "source_b": "",
+        "gain": 1.0,
+        "offset": 0.0,
+        "window": 8,
+        "custom_name": "double",
+        "expression": '2 * "CH1: V(out)"',
+        "needs_b": False,
+        "needs_window": False,
+    }
+    engine = window._math_engine
+    evaluated: list[tuple[int, int | None]] = []
+    evaluate = engine.evaluate
+
+    def counting_evaluate(expression, start=0, stop=None):
+        evaluated.append((start, stop))
+        return evaluate(expression, start, stop)
+
+    monkeypatch.setattr(engine, "evaluate", counting_evaluate)
+    window._on_create_math_signal_clicked()
+    name = "MATH_1:double"
+    assert evaluated and all(stop is not None for _start, stop in evaluated)
+
+    lo, hi = window._window_indices(*window._timeline_window())
+    assert 390 < lo and hi < 510
+    shown = 2.0 * np.sin(2e4 * np.linspace(0.0, 1e-3, 1001))[lo:hi]
+    stats = window._stacked_stats(name)
+    np.testing.assert_allclose([stats["max"], stats["min"]], [shown.max(), shown.min()])
+    assert window._stacked_panels[name].stats.text().startswith("RMS: ")
+
+    evaluated.clear()
+    window.apply_simulation_result(_result(3.0))
+    assert evaluated and all(stop is not None for _start, stop in evaluated)
+    np.testing.assert_allclose(window._stacked_stats(name)["max"], 3.0 * shown.max())
+    window.close()
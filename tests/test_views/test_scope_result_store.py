@@ -0,0 +1,69 @@
+"""Tests for scope windows sharing one result store."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from pulsimgui.models.component import ComponentType
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.scope.bindings import ScopeChannelBinding, ScopeSignal
+from pulsimgui.views.scope.scope_window import ScopeWindow
+
+
+def _binding(index: int, key: str | None) -> ScopeChannelBinding:
+    return ScopeChannelBinding(
+        index=index,
+        pin_index=index,
+        channel_label=f"CH{index + 1}",
+        overlay=False,
+        node_id=None,
+        node_label=None,
+        signals=[ScopeSignal(label=key or "", signal_key=key, node_id=None, node_label=None)],
+    )
+
+
+def _window(qapp, keys: list[str | None]) -> ScopeWindow:
+    window = ScopeWindow("scope", "Scope", ComponentType.ELECTRICAL_SCOPE)
+    window.set_bindings([_binding(index, key) for index, key in enumerate(keys)])
+    return window
+
+
+def test_windows_reference_one_copy_of_the_result(qapp) -> None:
+    time_axis = np.linspace(0.0, 1e-3, 50_001)
+    result = SimulationResult(
+        time=time_axis.tolist(),
+        signals={"V(out)": np.sin(time_axis).tolist(), "I(L1)": np.cos(time_axis).tolist()},
+    )
+    first = _window(qapp, ["V(out)", "I(L1)"])
+    second = _window(qapp, ["V(out)", "V(missing)"])
+
+    first.apply_simulation_result(result)
+    second.apply_simulation_result(result)
+
+    assert np.shares_memory(first._stacked_time, second._stacked_time)
+    assert np.shares_memory(
+        first._stacked_signals["CH1: V(out)"], second._stacked_signals["CH1: V(out)"]
+    )
+    assert list(second._stacked_signals) == ["CH1: V(out)"]
+    assert "missing 1" in second._message_label.text()
+
+    # Rebinding only re-resolves names against the same arrays.
+    second.set_bindings([_binding(0, "I(L1)")])
+    second.apply_simulation_result(result)
+    assert np.shares_memory(
+        first._stacked_signals["CH2: I(L1)"], second._stacked_signals["CH1: I(L1)"]
+    )
+    first.close()
+    second.close()
+
+
+def test_empty_result_clears_window(qapp) -> None:
+    window = _window(qapp, ["V(out)"])
+    window.apply_simulation_result(SimulationResult(time=[0.0, 1.0], signals={"V(out)": [1.0, 2.0]}))
+    assert window._stacked_signals
+
+    window.apply_simulation_result(None)
+
+    assert not window._stacked_signals
+    assert window._message_label.text() == "No simulation data available yet."
+    window.close()
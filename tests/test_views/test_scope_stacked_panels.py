@@ -0,0 +1,78 @@
+"""Tests for the retained stacked-scope panels."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from pulsimgui.models.component import ComponentType
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.scope.bindings import ScopeChannelBinding, ScopeSignal
+from pulsimgui.views.scope.scope_window import ScopeWindow
+
+KEYS = ["V(a)", "V(b)", "V(c)"]
+
+
+def _window(qapp) -> ScopeWindow:
+    window = ScopeWindow("scope", "Scope", ComponentType.ELECTRICAL_SCOPE)
+    window.set_bindings([
+        ScopeChannelBinding(
+            index=index,
+            pin_index=index,
+            channel_label=f"CH{index + 1}",
+            overlay=False,
+            node_id=None,
+            node_label=None,
+            signals=[ScopeSignal(label=key, signal_key=key, node_id=None, node_label=None)],
+        )
+        for index, key in enumerate(KEYS)
+    ])
+    return window
+
+
+def _result(scale: float) -> SimulationResult:
+    time_axis = np.linspace(0.0, 1.0, 101)
+    return SimulationResult(
+        time=time_axis.tolist(),
+        signals={key: (scale * (index + 1) * time_axis).tolist() for index, key in enumerate(KEYS)},
+    )
+
+
+def test_panels_are_reused_across_updates_and_visibility(qapp) -> None:
+    window = _window(qapp)
+    window.apply_simulation_result(_result(1.0))
+    for index, key in enumerate(KEYS):
+        window._stacked_signal_list.set_signal_visible(f"CH{index + 1}: {key}", True)
+    window._refresh_stacked_plots()
+    panels = dict(window._stacked_panels)
+    assert len(panels) == 3 and len(window._plot_widgets) == 3
+
+    window.apply_simulation_result(_result(2.0))
+    name = "CH2: V(b)"
+    window._stacked_signal_list.set_signal_visible(name, False)
+    window._on_stacked_signal_visibility_changed(name, False)
+
+    assert window._stacked_panels == panels
+    assert all(a is b for a, b in zip(window._stacked_panels.values(), panels.values()))
+    assert panels[name].frame.isHidden()
+    assert len(window._plot_widgets) == 2
+    _x, y = panels["CH3: V(c)"].trace.getData()
+    assert y[-1] == 6.0
+
+    window._stacked_cursor_toggle.setChecked(True)
+    assert len(window._stacked_cursor_lines) == 2
+    assert all(line.isVisible() for pair in window._stacked_cursor_lines for line in pair)
+    assert window._stacked_panels == panels
+    window.close()
+
+
+def test_empty_result_hides_panels_and_shows_placeholder(qapp) -> None:
+    window = _window(qapp)
+    window.apply_simulation_result(_result(1.0))
+    assert window._stacked_panels
+
+    window.apply_simulation_result(None)
+
+    assert window._stacked_panels == {}
+    assert not window._stacked_placeholder.isHidden()
+    assert "No signals to plot" in window._stacked_placeholder.text()
+    window.close()
@@ -162,6 +162,7 @@ class TestUIValueChanges:
         )
         dialog._thermal_include_conduction_check.setChecked(True)
         dialog._thermal_include_switching_check.setChecked(False)
+        dialog._ac_adaptive_check.setChecked(True)
 
         # Simulate accept
         dialog._on_accept()
@@ -192,6 +193,7 @@ class TestUIValueChanges:
         assert settings.thermal_network == "cauer"
         assert settings.thermal_include_conduction_losses is True
         assert settings.thermal_include_switching_losses is False
+        assert settings.ac_adaptive is True
 
     def test_dialog_apply_emits_signal_and_keeps_dialog_open(self, qapp) -> None:
         """Apply should store settings and emit settings_applied without closing dialog."""
@@ -0,0 +1,39 @@
+"""Tests for the spectrum analyzer panel hosted by waveform views."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.waveform import WaveformViewer
+
+
+def test_waveform_viewer_spectrum_follows_cursors(qapp) -> None:
+    time_axis = np.linspace(0.0, 1e-2, 20_001)
+    viewer = WaveformViewer()
+    viewer.set_result(
+        SimulationResult(
+            time=time_axis.tolist(),
+            signals={
+                "V(out)": (
+                    np.sin(2 * np.pi * 1e3 * time_axis) + 0.2 * np.sin(2 * np.pi * 2e3 * time_axis)
+                ).tolist()
+            },
+        )
+    )
+
+    panel = viewer.show_spectrum()
+    panel.refresh()
+    assert panel.spectrum is not None
+    assert panel.spectrum.thd == pytest.approx(0.2, rel=1e-2)
+
+    viewer._cursor_checkbox.setChecked(True)
+    viewer._set_cursor_positions(2e-3, 6e-3)
+    panel.refresh()
+
+    assert panel._range == pytest.approx((2e-3, 6e-3))
+    assert panel.spectrum.resolution == pytest.approx(250.0, rel=1e-3)
+    assert panel._harmonics_table.rowCount() == len(panel.spectrum.harmonics)
+    panel.close()
+    viewer.close()
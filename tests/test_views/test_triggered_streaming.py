@@ -0,0 +1,139 @@
+"""Tests for the triggered live display of the waveform viewer and scopes."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pulsimgui.models.component import ComponentType
+from pulsimgui.services.scope_trigger import TriggerSettings
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.scope.bindings import ScopeChannelBinding, ScopeSignal
+from pulsimgui.views.scope.scope_window import ScopeWindow
+from pulsimgui.views.waveform.waveform_viewer import WaveformViewer
+
+PERIOD = 10e-6
+DT = 1e-7
+
+
+def _gate(t: float) -> float:
+    return 1.0 if np.mod(t + DT / 2, PERIOD) < 0.3 * PERIOD else 0.0
+
+
+def _stream(target, start: int, stop: int) -> None:
+    for index in range(start, stop):
+        t = index * DT
+        target.add_data_point(t, {"V(gate)": _gate(t), "I(L1)": t})
+
+
+def test_viewer_draws_only_the_triggered_window(qapp) -> None:
+    viewer = WaveformViewer()
+    settings = TriggerSettings("V(gate)", level=0.5, window=2 * PERIOD, pre_trigger=0.25)
+    viewer.set_trigger(settings)
+    try:
+        for block in range(6):
+            _stream(viewer, block * 500, (block + 1) * 500)
+            viewer._flush_streaming_data()
+
+        x, y = viewer._streaming_traces["V(gate)"].getData()
+        assert x[0] >= -settings.pre_trigger_time - DT
+        assert x[-1] <= settings.post_trigger_time + DT
+        assert len(x) <= round(settings.window / DT) + 2
+        assert y[x < -DT][-1] == 0.0 and y[x > DT][0] == 1.0
+        assert viewer._trigger_consumed == 3000
+        x_range = viewer._plot_widget.getPlotItem().vb.viewRange()[0]
+        assert x_range == pytest.approx([-settings.pre_trigger_time, settings.post_trigger_time])
+
+        # Switching the trigger off goes back to drawing the whole history.
+        viewer.set_trigger(None)
+        viewer._flush_streaming_data()
+        x, _ = viewer._streaming_traces["V(gate)"].getData()
+        assert len(x) == 3000
+    finally:
+        viewer.close()
+
+
+def test_trigger_panel_drives_the_viewer(qapp) -> None:
+    viewer = WaveformViewer()
+    try:
+        _stream(viewer, 0, 10)
+        panel = viewer.show_trigger_controls()
+        assert panel._source_combo.findText("V(gate)") >= 0
+
+        panel._source_combo.setCurrentText("V(gate)")
+        panel._level_edit.setText("500m")
+        panel._mode_combo.setCurrentIndex(2)
+        panel._enabled_check.setChecked(True)
+
+        settings = viewer.trigger_settings
+        assert (settings.source, settings.mode) == ("V(gate)", "single")
+        assert settings.level == pytest.approx(0.5)
+        assert settings.window == pytest.approx(100e-6)
+        panel._enabled_check.setChecked(False)
+        assert viewer.trigger_settings is None
+    finally:
+        viewer.close()
+
+
+def test_scope_window_shows_triggered_sweeps_until_the_result_arrives(qapp) -> None:
+    window = ScopeWindow("scope", "Scope", ComponentType.ELECTRICAL_SCOPE)
+    window.set_bindings(
+        [
+            ScopeChannelBinding(
+                index=0,
+                pin_index=0,
+                channel_label="CH1",
+                overlay=False,
+                node_id=None,
+                node_label=None,
+                signals=[ScopeSignal(label="V(gate)", signal_key="V(gate)", node_id=None, node_label=None)],
+            )
+        ]
+    )
+    try:
+        _stream(window, 0, 1000)
+        window._flush_live_data()
+        assert len(window._stacked_time) == 0  # No trigger: scopes wait for the result
+
+        window.set_trigger(TriggerSettings("CH1: V(gate)", level=0.5, window=2 * PERIOD, mode="normal"))
+        _stream(window, 1000, 4000)
+        window._flush_live_data()
+
+        assert list(window._stacked_signals) == ["CH1: V(gate)"]
+        assert window._stacked_time[0] < 0.0 < window._stacked_time[-1]
+        assert len(window._stacked_time) <= round(2 * PERIOD / DT) + 2
+        assert "Live" in window._message_label.text()
+
+        time_axis = np.arange(4000) * DT
+        window.apply_simulation_result(
+            SimulationResult(
+                time=time_axis.tolist(),
+                signals={"V(gate)": [_gate(t) for t in time_axis]},
+            )
+        )
+        assert len(window._stacked_time) == 4000
+        assert not window._live_timer.isActive()
+    finally:
+        window.close()
+
+
+def test_trigger_controls_are_shared_by_viewer_and_scope(qapp) -> None:
+    viewer = WaveformViewer()
+    window = ScopeWindow("scope", "Scope", ComponentType.ELECTRICAL_SCOPE)
+    settings = TriggerSettings("V(gate)", level=0.5, window=2 * PERIOD, mode="single")
+    try:
+        for display in (viewer, window):
+            controls = display._triggers
+            panel = display.show_trigger_controls()
+            assert controls.panel is panel and controls.status() == "Off"
+
+            assert controls.apply(settings) and display.trigger_settings == settings
+            assert not controls.apply(settings) and panel.settings() == settings
+            panel.rearm_requested.emit()
+            assert controls.status() == "Armed (0 sweeps)"
+            panel.set_settings(None)
+            panel._emit_settings()
+            assert display.trigger_settings is None and controls.trigger is None
+    finally:
+        viewer.close()
+        window.close()
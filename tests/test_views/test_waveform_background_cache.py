@@ -0,0 +1,135 @@
+"""Tests for background preparation of waveform viewer caches."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from PySide6.QtWidgets import QWidget
+from shiboken6 import delete
+
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.waveform import WaveformViewer
+from pulsimgui.views.waveform import waveform_viewer
+from pulsimgui.views.waveform.waveform_viewer import (
+    MAX_DISPLAY_POINTS,
+    decimate_min_max,
+    prepare_signal,
+    signal_statistics,
+)
+
+
+def _reference_decimation(time: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Loop-based min-max bucketing the vectorized helper must reproduce."""
+    n_buckets = MAX_DISPLAY_POINTS // 2
+    bucket_size = len(time) // n_buckets
+    out_t, out_v = [], []
+    for i in range(n_buckets):
+        start = i * bucket_size
+        lo = start + int(np.argmin(values[start : start + bucket_size]))
+        hi = start + int(np.argmax(values[start : start + bucket_size]))
+        for index in sorted((lo, hi)):
+            out_t.append(time[index])
+            out_v.append(values[index])
+    return np.array(out_t), np.array(out_v)
+
+
+def _result(samples: int, signals: int) -> SimulationResult:
+    time_axis = np.linspace(0.0, 1e-3, samples)
+    return SimulationResult(
+        time=time_axis,
+        signals={f"V(n{k})": np.sin(time_axis * 1e4 * (k + 1)) + k for k in range(signals)},
+    )
+
+
+def test_decimate_min_max_matches_bucket_loop() -> None:
+    rng = np.random.default_rng(3)
+    time = np.linspace(0.0, 1.0, 123_457)
+    values = rng.normal(size=time.size)
+
+    fast_t, fast_v = decimate_min_max(time, values)
+    slow_t, slow_v = _reference_decimation(time, values)
+
+    np.testing.assert_array_equal(fast_t, slow_t)
+    np.testing.assert_array_equal(fast_v, slow_v)
+    short = np.arange(10.0)
+    assert decimate_min_max(short, short)[0] is short
+
+
+def test_prepare_signal_measures_and_rejects_mismatched_lengths() -> None:
+    time = np.linspace(0.0, 1.0, 50_000)
+    prepared = prepare_signal(time, np.sin(2 * np.pi * 5 * time).tolist())
+
+    assert prepared is not None
+    assert prepared.statistics["pkpk"] == pytest.approx(2.0, rel=1e-6)
+    assert prepared.statistics["rms"] == pytest.approx(np.sqrt(0.5), rel=1e-3)
+    assert prepared.display_time.size == MAX_DISPLAY_POINTS
+    assert prepare_signal(time, [1.0, 2.0]) is None
+    assert np.isnan(signal_statistics(np.array([np.nan]))["mean"])
+
+
+def test_large_result_is_prepared_in_background_and_plotted_progressively(qapp, monkeypatch) -> None:
+    monkeypatch.setattr(waveform_viewer, "BACKGROUND_CACHE_SAMPLES", 1_000)
+    viewer = WaveformViewer()
+    viewer.set_auto_show_all_signals(True)
+    ready: list[int] = []
+    viewer.caches_ready.connect(lambda: ready.append(1))
+
+    viewer.set_result(_result(20_000, 4))
+
+    assert viewer.caches_pending
+    assert viewer.wait_for_caches()
+    assert ready == [1]
+    assert sorted(viewer._traces) == [f"V(n{k})" for k in range(4)]
+    assert viewer._signal_statistics["V(n2)"]["mean"] == pytest.approx(2.0, abs=0.05)
+    x, _ = viewer._traces["V(n0)"].getData()
+    assert len(x) <= MAX_DISPLAY_POINTS
+    viewer.close()
+
+
+def test_traces_requested_before_preparation_are_plotted_when_ready(qapp, monkeypatch) -> None:
+    monkeypatch.setattr(waveform_viewer, "BACKGROUND_CACHE_SAMPLES", 1_000)
+    viewer = WaveformViewer()
+    viewer.set_result(_result(20_000, 3))
+
+    viewer.add_trace("V(n2)")
+    assert viewer.wait_for_caches()
+
+    assert set(viewer._traces) == {"V(n0)", "V(n2)"}
+    assert set(viewer._signal_arrays) == {"V(n0)", "V(n1)", "V(n2)"}
+    viewer.close()
+
+
+def test_stale_background_jobs_are_discarded(qapp, monkeypatch) -> None:
+    monkeypatch.setattr(waveform_viewer, "BACKGROUND_CACHE_SAMPLES", 1_000)
+    viewer = WaveformViewer()
+
+    viewer.set_result(_result(50_000, 6))
+    newer = SimulationResult(
+        time=np.linspace(0.0, 2.0, 30_000),
+        signals={"I(L1)": np.full(30_000, 3.0)},
+    )
+    viewer.set_result(newer)
+    assert viewer.wait_for_caches()
+
+    assert list(viewer._signal_arrays) == ["I(L1)"]
+    assert viewer._time_array[-1] == pytest.approx(2.0)
+    assert list(viewer._traces) == ["I(L1)"]
+    viewer.close()
+
+
+def test_cache_worker_is_shut_down_on_close_and_with_its_window(qapp, monkeypatch) -> None:
+    monkeypatch.setattr(waveform_viewer, "BACKGROUND_CACHE_SAMPLES", 1_000)
+    viewer = WaveformViewer()
+    viewer.set_result(_result(20_000, 2))
+    assert viewer.wait_for_caches()
+    executor = viewer._cache_executor
+    viewer.close()
+    assert executor._shutdown and viewer._cache_executor is None and not viewer.caches_pending
+
+    window = QWidget()
+    embedded = WaveformViewer(parent=window)
+    embedded.set_result(_result(20_000, 2))
+    assert embedded.wait_for_caches()
+    executor = embedded._cache_executor
+    delete(window)
+    assert executor._shutdown
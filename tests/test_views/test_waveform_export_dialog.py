@@ -0,0 +1,36 @@
+"""Tests for the waveform export options dialog."""
+
+from __future__ import annotations
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QDialogButtonBox
+
+from pulsimgui.views.dialogs import WaveformExportDialog
+
+
+def test_dialog_builds_export_options(qapp) -> None:
+    dialog = WaveformExportDialog(["V(out)", "I(L1)"], (0.0, 1e-3), 10_001)
+    ok_button = dialog._button_box.button(QDialogButtonBox.StandardButton.Ok)
+
+    options = dialog.get_options()
+    assert options.signals == ["V(out)", "I(L1)"]
+    assert (options.start, options.stop, options.decimation) == (None, None, 1)
+
+    dialog._signal_list.item(0).setCheckState(Qt.CheckState.Unchecked)
+    dialog._start_edit.setText("200us")
+    dialog._stop_edit.setText("0.5m")
+    dialog._decimation_spin.setValue(4)
+    options = dialog.get_options()
+    assert options.signals == ["I(L1)"]
+    assert options.start == pytest.approx(2e-4)
+    assert options.stop == pytest.approx(5e-4)
+    assert options.decimation == 4
+    assert ok_button.isEnabled()
+
+    dialog._start_edit.setText("1m")
+    assert dialog.get_options() is None and not ok_button.isEnabled()
+    dialog._start_edit.clear()
+    dialog._set_all_checked(False)
+    assert dialog.get_options() is None
+    dialog.close()
@@ -0,0 +1,126 @@
+"""Tests for overlaying earlier runs in the waveform viewer."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+
+import numpy as np
+import pytest
+
+from pulsimgui.services.result_store import ResultStore
+from pulsimgui.services.run_history import RunHistory
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.views.waveform import WaveformViewer
+from pulsimgui.views.waveform.waveform_viewer import resample_to_window
+
+
+def test_resample_to_window_keeps_pixel_extremes_inside_the_window() -> None:
+    time = np.linspace(0.0, 1.0, 1_000_001)
+    values = np.sin(2 * np.pi * 50 * time)
+
+    x, y = resample_to_window(time, values, 0.25, 0.5, 400)
+
+    assert x.size == y.size == 800
+    assert x[0] >= 0.25 and x[-1] <= 0.5
+    assert y.max() == pytest.approx(1.0, abs=1e-6)
+    assert y.min() == pytest.approx(-1.0, abs=1e-6)
+
+
+def test_resample_to_window_reads_the_pyramid_for_wide_windows() -> None:
+    time = np.linspace(0.0, 1.0, 1_000_001)
+    values = np.sin(2 * np.pi * 50 * time)
+    values[123_457] = 3.0
+    pyramid = ResultStore(time, {"v": values}).pyramid("v")
+
+    x, y = resample_to_window(time, values, 0.0, 1.0, 400, pyramid)
+    x_exact, y_exact = resample_to_window(time, values, 0.0, 1.0, 400)
+
+    # Buckets straddling a pixel edge land in one column, so the envelope
+    # may widen by at most one bucket's change; peaks are never lost.
+    np.testing.assert_array_equal(x, x_exact)
+    bucket_change = 2 * np.pi * 50 * pyramid.level_for(time.size, 800).bucket * 1e-6
+    assert np.abs(y - y_exact).max() <= bucket_change
+    assert y.max() == 3.0 and y.min() == -1.0
+    # Zoomed in past the finest level, the samples themselves are used.
+    x, y = resample_to_window(time, values, 0.1234, 0.1235, 40, pyramid)
+    assert y.max() == 3.0 and x[0] >= 0.1234
+
+
+def test_resample_to_window_returns_sparse_samples_with_edge_neighbours() -> None:
+    time = np.arange(10.0)
+
+    x, y = resample_to_window(time, time * 2, 2.5, 5.5, 400)
+
+    np.testing.assert_array_equal(x, [2.0, 3.0, 4.0, 5.0, 6.0])
+    np.testing.assert_array_equal(y, 2 * x)
+    assert resample_to_window(time, time, 5.0, 5.0, 400)[0].size == 0
+
+
+def test_viewer_overlays_runs_from_history(qapp) -> None:
+    history = RunHistory()
+    before = SimulationResult(
+        time=np.linspace(0.0, 1.0, 300_001).tolist(),
+        signals={"V(out)": np.full(300_001, 4.0).tolist()},
+    )
+    after = SimulationResult(
+        time=np.linspace(0.0, 1.0, 101).tolist(),
+        signals={"V(out)": np.full(101, 5.0).tolist(), "I(L1)": np.ones(101).tolist()},
+    )
+    before_record = history.add(before, label="before")
+    history.add(after, label="after")
+    viewer = WaveformViewer()
+    viewer.set_run_history(history)
+    viewer.set_result(after)
+    assert viewer.wait_for_caches()
+
+    viewer._populate_compare_menu()
+    labels = [action.text() for action in viewer._compare_menu.actions() if action.isCheckable()]
+    assert len(labels) == 1 and labels[0].startswith("before")
+
+    viewer._toggle_overlay_run(before_record.run_id, "before", True)
+    assert viewer.overlay_labels() == ["before"]
+    overlay = viewer._overlay_traces[("before", "V(out)")]
+    x, y = overlay.getData()
+    assert len(x) < 10_000
+    assert np.all(y == 4.0)
+
+    viewer._plot_widget.setXRange(0.1, 0.2, padding=0.0)
+    viewer._overlay_update_timer.timeout.emit()
+    x, _ = overlay.getData()
+    assert x[0] >= 0.1 - 1e-6 and x[-1] <= 0.2 + 1e-6
+
+    viewer.remove_trace("V(out)")
+    assert viewer._overlay_traces == {}
+    viewer.add_trace("V(out)")
+    assert ("before", "V(out)") in viewer._overlay_traces
+    viewer.clear_overlays()
+    assert viewer._overlay_traces == {}
+    viewer.close()
+
+
+def test_overlays_do_not_keep_evicted_runs_in_memory(qapp, tmp_path) -> None:
+    history = RunHistory(max_runs=2, spill_dir=tmp_path)
+    time = np.linspace(0.0, 1.0, 1_001)
+    before = SimulationResult(time=time.tolist(), signals={"V(out)": np.full(1_001, 4.0).tolist()})
+    after = SimulationResult(time=time.tolist(), signals={"V(out)": np.full(1_001, 5.0).tolist()})
+    record = history.add(before, label="before")
+    history.add(after, label="after")
+    viewer = WaveformViewer()
+    viewer.set_run_history(history)
+    viewer.set_result(after)
+    viewer._toggle_overlay_run(record.run_id, "before", True)
+    before_ref = weakref.ref(before)
+    del before
+
+    history.add(SimulationResult(time=time.tolist(), signals={"V(out)": time.tolist()}))
+    gc.collect()
+    assert not record.in_memory and before_ref() is None
+
+    viewer._refresh_overlays()
+    _x, y = viewer._overlay_traces[("before", "V(out)")].getData()
+    assert np.all(y == 4.0)
+    history.remove(record.run_id)
+    viewer._refresh_overlays()
+    assert viewer.overlay_labels() == [] and viewer._overlay_traces == {}
+    viewer.close()
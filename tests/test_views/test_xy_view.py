@@ -0,0 +1,115 @@
+"""Tests for the XY plot panel and its path decimation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from PySide6.QtGui import QColor
+
+from pulsimgui.models.component import ComponentType
+from pulsimgui.services.simulation_service import SimulationResult
+from pulsimgui.services.theme_service import DARK_THEME
+from pulsimgui.views.scope.bindings import ScopeChannelBinding, ScopeSignal
+from pulsimgui.views.scope.scope_window import ScopeWindow
+from pulsimgui.views.waveform import WaveformViewer
+from pulsimgui.views.waveform.persistence_view import PersistencePanel
+from pulsimgui.views.waveform.spectrum_view import SpectrumPanel
+from pulsimgui.views.waveform.xy_view import MAX_PATH_POINTS, XYPlotPanel, decimate_path
+
+
+def _loop(samples: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Time plus a hysteresis-like loop: H sinusoidal, B saturating with lag."""
+    time = np.linspace(0.0, 1e-2, samples)
+    h = np.sin(2 * np.pi * 1e3 * time)
+    b = np.tanh(3.0 * np.sin(2 * np.pi * 1e3 * time - 0.4))
+    return time, h, b
+
+
+def test_decimate_path_spreads_points_along_the_drawn_length() -> None:
+    # A step drawn as x = t: half the time is a flat line, the other half one
+    # vertical jump sampled just as densely in time.
+    t = np.linspace(0.0, 1.0, 200_000)
+    y = np.where(t < 0.5, 0.0, np.clip((t - 0.5) * 1e3, 0.0, 1.0))
+    keep = decimate_path(t, y, max_points=1000)
+
+    assert keep.size <= 1000
+    assert keep[0] == 0 and keep[-1] == t.size - 1
+    assert np.all(np.diff(keep) > 0)
+    # The jump spans 0.1 % of the samples but half the path length, so every
+    # one of its samples survives; thinning by time would keep one or two.
+    edge = (y > 0.0) & (y < 1.0)
+    assert np.count_nonzero(edge[keep]) == np.count_nonzero(edge)
+
+
+def test_decimate_path_drops_non_finite_and_keeps_short_paths() -> None:
+    x = np.array([0.0, 1.0, np.nan, 3.0])
+    assert decimate_path(x, np.ones(4)).tolist() == [0, 1, 3]
+    constant = decimate_path(np.ones(50_000), np.ones(50_000), max_points=10)
+    assert constant.tolist() == [0, 49_999]
+
+
+def test_panel_draws_bounded_path_and_marks_cursors(qapp) -> None:
+    time, h, b = _loop(1_000_001)
+    panel = XYPlotPanel()
+    panel.set_source(time, {"H": h, "B": b})
+    panel.select_signals("H", "B")
+
+    x, y = panel._path.getData()
+    assert len(x) <= MAX_PATH_POINTS
+    panel.set_cursor_times([2.5e-4, 5e-4], [(255, 0, 0), (0, 0, 255)])
+    (x1, y1), (x2, y2) = panel.cursor_points
+    assert x1 == pytest.approx(1.0, abs=1e-6)
+    assert y1 == pytest.approx(np.tanh(3.0 * np.sin(np.pi / 2 - 0.4)), abs=1e-4)
+    assert x2 == pytest.approx(0.0, abs=1e-6)
+
+    panel._swap_axes()
+    assert panel.cursor_points[0][1] == pytest.approx(1.0, abs=1e-6)
+    panel.set_cursor_times(None)
+    assert panel.cursor_points == []
+    panel.close()
+
+
+def test_viewer_and_scope_link_time_cursors_to_the_xy_plot(qapp) -> None:
+    time, h, b = _loop(20_001)
+    result = SimulationResult(time=time.tolist(), signals={"H": h.tolist(), "B": b.tolist()})
+
+    viewer = WaveformViewer()
+    viewer.set_result(result)
+    panel = viewer.show_xy_plot()
+    assert panel.cursor_points == []
+    viewer._cursor_checkbox.setChecked(True)
+    viewer._set_cursor_positions(2.5e-4, 5e-4)
+    assert panel.cursor_points[0][0 if panel._x_combo.currentText() == "H" else 1] == pytest.approx(1.0, abs=1e-4)
+    viewer.close()
+
+    window = ScopeWindow("scope", "Scope", ComponentType.ELECTRICAL_SCOPE)
+    window.set_bindings(
+        [
+            ScopeChannelBinding(
+                index=i,
+                pin_index=i,
+                channel_label=f"CH{i + 1}",
+                overlay=False,
+                node_id=None,
+                node_label=None,
+                signals=[ScopeSignal(label=key, signal_key=key, node_id=None, node_label=None)],
+            )
+            for i, key in enumerate(["H", "B"])
+        ]
+    )
+    window.apply_simulation_result(result)
+    scope_panel = window.show_xy_plot()
+    assert (scope_panel._x_combo.currentText(), scope_panel._y_combo.currentText()) == ("CH1: H", "CH2: B")
+    window._on_stacked_cursor_toggled(True)
+    assert len(scope_panel.cursor_points) == 2
+    window.close()
+
+
+def test_analysis_panels_share_the_plot_theme(qapp) -> None:
+    theme = DARK_THEME
+    for panel_type in (XYPlotPanel, SpectrumPanel, PersistencePanel):
+        panel = panel_type(theme=theme)
+        axis = panel._plot_widget.getPlotItem().getAxis("bottom")
+        assert panel._plot_widget.backgroundBrush().color() == QColor(theme.colors.plot_background)
+        assert axis.textPen().color() == QColor(theme.colors.plot_text)
+        panel.close()